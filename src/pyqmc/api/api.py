@@ -2,29 +2,126 @@
 
 from __future__ import annotations
 
-from fastapi import FastAPI
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from concurrent.futures import BrokenExecutor, Future
+from contextlib import asynccontextmanager
+from typing import Any
+
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 
 from pyqmc import __version__
+from pyqmc.application.cache import get_result_cache_stats
 from pyqmc.application.catalog import get_available_methods, get_available_systems
+from pyqmc.application.dispatch import get_simulation_dispatcher
+from pyqmc.application.jobs import (
+    FINISHED_JOB_STATES,
+    JobManager,
+    JobQueueFull,
+    create_job_manager,
+)
 from pyqmc.application.vmc import (
+    run_vmc_harmonic_oscillator_alpha_sweep_use_case,
     run_vmc_harmonic_oscillator_benchmark_use_case,
-    run_vmc_harmonic_oscillator_use_case,
+    run_vmc_harmonic_oscillator_optimization_use_case,
 )
+from pyqmc.core.progress import DEFAULT_PROGRESS_INTERVAL
 
 from .models import (
+    AlphaSweepResponse,
+    BatchResultLine,
     BenchmarkSuiteResponse,
+    DmcHarmonicOscillatorRequest,
+    JobResponse,
+    JobSubmitRequest,
     MethodInfo,
+    OptimizationResponse,
+    ResultCacheStatsResponse,
     SimulationResultResponse,
     SystemInfo,
+    VmcHarmonicOscillatorAlphaSweepRequest,
+    VmcHarmonicOscillatorBatchRequest,
     VmcHarmonicOscillatorBenchmarkRequest,
+    VmcHarmonicOscillatorOptimizationRequest,
     VmcHarmonicOscillatorRequest,
 )
 
 
+def _sse_event(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _job_events(jobs: JobManager, job_id: str) -> AsyncIterator[str]:
+    """Yield a `progress` event per new snapshot, then one `done` event."""
+    last_progress = None
+    while True:
+        try:
+            # Reading a running job's progress is an IPC round trip.
+            job = await asyncio.to_thread(jobs.get, job_id)
+        except KeyError:
+            return
+        if job["progress"] is not None and job["progress"] != last_progress:
+            last_progress = job["progress"]
+            yield _sse_event("progress", last_progress)
+        if job["status"] in FINISHED_JOB_STATES:
+            yield _sse_event("done", job)
+            return
+        await asyncio.sleep(DEFAULT_PROGRESS_INTERVAL)
+
+
+async def _completion_lines(futures: list[Future]) -> AsyncIterator[str]:
+    """Yield one NDJSON `BatchResultLine` per future, in completion order."""
+    pending = {asyncio.wrap_future(future): index for index, future in enumerate(futures)}
+    while pending:
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for future in sorted(done, key=pending.__getitem__):
+            index = pending.pop(future)
+            try:
+                line = BatchResultLine(
+                    index=index, status="ok", result=future.result().to_dict()
+                )
+            except (RuntimeError, ValueError) as exc:
+                # RuntimeError covers missing NumPy and a broken worker pool.
+                line = BatchResultLine(index=index, status="error", error=str(exc))
+            yield line.model_dump_json() + "\n"
+
+
+async def _offload(future: Future) -> Any:
+    """Await a pool future, mapping missing optional dependencies to 501."""
+    try:
+        return await asyncio.wrap_future(future)
+    except BrokenExecutor as exc:
+        raise HTTPException(status_code=503, detail="compute workers unavailable") from exc
+    except RuntimeError as exc:
+        # Raised when the optional NumPy dependency is missing.
+        raise HTTPException(status_code=501, detail=str(exc)) from exc
+
+
 def create_app() -> FastAPI:
-    """Create and configure the pyQMC FastAPI app."""
+    """Create and configure the pyQMC FastAPI app.
+
+    Simulation, optimization and benchmark handlers are async and run their
+    use-case on the shared `SimulationDispatcher` process pool, so CPU-bound
+    work scales with the worker count and never blocks the event loop.
+    """
+    jobs = create_job_manager()
+    dispatcher = get_simulation_dispatcher()
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        # Fork and warm the compute workers before serving requests.
+        await asyncio.to_thread(dispatcher.start)
+        yield
+        # Requests have drained; let running computations finish, drop
+        # queued ones and cancel background jobs.
+        await asyncio.to_thread(jobs.shutdown)
+        await asyncio.to_thread(dispatcher.shutdown)
+
     app = FastAPI(
+        lifespan=lifespan,
         title="pyQMC API",
         version=__version__,
         description=(
@@ -47,6 +144,10 @@ def create_app() -> FastAPI:
     def health() -> dict[str, str]:
         return {"status": "ok"}
 
+    @app.get("/cache/stats", response_model=ResultCacheStatsResponse, tags=["meta"])
+    def cache_stats() -> ResultCacheStatsResponse:
+        return ResultCacheStatsResponse(**get_result_cache_stats())
+
     @app.get("/methods", response_model=list[MethodInfo], tags=["catalog"])
     def methods() -> list[MethodInfo]:
         return [MethodInfo(**item) for item in get_available_methods()]
@@ -60,34 +161,158 @@ def create_app() -> FastAPI:
         response_model=SimulationResultResponse,
         tags=["simulate"],
     )
-    def simulate_vmc_harmonic_oscillator(
+    async def simulate_vmc_harmonic_oscillator(
         payload: VmcHarmonicOscillatorRequest,
     ) -> SimulationResultResponse:
-        result = run_vmc_harmonic_oscillator_use_case(
-            n_steps=payload.n_steps,
-            burn_in=payload.burn_in,
-            step_size=payload.step_size,
-            alpha=payload.alpha,
-            initial_position=payload.initial_position,
-            seed=payload.seed,
+        result = await _offload(
+            dispatcher.submit("vmc_harmonic_oscillator", payload.model_dump())
         )
         return SimulationResultResponse(**result.to_dict())
 
+    @app.post("/simulate/vmc/harmonic-oscillator/batch", tags=["simulate"])
+    def simulate_vmc_harmonic_oscillator_batch(
+        payload: VmcHarmonicOscillatorBatchRequest,
+    ) -> StreamingResponse:
+        """Run every config on the worker pool; stream NDJSON `BatchResultLine`s.
+
+        Identical seeded configs, within the batch or in flight for other
+        clients, are computed once.
+        """
+        futures = [
+            dispatcher.submit("vmc_harmonic_oscillator", config.model_dump())
+            for config in payload.configs
+        ]
+        return StreamingResponse(_completion_lines(futures), media_type="application/x-ndjson")
+
+    @app.post(
+        "/simulate/vmc/harmonic-oscillator/alpha-sweep",
+        response_model=AlphaSweepResponse,
+        tags=["simulate"],
+    )
+    async def simulate_vmc_harmonic_oscillator_alpha_sweep(
+        payload: VmcHarmonicOscillatorAlphaSweepRequest,
+    ) -> AlphaSweepResponse:
+        result = await _offload(
+            dispatcher.call(
+                run_vmc_harmonic_oscillator_alpha_sweep_use_case,
+                alphas=payload.alphas,
+                n_steps=payload.n_steps,
+                burn_in=payload.burn_in,
+                step_size=payload.step_size,
+                alpha=payload.alpha,
+                initial_position=payload.initial_position,
+                seed=payload.seed,
+                backend=payload.backend,
+                n_walkers=payload.n_walkers,
+                n_chains=payload.n_chains,
+                workers=payload.workers,
+                proposal=payload.proposal,
+            )
+        )
+        return AlphaSweepResponse(**result.to_dict())
+
+    @app.post(
+        "/simulate/dmc/harmonic-oscillator",
+        response_model=SimulationResultResponse,
+        tags=["simulate"],
+    )
+    async def simulate_dmc_harmonic_oscillator(
+        payload: DmcHarmonicOscillatorRequest,
+    ) -> SimulationResultResponse:
+        result = await _offload(
+            dispatcher.submit("dmc_harmonic_oscillator", payload.model_dump())
+        )
+        return SimulationResultResponse(**result.to_dict())
+
+    @app.post(
+        "/optimize/vmc/harmonic-oscillator",
+        response_model=OptimizationResponse,
+        tags=["optimize"],
+    )
+    async def optimize_vmc_harmonic_oscillator(
+        payload: VmcHarmonicOscillatorOptimizationRequest,
+    ) -> OptimizationResponse:
+        result = await _offload(
+            dispatcher.call(
+                run_vmc_harmonic_oscillator_optimization_use_case,
+                method=payload.method,
+                n_iterations=payload.n_iterations,
+                learning_rate=payload.learning_rate,
+                n_steps=payload.n_steps,
+                burn_in=payload.burn_in,
+                step_size=payload.step_size,
+                alpha=payload.alpha,
+                initial_position=payload.initial_position,
+                seed=payload.seed,
+                n_walkers=payload.n_walkers,
+                tune_step_size=payload.tune_step_size,
+                target_acceptance=payload.target_acceptance,
+                proposal=payload.proposal,
+            )
+        )
+        return OptimizationResponse(**result.to_dict())
+
     @app.post(
         "/benchmark/vmc/harmonic-oscillator",
         response_model=BenchmarkSuiteResponse,
         tags=["benchmark"],
     )
-    def benchmark_vmc_harmonic_oscillator(
+    async def benchmark_vmc_harmonic_oscillator(
         payload: VmcHarmonicOscillatorBenchmarkRequest,
     ) -> BenchmarkSuiteResponse:
-        suite = run_vmc_harmonic_oscillator_benchmark_use_case(
-            n_steps=payload.n_steps,
-            burn_in=payload.burn_in,
-            step_size=payload.step_size,
-            initial_position=payload.initial_position,
-            seed=payload.seed,
+        suite = await _offload(
+            dispatcher.call(
+                run_vmc_harmonic_oscillator_benchmark_use_case,
+                n_steps=payload.n_steps,
+                burn_in=payload.burn_in,
+                step_size=payload.step_size,
+                initial_position=payload.initial_position,
+                seed=payload.seed,
+                backend=payload.backend,
+                n_walkers=payload.n_walkers,
+            )
         )
         return BenchmarkSuiteResponse(**suite.to_dict())
 
+    @app.post("/jobs", response_model=JobResponse, status_code=202, tags=["jobs"])
+    def submit_job(payload: JobSubmitRequest) -> JobResponse:
+        try:
+            job = jobs.submit(payload.kind, payload.parameters.model_dump())
+        except JobQueueFull as exc:
+            raise HTTPException(
+                status_code=429, detail=str(exc), headers={"Retry-After": "1"}
+            ) from exc
+        return JobResponse(**job)
+
+    @app.get("/jobs", response_model=list[JobResponse], tags=["jobs"])
+    def list_jobs() -> list[JobResponse]:
+        return [JobResponse(**job) for job in jobs.list_jobs()]
+
+    @app.get("/jobs/{job_id}", response_model=JobResponse, tags=["jobs"])
+    def get_job(job_id: str) -> JobResponse:
+        try:
+            return JobResponse(**jobs.get(job_id))
+        except KeyError as exc:
+            raise HTTPException(status_code=404, detail=f"unknown job {job_id}") from exc
+
+    @app.get("/jobs/{job_id}/events", tags=["jobs"])
+    def stream_job_events(job_id: str) -> StreamingResponse:
+        """Server-Sent Events: `progress` snapshots, then `done` with the job."""
+        try:
+            jobs.get(job_id)
+        except KeyError as exc:
+            raise HTTPException(status_code=404, detail=f"unknown job {job_id}") from exc
+        return StreamingResponse(
+            _job_events(jobs, job_id),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"},
+        )
+
+    @app.delete("/jobs/{job_id}", response_model=JobResponse, tags=["jobs"])
+    def cancel_job(job_id: str) -> JobResponse:
+        try:
+            return JobResponse(**jobs.cancel(job_id))
+        except KeyError as exc:
+            raise HTTPException(status_code=404, detail=f"unknown job {job_id}") from exc
+
     return app
@@ -4,15 +4,17 @@ from __future__ import annotations
 
 import argparse
 import importlib.util
+import os
 import sys
 
+from pyqmc.application.dispatch import API_WORKERS_ENV
+from pyqmc.application.jobs import JOB_WORKERS_ENV
 
-def build_parser() -> argparse.ArgumentParser:
-    """Build command-line parser for API server startup."""
-    parser = argparse.ArgumentParser(
-        prog="pyqmc-api",
-        description="Run the pyQMC FastAPI server",
-    )
+DEFAULT_SHUTDOWN_TIMEOUT = 30.0
+
+
+def add_server_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the API server options shared by `pyqmc-api` and `pyqmc serve-api`."""
     parser.add_argument("--host", default="127.0.0.1")
     parser.add_argument("--port", type=int, default=8000)
     parser.add_argument("--log-level", default="info")
@@ -21,6 +23,33 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Enable auto-reload for local development",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Compute worker processes for simulate/benchmark requests (default: CPU count)",
+    )
+    parser.add_argument(
+        "--job-workers",
+        type=int,
+        default=None,
+        help="Worker processes for background jobs (default: CPU count)",
+    )
+    parser.add_argument(
+        "--shutdown-timeout",
+        type=float,
+        default=DEFAULT_SHUTDOWN_TIMEOUT,
+        help="Seconds to let in-flight requests finish on shutdown",
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build command-line parser for API server startup."""
+    parser = argparse.ArgumentParser(
+        prog="pyqmc-api",
+        description="Run the pyQMC FastAPI server",
+    )
+    add_server_arguments(parser)
     return parser
 
 
@@ -29,8 +58,22 @@ def run_server(
     port: int = 8000,
     log_level: str = "info",
     reload: bool = False,
+    workers: int | None = None,
+    job_workers: int | None = None,
+    shutdown_timeout: float = DEFAULT_SHUTDOWN_TIMEOUT,
 ) -> None:
-    """Run uvicorn with the pyQMC app factory."""
+    """Run uvicorn with the pyQMC app factory.
+
+    `workers` and `job_workers` size the compute and background-job process
+    pools; they are passed to the app through `PYQMC_API_WORKERS` and
+    `PYQMC_JOB_WORKERS` so reload subprocesses see them too. On shutdown,
+    in-flight requests get `shutdown_timeout` seconds to finish before the
+    pools are stopped.
+    """
+    if workers is not None and workers <= 0:
+        raise ValueError("workers must be positive")
+    if job_workers is not None and job_workers <= 0:
+        raise ValueError("job_workers must be positive")
     if importlib.util.find_spec("fastapi") is None:
         raise RuntimeError(
             "Missing API dependencies. Install with: pip install -e '.[api]'"
@@ -43,6 +86,11 @@ def run_server(
             "Missing API dependencies. Install with: pip install -e '.[api]'"
         ) from exc
 
+    if workers is not None:
+        os.environ[API_WORKERS_ENV] = str(workers)
+    if job_workers is not None:
+        os.environ[JOB_WORKERS_ENV] = str(job_workers)
+
     uvicorn.run(
         "pyqmc.api.api:create_app",
         host=host,
@@ -50,6 +98,7 @@ def run_server(
         log_level=log_level,
         reload=reload,
         factory=True,
+        timeout_graceful_shutdown=shutdown_timeout,
     )
 
 
@@ -64,8 +113,11 @@ def main(argv: list[str] | None = None) -> int:
             port=args.port,
             log_level=args.log_level,
             reload=args.reload,
+            workers=args.workers,
+            job_workers=args.job_workers,
+            shutdown_timeout=args.shutdown_timeout,
         )
-    except RuntimeError as exc:
+    except (RuntimeError, ValueError) as exc:
         print(str(exc), file=sys.stderr)
         return 2
 
@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Annotated, Any, Literal
 
 from pydantic import BaseModel, Field, model_validator
 from pyqmc.core.vmc_input import (
     DEFAULT_VMC_ALPHA,
+    DEFAULT_VMC_BACKEND,
     DEFAULT_VMC_BURN_IN,
     DEFAULT_VMC_INITIAL_POSITION,
+    DEFAULT_VMC_MAX_SECONDS,
+    DEFAULT_VMC_N_CHAINS,
     DEFAULT_VMC_N_STEPS,
+    DEFAULT_VMC_N_WALKERS,
+    DEFAULT_VMC_PROPOSAL,
     DEFAULT_VMC_SEED,
     DEFAULT_VMC_STEP_SIZE,
+    DEFAULT_VMC_TARGET_ACCEPTANCE,
+    DEFAULT_VMC_TARGET_STANDARD_ERROR,
+    DEFAULT_VMC_TUNE_STEP_SIZE,
+    DEFAULT_VMC_WORKERS,
 )
 
 
@@ -24,6 +33,18 @@ class VmcHarmonicOscillatorRequest(BaseModel):
     alpha: float = Field(default=DEFAULT_VMC_ALPHA, gt=0)
     initial_position: float = DEFAULT_VMC_INITIAL_POSITION
     seed: int | None = DEFAULT_VMC_SEED
+    backend: Literal["python", "numpy"] = DEFAULT_VMC_BACKEND
+    n_walkers: int = Field(default=DEFAULT_VMC_N_WALKERS, gt=0)
+    n_chains: int = Field(default=DEFAULT_VMC_N_CHAINS, gt=0)
+    workers: int = Field(default=DEFAULT_VMC_WORKERS, gt=0)
+    target_standard_error: float | None = Field(
+        default=DEFAULT_VMC_TARGET_STANDARD_ERROR,
+        gt=0,
+    )
+    max_seconds: float | None = Field(default=DEFAULT_VMC_MAX_SECONDS, gt=0)
+    tune_step_size: bool = DEFAULT_VMC_TUNE_STEP_SIZE
+    target_acceptance: float = Field(default=DEFAULT_VMC_TARGET_ACCEPTANCE, gt=0, lt=1)
+    proposal: Literal["uniform", "langevin"] = DEFAULT_VMC_PROPOSAL
 
     @model_validator(mode="after")
     def validate_burn_in(self) -> "VmcHarmonicOscillatorRequest":
@@ -32,6 +53,140 @@ class VmcHarmonicOscillatorRequest(BaseModel):
             raise ValueError("burn_in must be smaller than n_steps")
         return self
 
+    @model_validator(mode="after")
+    def validate_walkers(self) -> "VmcHarmonicOscillatorRequest":
+        """Ensure walker ensembles are only requested from the NumPy backend."""
+        if self.backend == "python" and self.n_walkers != 1:
+            raise ValueError("n_walkers > 1 requires backend='numpy'")
+        return self
+
+    @model_validator(mode="after")
+    def validate_time_budget(self) -> "VmcHarmonicOscillatorRequest":
+        """Ensure a wall-clock budget only accompanies a precision target."""
+        if self.max_seconds is not None and self.target_standard_error is None:
+            raise ValueError("max_seconds requires target_standard_error")
+        return self
+
+    @model_validator(mode="after")
+    def validate_tuning(self) -> "VmcHarmonicOscillatorRequest":
+        """Ensure step-size tuning has burn-in steps to adapt on."""
+        if self.tune_step_size and self.burn_in == 0:
+            raise ValueError("tune_step_size requires burn_in > 0")
+        return self
+
+
+MAX_BATCH_SIZE = 256
+
+
+class VmcHarmonicOscillatorBatchRequest(BaseModel):
+    """Several VMC harmonic-oscillator runs submitted in one request."""
+
+    configs: list[VmcHarmonicOscillatorRequest] = Field(
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+    )
+
+
+class BatchResultLine(BaseModel):
+    """One NDJSON line of a batch response; `index` points into `configs`."""
+
+    index: int
+    status: Literal["ok", "error"]
+    result: SimulationResultResponse | None = None
+    error: str | None = None
+
+
+class VmcHarmonicOscillatorAlphaSweepRequest(BaseModel):
+    """Input payload for a correlated-sampling alpha sweep."""
+
+    alphas: list[float] = Field(min_length=1)
+    n_steps: int = Field(default=DEFAULT_VMC_N_STEPS, gt=0)
+    burn_in: int = Field(default=DEFAULT_VMC_BURN_IN, ge=0)
+    step_size: float = Field(default=DEFAULT_VMC_STEP_SIZE, gt=0)
+    alpha: float = Field(default=DEFAULT_VMC_ALPHA, gt=0)
+    initial_position: float = DEFAULT_VMC_INITIAL_POSITION
+    seed: int | None = DEFAULT_VMC_SEED
+    backend: Literal["python", "numpy"] = DEFAULT_VMC_BACKEND
+    n_walkers: int = Field(default=DEFAULT_VMC_N_WALKERS, gt=0)
+    n_chains: int = Field(default=DEFAULT_VMC_N_CHAINS, gt=0)
+    workers: int = Field(default=DEFAULT_VMC_WORKERS, gt=0)
+    proposal: Literal["uniform", "langevin"] = DEFAULT_VMC_PROPOSAL
+
+    @model_validator(mode="after")
+    def validate_alphas(self) -> "VmcHarmonicOscillatorAlphaSweepRequest":
+        """Ensure every grid value is a valid variational parameter."""
+        if any(alpha <= 0 for alpha in self.alphas):
+            raise ValueError("alphas must be positive")
+        return self
+
+    @model_validator(mode="after")
+    def validate_burn_in(self) -> "VmcHarmonicOscillatorAlphaSweepRequest":
+        """Ensure burn-in is smaller than total steps."""
+        if self.burn_in >= self.n_steps:
+            raise ValueError("burn_in must be smaller than n_steps")
+        return self
+
+    @model_validator(mode="after")
+    def validate_walkers(self) -> "VmcHarmonicOscillatorAlphaSweepRequest":
+        """Ensure walker ensembles are only requested from the NumPy backend."""
+        if self.backend == "python" and self.n_walkers != 1:
+            raise ValueError("n_walkers > 1 requires backend='numpy'")
+        return self
+
+
+class VmcHarmonicOscillatorOptimizationRequest(BaseModel):
+    """Input payload for optimizing alpha with the linear method or SR."""
+
+    method: Literal["linear", "sr"] = "linear"
+    n_iterations: int = Field(default=30, gt=0)
+    learning_rate: float = Field(default=0.5, gt=0)
+    n_steps: int = Field(default=300, gt=0)
+    burn_in: int = Field(default=100, ge=0)
+    step_size: float = Field(default=1.5, gt=0)
+    alpha: float = Field(default=0.5, gt=0)
+    initial_position: float = DEFAULT_VMC_INITIAL_POSITION
+    seed: int | None = DEFAULT_VMC_SEED
+    n_walkers: int = Field(default=256, gt=0)
+    tune_step_size: bool = DEFAULT_VMC_TUNE_STEP_SIZE
+    target_acceptance: float = Field(default=DEFAULT_VMC_TARGET_ACCEPTANCE, gt=0, lt=1)
+    proposal: Literal["uniform", "langevin"] = DEFAULT_VMC_PROPOSAL
+
+    @model_validator(mode="after")
+    def validate_burn_in(self) -> "VmcHarmonicOscillatorOptimizationRequest":
+        """Ensure burn-in is smaller than the sweeps per iteration."""
+        if self.burn_in >= self.n_steps:
+            raise ValueError("burn_in must be smaller than n_steps")
+        return self
+
+    @model_validator(mode="after")
+    def validate_tuning(self) -> "VmcHarmonicOscillatorOptimizationRequest":
+        """Ensure step-size tuning has burn-in steps to adapt on."""
+        if self.tune_step_size and self.burn_in == 0:
+            raise ValueError("tune_step_size requires burn_in > 0")
+        return self
+
+
+class DmcHarmonicOscillatorRequest(BaseModel):
+    """Input payload for importance-sampled DMC on the 1D harmonic oscillator."""
+
+    n_steps: int = Field(default=4_000, gt=0)
+    burn_in: int = Field(default=500, ge=0)
+    time_step: float = Field(default=0.05, gt=0)
+    alpha: float = Field(default=0.8, gt=0)
+    target_population: int = Field(default=1_000, gt=0)
+    initial_position: float = DEFAULT_VMC_INITIAL_POSITION
+    seed: int | None = DEFAULT_VMC_SEED
+    workers: int = Field(default=DEFAULT_VMC_WORKERS, gt=0)
+
+    @model_validator(mode="after")
+    def validate_burn_in(self) -> "DmcHarmonicOscillatorRequest":
+        """Ensure equilibration is shorter than the run and every worker gets walkers."""
+        if self.burn_in >= self.n_steps:
+            raise ValueError("burn_in must be smaller than n_steps")
+        if self.target_population < self.workers:
+            raise ValueError("target_population must be at least workers")
+        return self
+
 
 class SimulationResultResponse(BaseModel):
     """Serialized simulation summary returned by API endpoints."""
@@ -46,6 +201,121 @@ class SimulationResultResponse(BaseModel):
     metadata: dict[str, Any]
 
 
+class VmcHarmonicOscillatorJobRequest(BaseModel):
+    """Background job running VMC on the 1D harmonic oscillator."""
+
+    kind: Literal["vmc_harmonic_oscillator"]
+    parameters: VmcHarmonicOscillatorRequest = Field(
+        default_factory=VmcHarmonicOscillatorRequest
+    )
+
+
+class DmcHarmonicOscillatorJobRequest(BaseModel):
+    """Background job running DMC on the 1D harmonic oscillator."""
+
+    kind: Literal["dmc_harmonic_oscillator"]
+    parameters: DmcHarmonicOscillatorRequest = Field(
+        default_factory=DmcHarmonicOscillatorRequest
+    )
+
+
+JobSubmitRequest = Annotated[
+    VmcHarmonicOscillatorJobRequest | DmcHarmonicOscillatorJobRequest,
+    Field(discriminator="kind"),
+]
+
+
+class ProgressResponse(BaseModel):
+    """Running estimates of a simulation in progress."""
+
+    steps_done: int
+    total_steps: int
+    fraction_done: float
+    n_samples: int
+    mean_energy: float | None
+    standard_error: float | None
+    acceptance_ratio: float
+    elapsed_seconds: float
+    steps_per_second: float
+
+
+class JobResponse(BaseModel):
+    """Status, partial results and final result of a background job."""
+
+    id: str
+    kind: str
+    status: Literal["queued", "running", "succeeded", "failed", "cancelled"]
+    arguments: dict[str, Any]
+    submitted_at: float
+    started_at: float | None
+    finished_at: float | None
+    cancel_requested: bool
+    progress: ProgressResponse | None
+    result: SimulationResultResponse | None
+    error: str | None
+
+
+class ResultCacheStatsResponse(BaseModel):
+    """Hit/miss counters and tier sizes of the shared result cache."""
+
+    hits: int
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    bypassed: int
+    memory_entries: int
+    disk_entries: int
+    disk_bytes: int
+
+
+class AlphaSweepPointResponse(BaseModel):
+    """One reweighted grid point of an alpha sweep."""
+
+    alpha: float
+    energy: float
+    standard_error: float
+    effective_samples: float
+
+
+class AlphaSweepResponse(BaseModel):
+    """Serialized alpha sweep returned by API endpoints."""
+
+    method: str
+    system: str
+    reference_alpha: float
+    n_samples: int
+    best_alpha: float
+    points: list[AlphaSweepPointResponse]
+    parameters: dict[str, Any]
+    metadata: dict[str, Any]
+
+
+class OptimizationStepResponse(BaseModel):
+    """One iteration of a wavefunction optimization."""
+
+    iteration: int
+    parameters: list[float]
+    energy: float
+    standard_error: float
+    gradient: list[float]
+    acceptance_ratio: float
+
+
+class OptimizationResponse(BaseModel):
+    """Serialized optimization trajectory returned by API endpoints."""
+
+    method: str
+    system: str
+    converged: bool
+    n_iterations: int
+    optimized_parameters: list[float]
+    energy: float
+    standard_error: float
+    history: list[OptimizationStepResponse]
+    parameters: dict[str, Any]
+    metadata: dict[str, Any]
+
+
 class MethodInfo(BaseModel):
     """QMC method metadata for discovery endpoints."""
 
@@ -72,6 +342,8 @@ class VmcHarmonicOscillatorBenchmarkRequest(BaseModel):
     step_size: float = Field(default=1.0, gt=0)
     initial_position: float = 0.0
     seed: int | None = 12345
+    backend: Literal["python", "numpy"] = DEFAULT_VMC_BACKEND
+    n_walkers: int = Field(default=DEFAULT_VMC_N_WALKERS, gt=0)
 
     @model_validator(mode="after")
     def validate_burn_in(self) -> "VmcHarmonicOscillatorBenchmarkRequest":
@@ -80,6 +352,13 @@ class VmcHarmonicOscillatorBenchmarkRequest(BaseModel):
             raise ValueError("burn_in must be smaller than n_steps")
         return self
 
+    @model_validator(mode="after")
+    def validate_walkers(self) -> "VmcHarmonicOscillatorBenchmarkRequest":
+        """Ensure walker ensembles are only requested from the NumPy backend."""
+        if self.backend == "python" and self.n_walkers != 1:
+            raise ValueError("n_walkers > 1 requires backend='numpy'")
+        return self
+
 
 class BenchmarkCaseResponse(BaseModel):
     """One benchmark case result returned by API."""
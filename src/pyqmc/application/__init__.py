@@ -3,15 +3,39 @@
 This package provides stable backend entry points used by CLI, GUI, and API.
 """
 
+from .cache import configure_result_cache, get_result_cache, get_result_cache_stats
 from .catalog import get_available_methods, get_available_systems
+from .dispatch import (
+    SimulationDispatcher,
+    configure_simulation_dispatcher,
+    get_simulation_dispatcher,
+)
+from .dmc import run_dmc_harmonic_oscillator_use_case
+from .jobs import JobManager, JobQueueFull, create_job_manager
 from .vmc import (
+    run_vmc_fermion_trap_use_case,
+    run_vmc_harmonic_oscillator_alpha_sweep_use_case,
     run_vmc_harmonic_oscillator_benchmark_use_case,
+    run_vmc_harmonic_oscillator_optimization_use_case,
     run_vmc_harmonic_oscillator_use_case,
 )
 
 __all__ = [
+    "JobManager",
+    "JobQueueFull",
+    "SimulationDispatcher",
+    "configure_result_cache",
+    "configure_simulation_dispatcher",
+    "create_job_manager",
+    "get_result_cache",
+    "get_result_cache_stats",
+    "get_simulation_dispatcher",
     "get_available_methods",
     "get_available_systems",
+    "run_dmc_harmonic_oscillator_use_case",
+    "run_vmc_fermion_trap_use_case",
+    "run_vmc_harmonic_oscillator_alpha_sweep_use_case",
     "run_vmc_harmonic_oscillator_benchmark_use_case",
+    "run_vmc_harmonic_oscillator_optimization_use_case",
     "run_vmc_harmonic_oscillator_use_case",
 ]
@@ -0,0 +1,159 @@
+"""Process-wide result cache shared by API, GUI, and CLI layers.
+
+Seeded simulation use-cases look their result up here before computing it.
+The cache keeps recent results in memory; setting `PYQMC_CACHE_DIR` (or
+calling `configure_result_cache`) adds a disk tier that survives restarts
+and can be shared between processes. `PYQMC_CACHE_MAX_BYTES` caps that
+directory.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+from pyqmc.core.config import SimulationConfig
+from pyqmc.core.progress import ProgressCallback, ProgressSnapshot
+from pyqmc.core.result_cache import (
+    DEFAULT_DISK_BYTES,
+    DEFAULT_MEMORY_ENTRIES,
+    ResultCache,
+    result_cache_key,
+)
+from pyqmc.core.results import SimulationResult
+
+CACHE_DIR_ENV = "PYQMC_CACHE_DIR"
+CACHE_MAX_BYTES_ENV = "PYQMC_CACHE_MAX_BYTES"
+
+_cache: ResultCache | None = None
+_cache_lock = threading.Lock()
+
+
+def configure_result_cache(
+    *,
+    directory: str | Path | None = None,
+    max_bytes: int = DEFAULT_DISK_BYTES,
+    max_entries: int = DEFAULT_MEMORY_ENTRIES,
+) -> ResultCache:
+    """Replace the shared cache, e.g. to add a disk tier; returns the new cache."""
+    global _cache
+    cache = ResultCache(
+        max_entries=max_entries,
+        directory=None if directory is None else Path(directory),
+        max_bytes=max_bytes,
+    )
+    with _cache_lock:
+        _cache = cache
+    return cache
+
+
+def get_result_cache() -> ResultCache:
+    """Return the shared cache, creating it from the environment on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            directory = os.environ.get(CACHE_DIR_ENV) or None
+            max_bytes = int(os.environ.get(CACHE_MAX_BYTES_ENV, DEFAULT_DISK_BYTES))
+            _cache = ResultCache(directory=directory, max_bytes=max_bytes)
+        return _cache
+
+
+def get_result_cache_stats() -> dict[str, Any]:
+    """Hit/miss counters and tier sizes of the shared cache."""
+    return get_result_cache().stats().to_dict()
+
+
+def simulation_cache_key(
+    kind: str,
+    config: SimulationConfig,
+    *,
+    extra: dict[str, Any] | None = None,
+    use_cache: bool = True,
+) -> str | None:
+    """Return the cache key of a reproducible run, or None if it must not be cached.
+
+    Runs are only cached when they are reproducible: `config.seed` must be
+    set and no wall-clock budget (`max_seconds`) may cut them short.
+    """
+    if not use_cache or config.seed is None or config.max_seconds is not None:
+        return None
+    return result_cache_key(kind, config, extra)
+
+
+def with_cache_status(result: SimulationResult, status: str) -> SimulationResult:
+    """Return a copy of `result` tagged with `metadata["result_cache"] = status`."""
+    return replace(result, metadata={**result.metadata, "result_cache": status})
+
+
+def served_from_cache(result: SimulationResult, config: SimulationConfig) -> SimulationResult:
+    """Return a stored `result` as a cache hit for a call with `config`.
+
+    The stored metadata describes the run that computed it. A hit runs
+    nothing, so `cpu_seconds` becomes 0.0 and the per-CPU-second rates None,
+    and `workers` (outside most cache keys) reports this call's setting.
+    """
+    metadata = {
+        name: None if name.endswith("_per_cpu_second") else value
+        for name, value in result.metadata.items()
+    }
+    if "cpu_seconds" in metadata:
+        metadata["cpu_seconds"] = 0.0
+    if "workers" in metadata:
+        metadata["workers"] = config.workers
+    return with_cache_status(replace(result, metadata=metadata), "hit")
+
+
+def completed_progress(result: SimulationResult, config: SimulationConfig) -> ProgressSnapshot:
+    """Final progress snapshot of a run answered without sampling (a cache hit).
+
+    Like the last snapshot of a live run, it reports the steps the stored run
+    completed against the `config.n_steps` cap, with no wall time spent.
+    """
+    return ProgressSnapshot(
+        steps_done=int(result.metadata.get("steps_per_chain", config.n_steps)),
+        total_steps=config.n_steps,
+        n_samples=result.n_samples,
+        mean_energy=result.mean_energy,
+        standard_error=result.standard_error,
+        acceptance_ratio=result.acceptance_ratio,
+        elapsed_seconds=0.0,
+        steps_per_second=0.0,
+    )
+
+
+def cached_simulation(
+    kind: str,
+    config: SimulationConfig,
+    compute: Callable[[], SimulationResult],
+    *,
+    extra: dict[str, Any] | None = None,
+    use_cache: bool = True,
+    progress: ProgressCallback | None = None,
+) -> SimulationResult:
+    """Return the cached result of `compute()` for this run, computing it once.
+
+    Runs that `simulation_cache_key` rejects, and calls with
+    `use_cache=False`, always compute and count as bypassed.
+    `metadata["result_cache"]` reports "hit", "miss" or "bypass"; hits are
+    shaped by `served_from_cache`. `compute` reports its own progress; on a
+    hit, `progress` receives one `completed_progress` snapshot instead.
+    """
+    cache = get_result_cache()
+    key = simulation_cache_key(kind, config, extra=extra, use_cache=use_cache)
+    if key is None:
+        cache.record_bypass()
+        return with_cache_status(compute(), "bypass")
+
+    cached = cache.get(key)
+    if cached is not None:
+        result = served_from_cache(cached, config)
+        if progress is not None:
+            progress(completed_progress(result, config))
+        return result
+    result = compute()
+    cache.put(key, result)
+    return with_cache_status(result, "miss")
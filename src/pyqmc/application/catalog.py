@@ -1,6 +1,10 @@
 """Read-only application catalog use-cases.
 
 These functions expose method/system metadata without coupling to HTTP schemas.
+A method lists a system only when a transport (API route, GUI) can run that
+system with it. Systems available only from Python or a dedicated CLI
+command are still listed by `get_available_systems`, and their notes say how
+to run them.
 """
 
 from __future__ import annotations
@@ -16,7 +20,13 @@ def get_available_methods() -> list[dict[str, Any]]:
             "name": "Variational Monte Carlo (Metropolis)",
             "description": "Random-walk Metropolis sampling of |psi_T|^2.",
             "systems": ["harmonic_oscillator_1d"],
-        }
+        },
+        {
+            "id": "dmc_importance_sampled",
+            "name": "Diffusion Monte Carlo (importance sampled)",
+            "description": "Drift-diffusion walkers with birth-death branching (needs NumPy).",
+            "systems": ["harmonic_oscillator_1d"],
+        },
     ]
 
 
@@ -28,5 +38,54 @@ def get_available_systems() -> list[dict[str, str]]:
             "name": "1D Harmonic Oscillator",
             "dimension": "1D",
             "notes": "Educational baseline with exact ground-state energy E0 = 0.5.",
-        }
+        },
+        {
+            "id": "harmonic_trap",
+            "name": "N-particle Harmonic Trap",
+            "dimension": "3D",
+            "notes": (
+                "Non-interacting particles with per-axis frequencies; exact "
+                "E0 = N/2 * sum_d omega_d. Python API only (numpy backend)."
+            ),
+        },
+        {
+            "id": "hookes_atom",
+            "name": "Hooke's Atom",
+            "dimension": "3D",
+            "notes": (
+                "Two Coulomb-repelling electrons in a trap with a Pade-Jastrow "
+                "trial function; exact E0 = 2 at omega = 1/2. Python API only "
+                "(numpy backend)."
+            ),
+        },
+        {
+            "id": "fermion_trap",
+            "name": "Trapped Fermions",
+            "dimension": "3D",
+            "notes": (
+                "Spin-1/2 fermions with Slater determinants updated by "
+                "Sherman-Morrison; exact at alpha = 1. CLI `pyqmc "
+                "vmc-fermion-trap` or Python API (numpy backend)."
+            ),
+        },
+        {
+            "id": "hydrogen_atom",
+            "name": "Hydrogen Atom",
+            "dimension": "3D",
+            "notes": (
+                "Electron-proton Coulomb attraction with exp(-zeta r); exact "
+                "E0 = -0.5 hartree at the cusp value zeta = 1. Python API only "
+                "(numpy backend)."
+            ),
+        },
+        {
+            "id": "helium_atom",
+            "name": "Helium Atom",
+            "dimension": "3D",
+            "notes": (
+                "Two electrons with nuclear and pair Coulomb terms; cusp-satisfying "
+                "Pade-Jastrow trial, exact E0 = -2.903724 hartree. Python API "
+                "only (numpy backend)."
+            ),
+        },
     ]
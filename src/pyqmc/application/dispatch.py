@@ -0,0 +1,262 @@
+"""Simulation use-cases run on a process pool with caching and coalescing.
+
+`SimulationDispatcher` is the parent-process front of a worker pool. For a
+seeded request it first consults the shared result cache, then joins an
+identical computation that is already in flight, and only otherwise submits
+the use-case to the pool. Results are cached in the parent, so the cache
+and its statistics stay in the process that serves clients, and identical
+requests arriving together, from one batch or from different clients, cost
+one computation.
+
+`metadata["result_cache"]` tells callers how a result was obtained: "hit",
+"miss" (computed for this request), "coalesced" (shared with an identical
+request in flight) or "bypass" (not cacheable). Other CPU-bound use-cases
+(sweeps, optimization, benchmarks) run on the same pool through `call`.
+
+Workers import the simulation modules when they start, and `start` waits
+until all of them are up, so the first request does not pay for process
+start-up and imports. `get_simulation_dispatcher` returns the process-wide
+dispatcher, sized by `PYQMC_API_WORKERS` (default: CPU count).
+"""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from pyqmc.application.cache import (
+    get_result_cache,
+    served_from_cache,
+    simulation_cache_key,
+    with_cache_status,
+)
+from pyqmc.application.dmc import (
+    build_dmc_harmonic_oscillator_config,
+    dmc_cache_extra,
+    run_dmc_harmonic_oscillator_use_case,
+)
+from pyqmc.application.vmc import run_vmc_harmonic_oscillator_use_case
+from pyqmc.core.config import SimulationConfig
+from pyqmc.core.results import SimulationResult
+from pyqmc.core.vmc_input import build_vmc_harmonic_oscillator_config
+
+
+@dataclass(frozen=True)
+class _Runner:
+    """A use-case and how to derive the config that identifies its result."""
+
+    use_case: Callable[..., SimulationResult]
+    config: Callable[..., SimulationConfig]
+    extra: Callable[[SimulationConfig], dict[str, Any]] | None = None
+
+
+_RUNNERS: dict[str, _Runner] = {
+    "vmc_harmonic_oscillator": _Runner(
+        use_case=run_vmc_harmonic_oscillator_use_case,
+        config=build_vmc_harmonic_oscillator_config,
+    ),
+    "dmc_harmonic_oscillator": _Runner(
+        use_case=run_dmc_harmonic_oscillator_use_case,
+        config=build_dmc_harmonic_oscillator_config,
+        extra=dmc_cache_extra,
+    ),
+}
+DISPATCH_KINDS = tuple(_RUNNERS)
+API_WORKERS_ENV = "PYQMC_API_WORKERS"
+
+# Imported by every worker at start-up; the NumPy-only ones are skipped
+# when NumPy is missing.
+_PRELOADED_MODULES = (
+    "pyqmc.vmc.solver",
+    "pyqmc.dmc.solver",
+    "pyqmc.benchmarks.vmc_harmonic_oscillator",
+    "pyqmc.benchmarks.proposal_kernels",
+    "pyqmc.vmc.batched_metropolis",
+    "pyqmc.vmc.reweighting",
+    "pyqmc.vmc.optimize",
+    "pyqmc.dmc.engine",
+    "pyqmc.dmc.parallel",
+)
+
+
+def simulation_run_key(kind: str, arguments: dict[str, Any]) -> tuple[SimulationConfig, str | None]:
+    """Build the config a run's arguments define and return it with its cache key.
+
+    The key is None for runs that must not be cached. Raises `TypeError` for
+    arguments the kind's config builder does not take and `ValueError` for
+    invalid values.
+    """
+    runner = _RUNNERS[kind]
+    config = runner.config(**arguments)
+    extra = None if runner.extra is None else runner.extra(config)
+    return config, simulation_cache_key(kind, config, extra=extra)
+
+
+def _preload_modules() -> None:
+    for name in _PRELOADED_MODULES:
+        try:
+            importlib.import_module(name)
+        except ModuleNotFoundError:
+            pass
+
+
+def _worker_ready() -> int:
+    return os.getpid()
+
+
+def _run_use_case(kind: str, arguments: dict[str, Any]) -> SimulationResult:
+    """Compute one result in a pool worker; the parent does the caching."""
+    return _RUNNERS[kind].use_case(**arguments, use_cache=False)
+
+
+def _completed(result: SimulationResult) -> Future:
+    future: Future = Future()
+    future.set_result(result)
+    return future
+
+
+def _tagged(source: Future, status: str) -> Future:
+    """Return a future resolving to `source`'s result tagged with `status`."""
+    future: Future = Future()
+
+    def _copy(done: Future) -> None:
+        if done.cancelled():
+            future.cancel()
+            return
+        exception = done.exception()
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(with_cache_status(done.result(), status))
+
+    source.add_done_callback(_copy)
+    return future
+
+
+class SimulationDispatcher:
+    """Runs simulation use-cases on a process pool; safe across threads.
+
+    `arguments` are the plain keyword arguments that define the run: those
+    of the kind's config builder (for VMC, `build_vmc_harmonic_oscillator_config`),
+    with its defaults for any that are missing.
+    The pool starts on the first submission; call `shutdown` to stop it.
+    """
+
+    def __init__(self, *, max_workers: int | None = None) -> None:
+        max_workers = max_workers or os.cpu_count() or 1
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        self.max_workers = max_workers
+        self._pool: ProcessPoolExecutor | None = None
+        self._in_flight: dict[str, Future] = {}
+        # Re-entrant: submissions start the pool while holding the lock.
+        self._lock = threading.RLock()
+
+    @property
+    def in_flight(self) -> int:
+        """Distinct cacheable computations currently running or queued."""
+        with self._lock:
+            return len(self._in_flight)
+
+    def submit(self, kind: str, arguments: dict[str, Any]) -> Future:
+        """Schedule one run and return a future of its `SimulationResult`.
+
+        Raises `ValueError` for an unknown `kind` or invalid arguments.
+        """
+        runner = _RUNNERS.get(kind)
+        if runner is None:
+            raise ValueError(f"unknown simulation kind {kind!r}; expected one of {DISPATCH_KINDS}")
+        try:
+            bound = inspect.signature(runner.config).bind(**arguments)
+        except TypeError as exc:
+            raise ValueError(f"invalid {kind} arguments: {exc}") from exc
+        # Fill in defaults so the worker runs exactly the config keyed here.
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        config, key = simulation_run_key(kind, arguments)
+        cache = get_result_cache()
+        if key is None:
+            cache.record_bypass()
+            return _tagged(self._pool_submit(kind, arguments), "bypass")
+
+        with self._lock:
+            shared = self._in_flight.get(key)
+            if shared is not None:
+                return _tagged(shared, "coalesced")
+            cached = cache.get(key)
+            if cached is not None:
+                return _completed(served_from_cache(cached, config))
+            shared = self._pool_submit(kind, arguments)
+            self._in_flight[key] = shared
+        shared.add_done_callback(lambda done: self._settle(key, done))
+        return _tagged(shared, "miss")
+
+    def call(self, function: Callable[..., Any], /, **kwargs: Any) -> Future:
+        """Run a module-level `function(**kwargs)` on the pool, uncached."""
+        return self._ensure_pool().submit(function, **kwargs)
+
+    def start(self) -> None:
+        """Start the pool and wait until every worker has loaded its modules."""
+        pool = self._ensure_pool()
+        for ready in [pool.submit(_worker_ready) for _ in range(self.max_workers)]:
+            ready.result()
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop the pool, cancelling runs that have not started.
+
+        With `wait`, runs already executing finish first. A later submission
+        starts a fresh pool.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers, initializer=_preload_modules
+                )
+            return self._pool
+
+    def _pool_submit(self, kind: str, arguments: dict[str, Any]) -> Future:
+        return self._ensure_pool().submit(_run_use_case, kind, dict(arguments))
+
+    def _settle(self, key: str, done: Future) -> None:
+        # Cache before leaving the in-flight table so no request recomputes.
+        if not done.cancelled() and done.exception() is None:
+            get_result_cache().put(key, done.result())
+        with self._lock:
+            self._in_flight.pop(key, None)
+
+
+_dispatcher: SimulationDispatcher | None = None
+_dispatcher_lock = threading.Lock()
+
+
+def configure_simulation_dispatcher(*, max_workers: int | None = None) -> SimulationDispatcher:
+    """Replace the shared dispatcher, shutting the old one down; returns the new one."""
+    global _dispatcher
+    dispatcher = SimulationDispatcher(max_workers=max_workers)
+    with _dispatcher_lock:
+        previous, _dispatcher = _dispatcher, dispatcher
+    if previous is not None:
+        previous.shutdown()
+    return dispatcher
+
+
+def get_simulation_dispatcher() -> SimulationDispatcher:
+    """Return the shared dispatcher, sized from `PYQMC_API_WORKERS` on first use."""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            workers = os.environ.get(API_WORKERS_ENV)
+            _dispatcher = SimulationDispatcher(max_workers=int(workers) if workers else None)
+        return _dispatcher
@@ -0,0 +1,85 @@
+"""DMC application use-cases shared by API, GUI, and CLI layers."""
+
+from __future__ import annotations
+
+from pyqmc.application.cache import cached_simulation
+from pyqmc.core.config import SimulationConfig
+from pyqmc.core.progress import ProgressCallback
+from pyqmc.core.results import SimulationResult
+from pyqmc.dmc.solver import run_dmc_harmonic_oscillator
+
+
+def build_dmc_harmonic_oscillator_config(
+    *,
+    n_steps: int,
+    burn_in: int,
+    time_step: float,
+    alpha: float,
+    target_population: int,
+    initial_position: float,
+    seed: int | None,
+    workers: int = 1,
+) -> SimulationConfig:
+    """Map DMC primitive arguments onto a `SimulationConfig`."""
+    return SimulationConfig(
+        n_steps=int(n_steps),
+        burn_in=int(burn_in),
+        step_size=float(time_step),
+        alpha=float(alpha),
+        initial_position=float(initial_position),
+        seed=None if seed is None else int(seed),
+        backend="numpy",
+        n_walkers=int(target_population),
+        workers=int(workers),
+    )
+
+
+def dmc_cache_extra(config: SimulationConfig) -> dict[str, int]:
+    """Settings outside the config fingerprint that identify a DMC result.
+
+    Each DMC worker has its own random stream, so the worker count is part
+    of the result's identity.
+    """
+    return {"workers": config.workers}
+
+
+def run_dmc_harmonic_oscillator_use_case(
+    *,
+    n_steps: int,
+    burn_in: int,
+    time_step: float,
+    alpha: float,
+    target_population: int,
+    initial_position: float,
+    seed: int | None,
+    workers: int = 1,
+    use_cache: bool = True,
+    progress: ProgressCallback | None = None,
+) -> SimulationResult:
+    """Run importance-sampled DMC using transport-agnostic primitive arguments.
+
+    `n_steps` counts DMC time steps including the `burn_in` equilibration
+    steps; `alpha` selects the guiding trial function. `workers > 1` splits
+    the population over that many local processes. Seeded runs are served
+    from the shared result cache unless `use_cache` is False. `progress`
+    receives periodic snapshots while the run computes, or one final
+    snapshot on a cache hit.
+    """
+    config = build_dmc_harmonic_oscillator_config(
+        n_steps=n_steps,
+        burn_in=burn_in,
+        time_step=time_step,
+        alpha=alpha,
+        target_population=target_population,
+        initial_position=initial_position,
+        seed=seed,
+        workers=workers,
+    )
+    return cached_simulation(
+        "dmc_harmonic_oscillator",
+        config,
+        lambda: run_dmc_harmonic_oscillator(config, progress=progress),
+        extra=dmc_cache_extra(config),
+        use_cache=use_cache,
+        progress=progress,
+    )
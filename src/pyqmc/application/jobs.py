@@ -0,0 +1,333 @@
+"""Background simulation jobs on a bounded process pool.
+
+`JobManager` accepts simulation requests, runs them on a
+`ProcessPoolExecutor` and keeps each job's status, latest progress snapshot
+and result for polling. Admission control bounds the work it holds: at most
+`max_workers` jobs run and at most `max_queued` more wait; further
+submissions raise `JobQueueFull` until a slot frees up.
+
+Pool workers share two `multiprocessing.Manager` dicts with the manager:
+a running job writes its latest `ProgressSnapshot` to one and, between
+segments, checks the other for a cancel flag. A queued job is cancelled
+before it starts; a running one stops at its next segment boundary.
+
+Like `SimulationDispatcher`, the manager caches results in the parent: a
+seeded job already in the shared result cache finishes at submission
+without reaching the pool, and workers compute with `use_cache=False`.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from pyqmc.application.cache import (
+    completed_progress,
+    get_result_cache,
+    served_from_cache,
+    with_cache_status,
+)
+from pyqmc.application.dispatch import simulation_run_key
+from pyqmc.application.dmc import run_dmc_harmonic_oscillator_use_case
+from pyqmc.application.vmc import run_vmc_harmonic_oscillator_use_case
+from pyqmc.core.config import SimulationConfig
+from pyqmc.core.progress import ProgressSnapshot
+from pyqmc.core.results import SimulationResult
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+FINISHED_JOB_STATES = (JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED)
+
+DEFAULT_JOB_QUEUE_DEPTH = 16
+DEFAULT_FINISHED_JOBS = 256
+JOB_WORKERS_ENV = "PYQMC_JOB_WORKERS"
+JOB_QUEUE_DEPTH_ENV = "PYQMC_JOB_QUEUE_DEPTH"
+
+_JOB_RUNNERS: dict[str, Callable[..., SimulationResult]] = {
+    "vmc_harmonic_oscillator": run_vmc_harmonic_oscillator_use_case,
+    "dmc_harmonic_oscillator": run_dmc_harmonic_oscillator_use_case,
+}
+JOB_KINDS = tuple(_JOB_RUNNERS)
+
+
+class JobQueueFull(RuntimeError):
+    """Raised when a submission would exceed the job queue depth."""
+
+
+class JobCancelled(Exception):
+    """Raised inside a pool worker to stop a job whose cancellation was requested."""
+
+
+def _run_job(
+    job_id: str,
+    kind: str,
+    arguments: dict[str, Any],
+    progress: Any,
+    cancelled: Any,
+) -> SimulationResult:
+    """Run one job in a pool worker; `progress`/`cancelled` are shared dicts.
+
+    The parent does the caching, so the use-case runs with `use_cache=False`.
+    """
+    if job_id in cancelled:
+        raise JobCancelled(job_id)
+    started_at = time.time()
+    progress[job_id] = {"started_at": started_at, "snapshot": None}
+
+    def report(snapshot: ProgressSnapshot) -> None:
+        if job_id in cancelled:
+            raise JobCancelled(job_id)
+        progress[job_id] = {"started_at": started_at, "snapshot": snapshot.to_dict()}
+
+    return _JOB_RUNNERS[kind](**{**arguments, "use_cache": False}, progress=report)
+
+
+def _job_run_key(
+    kind: str, arguments: dict[str, Any]
+) -> tuple[SimulationConfig | None, str | None]:
+    """Return the config and cache key of a job, or `(None, None)` if it has none.
+
+    Arguments that do not build a config (invalid values, or use-case-only
+    settings such as `checkpoint_path`) leave the job uncached; the worker
+    then reports the error or writes the files.
+    """
+    try:
+        return simulation_run_key(kind, arguments)
+    except (TypeError, ValueError):
+        return None, None
+
+
+@dataclass
+class Job:
+    """Status of one submitted job as seen by its `JobManager`."""
+
+    id: str
+    kind: str
+    arguments: dict[str, Any]
+    status: str = JOB_QUEUED
+    submitted_at: float = 0.0
+    started_at: float | None = None
+    finished_at: float | None = None
+    cancel_requested: bool = False
+    progress: dict[str, Any] | None = None
+    result: dict[str, Any] | None = None
+    error: str | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_JOB_STATES
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "arguments": dict(self.arguments),
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "cancel_requested": self.cancel_requested,
+            "progress": None if self.progress is None else dict(self.progress),
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class JobManager:
+    """Runs simulation jobs in the background; safe across threads.
+
+    The pool and the shared dicts are created on the first submission, so an
+    idle manager costs nothing. Finished jobs are kept for polling, up to
+    `max_finished` of them (oldest dropped first). Call `shutdown` to cancel
+    outstanding work and stop the worker processes.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        max_queued: int = DEFAULT_JOB_QUEUE_DEPTH,
+        max_finished: int = DEFAULT_FINISHED_JOBS,
+    ) -> None:
+        max_workers = max_workers or os.cpu_count() or 1
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        if max_queued < 0:
+            raise ValueError("max_queued cannot be negative")
+        if max_finished <= 0:
+            raise ValueError("max_finished must be positive")
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.max_finished = max_finished
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._futures: dict[str, Future] = {}
+        self._cache_keys: dict[str, str | None] = {}
+        # Future callbacks may run synchronously while the lock is held.
+        self._lock = threading.RLock()
+        self._pool: ProcessPoolExecutor | None = None
+        self._sync: Any = None
+        self._progress: Any = None
+        self._cancelled: Any = None
+
+    @property
+    def capacity(self) -> int:
+        """Most jobs that may be queued or running at once."""
+        return self.max_workers + self.max_queued
+
+    def submit(self, kind: str, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Queue a job and return its initial status.
+
+        A seeded job whose result is cached succeeds at once, even when the
+        queue is full. Raises `ValueError` for an unknown `kind` and
+        `JobQueueFull` when `capacity` jobs are already queued or running.
+        """
+        if kind not in _JOB_RUNNERS:
+            raise ValueError(f"unknown job kind {kind!r}; expected one of {JOB_KINDS}")
+        config, key = _job_run_key(kind, arguments)
+        cache = get_result_cache()
+        with self._lock:
+            job = Job(
+                id=uuid.uuid4().hex,
+                kind=kind,
+                arguments=dict(arguments),
+                submitted_at=time.time(),
+            )
+            cached = None if key is None else cache.get(key)
+            if cached is not None:
+                job.status = JOB_SUCCEEDED
+                job.started_at = job.finished_at = job.submitted_at
+                result = served_from_cache(cached, config)
+                job.progress = completed_progress(result, config).to_dict()
+                job.result = result.to_dict()
+                self._jobs[job.id] = job
+                self._evict_finished()
+                return job.to_dict()
+
+            active = sum(1 for other in self._jobs.values() if not other.finished)
+            if active >= self.capacity:
+                raise JobQueueFull(f"job queue is full ({active} jobs active); retry later")
+            if key is None:
+                cache.record_bypass()
+            self._start()
+            self._jobs[job.id] = job
+            future = self._pool.submit(
+                _run_job, job.id, kind, job.arguments, self._progress, self._cancelled
+            )
+            self._futures[job.id] = future
+            self._cache_keys[job.id] = key
+            future.add_done_callback(lambda done, job_id=job.id: self._finish(job_id, done))
+            return self._refresh(job).to_dict()
+
+    def get(self, job_id: str) -> dict[str, Any]:
+        """Return the current status of a job; raises `KeyError` if unknown."""
+        with self._lock:
+            return self._refresh(self._jobs[job_id]).to_dict()
+
+    def list_jobs(self) -> list[dict[str, Any]]:
+        """Status of every retained job, oldest submission first."""
+        with self._lock:
+            return [self._refresh(job).to_dict() for job in self._jobs.values()]
+
+    def cancel(self, job_id: str) -> dict[str, Any]:
+        """Request cancellation of a job and return its status.
+
+        Queued jobs are cancelled at once; running jobs stop at their next
+        progress segment. Cancelling a finished job changes nothing.
+        Raises `KeyError` if the job is unknown.
+        """
+        with self._lock:
+            job = self._jobs[job_id]
+            if job.finished:
+                return job.to_dict()
+            job.cancel_requested = True
+            if not self._futures[job_id].cancel():
+                self._cancelled[job_id] = True
+            return self._refresh(job).to_dict()
+
+    def shutdown(self) -> None:
+        """Cancel outstanding jobs, then wait for the workers to exit."""
+        with self._lock:
+            pool, sync = self._pool, self._sync
+            if pool is None:
+                return
+            for job_id, job in self._jobs.items():
+                if not job.finished:
+                    job.cancel_requested = True
+                    if not self._futures[job_id].cancel():
+                        self._cancelled[job_id] = True
+        pool.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            self._pool = self._sync = self._progress = self._cancelled = None
+        sync.shutdown()
+
+    def _start(self) -> None:
+        if self._pool is not None:
+            return
+        self._sync = multiprocessing.Manager()
+        self._progress = self._sync.dict()
+        self._cancelled = self._sync.dict()
+        self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def _refresh(self, job: Job) -> Job:
+        """Pull a running job's latest progress from the shared dict."""
+        if job.finished or self._progress is None:
+            return job
+        shared = self._progress.get(job.id)
+        if shared is not None:
+            job.status = JOB_RUNNING
+            job.started_at = shared["started_at"]
+            job.progress = shared["snapshot"]
+        return job
+
+    def _finish(self, job_id: str, future: Future) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            if self._progress is not None:
+                self._refresh(job)
+                self._progress.pop(job_id, None)
+                self._cancelled.pop(job_id, None)
+            self._futures.pop(job_id, None)
+            key = self._cache_keys.pop(job_id, None)
+            job.finished_at = time.time()
+            if future.cancelled():
+                job.status = JOB_CANCELLED
+            elif isinstance(future.exception(), JobCancelled):
+                job.status = JOB_CANCELLED
+            elif future.exception() is not None:
+                job.status = JOB_FAILED
+                job.error = str(future.exception()) or type(future.exception()).__name__
+            else:
+                job.status = JOB_SUCCEEDED
+                result = future.result()
+                if key is not None:
+                    get_result_cache().put(key, result)
+                status = "bypass" if key is None else "miss"
+                job.result = with_cache_status(result, status).to_dict()
+            self._evict_finished()
+
+    def _evict_finished(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+
+def create_job_manager() -> JobManager:
+    """Build a manager sized from `PYQMC_JOB_WORKERS` and `PYQMC_JOB_QUEUE_DEPTH`."""
+    workers = os.environ.get(JOB_WORKERS_ENV)
+    return JobManager(
+        max_workers=int(workers) if workers else None,
+        max_queued=int(os.environ.get(JOB_QUEUE_DEPTH_ENV, DEFAULT_JOB_QUEUE_DEPTH)),
+    )
@@ -2,13 +2,44 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from pathlib import Path
+
+from pyqmc.application.cache import cached_simulation
+from pyqmc.benchmarks.particle_moves import (
+    DEFAULT_PARTICLE_COUNTS,
+    ParticleMoveScalingResult,
+    run_particle_move_scaling_benchmark,
+)
+from pyqmc.benchmarks.proposal_kernels import (
+    KernelBenchmarkResult,
+    run_proposal_kernel_benchmark,
+)
 from pyqmc.benchmarks.vmc_harmonic_oscillator import (
     BenchmarkSuiteResult,
     run_vmc_harmonic_oscillator_benchmarks,
 )
-from pyqmc.core.results import SimulationResult
-from pyqmc.core.vmc_input import build_vmc_harmonic_oscillator_config
-from pyqmc.vmc.solver import run_vmc_harmonic_oscillator
+from pyqmc.core.checkpoint import DEFAULT_CHECKPOINT_SECONDS, CheckpointPolicy
+from pyqmc.core.progress import ProgressCallback
+from pyqmc.core.results import AlphaSweepResult, OptimizationResult, SimulationResult
+from pyqmc.core.vmc_input import (
+    DEFAULT_VMC_BACKEND,
+    DEFAULT_VMC_MAX_SECONDS,
+    DEFAULT_VMC_N_CHAINS,
+    DEFAULT_VMC_N_WALKERS,
+    DEFAULT_VMC_PROPOSAL,
+    DEFAULT_VMC_TARGET_ACCEPTANCE,
+    DEFAULT_VMC_TARGET_STANDARD_ERROR,
+    DEFAULT_VMC_TUNE_STEP_SIZE,
+    DEFAULT_VMC_WORKERS,
+    build_vmc_harmonic_oscillator_config,
+)
+from pyqmc.vmc.solver import (
+    run_vmc_fermion_trap,
+    run_vmc_harmonic_oscillator,
+    run_vmc_harmonic_oscillator_alpha_sweep,
+    run_vmc_harmonic_oscillator_optimization,
+)
 
 
 def run_vmc_harmonic_oscillator_use_case(
@@ -19,11 +50,193 @@ def run_vmc_harmonic_oscillator_use_case(
     alpha: float,
     initial_position: float,
     seed: int | None,
+    backend: str = DEFAULT_VMC_BACKEND,
+    n_walkers: int = DEFAULT_VMC_N_WALKERS,
+    n_chains: int = DEFAULT_VMC_N_CHAINS,
+    workers: int = DEFAULT_VMC_WORKERS,
+    target_standard_error: float | None = DEFAULT_VMC_TARGET_STANDARD_ERROR,
+    max_seconds: float | None = DEFAULT_VMC_MAX_SECONDS,
+    tune_step_size: bool = DEFAULT_VMC_TUNE_STEP_SIZE,
+    target_acceptance: float = DEFAULT_VMC_TARGET_ACCEPTANCE,
+    proposal: str = DEFAULT_VMC_PROPOSAL,
+    checkpoint_path: str | None = None,
+    checkpoint_every: int | None = None,
+    checkpoint_seconds: float | None = DEFAULT_CHECKPOINT_SECONDS,
+    resume: bool = False,
+    trace_out: str | None = None,
+    use_cache: bool = True,
+    progress: ProgressCallback | None = None,
 ) -> SimulationResult:
     """Run one VMC simulation using transport-agnostic primitive arguments.
 
     Transport layers (HTTP, GUI bridge, CLI) should pass plain values here,
     allowing backend evolution without coupling to transport-specific schemas.
+
+    With `target_standard_error` set, `n_steps` becomes the per-chain step cap
+    and the run stops once the blocked error bar reaches the target (or the
+    optional `max_seconds` budget runs out). With `tune_step_size`, the
+    burn-in adapts `step_size` toward `target_acceptance`; the tuned width is
+    reported as `metadata["tuned_step_size"]`.
+
+    With `checkpoint_path`, the run state is saved every `checkpoint_every`
+    steps per chain or `checkpoint_seconds` of wall time, and at the end.
+    `resume` continues from that file when it exists and gives exactly the
+    result of an uninterrupted run with the same settings. `trace_out`
+    names a directory that receives every kept sample as memory-mapped
+    `.npy` arrays (requires NumPy).
+
+    Seeded runs are served from the shared result cache
+    (`pyqmc.application.cache`) unless `use_cache` is False; runs that write
+    checkpoints or traces always compute. `progress` receives periodic
+    `pyqmc.core.progress.ProgressSnapshot`s while the run computes, or one
+    final snapshot when the result comes from the cache.
+    """
+    config = build_vmc_harmonic_oscillator_config(
+        n_steps=n_steps,
+        burn_in=burn_in,
+        step_size=step_size,
+        alpha=alpha,
+        initial_position=initial_position,
+        seed=seed,
+        backend=backend,
+        n_walkers=n_walkers,
+        n_chains=n_chains,
+        workers=workers,
+        target_standard_error=target_standard_error,
+        max_seconds=max_seconds,
+        tune_step_size=tune_step_size,
+        target_acceptance=target_acceptance,
+        proposal=proposal,
+    )
+    checkpoint = None
+    if checkpoint_path is not None:
+        checkpoint = CheckpointPolicy(
+            path=Path(checkpoint_path),
+            every_steps=None if checkpoint_every is None else int(checkpoint_every),
+            every_seconds=None if checkpoint_seconds is None else float(checkpoint_seconds),
+            resume=bool(resume),
+        )
+    elif resume:
+        raise ValueError("resume requires a checkpoint path")
+    return cached_simulation(
+        "vmc_harmonic_oscillator",
+        config,
+        lambda: run_vmc_harmonic_oscillator(
+            config,
+            checkpoint=checkpoint,
+            trace_out=None if trace_out is None else Path(trace_out),
+            progress=progress,
+        ),
+        use_cache=use_cache and checkpoint is None and trace_out is None,
+        progress=progress,
+    )
+
+
+def run_vmc_fermion_trap_use_case(
+    *,
+    n_up: int,
+    n_down: int,
+    frequencies: Sequence[float],
+    n_steps: int,
+    burn_in: int,
+    step_size: float,
+    alpha: float,
+    seed: int | None,
+    n_walkers: int = DEFAULT_VMC_N_WALKERS,
+    tune_step_size: bool = DEFAULT_VMC_TUNE_STEP_SIZE,
+    target_acceptance: float = DEFAULT_VMC_TARGET_ACCEPTANCE,
+    use_cache: bool = True,
+) -> SimulationResult:
+    """Run particle-by-particle VMC for fermions in a harmonic trap (requires NumPy).
+
+    `n_steps` and `burn_in` count sweeps over every particle. Seeded runs are
+    cached like the harmonic-oscillator runs, keyed on the particle numbers
+    and frequencies as well as the sampler settings.
+    """
+    config = build_vmc_harmonic_oscillator_config(
+        n_steps=n_steps,
+        burn_in=burn_in,
+        step_size=step_size,
+        alpha=alpha,
+        initial_position=0.0,
+        seed=seed,
+        backend="numpy",
+        n_walkers=n_walkers,
+        tune_step_size=tune_step_size,
+        target_acceptance=target_acceptance,
+    )
+    frequencies = [float(omega) for omega in frequencies]
+    return cached_simulation(
+        "vmc_fermion_trap",
+        config,
+        lambda: run_vmc_fermion_trap(
+            config, n_up=n_up, n_down=n_down, frequencies=frequencies
+        ),
+        extra={"n_up": int(n_up), "n_down": int(n_down), "frequencies": frequencies},
+        use_cache=use_cache,
+    )
+
+
+def run_vmc_harmonic_oscillator_alpha_sweep_use_case(
+    *,
+    alphas: Sequence[float],
+    n_steps: int,
+    burn_in: int,
+    step_size: float,
+    alpha: float,
+    initial_position: float,
+    seed: int | None,
+    backend: str = DEFAULT_VMC_BACKEND,
+    n_walkers: int = DEFAULT_VMC_N_WALKERS,
+    n_chains: int = DEFAULT_VMC_N_CHAINS,
+    workers: int = DEFAULT_VMC_WORKERS,
+    tune_step_size: bool = DEFAULT_VMC_TUNE_STEP_SIZE,
+    target_acceptance: float = DEFAULT_VMC_TARGET_ACCEPTANCE,
+    proposal: str = DEFAULT_VMC_PROPOSAL,
+) -> AlphaSweepResult:
+    """Estimate E(alpha) over `alphas` from one sample set drawn at `alpha`.
+
+    `alpha` is the reference parameter that is actually sampled; every grid
+    value is obtained by correlated-sampling reweighting. Requires NumPy.
+    """
+    config = build_vmc_harmonic_oscillator_config(
+        n_steps=n_steps,
+        burn_in=burn_in,
+        step_size=step_size,
+        alpha=alpha,
+        initial_position=initial_position,
+        seed=seed,
+        backend=backend,
+        n_walkers=n_walkers,
+        n_chains=n_chains,
+        workers=workers,
+        tune_step_size=tune_step_size,
+        target_acceptance=target_acceptance,
+        proposal=proposal,
+    )
+    return run_vmc_harmonic_oscillator_alpha_sweep(config, list(alphas))
+
+
+def run_vmc_harmonic_oscillator_optimization_use_case(
+    *,
+    method: str,
+    n_iterations: int,
+    learning_rate: float,
+    n_steps: int,
+    burn_in: int,
+    step_size: float,
+    alpha: float,
+    initial_position: float,
+    seed: int | None,
+    n_walkers: int,
+    tune_step_size: bool = DEFAULT_VMC_TUNE_STEP_SIZE,
+    target_acceptance: float = DEFAULT_VMC_TARGET_ACCEPTANCE,
+    proposal: str = DEFAULT_VMC_PROPOSAL,
+) -> OptimizationResult:
+    """Optimize `alpha` with the linear method or SR on the NumPy backend.
+
+    `alpha` is the starting point and `n_steps - burn_in` the sweeps sampled
+    per iteration; only the first iteration burns in.
     """
     config = build_vmc_harmonic_oscillator_config(
         n_steps=n_steps,
@@ -32,8 +245,18 @@ def run_vmc_harmonic_oscillator_use_case(
         alpha=alpha,
         initial_position=initial_position,
         seed=seed,
+        backend="numpy",
+        n_walkers=n_walkers,
+        tune_step_size=tune_step_size,
+        target_acceptance=target_acceptance,
+        proposal=proposal,
+    )
+    return run_vmc_harmonic_oscillator_optimization(
+        config,
+        method=method,
+        n_iterations=n_iterations,
+        learning_rate=learning_rate,
     )
-    return run_vmc_harmonic_oscillator(config)
 
 
 def run_vmc_harmonic_oscillator_benchmark_use_case(
@@ -43,6 +266,8 @@ def run_vmc_harmonic_oscillator_benchmark_use_case(
     step_size: float,
     initial_position: float,
     seed: int | None,
+    backend: str = DEFAULT_VMC_BACKEND,
+    n_walkers: int = DEFAULT_VMC_N_WALKERS,
 ) -> BenchmarkSuiteResult:
     """Run benchmark suite with transport-agnostic primitive arguments."""
     return run_vmc_harmonic_oscillator_benchmarks(
@@ -51,4 +276,40 @@ def run_vmc_harmonic_oscillator_benchmark_use_case(
         step_size=step_size,
         initial_position=initial_position,
         seed=seed,
+        backend=backend,
+        n_walkers=n_walkers,
+    )
+
+
+def run_proposal_kernel_benchmark_use_case(
+    *,
+    n_steps: int,
+    burn_in: int,
+    alpha: float,
+    seed: int | None,
+    backend: str = DEFAULT_VMC_BACKEND,
+    n_walkers: int = DEFAULT_VMC_N_WALKERS,
+) -> KernelBenchmarkResult:
+    """Compare tau_int per step of the proposal kernels over a step-size scan."""
+    return run_proposal_kernel_benchmark(
+        n_steps=n_steps,
+        burn_in=burn_in,
+        alpha=alpha,
+        seed=seed,
+        backend=backend,
+        n_walkers=n_walkers,
+    )
+
+
+def run_particle_move_benchmark_use_case(
+    *,
+    particle_counts: Sequence[int] = DEFAULT_PARTICLE_COUNTS,
+    n_sweeps: int = 3,
+    seed: int | None = 12345,
+) -> ParticleMoveScalingResult:
+    """Time incremental against full pair, Jastrow and determinant updates per sweep."""
+    return run_particle_move_scaling_benchmark(
+        particle_counts=tuple(particle_counts),
+        n_sweeps=n_sweeps,
+        seed=seed,
     )
@@ -1,5 +1,18 @@
 """Benchmark suite for validating numerical correctness."""
 
+from .particle_moves import run_particle_move_scaling_benchmark
+from .proposal_kernels import run_proposal_kernel_benchmark
+from .vmc_atoms import run_vmc_helium_benchmarks, run_vmc_hydrogen_benchmarks
+from .vmc_fermion_trap import run_vmc_fermion_trap_benchmarks
 from .vmc_harmonic_oscillator import run_vmc_harmonic_oscillator_benchmarks
+from .vmc_harmonic_trap import run_vmc_harmonic_trap_benchmarks
 
-__all__ = ["run_vmc_harmonic_oscillator_benchmarks"]
+__all__ = [
+    "run_particle_move_scaling_benchmark",
+    "run_proposal_kernel_benchmark",
+    "run_vmc_fermion_trap_benchmarks",
+    "run_vmc_helium_benchmarks",
+    "run_vmc_harmonic_oscillator_benchmarks",
+    "run_vmc_harmonic_trap_benchmarks",
+    "run_vmc_hydrogen_benchmarks",
+]
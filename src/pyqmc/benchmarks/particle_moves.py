@@ -0,0 +1,189 @@
+"""Scaling benchmark for single-particle moves with cached pair terms.
+
+A sweep moves each of the N particles once. Keeping pair distances in a
+`PairDistanceTable` makes a move cost O(N) (one new row), so a sweep costs
+O(N^2); rebuilding every pair after each move costs O(N^2) per move and
+O(N^3) per sweep. The benchmark times both strategies over a range of N and
+fits the exponent of `seconds_per_sweep ~ N^k` on a log-log scale.
+
+The Jastrow modes time the same comparison one level up: a sweep of
+wavefunction ratios for interacting trapped particles, through the
+`InteractingSystem` hooks (O(N) per move) and through `FullEvaluationMoves`,
+which re-evaluates `ln psi_T` over all pairs for every move. The Slater
+modes do the same for trapped fermions, where a move costs O(N) for the
+ratio plus O(N^2) for the Sherman-Morrison update, against an O(N^3)
+determinant per move under full re-evaluation.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any
+
+PAIR_TABLE_INCREMENTAL = "pair_table_incremental"
+PAIR_TABLE_REBUILD = "pair_table_rebuild"
+JASTROW_INCREMENTAL = "jastrow_incremental"
+JASTROW_FULL_EVALUATION = "jastrow_full_evaluation"
+SLATER_SHERMAN_MORRISON = "slater_sherman_morrison"
+SLATER_FULL_EVALUATION = "slater_full_evaluation"
+DEFAULT_PARTICLE_COUNTS = (16, 32, 64, 128)
+# Trap width and Pade range of the timed Jastrow wavefunction.
+_JASTROW_PARAMETERS = (1.0, 0.5)
+
+
+@dataclass(frozen=True)
+class ParticleMoveScalingPoint:
+    """Cost of one sweep for one update strategy and particle count."""
+
+    mode: str
+    n_particles: int
+    seconds_per_sweep: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "n_particles": self.n_particles,
+            "seconds_per_sweep": self.seconds_per_sweep,
+        }
+
+
+@dataclass(frozen=True)
+class ParticleMoveScalingResult:
+    """All timings plus the fitted scaling exponent of each strategy."""
+
+    points: list[ParticleMoveScalingPoint] = field(default_factory=list)
+
+    @property
+    def modes(self) -> list[str]:
+        return list(dict.fromkeys(point.mode for point in self.points))
+
+    def exponent(self, mode: str) -> float:
+        """Least-squares slope of log(seconds_per_sweep) against log(N)."""
+        samples = [
+            (math.log(point.n_particles), math.log(point.seconds_per_sweep))
+            for point in self.points
+            if point.mode == mode
+        ]
+        if len(samples) < 2:
+            raise ValueError(f"need at least two particle counts for mode: {mode}")
+        mean_x = sum(x for x, _ in samples) / len(samples)
+        mean_y = sum(y for _, y in samples) / len(samples)
+        covariance = sum((x - mean_x) * (y - mean_y) for x, y in samples)
+        variance = sum((x - mean_x) ** 2 for x, _ in samples)
+        return covariance / variance
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "points": [point.to_dict() for point in self.points],
+            "exponents": {mode: self.exponent(mode) for mode in self.modes},
+        }
+
+    def to_pretty_text(self) -> str:
+        lines = ["Particle-move sweep scaling (seconds per sweep ~ N^k)"]
+        for mode in self.modes:
+            timings = ", ".join(
+                f"N={point.n_particles}: {point.seconds_per_sweep:.3e}s"
+                for point in self.points
+                if point.mode == mode
+            )
+            lines.append(f" - {mode}: k={self.exponent(mode):.2f} ({timings})")
+        return "\n".join(lines)
+
+
+def _time_sweeps(run_sweep: Any, n_sweeps: int, repeats: int) -> float:
+    """Best-of-`repeats` wall time per sweep, which filters scheduler noise."""
+    best = math.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(n_sweeps):
+            run_sweep()
+        best = min(best, (time.perf_counter() - start) / n_sweeps)
+    return best
+
+
+def run_particle_move_scaling_benchmark(
+    particle_counts: tuple[int, ...] = DEFAULT_PARTICLE_COUNTS,
+    n_sweeps: int = 3,
+    repeats: int = 3,
+    step_size: float = 0.5,
+    seed: int | None = 12345,
+) -> ParticleMoveScalingResult:
+    """Time pair-table, Jastrow and determinant updates per sweep, incremental vs full.
+
+    All strategies see the same particles and moves, and every move is
+    accepted, which is the worst case for the incremental table. Requires
+    NumPy.
+    """
+    try:
+        import numpy as np
+
+        from pyqmc.vmc.interacting import fermion_trap, interacting_trap
+        from pyqmc.vmc.pair_distances import PairDistanceTable
+        from pyqmc.vmc.particle_metropolis import FullEvaluationMoves
+    except ModuleNotFoundError as exc:
+        raise RuntimeError(
+            "The particle-move benchmark requires NumPy. Install with: pip install -e '.[numpy]'"
+        ) from exc
+
+    if len(particle_counts) < 2:
+        raise ValueError("particle_counts needs at least two entries")
+    if n_sweeps <= 0 or repeats <= 0:
+        raise ValueError("n_sweeps and repeats must be positive")
+
+    rng = np.random.default_rng(seed)
+    points: list[ParticleMoveScalingPoint] = []
+    for n_particles in particle_counts:
+        start = rng.normal(size=(n_particles, 3))
+        moves = rng.uniform(-step_size, step_size, size=(n_particles, 3))
+        incremental = PairDistanceTable(start)
+        rebuilt = PairDistanceTable(start)
+
+        def incremental_sweep(table: Any = incremental, moves: Any = moves) -> None:
+            for i, move in enumerate(moves):
+                new_position = table.positions[i] + move
+                table.accept(i, new_position, table.trial_row(i, new_position))
+
+        def rebuild_sweep(table: Any = rebuilt, moves: Any = moves) -> None:
+            for i, move in enumerate(moves):
+                table.positions[i] += move
+                table.rebuild()
+
+        system = interacting_trap(n_particles)
+        full = FullEvaluationMoves(system, n_particles, system.n_axes)
+        incremental_hooks, full_hooks = (
+            (hooks, hooks.particle_configuration(start, _JASTROW_PARAMETERS))
+            for hooks in (system, full)
+        )
+        fermions = fermion_trap(n_particles // 2, n_particles - n_particles // 2)
+        fermions_full = FullEvaluationMoves(fermions, n_particles, fermions.n_axes)
+        slater_hooks, slater_full_hooks = (
+            (hooks, hooks.particle_configuration(start, 1.0))
+            for hooks in (fermions, fermions_full)
+        )
+
+        def ratio_sweep(hooks: Any, configuration: Any, moves: Any = moves) -> None:
+            for i, move in enumerate(moves):
+                new_position = configuration.positions[i] + move
+                hooks.ratio(configuration, i, new_position)
+                hooks.accept_move(configuration, i, new_position)
+
+        for mode, sweep in (
+            (PAIR_TABLE_INCREMENTAL, incremental_sweep),
+            (PAIR_TABLE_REBUILD, rebuild_sweep),
+            (JASTROW_INCREMENTAL, partial(ratio_sweep, *incremental_hooks)),
+            (JASTROW_FULL_EVALUATION, partial(ratio_sweep, *full_hooks)),
+            (SLATER_SHERMAN_MORRISON, partial(ratio_sweep, *slater_hooks)),
+            (SLATER_FULL_EVALUATION, partial(ratio_sweep, *slater_full_hooks)),
+        ):
+            points.append(
+                ParticleMoveScalingPoint(
+                    mode=mode,
+                    n_particles=n_particles,
+                    seconds_per_sweep=_time_sweeps(sweep, n_sweeps, repeats),
+                )
+            )
+
+    return ParticleMoveScalingResult(points=points)
@@ -0,0 +1,145 @@
+"""Efficiency benchmark comparing Metropolis proposal kernels.
+
+Each kernel is run over a small grid of step sizes on the 1D harmonic
+oscillator, and its best integrated autocorrelation time per step is
+reported. Comparing kernels at their own best step size keeps the comparison
+independent of any particular tuning target.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from pyqmc.core.config import PROPOSAL_KERNELS, SimulationConfig
+from pyqmc.vmc.solver import run_vmc_harmonic_oscillator
+
+DEFAULT_KERNEL_STEP_SIZES: dict[str, tuple[float, ...]] = {
+    "uniform": (1.0, 1.5, 2.0, 2.5, 3.0, 3.5),
+    "langevin": (0.4, 0.6, 0.8, 1.0, 1.2, 1.5),
+}
+
+
+@dataclass(frozen=True)
+class KernelBenchmarkPoint:
+    """Efficiency of one kernel at one step size."""
+
+    kernel: str
+    step_size: float
+    acceptance_ratio: float
+    integrated_autocorrelation_time: float
+    effective_samples_per_cpu_second: float | None
+    mean_energy: float
+    standard_error: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "kernel": self.kernel,
+            "step_size": self.step_size,
+            "acceptance_ratio": self.acceptance_ratio,
+            "integrated_autocorrelation_time": self.integrated_autocorrelation_time,
+            "effective_samples_per_cpu_second": self.effective_samples_per_cpu_second,
+            "mean_energy": self.mean_energy,
+            "standard_error": self.standard_error,
+        }
+
+
+@dataclass(frozen=True)
+class KernelBenchmarkResult:
+    """All scan points plus the best point of each kernel."""
+
+    system: str
+    alpha: float
+    points: list[KernelBenchmarkPoint] = field(default_factory=list)
+
+    def best(self, kernel: str) -> KernelBenchmarkPoint:
+        """Return the point with the smallest tau_int for `kernel`."""
+        candidates = [point for point in self.points if point.kernel == kernel]
+        if not candidates:
+            raise ValueError(f"no benchmark points for kernel: {kernel}")
+        return min(candidates, key=lambda point: point.integrated_autocorrelation_time)
+
+    @property
+    def tau_int_reduction(self) -> float:
+        """Best uniform tau_int divided by best langevin tau_int."""
+        return (
+            self.best("uniform").integrated_autocorrelation_time
+            / self.best("langevin").integrated_autocorrelation_time
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        kernels = sorted({point.kernel for point in self.points})
+        return {
+            "system": self.system,
+            "alpha": self.alpha,
+            "tau_int_reduction": self.tau_int_reduction,
+            "best": {kernel: self.best(kernel).to_dict() for kernel in kernels},
+            "points": [point.to_dict() for point in self.points],
+        }
+
+    def to_pretty_text(self) -> str:
+        lines = [
+            "Proposal kernel benchmark",
+            f"System: {self.system} (alpha={self.alpha})",
+        ]
+        for point in self.points:
+            lines.append(
+                f" - {point.kernel:<8} step={point.step_size:<5g} "
+                f"acc={point.acceptance_ratio:.3f} "
+                f"tau_int={point.integrated_autocorrelation_time:.3f}"
+            )
+        lines.append(f"tau_int reduction (uniform / langevin): {self.tau_int_reduction:.2f}x")
+        return "\n".join(lines)
+
+
+def run_proposal_kernel_benchmark(
+    n_steps: int = 50_000,
+    burn_in: int = 2_000,
+    alpha: float = 0.8,
+    seed: int | None = 12345,
+    backend: str = "python",
+    n_walkers: int = 1,
+    step_sizes: dict[str, tuple[float, ...]] | None = None,
+) -> KernelBenchmarkResult:
+    """Scan step sizes for every proposal kernel and collect tau_int per step.
+
+    `step_sizes` overrides the scan grid per kernel; kernels it leaves out use
+    `DEFAULT_KERNEL_STEP_SIZES`.
+    """
+    overrides = step_sizes or {}
+    unknown = sorted(set(overrides) - set(PROPOSAL_KERNELS))
+    if unknown:
+        raise ValueError(f"unknown proposal kernels in step_sizes: {', '.join(unknown)}")
+    grid = {**DEFAULT_KERNEL_STEP_SIZES, **overrides}
+    points: list[KernelBenchmarkPoint] = []
+
+    for kernel in PROPOSAL_KERNELS:
+        for step_size in grid[kernel]:
+            config = SimulationConfig(
+                n_steps=n_steps,
+                burn_in=burn_in,
+                step_size=step_size,
+                alpha=alpha,
+                seed=seed,
+                backend=backend,
+                n_walkers=n_walkers,
+                proposal=kernel,
+            )
+            result = run_vmc_harmonic_oscillator(config)
+            points.append(
+                KernelBenchmarkPoint(
+                    kernel=kernel,
+                    step_size=step_size,
+                    acceptance_ratio=result.acceptance_ratio,
+                    integrated_autocorrelation_time=result.metadata[
+                        "integrated_autocorrelation_time"
+                    ],
+                    effective_samples_per_cpu_second=result.metadata[
+                        "effective_samples_per_cpu_second"
+                    ],
+                    mean_energy=result.mean_energy,
+                    standard_error=result.standard_error,
+                )
+            )
+
+    return KernelBenchmarkResult(system="harmonic_oscillator_1d", alpha=alpha, points=points)
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import itertools
+from collections.abc import Sequence
+
 
 def harmonic_oscillator_exact_ground_state_energy() -> float:
     """Return exact E0 for 1D harmonic oscillator in units hbar = m = omega = 1."""
@@ -20,3 +23,127 @@ def harmonic_oscillator_variational_energy(alpha: float) -> float:
     if alpha <= 0:
         raise ValueError("alpha must be positive")
     return 0.25 * (alpha + 1.0 / alpha)
+
+
+def harmonic_trap_exact_ground_state_energy(
+    n_particles: int,
+    frequencies: Sequence[float],
+) -> float:
+    """Return exact E0 = N/2 * sum_d omega_d for particles in a harmonic trap."""
+    if n_particles <= 0:
+        raise ValueError("n_particles must be positive")
+    return 0.5 * n_particles * sum(frequencies)
+
+
+def harmonic_trap_variational_energy(
+    alpha: float,
+    n_particles: int,
+    frequencies: Sequence[float],
+) -> float:
+    """Return the variational energy of the scaled-Gaussian trap trial function.
+
+    Every particle and axis contributes the 1D result scaled by its frequency:
+
+        E(alpha) = N/4 * (alpha + 1/alpha) * sum_d omega_d
+    """
+    if alpha <= 0:
+        raise ValueError("alpha must be positive")
+    return 0.5 * (alpha + 1.0 / alpha) * harmonic_trap_exact_ground_state_energy(
+        n_particles, frequencies
+    )
+
+
+def _lowest_trap_level_energies(n_levels: int, frequencies: Sequence[float]) -> list[float]:
+    """Return the `n_levels` lowest single-particle energies sum_d (n_d + 1/2) omega_d."""
+    if n_levels == 0:
+        return []
+    # A filled level never needs a quantum number above n_levels - 1 on any axis.
+    energies = sorted(
+        sum((n + 0.5) * omega for n, omega in zip(level, frequencies, strict=True))
+        for level in itertools.product(range(n_levels), repeat=len(frequencies))
+    )
+    return energies[:n_levels]
+
+
+def fermion_trap_exact_ground_state_energy(
+    n_up: int,
+    n_down: int,
+    frequencies: Sequence[float],
+) -> float:
+    """Return exact E0 of non-interacting spin-1/2 fermions in a harmonic trap.
+
+    Each spin species fills its `n_up` or `n_down` lowest levels, whose
+    energies are sum_d (n_d + 1/2) omega_d.
+    """
+    if n_up < 0 or n_down < 0 or n_up + n_down == 0:
+        raise ValueError("n_up and n_down must be non-negative with at least one particle")
+    return sum(_lowest_trap_level_energies(n_up, frequencies)) + sum(
+        _lowest_trap_level_energies(n_down, frequencies)
+    )
+
+
+def fermion_trap_variational_energy(
+    alpha: float,
+    n_up: int,
+    n_down: int,
+    frequencies: Sequence[float],
+) -> float:
+    """Return the variational energy of the scaled Slater-determinant trial function.
+
+    Scaling the Gaussian by alpha gives the exact state of a trap with
+    frequencies alpha * omega_d, so every filled level contributes
+    (alpha + 1/alpha) / 2 times its exact energy:
+
+        E(alpha) = 1/2 * (alpha + 1/alpha) * E0
+    """
+    if alpha <= 0:
+        raise ValueError("alpha must be positive")
+    return 0.5 * (alpha + 1.0 / alpha) * fermion_trap_exact_ground_state_energy(
+        n_up, n_down, frequencies
+    )
+
+
+def hookes_atom_exact_ground_state_energy() -> float:
+    """Return exact E0 = 2 for two electrons in an isotropic trap with omega = 1/2.
+
+    The singlet ground state is psi(r_1, r_2) = (1 + r_12 / 2) exp(-(r_1^2 + r_2^2) / 4),
+    known in closed form (Kais, Herschbach and Levine, 1989).
+    """
+    return 2.0
+
+
+def hydrogen_exact_ground_state_energy() -> float:
+    """Return exact E0 = -1/2 hartree for the hydrogen atom (infinite nuclear mass)."""
+    return -0.5
+
+
+def hydrogen_variational_energy(zeta: float) -> float:
+    """Return the energy of the trial function exp(-zeta r) for hydrogen.
+
+        E(zeta) = zeta^2 / 2 - zeta
+
+    with its minimum E = -1/2 at the exact, cusp-satisfying zeta = 1.
+    """
+    if zeta <= 0:
+        raise ValueError("zeta must be positive")
+    return 0.5 * zeta * zeta - zeta
+
+
+def helium_exact_ground_state_energy() -> float:
+    """Return the nonrelativistic helium ground-state energy in hartree.
+
+    Value from Pekeris's high-precision Hylleraas expansion (E0 = -2.903724...).
+    """
+    return -2.903724
+
+
+def helium_variational_energy(zeta: float) -> float:
+    """Return the energy of exp(-zeta (r_1 + r_2)) for helium (Z = 2).
+
+        E(zeta) = zeta^2 - 2 Z zeta + 5 zeta / 8 = zeta^2 - 27 zeta / 8
+
+    The minimum is E = -(27/16)^2 = -2.84765625 at zeta = 27/16.
+    """
+    if zeta <= 0:
+        raise ValueError("zeta must be positive")
+    return zeta * zeta - 27.0 * zeta / 8.0
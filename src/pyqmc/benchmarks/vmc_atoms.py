@@ -0,0 +1,198 @@
+"""Benchmark runners for VMC on the hydrogen and helium atoms."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pyqmc.core.config import SimulationConfig
+from pyqmc.vmc.parallel import run_chains
+
+from .references import (
+    helium_exact_ground_state_energy,
+    helium_variational_energy,
+    hydrogen_exact_ground_state_energy,
+    hydrogen_variational_energy,
+)
+from .vmc_harmonic_oscillator import BenchmarkCase, BenchmarkCaseResult, BenchmarkSuiteResult
+
+# Pade-Jastrow range near the variational optimum of the cusp-satisfying helium trial.
+HELIUM_JASTROW_RANGE = 0.15
+
+
+def _atoms_module() -> Any:
+    try:
+        from pyqmc.vmc import interacting
+    except ModuleNotFoundError as exc:
+        raise RuntimeError(
+            "Atomic systems require NumPy. Install with: pip install -e '.[numpy]'"
+        ) from exc
+    return interacting
+
+
+def _run_cases(
+    cases: list[tuple[BenchmarkCase, Any]],
+    *,
+    suite_name: str,
+    system_name: str,
+    n_steps: int,
+    burn_in: int,
+    step_size: float,
+    seed: int | None,
+    n_walkers: int,
+) -> BenchmarkSuiteResult:
+    """Run every `(case, system)` pair on the numpy backend and compare energies."""
+    results: list[BenchmarkCaseResult] = []
+    for index, (case, system) in enumerate(cases):
+        config = SimulationConfig(
+            n_steps=n_steps,
+            burn_in=burn_in,
+            step_size=step_size,
+            alpha=case.alpha,
+            initial_position=0.0,
+            seed=None if seed is None else seed + index,
+            backend="numpy",
+            n_walkers=n_walkers,
+        )
+        config.validate()
+        summary = run_chains(system, config)
+        measured = summary.energy_stats.mean
+        abs_error = abs(measured - case.reference_energy)
+        results.append(
+            BenchmarkCaseResult(
+                case_id=case.case_id,
+                description=case.description,
+                alpha=case.alpha,
+                reference_energy=case.reference_energy,
+                measured_energy=measured,
+                standard_error=summary.energy_blocks.analysis().standard_error,
+                abs_error=abs_error,
+                tolerance=case.tolerance,
+                passed=abs_error <= case.tolerance,
+                acceptance_ratio=summary.acceptance_ratio,
+                n_samples=summary.energy_stats.count,
+                reference_source=case.reference_source,
+            )
+        )
+
+    return BenchmarkSuiteResult(
+        suite_name=suite_name,
+        method="VMC (Metropolis)",
+        system=system_name,
+        cases=results,
+    )
+
+
+def run_vmc_hydrogen_benchmarks(
+    n_steps: int = 4_000,
+    burn_in: int = 500,
+    step_size: float = 0.6,
+    seed: int | None = 12345,
+    n_walkers: int = 64,
+) -> BenchmarkSuiteResult:
+    """Run the hydrogen-atom benchmarks on the numpy backend (requires NumPy).
+
+    `alpha` is the orbital exponent `zeta`; `zeta = 1` is exact.
+    """
+    system = _atoms_module().hydrogen_atom()
+    variational_source = "Hydrogenic trial energy E(zeta) = zeta^2/2 - zeta (hartree)."
+    cases = [
+        BenchmarkCase(
+            case_id="hydrogen_exact_zeta_1.0",
+            description="Exact-energy check with the cusp-satisfying zeta=1.0",
+            alpha=1.0,
+            reference_energy=hydrogen_exact_ground_state_energy(),
+            tolerance=1e-10,
+            reference_source="Exact hydrogen ground-state energy E0 = -1/2 hartree.",
+        ),
+    ]
+    for zeta in (0.8, 1.2):
+        cases.append(
+            BenchmarkCase(
+                case_id=f"hydrogen_variational_zeta_{zeta}",
+                description=f"Variational reference check with zeta={zeta}",
+                alpha=zeta,
+                reference_energy=hydrogen_variational_energy(zeta),
+                tolerance=0.01,
+                reference_source=variational_source,
+            )
+        )
+    return _run_cases(
+        [(case, system) for case in cases],
+        suite_name="vmc_hydrogen_reference_suite",
+        system_name=system.name,
+        n_steps=n_steps,
+        burn_in=burn_in,
+        step_size=step_size,
+        seed=seed,
+        n_walkers=n_walkers,
+    )
+
+
+def run_vmc_helium_benchmarks(
+    n_steps: int = 4_000,
+    burn_in: int = 500,
+    step_size: float = 0.6,
+    seed: int | None = 12345,
+    n_walkers: int = 64,
+) -> BenchmarkSuiteResult:
+    """Run the helium-atom benchmarks on the numpy backend (requires NumPy).
+
+    The exponent-only trial function is checked against its analytic
+    energy. The cusp-satisfying Pade-Jastrow trial (`alpha` is the Jastrow
+    range) is checked against the exact energy, within its variational
+    error of about 0.03 hartree.
+    """
+    atoms = _atoms_module()
+    plain = atoms.helium_atom()
+    correlated = atoms.helium_atom(jastrow="pade")
+    variational_source = "Screened-exponent trial energy E(zeta) = zeta^2 - 27 zeta/8 (hartree)."
+    cases = [
+        (
+            BenchmarkCase(
+                case_id="helium_variational_zeta_1.6875",
+                description="Variational reference check at the optimal zeta=27/16",
+                alpha=27.0 / 16.0,
+                reference_energy=helium_variational_energy(27.0 / 16.0),
+                tolerance=0.03,
+                reference_source=variational_source,
+            ),
+            plain,
+        ),
+        (
+            BenchmarkCase(
+                case_id="helium_variational_zeta_2.0",
+                description="Variational reference check with the bare nuclear charge zeta=2.0",
+                alpha=2.0,
+                reference_energy=helium_variational_energy(2.0),
+                tolerance=0.04,
+                reference_source=variational_source,
+            ),
+            plain,
+        ),
+        (
+            BenchmarkCase(
+                case_id="helium_cusp_jastrow",
+                description=(
+                    f"Cusp-satisfying Pade-Jastrow trial (b={HELIUM_JASTROW_RANGE}) "
+                    "near the exact energy"
+                ),
+                alpha=HELIUM_JASTROW_RANGE,
+                reference_energy=helium_exact_ground_state_energy(),
+                tolerance=0.05,
+                reference_source=(
+                    "Exact nonrelativistic helium energy -2.903724 hartree (Pekeris, 1959)."
+                ),
+            ),
+            correlated,
+        ),
+    ]
+    return _run_cases(
+        cases,
+        suite_name="vmc_helium_reference_suite",
+        system_name=plain.name,
+        n_steps=n_steps,
+        burn_in=burn_in,
+        step_size=step_size,
+        seed=seed,
+        n_walkers=n_walkers,
+    )
@@ -0,0 +1,107 @@
+"""Benchmark runner for particle-by-particle VMC on trapped fermions."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from pyqmc.core.config import SimulationConfig
+from pyqmc.vmc.solver import run_vmc_fermion_trap
+
+from .references import (
+    fermion_trap_exact_ground_state_energy,
+    fermion_trap_variational_energy,
+)
+from .vmc_harmonic_oscillator import BenchmarkCase, BenchmarkCaseResult, BenchmarkSuiteResult
+from .vmc_harmonic_trap import DEFAULT_TRAP_FREQUENCIES
+
+
+def _fermion_cases(
+    n_up: int,
+    n_down: int,
+    frequencies: Sequence[float],
+) -> list[BenchmarkCase]:
+    """Return fermion-trap benchmark definitions; tolerances scale with the energy."""
+    exact = fermion_trap_exact_ground_state_energy(n_up, n_down, frequencies)
+    exact_source = "Exact E0: each spin fills its lowest trap levels sum_d (n_d + 1/2) omega_d."
+    variational_source = "Scaled Slater-determinant energy E(alpha) = 1/2 (alpha + 1/alpha) E0."
+    cases = [
+        BenchmarkCase(
+            case_id="fermion_trap_exact_alpha_1.0",
+            description="Exact-energy check with optimal alpha=1.0",
+            alpha=1.0,
+            reference_energy=exact,
+            tolerance=1e-10 * exact,
+            reference_source=exact_source,
+        )
+    ]
+    for alpha in (0.8, 1.2):
+        cases.append(
+            BenchmarkCase(
+                case_id=f"fermion_trap_variational_alpha_{alpha}",
+                description=f"Variational reference check with alpha={alpha}",
+                alpha=alpha,
+                reference_energy=fermion_trap_variational_energy(
+                    alpha, n_up, n_down, frequencies
+                ),
+                tolerance=0.02 * exact,
+                reference_source=variational_source,
+            )
+        )
+    return cases
+
+
+def run_vmc_fermion_trap_benchmarks(
+    n_up: int = 3,
+    n_down: int = 3,
+    frequencies: Sequence[float] = DEFAULT_TRAP_FREQUENCIES,
+    n_steps: int = 1_000,
+    burn_in: int = 200,
+    step_size: float = 0.8,
+    seed: int | None = 12345,
+    n_walkers: int = 8,
+) -> BenchmarkSuiteResult:
+    """Run the fermion benchmarks with particle moves (requires NumPy).
+
+    Each case runs `run_vmc_fermion_trap`, whose walkers keep their inverse
+    Slater matrices up to date with Sherman-Morrison updates. The mean local
+    energy is compared with the analytic reference.
+    """
+    results: list[BenchmarkCaseResult] = []
+    for index, case in enumerate(_fermion_cases(n_up, n_down, frequencies)):
+        config = SimulationConfig(
+            n_steps=n_steps,
+            burn_in=burn_in,
+            step_size=step_size,
+            alpha=case.alpha,
+            initial_position=0.0,
+            seed=None if seed is None else seed + index,
+            backend="numpy",
+            n_walkers=n_walkers,
+        )
+        result = run_vmc_fermion_trap(
+            config, n_up=n_up, n_down=n_down, frequencies=frequencies
+        )
+        abs_error = abs(result.mean_energy - case.reference_energy)
+        results.append(
+            BenchmarkCaseResult(
+                case_id=case.case_id,
+                description=case.description,
+                alpha=case.alpha,
+                reference_energy=case.reference_energy,
+                measured_energy=result.mean_energy,
+                standard_error=result.standard_error,
+                abs_error=abs_error,
+                tolerance=case.tolerance,
+                passed=abs_error <= case.tolerance,
+                acceptance_ratio=result.acceptance_ratio,
+                n_samples=result.n_samples,
+                reference_source=case.reference_source,
+            )
+        )
+
+    return BenchmarkSuiteResult(
+        suite_name="vmc_fermion_trap_reference_suite",
+        method="VMC (particle-by-particle Metropolis)",
+        system="fermion_trap",
+        cases=results,
+    )
@@ -164,11 +164,14 @@ def run_vmc_harmonic_oscillator_benchmarks(
     step_size: float = 1.0,
     initial_position: float = 0.0,
     seed: int | None = 12345,
+    backend: str = "python",
+    n_walkers: int = 1,
 ) -> BenchmarkSuiteResult:
     """Run built-in VMC benchmarks and compare against references.
 
     The benchmark cases intentionally keep scope small and transparent for
-    educational use.
+    educational use. With `backend="numpy"` every case evaluates its whole
+    walker ensemble per sweep through the batched system protocol.
     """
     cases = _default_cases()
     results: list[BenchmarkCaseResult] = []
@@ -182,6 +185,8 @@ def run_vmc_harmonic_oscillator_benchmarks(
             alpha=case.alpha,
             initial_position=initial_position,
             seed=case_seed,
+            backend=backend,
+            n_walkers=n_walkers,
         )
         simulation = run_vmc_harmonic_oscillator(config)
 
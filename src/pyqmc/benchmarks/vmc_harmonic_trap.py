@@ -0,0 +1,115 @@
+"""Benchmark runner for VMC on an N-particle anisotropic harmonic trap."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from pyqmc.core.config import SimulationConfig
+from pyqmc.vmc.parallel import run_chains
+
+from .references import (
+    harmonic_trap_exact_ground_state_energy,
+    harmonic_trap_variational_energy,
+)
+from .vmc_harmonic_oscillator import BenchmarkCase, BenchmarkCaseResult, BenchmarkSuiteResult
+
+DEFAULT_TRAP_FREQUENCIES = (1.0, 1.5, 2.0)
+
+
+def _trap_cases(n_particles: int, frequencies: Sequence[float]) -> list[BenchmarkCase]:
+    """Return trap benchmark definitions; tolerances scale with the energy."""
+    exact = harmonic_trap_exact_ground_state_energy(n_particles, frequencies)
+    exact_source = "Exact trap ground-state energy E0 = N/2 * sum_d omega_d (hbar = m = 1)."
+    variational_source = (
+        "Scaled-Gaussian variational energy E(alpha) = N/4 (alpha + 1/alpha) sum_d omega_d."
+    )
+    return [
+        BenchmarkCase(
+            case_id="trap_exact_alpha_1.0",
+            description="Exact-energy check with optimal alpha=1.0",
+            alpha=1.0,
+            reference_energy=exact,
+            tolerance=1e-10 * exact,
+            reference_source=exact_source,
+        ),
+        BenchmarkCase(
+            case_id="trap_variational_alpha_0.8",
+            description="Variational reference check with alpha=0.8",
+            alpha=0.8,
+            reference_energy=harmonic_trap_variational_energy(0.8, n_particles, frequencies),
+            tolerance=0.02 * exact,
+            reference_source=variational_source,
+        ),
+        BenchmarkCase(
+            case_id="trap_variational_alpha_1.2",
+            description="Variational reference check with alpha=1.2",
+            alpha=1.2,
+            reference_energy=harmonic_trap_variational_energy(1.2, n_particles, frequencies),
+            tolerance=0.02 * exact,
+            reference_source=variational_source,
+        ),
+    ]
+
+
+def run_vmc_harmonic_trap_benchmarks(
+    n_particles: int = 4,
+    frequencies: Sequence[float] = DEFAULT_TRAP_FREQUENCIES,
+    n_steps: int = 4_000,
+    burn_in: int = 500,
+    step_size: float = 0.5,
+    seed: int | None = 12345,
+    n_walkers: int = 64,
+) -> BenchmarkSuiteResult:
+    """Run the trap benchmarks on the numpy backend (requires NumPy).
+
+    Each case samples `n_walkers` walkers of `n_particles` particles in lockstep
+    and compares the mean local energy with the analytic reference.
+    """
+    try:
+        from pyqmc.vmc.harmonic_trap import HarmonicTrap
+    except ModuleNotFoundError as exc:
+        raise RuntimeError(
+            "The harmonic trap requires NumPy. Install with: pip install -e '.[numpy]'"
+        ) from exc
+
+    system = HarmonicTrap(n_particles, frequencies)
+    results: list[BenchmarkCaseResult] = []
+
+    for index, case in enumerate(_trap_cases(n_particles, frequencies)):
+        config = SimulationConfig(
+            n_steps=n_steps,
+            burn_in=burn_in,
+            step_size=step_size,
+            alpha=case.alpha,
+            initial_position=0.0,
+            seed=None if seed is None else seed + index,
+            backend="numpy",
+            n_walkers=n_walkers,
+        )
+        config.validate()
+        summary = run_chains(system, config)
+        measured = summary.energy_stats.mean
+        abs_error = abs(measured - case.reference_energy)
+        results.append(
+            BenchmarkCaseResult(
+                case_id=case.case_id,
+                description=case.description,
+                alpha=case.alpha,
+                reference_energy=case.reference_energy,
+                measured_energy=measured,
+                standard_error=summary.energy_blocks.analysis().standard_error,
+                abs_error=abs_error,
+                tolerance=case.tolerance,
+                passed=abs_error <= case.tolerance,
+                acceptance_ratio=summary.acceptance_ratio,
+                n_samples=summary.energy_stats.count,
+                reference_source=case.reference_source,
+            )
+        )
+
+    return BenchmarkSuiteResult(
+        suite_name="vmc_harmonic_trap_reference_suite",
+        method="VMC (Metropolis)",
+        system=system.name,
+        cases=results,
+    )
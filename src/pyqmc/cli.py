@@ -6,8 +6,16 @@ import argparse
 import json
 import sys
 
+from pyqmc.api.api_server import add_server_arguments
+from pyqmc.application.cache import configure_result_cache
+from pyqmc.application.dmc import run_dmc_harmonic_oscillator_use_case
 from pyqmc.application.vmc import (
+    run_particle_move_benchmark_use_case,
+    run_proposal_kernel_benchmark_use_case,
+    run_vmc_fermion_trap_use_case,
+    run_vmc_harmonic_oscillator_alpha_sweep_use_case,
     run_vmc_harmonic_oscillator_benchmark_use_case,
+    run_vmc_harmonic_oscillator_optimization_use_case,
     run_vmc_harmonic_oscillator_use_case,
 )
 
@@ -31,24 +39,282 @@ def build_parser() -> argparse.ArgumentParser:
     vmc_ho.add_argument("--alpha", type=float, default=1.0)
     vmc_ho.add_argument("--initial-position", type=float, default=0.0)
     vmc_ho.add_argument("--seed", type=int, default=12345)
+    vmc_ho.add_argument(
+        "--backend",
+        default="python",
+        choices=("python", "numpy"),
+        help="Sampler implementation: scalar Python loop or vectorized NumPy walkers",
+    )
+    vmc_ho.add_argument(
+        "--n-walkers",
+        type=int,
+        default=1,
+        help="Number of walkers advanced together (numpy backend only)",
+    )
+    vmc_ho.add_argument(
+        "--n-chains",
+        type=int,
+        default=1,
+        help="Number of independent chains, each with its own derived seed",
+    )
+    vmc_ho.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes used to run the chains",
+    )
+    vmc_ho.add_argument(
+        "--target-standard-error",
+        type=float,
+        default=None,
+        help="Run until the blocked standard error reaches this value (--n-steps caps the run)",
+    )
+    vmc_ho.add_argument(
+        "--max-seconds",
+        type=float,
+        default=None,
+        help="Wall-clock budget for a --target-standard-error run",
+    )
+    vmc_ho.add_argument(
+        "--tune-step-size",
+        action="store_true",
+        help="Adapt --step-size during burn-in toward --target-acceptance",
+    )
+    vmc_ho.add_argument(
+        "--target-acceptance",
+        type=float,
+        default=0.5,
+        help="Acceptance ratio aimed for by --tune-step-size",
+    )
+    vmc_ho.add_argument(
+        "--proposal",
+        default="uniform",
+        choices=("uniform", "langevin"),
+        help="Metropolis move: uniform random walk or Langevin drift-diffusion",
+    )
+    vmc_ho.add_argument(
+        "--checkpoint",
+        default=None,
+        help="File the run state is saved to periodically",
+    )
+    vmc_ho.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=None,
+        help="Save a checkpoint every this many steps per chain",
+    )
+    vmc_ho.add_argument(
+        "--checkpoint-seconds",
+        type=float,
+        default=60.0,
+        help="Save a checkpoint after this much wall time",
+    )
+    vmc_ho.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue from --checkpoint when the file exists",
+    )
+    vmc_ho.add_argument(
+        "--trace-out",
+        default=None,
+        help="Directory that receives every kept sample as memory-mapped .npy files",
+    )
+    vmc_ho.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Reuse results of identical seeded runs stored in this directory",
+    )
+    vmc_ho.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always compute, even when an identical seeded run is cached",
+    )
     vmc_ho.add_argument(
         "--json",
         action="store_true",
         help="Emit machine-readable JSON instead of text summary",
     )
 
+    sweep = subparsers.add_parser(
+        "vmc-ho-sweep",
+        help="Scan E(alpha) for the 1D harmonic oscillator from one reweighted sample set",
+    )
+    sweep.add_argument("--n-steps", type=int, default=20_000)
+    sweep.add_argument("--burn-in", type=int, default=2_000)
+    sweep.add_argument("--step-size", type=float, default=1.0)
+    sweep.add_argument(
+        "--alpha",
+        type=float,
+        default=1.0,
+        help="Reference alpha that is actually sampled",
+    )
+    sweep.add_argument("--alpha-min", type=float, default=0.6)
+    sweep.add_argument("--alpha-max", type=float, default=1.4)
+    sweep.add_argument(
+        "--n-alpha",
+        type=int,
+        default=17,
+        help="Number of evenly spaced alpha values between --alpha-min and --alpha-max",
+    )
+    sweep.add_argument("--initial-position", type=float, default=0.0)
+    sweep.add_argument("--seed", type=int, default=12345)
+    sweep.add_argument(
+        "--backend",
+        default="python",
+        choices=("python", "numpy"),
+        help="Sampler implementation used for the reference run",
+    )
+    sweep.add_argument(
+        "--n-walkers",
+        type=int,
+        default=1,
+        help="Number of walkers advanced together (numpy backend only)",
+    )
+    sweep.add_argument("--n-chains", type=int, default=1)
+    sweep.add_argument("--workers", type=int, default=1)
+    sweep.add_argument(
+        "--proposal",
+        default="uniform",
+        choices=("uniform", "langevin"),
+        help="Metropolis move used for the reference run",
+    )
+    sweep.add_argument(
+        "--json",
+        action="store_true",
+        help="Emit machine-readable JSON instead of text summary",
+    )
+
+    optimize = subparsers.add_parser(
+        "vmc-ho-optimize",
+        help="Optimize alpha for the 1D harmonic oscillator (linear method or SR)",
+    )
+    optimize.add_argument(
+        "--method",
+        default="linear",
+        choices=("linear", "sr"),
+        help="Parameter update: linear method or stochastic reconfiguration",
+    )
+    optimize.add_argument("--n-iterations", type=int, default=30)
+    optimize.add_argument(
+        "--learning-rate",
+        type=float,
+        default=0.5,
+        help="SR time step tau applied to the preconditioned gradient (--method sr)",
+    )
+    optimize.add_argument(
+        "--n-steps",
+        type=int,
+        default=300,
+        help="Sweeps per iteration including --burn-in (burn-in only runs once)",
+    )
+    optimize.add_argument("--burn-in", type=int, default=100)
+    optimize.add_argument("--step-size", type=float, default=1.5)
+    optimize.add_argument(
+        "--alpha",
+        type=float,
+        default=0.5,
+        help="Starting value of the variational parameter",
+    )
+    optimize.add_argument("--initial-position", type=float, default=0.0)
+    optimize.add_argument("--seed", type=int, default=12345)
+    optimize.add_argument("--n-walkers", type=int, default=256)
+    optimize.add_argument(
+        "--tune-step-size",
+        action="store_true",
+        help="Adapt --step-size during the first burn-in toward --target-acceptance",
+    )
+    optimize.add_argument("--target-acceptance", type=float, default=0.5)
+    optimize.add_argument(
+        "--proposal",
+        default="uniform",
+        choices=("uniform", "langevin"),
+        help="Metropolis move used for sampling",
+    )
+    optimize.add_argument(
+        "--json",
+        action="store_true",
+        help="Emit machine-readable JSON instead of text summary",
+    )
+
+    dmc_ho = subparsers.add_parser(
+        "dmc-ho",
+        help="Run importance-sampled DMC for the 1D harmonic oscillator",
+    )
+    dmc_ho.add_argument(
+        "--n-steps",
+        type=int,
+        default=4_000,
+        help="DMC time steps including --burn-in",
+    )
+    dmc_ho.add_argument("--burn-in", type=int, default=500)
+    dmc_ho.add_argument("--time-step", type=float, default=0.05)
+    dmc_ho.add_argument(
+        "--alpha",
+        type=float,
+        default=0.8,
+        help="Trial-function parameter used for importance sampling",
+    )
+    dmc_ho.add_argument("--target-population", type=int, default=1_000)
+    dmc_ho.add_argument("--initial-position", type=float, default=0.0)
+    dmc_ho.add_argument("--seed", type=int, default=12345)
+    dmc_ho.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes sharing the walker population",
+    )
+    dmc_ho.add_argument(
+        "--json",
+        action="store_true",
+        help="Emit machine-readable JSON instead of text summary",
+    )
+
+    fermion_trap = subparsers.add_parser(
+        "vmc-fermion-trap",
+        help="Run particle-by-particle VMC for fermions in a harmonic trap (needs NumPy)",
+    )
+    fermion_trap.add_argument("--n-up", type=int, default=4, help="Spin-up fermions")
+    fermion_trap.add_argument("--n-down", type=int, default=4, help="Spin-down fermions")
+    fermion_trap.add_argument(
+        "--frequencies",
+        type=float,
+        nargs="+",
+        default=[1.0, 1.0, 1.0],
+        help="Trap frequency of every axis",
+    )
+    fermion_trap.add_argument(
+        "--n-steps",
+        type=int,
+        default=2_000,
+        help="Sweeps over all particles, including --burn-in",
+    )
+    fermion_trap.add_argument("--burn-in", type=int, default=200)
+    fermion_trap.add_argument("--step-size", type=float, default=0.8)
+    fermion_trap.add_argument("--alpha", type=float, default=0.9)
+    fermion_trap.add_argument("--seed", type=int, default=12345)
+    fermion_trap.add_argument("--n-walkers", type=int, default=16)
+    fermion_trap.add_argument(
+        "--tune-step-size",
+        action="store_true",
+        help="Adapt --step-size during burn-in toward --target-acceptance",
+    )
+    fermion_trap.add_argument("--target-acceptance", type=float, default=0.5)
+    fermion_trap.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always compute, even when an identical seeded run is cached",
+    )
+    fermion_trap.add_argument(
+        "--json",
+        action="store_true",
+        help="Emit machine-readable JSON instead of text summary",
+    )
+
     serve_api = subparsers.add_parser(
         "serve-api",
         help="Run FastAPI backend service",
     )
-    serve_api.add_argument("--host", default="127.0.0.1")
-    serve_api.add_argument("--port", type=int, default=8000)
-    serve_api.add_argument("--log-level", default="info")
-    serve_api.add_argument(
-        "--reload",
-        action="store_true",
-        help="Enable auto-reload for local development",
-    )
+    add_server_arguments(serve_api)
 
     gui = subparsers.add_parser(
         "gui",
@@ -83,6 +349,18 @@ def build_parser() -> argparse.ArgumentParser:
     benchmark.add_argument("--step-size", type=float, default=1.0)
     benchmark.add_argument("--initial-position", type=float, default=0.0)
     benchmark.add_argument("--seed", type=int, default=12345)
+    benchmark.add_argument(
+        "--backend",
+        default="python",
+        choices=("python", "numpy"),
+        help="Sampler implementation used by every benchmark case",
+    )
+    benchmark.add_argument(
+        "--n-walkers",
+        type=int,
+        default=1,
+        help="Number of walkers advanced together (numpy backend only)",
+    )
     benchmark.add_argument(
         "--json",
         action="store_true",
@@ -94,23 +372,202 @@ def build_parser() -> argparse.ArgumentParser:
         help="Return nonzero exit code when any benchmark case fails",
     )
 
+    benchmark_kernels = subparsers.add_parser(
+        "benchmark-kernels",
+        help="Compare autocorrelation times of the Metropolis proposal kernels",
+    )
+    benchmark_kernels.add_argument("--n-steps", type=int, default=50_000)
+    benchmark_kernels.add_argument("--burn-in", type=int, default=2_000)
+    benchmark_kernels.add_argument("--alpha", type=float, default=0.8)
+    benchmark_kernels.add_argument("--seed", type=int, default=12345)
+    benchmark_kernels.add_argument(
+        "--backend",
+        default="python",
+        choices=("python", "numpy"),
+        help="Sampler implementation used for every scan point",
+    )
+    benchmark_kernels.add_argument(
+        "--n-walkers",
+        type=int,
+        default=1,
+        help="Number of walkers advanced together (numpy backend only)",
+    )
+    benchmark_kernels.add_argument(
+        "--json",
+        action="store_true",
+        help="Emit machine-readable JSON summary",
+    )
+
+    benchmark_particle_moves = subparsers.add_parser(
+        "benchmark-particle-moves",
+        help="Time incremental vs full pair, Jastrow and determinant updates per sweep",
+    )
+    benchmark_particle_moves.add_argument(
+        "--particle-counts",
+        type=int,
+        nargs="+",
+        default=[16, 32, 64, 128],
+        help="Particle counts to time (at least two)",
+    )
+    benchmark_particle_moves.add_argument("--n-sweeps", type=int, default=3)
+    benchmark_particle_moves.add_argument("--seed", type=int, default=12345)
+    benchmark_particle_moves.add_argument(
+        "--json",
+        action="store_true",
+        help="Emit machine-readable JSON summary",
+    )
+
     return parser
 
 
 def _run_vmc_ho(args: argparse.Namespace) -> int:
-    result = run_vmc_harmonic_oscillator_use_case(
-        n_steps=args.n_steps,
-        burn_in=args.burn_in,
-        step_size=args.step_size,
-        alpha=args.alpha,
-        initial_position=args.initial_position,
-        seed=args.seed,
-    )
+    if args.cache_dir is not None:
+        configure_result_cache(directory=args.cache_dir)
+    try:
+        result = run_vmc_harmonic_oscillator_use_case(
+            n_steps=args.n_steps,
+            burn_in=args.burn_in,
+            step_size=args.step_size,
+            alpha=args.alpha,
+            initial_position=args.initial_position,
+            seed=args.seed,
+            backend=args.backend,
+            n_walkers=args.n_walkers,
+            n_chains=args.n_chains,
+            workers=args.workers,
+            target_standard_error=args.target_standard_error,
+            max_seconds=args.max_seconds,
+            tune_step_size=args.tune_step_size,
+            target_acceptance=args.target_acceptance,
+            proposal=args.proposal,
+            checkpoint_path=args.checkpoint,
+            checkpoint_every=args.checkpoint_every,
+            checkpoint_seconds=args.checkpoint_seconds,
+            resume=args.resume,
+            trace_out=args.trace_out,
+            use_cache=not args.no_cache,
+        )
+    except (RuntimeError, ValueError) as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    else:
+        print(result.to_pretty_text())
+
+    return 0
+
+
+def _alpha_grid(alpha_min: float, alpha_max: float, n_alpha: int) -> list[float]:
+    if n_alpha < 1:
+        raise ValueError("n_alpha must be positive")
+    if n_alpha == 1:
+        return [alpha_min]
+    spacing = (alpha_max - alpha_min) / (n_alpha - 1)
+    return [alpha_min + index * spacing for index in range(n_alpha)]
+
+
+def _run_vmc_ho_sweep(args: argparse.Namespace) -> int:
+    try:
+        result = run_vmc_harmonic_oscillator_alpha_sweep_use_case(
+            alphas=_alpha_grid(args.alpha_min, args.alpha_max, args.n_alpha),
+            n_steps=args.n_steps,
+            burn_in=args.burn_in,
+            step_size=args.step_size,
+            alpha=args.alpha,
+            initial_position=args.initial_position,
+            seed=args.seed,
+            backend=args.backend,
+            n_walkers=args.n_walkers,
+            n_chains=args.n_chains,
+            workers=args.workers,
+            proposal=args.proposal,
+        )
+    except (RuntimeError, ValueError) as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    else:
+        print(result.to_pretty_text())
+    return 0
+
+
+def _run_vmc_ho_optimize(args: argparse.Namespace) -> int:
+    try:
+        result = run_vmc_harmonic_oscillator_optimization_use_case(
+            method=args.method,
+            n_iterations=args.n_iterations,
+            learning_rate=args.learning_rate,
+            n_steps=args.n_steps,
+            burn_in=args.burn_in,
+            step_size=args.step_size,
+            alpha=args.alpha,
+            initial_position=args.initial_position,
+            seed=args.seed,
+            n_walkers=args.n_walkers,
+            tune_step_size=args.tune_step_size,
+            target_acceptance=args.target_acceptance,
+            proposal=args.proposal,
+        )
+    except (RuntimeError, ValueError) as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+
     if args.json:
         print(json.dumps(result.to_dict(), indent=2))
     else:
         print(result.to_pretty_text())
+    return 0
+
+
+def _run_vmc_fermion_trap(args: argparse.Namespace) -> int:
+    try:
+        result = run_vmc_fermion_trap_use_case(
+            n_up=args.n_up,
+            n_down=args.n_down,
+            frequencies=args.frequencies,
+            n_steps=args.n_steps,
+            burn_in=args.burn_in,
+            step_size=args.step_size,
+            alpha=args.alpha,
+            seed=args.seed,
+            n_walkers=args.n_walkers,
+            tune_step_size=args.tune_step_size,
+            target_acceptance=args.target_acceptance,
+            use_cache=not args.no_cache,
+        )
+    except (RuntimeError, ValueError) as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    else:
+        print(result.to_pretty_text())
+    return 0
 
+
+def _run_dmc_ho(args: argparse.Namespace) -> int:
+    try:
+        result = run_dmc_harmonic_oscillator_use_case(
+            n_steps=args.n_steps,
+            burn_in=args.burn_in,
+            time_step=args.time_step,
+            alpha=args.alpha,
+            target_population=args.target_population,
+            initial_position=args.initial_position,
+            seed=args.seed,
+            workers=args.workers,
+        )
+    except (RuntimeError, ValueError) as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    else:
+        print(result.to_pretty_text())
     return 0
 
 
@@ -123,8 +580,11 @@ def _run_serve_api(args: argparse.Namespace) -> int:
             port=args.port,
             log_level=args.log_level,
             reload=args.reload,
+            workers=args.workers,
+            job_workers=args.job_workers,
+            shutdown_timeout=args.shutdown_timeout,
         )
-    except RuntimeError as exc:
+    except (RuntimeError, ValueError) as exc:
         print(str(exc), file=sys.stderr)
         return 2
 
@@ -156,6 +616,8 @@ def _run_benchmark(args: argparse.Namespace) -> int:
         step_size=args.step_size,
         initial_position=args.initial_position,
         seed=args.seed,
+        backend=args.backend,
+        n_walkers=args.n_walkers,
     )
 
     if args.json:
@@ -168,6 +630,41 @@ def _run_benchmark(args: argparse.Namespace) -> int:
     return 0
 
 
+def _run_benchmark_kernels(args: argparse.Namespace) -> int:
+    result = run_proposal_kernel_benchmark_use_case(
+        n_steps=args.n_steps,
+        burn_in=args.burn_in,
+        alpha=args.alpha,
+        seed=args.seed,
+        backend=args.backend,
+        n_walkers=args.n_walkers,
+    )
+
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    else:
+        print(result.to_pretty_text())
+    return 0
+
+
+def _run_benchmark_particle_moves(args: argparse.Namespace) -> int:
+    try:
+        result = run_particle_move_benchmark_use_case(
+            particle_counts=args.particle_counts,
+            n_sweeps=args.n_sweeps,
+            seed=args.seed,
+        )
+    except (RuntimeError, ValueError) as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    else:
+        print(result.to_pretty_text())
+    return 0
+
+
 def main(argv: list[str] | None = None) -> int:
     """CLI entry point."""
     parser = build_parser()
@@ -175,12 +672,24 @@ def main(argv: list[str] | None = None) -> int:
 
     if args.command == "vmc-ho":
         return _run_vmc_ho(args)
+    if args.command == "vmc-ho-sweep":
+        return _run_vmc_ho_sweep(args)
+    if args.command == "vmc-ho-optimize":
+        return _run_vmc_ho_optimize(args)
+    if args.command == "vmc-fermion-trap":
+        return _run_vmc_fermion_trap(args)
+    if args.command == "dmc-ho":
+        return _run_dmc_ho(args)
     if args.command == "serve-api":
         return _run_serve_api(args)
     if args.command == "gui":
         return _run_gui(args)
     if args.command == "benchmark":
         return _run_benchmark(args)
+    if args.command == "benchmark-kernels":
+        return _run_benchmark_kernels(args)
+    if args.command == "benchmark-particle-moves":
+        return _run_benchmark_particle_moves(args)
 
     parser.error(f"unsupported command: {args.command}")
     return 2
@@ -4,11 +4,20 @@ from .config import SimulationConfig
 from .results import SimulationResult
 from .vmc_input import (
     DEFAULT_VMC_ALPHA,
+    DEFAULT_VMC_BACKEND,
     DEFAULT_VMC_BURN_IN,
     DEFAULT_VMC_INITIAL_POSITION,
+    DEFAULT_VMC_MAX_SECONDS,
+    DEFAULT_VMC_N_CHAINS,
     DEFAULT_VMC_N_STEPS,
+    DEFAULT_VMC_N_WALKERS,
+    DEFAULT_VMC_PROPOSAL,
     DEFAULT_VMC_SEED,
     DEFAULT_VMC_STEP_SIZE,
+    DEFAULT_VMC_TARGET_ACCEPTANCE,
+    DEFAULT_VMC_TARGET_STANDARD_ERROR,
+    DEFAULT_VMC_TUNE_STEP_SIZE,
+    DEFAULT_VMC_WORKERS,
     build_vmc_harmonic_oscillator_config,
     build_vmc_harmonic_oscillator_config_from_mapping,
 )
@@ -17,11 +26,20 @@ __all__ = [
     "SimulationConfig",
     "SimulationResult",
     "DEFAULT_VMC_ALPHA",
+    "DEFAULT_VMC_BACKEND",
     "DEFAULT_VMC_BURN_IN",
     "DEFAULT_VMC_INITIAL_POSITION",
+    "DEFAULT_VMC_MAX_SECONDS",
+    "DEFAULT_VMC_N_CHAINS",
     "DEFAULT_VMC_N_STEPS",
+    "DEFAULT_VMC_N_WALKERS",
+    "DEFAULT_VMC_PROPOSAL",
     "DEFAULT_VMC_SEED",
     "DEFAULT_VMC_STEP_SIZE",
+    "DEFAULT_VMC_TARGET_ACCEPTANCE",
+    "DEFAULT_VMC_TARGET_STANDARD_ERROR",
+    "DEFAULT_VMC_TUNE_STEP_SIZE",
+    "DEFAULT_VMC_WORKERS",
     "build_vmc_harmonic_oscillator_config",
     "build_vmc_harmonic_oscillator_config_from_mapping",
 ]
@@ -0,0 +1,234 @@
+"""Integrated autocorrelation time from FFT autocovariances.
+
+The autocovariance of a length-`n` series is obtained in `O(n log n)` through
+the Wiener-Khinchin theorem (zero-padded FFT, power spectrum, inverse FFT).
+The integrated time `tau_int = 1 + 2 * sum_t rho(t)` is truncated with Sokal's
+self-consistent window: the smallest `M` with `M >= c * tau_int(M)`. With this
+convention the effective sample size is simply `n / tau_int`.
+
+A radix-2 FFT in pure Python keeps the baseline dependency-free; NumPy is used
+automatically when it is installed.
+"""
+
+from __future__ import annotations
+
+import cmath
+import math
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+
+# Samplers keep at most this many (block-averaged) values per chain, so the
+# FFT cost stays bounded however long the chain runs.
+_SERIES_CAPACITY = 1 << 14
+_SOKAL_WINDOW_FACTOR = 5.0
+# The windowed estimate is considered reliable once the series is this many
+# autocorrelation times long.
+_MIN_TAU_MULTIPLE = 50.0
+
+
+@dataclass
+class DecimatedSeries:
+    """Bounded copy of a time series for autocorrelation analysis.
+
+    Values are stored verbatim until `capacity` is reached; from then on
+    neighbouring values are averaged in pairs and `stride` doubles, so memory
+    stays below `capacity` floats. Each stored value is the mean of `stride`
+    consecutive raw values; a trailing incomplete group is held in
+    `partial_sum`/`partial_count` until it fills up.
+    """
+
+    capacity: int = _SERIES_CAPACITY
+    values: list[float] = field(default_factory=list)
+    stride: int = 1
+    partial_sum: float = 0.0
+    partial_count: int = 0
+
+    @property
+    def count(self) -> int:
+        """Number of raw values pushed so far."""
+        return len(self.values) * self.stride + self.partial_count
+
+    def push(self, value: float) -> None:
+        """Append one raw value."""
+        self.extend((value,))
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Append raw values in order."""
+        chunk = values if isinstance(values, list) else list(values)
+        n = len(chunk)
+        stride = self.stride
+        start = 0
+
+        if self.partial_count:
+            start = min(stride - self.partial_count, n)
+            self.partial_sum += sum(chunk[:start])
+            self.partial_count += start
+            if self.partial_count == stride:
+                self.values.append(self.partial_sum / stride)
+                self.partial_sum = 0.0
+                self.partial_count = 0
+
+        full_end = start + (n - start) // stride * stride
+        if stride == 1:
+            self.values.extend(chunk[start:full_end])
+        else:
+            self.values.extend(
+                [sum(chunk[i : i + stride]) / stride for i in range(start, full_end, stride)]
+            )
+        if full_end < n:
+            self.partial_sum += sum(chunk[full_end:])
+            self.partial_count += n - full_end
+
+        while len(self.values) >= self.capacity:
+            self._halve()
+
+    def _halve(self) -> None:
+        values = self.values
+        if len(values) % 2:
+            # The odd value out precedes the current partial group in time.
+            self.partial_sum += values[-1] * self.stride
+            self.partial_count += self.stride
+        self.values = [(a + b) * 0.5 for a, b in zip(values[0::2], values[1::2])]
+        self.stride *= 2
+
+
+@dataclass(frozen=True)
+class AutocorrelationResult:
+    """Windowed integrated autocorrelation estimate of one or more series.
+
+    `tau_int` is measured in series elements. `standard_error` is the error of
+    the overall mean implied by `tau_int`; `converged` is false when no Sokal
+    window was found or the series is shorter than 50 `tau_int`.
+    """
+
+    mean: float
+    variance: float
+    tau_int: float
+    window: int
+    effective_samples: float
+    standard_error: float
+    converged: bool
+
+
+def _fft(values: list[complex]) -> list[complex]:
+    """Iterative radix-2 FFT; `len(values)` must be a power of 2."""
+    n = len(values)
+    result = list(values)
+
+    j = 0
+    for i in range(1, n):
+        bit = n >> 1
+        while j & bit:
+            j ^= bit
+            bit >>= 1
+        j |= bit
+        if i < j:
+            result[i], result[j] = result[j], result[i]
+
+    size = 2
+    while size <= n:
+        half = size // 2
+        twiddles = [cmath.exp(-2j * math.pi * k / size) for k in range(half)]
+        for start in range(0, n, size):
+            for k in range(half):
+                a = result[start + k]
+                b = result[start + k + half] * twiddles[k]
+                result[start + k] = a + b
+                result[start + k + half] = a - b
+        size *= 2
+    return result
+
+
+def _python_autocovariance(values: Sequence[float]) -> list[float]:
+    """Pure-Python version of `_autocovariance`."""
+    n = len(values)
+    padded = 1 << (2 * n - 1).bit_length()
+    mu = sum(values) / n
+    spectrum = _fft([complex(x - mu) for x in values] + [0j] * (padded - n))
+    power = [complex(abs(z) ** 2) for z in spectrum]
+    # The power spectrum is real and even, so a forward FFT equals the inverse
+    # up to the 1/padded normalisation.
+    return [z.real / (padded * n) for z in _fft(power)[:n]]
+
+
+def _autocovariance(values: Sequence[float]) -> list[float]:
+    """Biased autocovariance `c(t) = sum_i d_i d_{i+t} / n` for all lags."""
+    try:
+        import numpy as np
+    except ModuleNotFoundError:
+        return _python_autocovariance(values)
+
+    n = len(values)
+    padded = 1 << (2 * n - 1).bit_length()
+    deviations = np.asarray(values, dtype=float)
+    deviations = deviations - deviations.mean()
+    spectrum = np.fft.rfft(deviations, n=padded)
+    return (np.fft.irfft(spectrum * spectrum.conjugate(), n=padded)[:n] / n).tolist()
+
+
+def autocorrelation_function(values: Sequence[float]) -> list[float]:
+    """Return the normalised autocorrelation `rho(t)` for lags `0..n-1`."""
+    if not values:
+        raise ValueError("autocorrelation_function requires at least one value")
+    acov = _autocovariance(values)
+    if acov[0] <= 0.0:
+        return [1.0] + [0.0] * (len(acov) - 1)
+    return [c / acov[0] for c in acov]
+
+
+def autocorrelation_analysis(
+    series: Sequence[Sequence[float]],
+    *,
+    window_factor: float = _SOKAL_WINDOW_FACTOR,
+) -> AutocorrelationResult:
+    """Estimate `tau_int` from one or more independent chains.
+
+    Autocovariances of the chains (truncated to the shortest one) are averaged
+    before normalisation, so chains are never concatenated across their
+    boundaries.
+    """
+    chains = [chain for chain in series if len(chain) > 0]
+    if not chains:
+        raise ValueError("autocorrelation_analysis requires at least one value")
+
+    total = sum(len(chain) for chain in chains)
+    overall_mean = sum(sum(chain) for chain in chains) / total
+    length = min(len(chain) for chain in chains)
+    acov = [0.0] * length
+    for chain in chains:
+        for lag, value in enumerate(_autocovariance(chain)[:length]):
+            acov[lag] += value / len(chains)
+
+    variance = acov[0]
+    if variance <= 0.0:
+        return AutocorrelationResult(
+            mean=overall_mean,
+            variance=0.0,
+            tau_int=1.0,
+            window=0,
+            effective_samples=float(total),
+            standard_error=0.0,
+            converged=True,
+        )
+
+    tau = 1.0
+    window = length - 1
+    found = False
+    for lag in range(1, length):
+        tau += 2.0 * acov[lag] / variance
+        if lag >= window_factor * tau:
+            window = lag
+            found = True
+            break
+    # Noise can drive the truncated sum below one; clamp to the iid value.
+    tau = max(tau, 1.0)
+
+    return AutocorrelationResult(
+        mean=overall_mean,
+        variance=variance,
+        tau_int=tau,
+        window=window,
+        effective_samples=total / tau,
+        standard_error=math.sqrt(variance * tau / total),
+        converged=found and length >= _MIN_TAU_MULTIPLE * tau,
+    )
@@ -0,0 +1,140 @@
+"""Binary checkpoint files for resumable Monte Carlo runs.
+
+A checkpoint file is a fixed header followed by a zlib-compressed JSON
+payload:
+
+    magic (8 bytes) | format version (uint16) | config fingerprint (32 bytes)
+
+The fingerprint is the SHA-256 of the run configuration, so a checkpoint is
+never resumed under different settings. JSON keeps the format inspectable
+and round-trips Python floats exactly; samplers encode their own state
+(random generator, walkers, accumulators) as plain values. Files are written
+to a temporary sibling, synced and renamed over the target with
+`os.replace`, so an interrupted write leaves the previous checkpoint intact.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pyqmc.core.autocorrelation import DecimatedSeries
+from pyqmc.core.config import SimulationConfig
+from pyqmc.core.stats import BlockingAccumulator, RunningStats
+
+CHECKPOINT_MAGIC = b"PYQMCCKP"
+CHECKPOINT_VERSION = 1
+DEFAULT_CHECKPOINT_SECONDS = 60.0
+
+_HEADER = struct.Struct(">8sH32s")
+# Fields that change how a run is executed but not what it computes.
+_FINGERPRINT_EXCLUDED_FIELDS = ("workers",)
+
+
+def config_fingerprint(config: SimulationConfig) -> bytes:
+    """Return the SHA-256 digest identifying the samples `config` produces.
+
+    `workers` is left out because results do not depend on it, so a run may
+    be resumed on a different number of processes.
+    """
+    fields = dataclasses.asdict(config)
+    for name in _FINGERPRINT_EXCLUDED_FIELDS:
+        fields.pop(name)
+    encoded = json.dumps(fields, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).digest()
+
+
+@dataclass(frozen=True)
+class CheckpointPolicy:
+    """Where and how often a run saves its state.
+
+    A checkpoint is written whenever `every_steps` steps per chain or
+    `every_seconds` of wall time have passed since the last one, whichever
+    comes first, and once more when the run ends. With `resume`, a run
+    starts from the file at `path` when it exists.
+    """
+
+    path: Path
+    every_steps: int | None = None
+    every_seconds: float | None = DEFAULT_CHECKPOINT_SECONDS
+    resume: bool = False
+
+    def validate(self) -> None:
+        """Raise `ValueError` when the policy is invalid."""
+        if self.every_steps is not None and self.every_steps <= 0:
+            raise ValueError("checkpoint every_steps must be positive")
+        if self.every_seconds is not None and self.every_seconds <= 0:
+            raise ValueError("checkpoint every_seconds must be positive")
+
+
+def write_checkpoint(path: Path, config: SimulationConfig, state: dict[str, Any]) -> None:
+    """Atomically replace `path` with a checkpoint of `state`."""
+    payload = zlib.compress(json.dumps(state, separators=(",", ":")).encode("utf-8"))
+    header = _HEADER.pack(CHECKPOINT_MAGIC, CHECKPOINT_VERSION, config_fingerprint(config))
+    path = Path(path)
+    temporary = path.with_name(f".{path.name}.tmp")
+    with open(temporary, "wb") as handle:
+        handle.write(header)
+        handle.write(payload)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temporary, path)
+
+
+def read_checkpoint(path: Path, config: SimulationConfig) -> dict[str, Any]:
+    """Load the state stored at `path`, checking it belongs to `config`."""
+    data = Path(path).read_bytes()
+    if len(data) < _HEADER.size:
+        raise ValueError(f"{path} is not a pyqmc checkpoint")
+    magic, version, fingerprint = _HEADER.unpack_from(data)
+    if magic != CHECKPOINT_MAGIC:
+        raise ValueError(f"{path} is not a pyqmc checkpoint")
+    if version != CHECKPOINT_VERSION:
+        raise ValueError(f"unsupported checkpoint version {version}")
+    if fingerprint != config_fingerprint(config):
+        raise ValueError("checkpoint was written for a different configuration")
+    return json.loads(zlib.decompress(data[_HEADER.size :]))
+
+
+def running_stats_state(stats: RunningStats) -> list[float]:
+    """Encode a `RunningStats` as `[count, mean, m2]`."""
+    return [stats.count, stats.mean, stats.m2]
+
+
+def restore_running_stats(state: list[float]) -> RunningStats:
+    """Inverse of `running_stats_state`."""
+    count, mean, m2 = state
+    return RunningStats(count=int(count), mean=mean, m2=m2)
+
+
+def blocking_state(blocks: BlockingAccumulator) -> dict[str, Any]:
+    """Encode a `BlockingAccumulator`, including half-filled blocks."""
+    return {
+        "levels": [running_stats_state(level) for level in blocks.levels],
+        "pending": list(blocks.pending),
+    }
+
+
+def restore_blocking(state: dict[str, Any]) -> BlockingAccumulator:
+    """Inverse of `blocking_state`."""
+    return BlockingAccumulator(
+        levels=[restore_running_stats(level) for level in state["levels"]],
+        pending=list(state["pending"]),
+    )
+
+
+def series_state(series: DecimatedSeries) -> dict[str, Any]:
+    """Encode a `DecimatedSeries`."""
+    return dataclasses.asdict(series)
+
+
+def restore_series(state: dict[str, Any]) -> DecimatedSeries:
+    """Inverse of `series_state`."""
+    return DecimatedSeries(**state)
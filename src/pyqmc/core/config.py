@@ -5,6 +5,11 @@ These objects are intentionally simple and explicit for educational use.
 
 from dataclasses import dataclass
 
+# Sampler implementations selectable through `SimulationConfig.backend`.
+SAMPLER_BACKENDS = ("python", "numpy")
+# Metropolis proposal kernels selectable through `SimulationConfig.proposal`.
+PROPOSAL_KERNELS = ("uniform", "langevin")
+
 
 @dataclass(frozen=True)
 class SimulationConfig:
@@ -13,10 +18,32 @@ class SimulationConfig:
     Attributes:
         n_steps: Total Monte Carlo steps including burn-in.
         burn_in: Number of initial steps discarded before statistics.
-        step_size: Proposal width for random-walk Metropolis.
+        step_size: Proposal scale: the half-width of uniform moves or the time
+            step of Langevin (drift-diffusion) moves.
         alpha: Trial-wavefunction variational parameter.
         initial_position: Initial particle coordinate.
         seed: Optional RNG seed for reproducibility.
+        backend: Sampler implementation, either the pure-Python single-walker
+            loop ("python") or the vectorized NumPy ensemble ("numpy").
+        n_walkers: Number of walkers advanced together by the NumPy backend.
+            Each walker runs `n_steps` steps, so the run collects
+            `n_walkers * (n_steps - burn_in)` samples.
+        n_chains: Number of independent chains (or walker ensembles), each
+            with its own random stream derived from `seed`.
+        workers: Number of processes the chains are distributed over. The
+            result for a given seed does not depend on this value.
+        target_standard_error: When set, chains run in chunks until the
+            blocked standard error has converged and is at most this value.
+            `n_steps` then caps the steps per chain instead of fixing them.
+        max_seconds: Optional wall-clock budget for a target-precision run.
+        tune_step_size: Adapt `step_size` during burn-in toward
+            `target_acceptance`, then freeze it for the kept samples.
+        target_acceptance: Acceptance ratio the step-size tuner aims for.
+        proposal: Metropolis proposal kernel, either symmetric "uniform"
+            moves or "langevin" drift-diffusion moves along grad ln psi_T.
+
+    DMC runners (`pyqmc.dmc`) read `step_size` as the time step, `n_walkers`
+    as the target population and `alpha` as the guiding trial function.
     """
 
     n_steps: int = 20_000
@@ -25,6 +52,15 @@ class SimulationConfig:
     alpha: float = 1.0
     initial_position: float = 0.0
     seed: int | None = 12345
+    backend: str = "python"
+    n_walkers: int = 1
+    n_chains: int = 1
+    workers: int = 1
+    target_standard_error: float | None = None
+    max_seconds: float | None = None
+    tune_step_size: bool = False
+    target_acceptance: float = 0.5
+    proposal: str = "uniform"
 
     def validate(self) -> None:
         """Raise `ValueError` when configuration fields are invalid."""
@@ -38,3 +74,26 @@ class SimulationConfig:
             raise ValueError("step_size must be positive")
         if self.alpha <= 0:
             raise ValueError("alpha must be positive")
+        if self.backend not in SAMPLER_BACKENDS:
+            raise ValueError(f"backend must be one of: {', '.join(SAMPLER_BACKENDS)}")
+        if self.n_walkers <= 0:
+            raise ValueError("n_walkers must be positive")
+        if self.backend == "python" and self.n_walkers != 1:
+            raise ValueError("n_walkers > 1 requires backend='numpy'")
+        if self.n_chains <= 0:
+            raise ValueError("n_chains must be positive")
+        if self.workers <= 0:
+            raise ValueError("workers must be positive")
+        if self.target_standard_error is not None and self.target_standard_error <= 0:
+            raise ValueError("target_standard_error must be positive")
+        if self.max_seconds is not None:
+            if self.max_seconds <= 0:
+                raise ValueError("max_seconds must be positive")
+            if self.target_standard_error is None:
+                raise ValueError("max_seconds requires target_standard_error")
+        if not 0.0 < self.target_acceptance < 1.0:
+            raise ValueError("target_acceptance must be between 0 and 1")
+        if self.tune_step_size and self.burn_in == 0:
+            raise ValueError("tune_step_size requires burn_in > 0")
+        if self.proposal not in PROPOSAL_KERNELS:
+            raise ValueError(f"proposal must be one of: {', '.join(PROPOSAL_KERNELS)}")
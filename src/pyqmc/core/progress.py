@@ -0,0 +1,107 @@
+"""Progress snapshots emitted by long-running samplers.
+
+Runners that accept a `progress` callback consider reporting between
+fixed-length segments of work and, when their `ProgressThrottle` says a
+report is due, call it with a `ProgressSnapshot` of the estimators so far.
+The throttle limits reports by wall time, so streaming progress costs a
+bounded fraction of sampler throughput however cheap a segment is or however
+slow the callback. A callback may raise to abort the run, which is how
+cancellation reaches a sampler running in another process.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class ProgressSnapshot:
+    """State of a running simulation.
+
+    Attributes:
+        steps_done: Steps completed per chain (time steps for DMC).
+        total_steps: Step cap of the run.
+        n_samples: Post-burn-in samples collected so far.
+        mean_energy: Running energy estimate; None during burn-in.
+        standard_error: Running blocked error; None during burn-in.
+        acceptance_ratio: Acceptance ratio so far.
+        elapsed_seconds: Wall time since the run started.
+        steps_per_second: Walker steps (over all chains and walkers) per
+            second of wall time.
+    """
+
+    steps_done: int
+    total_steps: int
+    n_samples: int
+    mean_energy: float | None
+    standard_error: float | None
+    acceptance_ratio: float
+    elapsed_seconds: float
+    steps_per_second: float
+
+    @property
+    def fraction_done(self) -> float:
+        return min(1.0, self.steps_done / self.total_steps) if self.total_steps else 1.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "steps_done": self.steps_done,
+            "total_steps": self.total_steps,
+            "fraction_done": self.fraction_done,
+            "n_samples": self.n_samples,
+            "mean_energy": self.mean_energy,
+            "standard_error": self.standard_error,
+            "acceptance_ratio": self.acceptance_ratio,
+            "elapsed_seconds": self.elapsed_seconds,
+            "steps_per_second": self.steps_per_second,
+        }
+
+
+ProgressCallback = Callable[[ProgressSnapshot], None]
+
+DEFAULT_PROGRESS_INTERVAL = 0.25
+DEFAULT_PROGRESS_BUDGET = 0.01
+
+
+class ProgressThrottle:
+    """Time-based rate limit for progress reports.
+
+    A report is due once `interval` seconds have passed since the previous
+    one. The wait is stretched to `cost / budget`, where `cost` is how long
+    the previous report took to build and deliver, so reporting never takes
+    more than `budget` of the wall time.
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_PROGRESS_INTERVAL,
+        budget: float = DEFAULT_PROGRESS_BUDGET,
+    ) -> None:
+        if interval < 0:
+            raise ValueError("progress interval cannot be negative")
+        if not 0 < budget <= 1:
+            raise ValueError("progress budget must be in (0, 1]")
+        self.interval = interval
+        self.budget = budget
+        self.reports = 0
+        self._last = time.perf_counter()
+        self._cost = 0.0
+
+    def due(self) -> bool:
+        wait = max(self.interval, self._cost / self.budget)
+        return time.perf_counter() - self._last >= wait
+
+    def emit(
+        self,
+        callback: ProgressCallback,
+        snapshot: Callable[[], ProgressSnapshot],
+    ) -> None:
+        """Build a snapshot and deliver it, timing both."""
+        start = time.perf_counter()
+        callback(snapshot())
+        self._last = time.perf_counter()
+        self._cost = self._last - start
+        self.reports += 1
@@ -0,0 +1,219 @@
+"""Content-addressed cache of simulation results.
+
+Seeded runs are deterministic, so a result is fully identified by its
+configuration and the engine that computed it. `result_cache_key` hashes
+both; `ResultCache` keeps results in a bounded in-memory LRU tier and,
+optionally, in a directory of JSON files whose total size is capped by
+evicting the least recently used entries. Only files with the entry suffix
+`.pyqmc-result.json` are treated as entries, so pointing the cache at a
+directory that holds other JSON files never reads or deletes them.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pyqmc import __version__
+from pyqmc.core.checkpoint import config_fingerprint
+from pyqmc.core.config import SimulationConfig
+from pyqmc.core.results import SimulationResult
+
+# Bump when a change alters the numbers a given config produces.
+ENGINE_VERSION = 1
+DEFAULT_MEMORY_ENTRIES = 256
+DEFAULT_DISK_BYTES = 64 * 1024 * 1024
+ENTRY_SUFFIX = ".pyqmc-result.json"
+
+
+def result_cache_key(
+    kind: str,
+    config: SimulationConfig,
+    extra: dict[str, Any] | None = None,
+) -> str:
+    """Return the hex digest identifying one run.
+
+    `kind` names the runner, and `extra` holds settings outside
+    `SimulationConfig` that change the result. Like checkpoints, the key
+    ignores `config.workers`; runners whose results depend on it pass it in
+    `extra`.
+    """
+    identity = {
+        "kind": kind,
+        "pyqmc_version": __version__,
+        "engine_version": ENGINE_VERSION,
+        "config": config_fingerprint(config).hex(),
+        "extra": extra or {},
+    }
+    encoded = json.dumps(identity, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ResultCacheStats:
+    """Hit/miss counters and current tier sizes."""
+
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    bypassed: int
+    memory_entries: int
+    disk_entries: int
+    disk_bytes: int
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "memory_entries": self.memory_entries,
+            "disk_entries": self.disk_entries,
+            "disk_bytes": self.disk_bytes,
+        }
+
+
+class ResultCache:
+    """Two-tier LRU cache of `SimulationResult` objects; safe across threads.
+
+    `directory=None` disables the disk tier. Disk entries are written
+    atomically, so several processes may share one directory.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MEMORY_ENTRIES,
+        directory: Path | None = None,
+        max_bytes: int = DEFAULT_DISK_BYTES,
+    ) -> None:
+        if max_entries < 0:
+            raise ValueError("max_entries cannot be negative")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_entries = max_entries
+        self.directory = None if directory is None else Path(directory)
+        self.max_bytes = max_bytes
+        self._memory: OrderedDict[str, SimulationResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._bypassed = 0
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> SimulationResult | None:
+        """Return the cached result for `key`, or None (counted as a miss).
+
+        Hits are deep copies, so callers may modify them freely.
+        """
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+                return copy.deepcopy(result)
+            result = self._read_disk(key)
+            if result is not None:
+                self._disk_hits += 1
+                self._remember(key, result)
+                return copy.deepcopy(result)
+            self._misses += 1
+            return None
+
+    def put(self, key: str, result: SimulationResult) -> None:
+        """Store `result` in both tiers, evicting old entries as needed."""
+        with self._lock:
+            self._remember(key, copy.deepcopy(result))
+            self._write_disk(key, result)
+
+    def record_bypass(self) -> None:
+        """Count a run that was deliberately not cached."""
+        with self._lock:
+            self._bypassed += 1
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers; counters are kept."""
+        with self._lock:
+            self._memory.clear()
+            for path in self._disk_entries():
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> ResultCacheStats:
+        with self._lock:
+            entries = self._disk_usage()
+            return ResultCacheStats(
+                memory_hits=self._memory_hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                bypassed=self._bypassed,
+                memory_entries=len(self._memory),
+                disk_entries=len(entries),
+                disk_bytes=sum(size for _, _, size in entries),
+            )
+
+    def _remember(self, key: str, result: SimulationResult) -> None:
+        if self.max_entries == 0:
+            return
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_entries(self) -> list[Path]:
+        if self.directory is None:
+            return []
+        return list(self.directory.glob(f"*{ENTRY_SUFFIX}"))
+
+    def _disk_usage(self) -> list[tuple[Path, float, int]]:
+        """Return `(path, mtime, size)` of every disk entry, oldest first."""
+        usage = []
+        for path in self._disk_entries():
+            try:
+                info = path.stat()
+            except FileNotFoundError:
+                # Evicted by another process sharing the directory.
+                continue
+            usage.append((path, info.st_mtime, info.st_size))
+        return sorted(usage, key=lambda entry: entry[1])
+
+    def _read_disk(self, key: str) -> SimulationResult | None:
+        if self.directory is None:
+            return None
+        path = self.directory / f"{key}{ENTRY_SUFFIX}"
+        try:
+            payload = json.loads(path.read_text())
+            # Touch the entry so eviction sees it as recently used.
+            os.utime(path)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return SimulationResult(**payload)
+
+    def _write_disk(self, key: str, result: SimulationResult) -> None:
+        if self.directory is None:
+            return
+        path = self.directory / f"{key}{ENTRY_SUFFIX}"
+        temporary = self.directory / f".{key}.tmp"
+        temporary.write_text(json.dumps(result.to_dict()))
+        os.replace(temporary, path)
+
+        entries = self._disk_usage()
+        total = sum(size for _, _, size in entries)
+        for entry_path, _, size in entries:
+            if total <= self.max_bytes:
+                break
+            total -= size
+            entry_path.unlink(missing_ok=True)
@@ -40,3 +40,137 @@ class SimulationResult:
             f"Standard error: {self.standard_error:.8f}\n"
             f"Acceptance ratio: {self.acceptance_ratio:.4f}"
         )
+
+
+@dataclass(frozen=True)
+class AlphaSweepPoint:
+    """Reweighted energy estimate at one variational parameter value."""
+
+    alpha: float
+    energy: float
+    standard_error: float
+    effective_samples: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "alpha": self.alpha,
+            "energy": self.energy,
+            "standard_error": self.standard_error,
+            "effective_samples": self.effective_samples,
+        }
+
+
+@dataclass(frozen=True)
+class AlphaSweepResult:
+    """Energy curve E(alpha) estimated from one reference sample set."""
+
+    method: str
+    system: str
+    reference_alpha: float
+    n_samples: int
+    points: list[AlphaSweepPoint] = field(default_factory=list)
+    parameters: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def best_point(self) -> AlphaSweepPoint:
+        """Grid point with the lowest estimated energy."""
+        return min(self.points, key=lambda point: point.energy)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a plain dictionary for JSON/API responses."""
+        return {
+            "method": self.method,
+            "system": self.system,
+            "reference_alpha": self.reference_alpha,
+            "n_samples": self.n_samples,
+            "best_alpha": self.best_point.alpha,
+            "points": [point.to_dict() for point in self.points],
+            "parameters": dict(self.parameters),
+            "metadata": dict(self.metadata),
+        }
+
+    def to_pretty_text(self) -> str:
+        """Return a compact multi-line summary for CLI output."""
+        lines = [
+            f"Method: {self.method}",
+            f"System: {self.system}",
+            f"Reference alpha: {self.reference_alpha}",
+            f"Samples: {self.n_samples}",
+        ]
+        for point in self.points:
+            lines.append(
+                f" - alpha={point.alpha:.4f}: E={point.energy:.8f} "
+                f"+/- {point.standard_error:.8f} (ESS={point.effective_samples:.0f})"
+            )
+        lines.append(f"Lowest energy at alpha={self.best_point.alpha:.4f}")
+        return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class OptimizationStep:
+    """Estimates gathered at one iteration of a wavefunction optimization."""
+
+    iteration: int
+    parameters: list[float]
+    energy: float
+    standard_error: float
+    gradient: list[float]
+    acceptance_ratio: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "iteration": self.iteration,
+            "parameters": list(self.parameters),
+            "energy": self.energy,
+            "standard_error": self.standard_error,
+            "gradient": list(self.gradient),
+            "acceptance_ratio": self.acceptance_ratio,
+        }
+
+
+@dataclass(frozen=True)
+class OptimizationResult:
+    """Trajectory and final parameters of a wavefunction optimization."""
+
+    method: str
+    system: str
+    converged: bool
+    history: list[OptimizationStep] = field(default_factory=list)
+    parameters: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def final_step(self) -> OptimizationStep:
+        """Last evaluated iteration."""
+        return self.history[-1]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a plain dictionary for JSON/API responses."""
+        final = self.final_step
+        return {
+            "method": self.method,
+            "system": self.system,
+            "converged": self.converged,
+            "n_iterations": len(self.history),
+            "optimized_parameters": list(final.parameters),
+            "energy": final.energy,
+            "standard_error": final.standard_error,
+            "history": [step.to_dict() for step in self.history],
+            "parameters": dict(self.parameters),
+            "metadata": dict(self.metadata),
+        }
+
+    def to_pretty_text(self) -> str:
+        """Return a compact multi-line summary for CLI output."""
+        lines = [f"Method: {self.method}", f"System: {self.system}"]
+        for step in self.history:
+            values = ", ".join(f"{value:.6f}" for value in step.parameters)
+            lines.append(
+                f" - iter {step.iteration:>3}: params=[{values}] "
+                f"E={step.energy:.8f} +/- {step.standard_error:.8f}"
+            )
+        final = ", ".join(f"{value:.6f}" for value in self.final_step.parameters)
+        status = "converged" if self.converged else "not converged"
+        lines.append(f"Optimized parameters: [{final}] ({status})")
+        return "\n".join(lines)
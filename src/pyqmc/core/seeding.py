@@ -0,0 +1,28 @@
+"""Deterministic seed derivation for independent random streams."""
+
+from __future__ import annotations
+
+import hashlib
+
+
+def spawn_seeds(seed: int | None, n_streams: int) -> list[int | None]:
+    """Derive `n_streams` independent child seeds from one root seed.
+
+    Child `i` depends only on `(seed, i)`, so stream assignment is stable no
+    matter how the streams are later distributed over processes. Seeds are
+    taken from SHA-256 digests, which decorrelates neighbouring root seeds in
+    the same spirit as `numpy.random.SeedSequence.spawn` while staying usable
+    by the pure-Python `random.Random` backend.
+
+    A `None` root seed yields `None` children (fresh OS entropy per stream).
+    """
+    if n_streams <= 0:
+        raise ValueError("n_streams must be positive")
+    if seed is None:
+        return [None] * n_streams
+
+    children: list[int | None] = []
+    for index in range(n_streams):
+        digest = hashlib.sha256(f"pyqmc-stream:{seed}:{index}".encode()).digest()
+        children.append(int.from_bytes(digest[:16], "little"))
+    return children
@@ -1,7 +1,10 @@
 """Small statistical helpers for Monte Carlo estimators."""
 
+from __future__ import annotations
+
 import math
 from collections.abc import Sequence
+from dataclasses import dataclass, field
 
 
 def mean(values: Sequence[float]) -> float:
@@ -30,3 +33,268 @@ def standard_error(values: Sequence[float]) -> float:
     if len(values) == 1:
         return 0.0
     return math.sqrt(sample_variance(values) / len(values))
+
+
+@dataclass
+class RunningStats:
+    """Welford running mean/variance in O(1) memory.
+
+    Two accumulators can be combined with `merge`, which uses the pairwise
+    update of Chan, Golub and LeVeque so partial results from independent
+    chunks or chains give the same moments as one long pass.
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    @classmethod
+    def from_moments(cls, count: int, mean: float, m2: float) -> RunningStats:
+        """Build an accumulator from precomputed batch moments."""
+        return cls(count=int(count), mean=float(mean), m2=float(m2))
+
+    def push(self, value: float) -> None:
+        """Add one value."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other: RunningStats) -> None:
+        """Fold another accumulator into this one in place."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+
+    @property
+    def variance(self) -> float:
+        """Unbiased sample variance (ddof=1); zero for fewer than two values."""
+        if self.count < 2:
+            return 0.0
+        return self.m2 / (self.count - 1)
+
+    @property
+    def standard_error(self) -> float:
+        """Standard error of the mean assuming independent values."""
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(self.variance / self.count)
+
+
+@dataclass(frozen=True)
+class BlockingLevel:
+    """Error estimate obtained from blocks of one size."""
+
+    block_size: int
+    n_blocks: int
+    standard_error: float
+    standard_error_error: float
+
+
+@dataclass(frozen=True)
+class BlockingResult:
+    """Outcome of a Flyvbjerg-Petersen blocking (reblocking) analysis.
+
+    Attributes:
+        mean: Mean of the analysed series.
+        naive_standard_error: Error assuming uncorrelated values.
+        standard_error: Error read off the plateau of the blocking curve.
+        block_size: Block size at which the plateau was selected.
+        effective_samples: Number of independent values with the same error,
+            `n * (naive_standard_error / standard_error)^2`.
+        converged: False when the series is too short for any level to meet
+            the plateau criterion; `standard_error` is then the largest
+            well-sampled estimate and should be treated as a lower bound.
+        levels: Per-level estimates, from block size 1 upwards.
+    """
+
+    mean: float
+    naive_standard_error: float
+    standard_error: float
+    block_size: int
+    effective_samples: float
+    converged: bool
+    levels: tuple[BlockingLevel, ...]
+
+
+# Levels with fewer blocks are too noisy to serve as a fallback plateau.
+_MIN_FALLBACK_BLOCKS = 32
+
+
+def _analyse_blocking_levels(levels: Sequence[RunningStats]) -> BlockingResult:
+    """Select the blocking plateau from per-level block-mean statistics.
+
+    Uses the automatic criterion of Lee, Filippi and Foulkes (2011, as in
+    `pyblock`): the optimal level is the smallest block size `B` with
+    `B^3 > 2 N (sigma_B / sigma_1)^4`, where `sigma_B` is the standard error
+    estimated from blocks of size `B`, `sigma_1` is the naive error and `N`
+    is the series length.
+    """
+    base = levels[0]
+    if base.count == 0:
+        raise ValueError("blocking analysis requires at least one value")
+
+    estimates: list[BlockingLevel] = []
+    for index, stats in enumerate(levels):
+        if stats.count < 2:
+            break
+        error = stats.standard_error
+        estimates.append(
+            BlockingLevel(
+                block_size=2**index,
+                n_blocks=stats.count,
+                standard_error=error,
+                standard_error_error=error / math.sqrt(2.0 * (stats.count - 1)),
+            )
+        )
+
+    naive = base.standard_error
+    if not estimates or naive == 0.0:
+        return BlockingResult(
+            mean=base.mean,
+            naive_standard_error=naive,
+            standard_error=naive,
+            block_size=1,
+            effective_samples=float(base.count),
+            converged=True,
+            levels=tuple(estimates),
+        )
+
+    chosen: BlockingLevel | None = None
+    for level in estimates:
+        ratio = level.standard_error / naive
+        if level.block_size**3 > 2.0 * base.count * ratio**4:
+            chosen = level
+            break
+
+    converged = chosen is not None
+    if chosen is None:
+        candidates = [level for level in estimates if level.n_blocks >= _MIN_FALLBACK_BLOCKS]
+        chosen = max(candidates or estimates[:1], key=lambda level: level.standard_error)
+
+    error = chosen.standard_error
+    return BlockingResult(
+        mean=base.mean,
+        naive_standard_error=naive,
+        standard_error=error,
+        block_size=chosen.block_size,
+        effective_samples=base.count * (naive / error) ** 2 if error > 0 else float(base.count),
+        converged=converged,
+        levels=tuple(estimates),
+    )
+
+
+@dataclass
+class BlockingAccumulator:
+    """Streaming series accumulator with running blocking levels.
+
+    Level `k` holds a `RunningStats` over the means of consecutive,
+    non-overlapping blocks of `2**k` series values. Level 0 therefore sees
+    every value and gives the usual Welford mean/variance. Each completed
+    block at level `k` is averaged with its neighbour and pushed one level up,
+    so memory grows as O(log2 N) and each push costs amortized O(1).
+    """
+
+    levels: list[RunningStats] = field(default_factory=lambda: [RunningStats()])
+    pending: list[float | None] = field(default_factory=lambda: [None])
+
+    def push(self, value: float) -> None:
+        """Add one series value and carry completed blocks upward."""
+        levels = self.levels
+        pending = self.pending
+        level = 0
+        while True:
+            # Inlined `RunningStats.push`: this runs once per Monte Carlo step.
+            stats = levels[level]
+            stats.count += 1
+            delta = value - stats.mean
+            stats.mean += delta / stats.count
+            stats.m2 += delta * (value - stats.mean)
+
+            waiting = pending[level]
+            if waiting is None:
+                pending[level] = value
+                return
+            pending[level] = None
+            value = 0.5 * (waiting + value)
+            level += 1
+            if level == len(levels):
+                levels.append(RunningStats())
+                pending.append(None)
+
+    def extend(self, values: Sequence[float]) -> None:
+        """Add many series values; equivalent to pushing them one by one.
+
+        Each level folds the whole chunk in with one batch-moment merge and
+        pairs neighbours with a list comprehension, which is cheaper than
+        per-value `push` calls in pure Python.
+        """
+        levels = self.levels
+        pending = self.pending
+        level = 0
+        chunk = list(values)
+        while chunk:
+            if level == len(levels):
+                levels.append(RunningStats())
+                pending.append(None)
+            chunk_mean = sum(chunk) / len(chunk)
+            chunk_m2 = sum((value - chunk_mean) ** 2 for value in chunk)
+            levels[level].merge(RunningStats.from_moments(len(chunk), chunk_mean, chunk_m2))
+
+            waiting = pending[level]
+            if waiting is not None:
+                chunk.insert(0, waiting)
+            pending[level] = chunk.pop() if len(chunk) % 2 else None
+            chunk = [0.5 * (a + b) for a, b in zip(chunk[0::2], chunk[1::2])]
+            level += 1
+
+    def merge(self, other: BlockingAccumulator) -> None:
+        """Fold the blocking levels of an independent series into this one.
+
+        Block means from both series are pooled level by level, which is the
+        right combination for independent chains. A half-filled block of
+        `other` cannot be paired across series and is dropped, so merging is
+        meant for final analysis rather than for continuing to push values.
+        """
+        while len(self.levels) < len(other.levels):
+            self.levels.append(RunningStats())
+            self.pending.append(None)
+        for mine, theirs in zip(self.levels, other.levels):
+            mine.merge(theirs)
+
+    def analysis(self) -> BlockingResult:
+        """Return the plateau-corrected error of the values seen so far."""
+        return _analyse_blocking_levels(self.levels)
+
+    @property
+    def count(self) -> int:
+        """Number of series values pushed so far."""
+        return self.levels[0].count
+
+    @property
+    def mean(self) -> float:
+        """Running mean of the series."""
+        return self.levels[0].mean
+
+
+def blocking_analysis(values: Sequence[float]) -> BlockingResult:
+    """Run a Flyvbjerg-Petersen blocking analysis in O(N) time.
+
+    The series is repeatedly halved by averaging neighbouring pairs. The
+    standard error estimated at each block size grows while blocks are still
+    correlated and levels off once blocks are longer than the correlation
+    time; the plateau value is the honest error of the mean for correlated
+    Monte Carlo samples.
+    """
+    if not values:
+        raise ValueError("blocking_analysis requires at least one value")
+    accumulator = BlockingAccumulator()
+    accumulator.extend(values)
+    return accumulator.analysis()
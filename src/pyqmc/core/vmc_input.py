@@ -19,6 +19,15 @@ DEFAULT_VMC_STEP_SIZE = 1.0
 DEFAULT_VMC_ALPHA = 1.0
 DEFAULT_VMC_INITIAL_POSITION = 0.0
 DEFAULT_VMC_SEED = 12345
+DEFAULT_VMC_BACKEND = "python"
+DEFAULT_VMC_N_WALKERS = 1
+DEFAULT_VMC_N_CHAINS = 1
+DEFAULT_VMC_WORKERS = 1
+DEFAULT_VMC_TARGET_STANDARD_ERROR: float | None = None
+DEFAULT_VMC_MAX_SECONDS: float | None = None
+DEFAULT_VMC_TUNE_STEP_SIZE = False
+DEFAULT_VMC_TARGET_ACCEPTANCE = 0.5
+DEFAULT_VMC_PROPOSAL = "uniform"
 
 
 def _parse_int(value: Any, field_name: str) -> int:
@@ -37,6 +46,17 @@ def _parse_float(value: Any, field_name: str) -> float:
         raise ValueError(f"{field_name} must be a number") from exc
 
 
+def _parse_bool(value: Any, field_name: str) -> bool:
+    """Parse a boolean flag that may arrive as a form string."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str) and value.strip().lower() in ("true", "false", "1", "0"):
+        return value.strip().lower() in ("true", "1")
+    raise ValueError(f"{field_name} must be a boolean")
+
+
 def _parse_optional_int(value: Any, field_name: str) -> int | None:
     """Parse optional integer field where `None`/empty string means null."""
     if value in (None, ""):
@@ -44,6 +64,13 @@ def _parse_optional_int(value: Any, field_name: str) -> int | None:
     return _parse_int(value, field_name)
 
 
+def _parse_optional_float(value: Any, field_name: str) -> float | None:
+    """Parse optional float field where `None`/empty string means null."""
+    if value in (None, ""):
+        return None
+    return _parse_float(value, field_name)
+
+
 def build_vmc_harmonic_oscillator_config(
     *,
     n_steps: int = DEFAULT_VMC_N_STEPS,
@@ -52,6 +79,15 @@ def build_vmc_harmonic_oscillator_config(
     alpha: float = DEFAULT_VMC_ALPHA,
     initial_position: float = DEFAULT_VMC_INITIAL_POSITION,
     seed: int | None = DEFAULT_VMC_SEED,
+    backend: str = DEFAULT_VMC_BACKEND,
+    n_walkers: int = DEFAULT_VMC_N_WALKERS,
+    n_chains: int = DEFAULT_VMC_N_CHAINS,
+    workers: int = DEFAULT_VMC_WORKERS,
+    target_standard_error: float | None = DEFAULT_VMC_TARGET_STANDARD_ERROR,
+    max_seconds: float | None = DEFAULT_VMC_MAX_SECONDS,
+    tune_step_size: bool = DEFAULT_VMC_TUNE_STEP_SIZE,
+    target_acceptance: float = DEFAULT_VMC_TARGET_ACCEPTANCE,
+    proposal: str = DEFAULT_VMC_PROPOSAL,
 ) -> SimulationConfig:
     """Build a validated `SimulationConfig` for VMC harmonic oscillator runs.
 
@@ -65,6 +101,17 @@ def build_vmc_harmonic_oscillator_config(
         alpha=float(alpha),
         initial_position=float(initial_position),
         seed=None if seed is None else int(seed),
+        backend=str(backend),
+        n_walkers=int(n_walkers),
+        n_chains=int(n_chains),
+        workers=int(workers),
+        target_standard_error=(
+            None if target_standard_error is None else float(target_standard_error)
+        ),
+        max_seconds=None if max_seconds is None else float(max_seconds),
+        tune_step_size=bool(tune_step_size),
+        target_acceptance=float(target_acceptance),
+        proposal=str(proposal),
     )
     config.validate()
     return config
@@ -94,4 +141,28 @@ def build_vmc_harmonic_oscillator_config_from_mapping(
             "initial_position",
         ),
         seed=_parse_optional_int(payload.get("seed", DEFAULT_VMC_SEED), "seed"),
+        backend=str(payload.get("backend", DEFAULT_VMC_BACKEND)),
+        n_walkers=_parse_int(
+            payload.get("n_walkers", DEFAULT_VMC_N_WALKERS),
+            "n_walkers",
+        ),
+        n_chains=_parse_int(payload.get("n_chains", DEFAULT_VMC_N_CHAINS), "n_chains"),
+        workers=_parse_int(payload.get("workers", DEFAULT_VMC_WORKERS), "workers"),
+        target_standard_error=_parse_optional_float(
+            payload.get("target_standard_error", DEFAULT_VMC_TARGET_STANDARD_ERROR),
+            "target_standard_error",
+        ),
+        max_seconds=_parse_optional_float(
+            payload.get("max_seconds", DEFAULT_VMC_MAX_SECONDS),
+            "max_seconds",
+        ),
+        tune_step_size=_parse_bool(
+            payload.get("tune_step_size", DEFAULT_VMC_TUNE_STEP_SIZE),
+            "tune_step_size",
+        ),
+        target_acceptance=_parse_float(
+            payload.get("target_acceptance", DEFAULT_VMC_TARGET_ACCEPTANCE),
+            "target_acceptance",
+        ),
+        proposal=str(payload.get("proposal", DEFAULT_VMC_PROPOSAL)),
     )
@@ -1,4 +1,9 @@
-"""Diffusion Monte Carlo (DMC) module placeholder.
+"""Diffusion Monte Carlo (DMC) implementations.
 
-Implemented in later phases.
+The engine (`pyqmc.dmc.engine`) requires NumPy and is imported lazily by the
+runners in `pyqmc.dmc.solver`.
 """
+
+from .solver import run_dmc_harmonic_oscillator
+
+__all__ = ["run_dmc_harmonic_oscillator"]
@@ -0,0 +1,346 @@
+"""Vectorized importance-sampled Diffusion Monte Carlo.
+
+The walker population lives in contiguous NumPy arrays (`WalkerPopulation`).
+Every time step applies, to the whole population at once:
+
+1. a drift-diffusion move `x' = x + tau v(x) + sqrt(tau) eta` along the trial
+   drift velocity `v = grad ln psi_T`, accepted with the Metropolis test of
+   the Langevin proposal so that `psi_T^2` is sampled without time-step bias
+   at `E_T = E_L`;
+2. a branching weight `w = exp(-tau_eff ((E_L(x) + E_L(x')) / 2 - E_T))`;
+3. birth-death by stochastic rounding: every walker is copied
+   `floor(w + u)` times with one `np.repeat`.
+
+The reference energy `E_T` follows the population with the feedback
+`E_T = E_est - (feedback / tau) ln(N / N_target)`. Two estimators of the
+ground-state energy are accumulated after equilibration: the mixed estimator
+(population average of `E_L`) and the growth estimator
+`E_T - ln(<w>) / tau_eff`.
+
+This module requires NumPy (install with `pip install -e '.[numpy]'`).
+"""
+
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from pyqmc.core.config import SimulationConfig
+from pyqmc.core.stats import BlockingAccumulator, RunningStats
+from pyqmc.vmc.system import BatchedDriftSystem, BatchedSystem
+
+DEFAULT_POPULATION_FEEDBACK = 0.1
+
+
+@dataclass
+class WalkerPopulation:
+    """Walker positions with the cached quantities every step needs.
+
+    All arrays share their first axis; `positions` and `drift` have shape
+    `(n_walkers, n_dim)`, the others `(n_walkers,)`.
+    """
+
+    positions: np.ndarray
+    log_prob: np.ndarray
+    local_energy: np.ndarray
+    drift: np.ndarray
+
+    @classmethod
+    def from_positions(
+        cls,
+        system: Any,
+        positions: np.ndarray,
+        alpha: Any,
+    ) -> WalkerPopulation:
+        """Evaluate the cached quantities for fresh `positions`."""
+        return cls(
+            positions=positions,
+            log_prob=system.batched_log_probability_density(positions, alpha),
+            local_energy=system.batched_local_energy(positions, alpha),
+            drift=system.batched_drift_velocity(positions, alpha),
+        )
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def take(self, indices: np.ndarray) -> WalkerPopulation:
+        """Return the walkers at `indices` (repeats allowed) as new arrays."""
+        return WalkerPopulation(
+            positions=self.positions[indices],
+            log_prob=self.log_prob[indices],
+            local_energy=self.local_energy[indices],
+            drift=self.drift[indices],
+        )
+
+
+def drift_diffuse(
+    system: Any,
+    population: WalkerPopulation,
+    alpha: Any,
+    tau: float,
+    rng: np.random.Generator,
+) -> tuple[WalkerPopulation, np.ndarray]:
+    """Move every walker once; return the new population and the accept mask."""
+    x = population.positions
+    proposal = x + tau * population.drift + math.sqrt(tau) * rng.standard_normal(x.shape)
+    trial = WalkerPopulation.from_positions(system, proposal, alpha)
+
+    forward = proposal - x - tau * population.drift
+    backward = x - proposal - tau * trial.drift
+    log_green_ratio = ((forward * forward).sum(axis=1) - (backward * backward).sum(axis=1)) / (
+        2.0 * tau
+    )
+    log_accept_ratio = trial.log_prob - population.log_prob + log_green_ratio
+    accept = np.log(rng.random(len(x))) < log_accept_ratio
+
+    moved = WalkerPopulation(
+        positions=np.where(accept[:, None], trial.positions, x),
+        log_prob=np.where(accept, trial.log_prob, population.log_prob),
+        local_energy=np.where(accept, trial.local_energy, population.local_energy),
+        drift=np.where(accept[:, None], trial.drift, population.drift),
+    )
+    return moved, accept
+
+
+def branching_weights(
+    old_energy: np.ndarray,
+    new_energy: np.ndarray,
+    reference_energy: float,
+    tau_eff: float,
+) -> np.ndarray:
+    """Return `exp(-tau_eff ((E_old + E_new) / 2 - E_T))` for every walker.
+
+    Local energies are clipped to `E_T +/- 2 / sqrt(tau_eff)` first, which
+    only acts on rare outliers and keeps a single walker from flooding the
+    population.
+    """
+    cutoff = 2.0 / math.sqrt(tau_eff)
+    low, high = reference_energy - cutoff, reference_energy + cutoff
+    average = 0.5 * (np.clip(old_energy, low, high) + np.clip(new_energy, low, high))
+    return np.exp(-tau_eff * (average - reference_energy))
+
+
+def branch(
+    population: WalkerPopulation,
+    weights: np.ndarray,
+    rng: np.random.Generator,
+) -> WalkerPopulation:
+    """Birth-death by stochastic rounding, `floor(w + u)` copies per walker."""
+    copies = np.floor(weights + rng.random(len(weights))).astype(np.intp)
+    return population.take(np.repeat(np.arange(len(weights)), copies))
+
+
+def population_control(
+    energy_estimate: float,
+    population: int,
+    target_population: int,
+    tau: float,
+    feedback: float,
+) -> float:
+    """Return the reference energy that steers `population` to the target."""
+    return energy_estimate - feedback / tau * math.log(population / target_population)
+
+
+@dataclass
+class StepTally:
+    """Sums describing one time step of one (sub-)population.
+
+    Tallies of disjoint sub-populations taken at the same step combine
+    exactly with `merge`, which is how multi-process runs reduce them.
+    """
+
+    walkers_before: int = 0
+    weight_sum: float = 0.0
+    accepted: int = 0
+    energy: RunningStats = field(default_factory=RunningStats)
+
+    def merge(self, other: StepTally) -> None:
+        """Fold another sub-population's tally for the same step into this one."""
+        self.walkers_before += other.walkers_before
+        self.weight_sum += other.weight_sum
+        self.accepted += other.accepted
+        self.energy.merge(other.energy)
+
+
+def dmc_step(
+    system: Any,
+    population: WalkerPopulation,
+    alpha: Any,
+    tau: float,
+    tau_eff: float,
+    reference_energy: float,
+    rng: np.random.Generator,
+) -> tuple[WalkerPopulation, StepTally]:
+    """Move, weight and branch `population` once."""
+    moved, accept = drift_diffuse(system, population, alpha, tau, rng)
+    weights = branching_weights(
+        population.local_energy, moved.local_energy, reference_energy, tau_eff
+    )
+    branched = branch(moved, weights, rng)
+
+    energies = branched.local_energy
+    energy = RunningStats()
+    if len(energies):
+        step_mean = float(energies.mean())
+        deviations = energies - step_mean
+        energy = RunningStats.from_moments(len(energies), step_mean, deviations @ deviations)
+    tally = StepTally(
+        walkers_before=len(population),
+        weight_sum=float(weights.sum()),
+        accepted=int(np.count_nonzero(accept)),
+        energy=energy,
+    )
+    return branched, tally
+
+
+@dataclass
+class DmcEstimators:
+    """Streaming DMC energy estimators collected after equilibration.
+
+    `mixed_stats` holds every walker's local energy (population-weighted
+    mean); the blocking accumulators receive one value per time step.
+    """
+
+    mixed_stats: RunningStats = field(default_factory=RunningStats)
+    mixed_blocks: BlockingAccumulator = field(default_factory=BlockingAccumulator)
+    growth_stats: RunningStats = field(default_factory=RunningStats)
+    growth_blocks: BlockingAccumulator = field(default_factory=BlockingAccumulator)
+    population_stats: RunningStats = field(default_factory=RunningStats)
+
+    def push(self, tally: StepTally, growth_energy: float) -> None:
+        """Record one time step of the whole (branched) population."""
+        self.mixed_stats.merge(tally.energy)
+        self.mixed_blocks.push(tally.energy.mean)
+        self.growth_stats.push(growth_energy)
+        self.growth_blocks.push(growth_energy)
+        self.population_stats.push(float(tally.energy.count))
+
+
+def growth_energy(tally: StepTally, reference_energy: float, tau_eff: float) -> float:
+    """Growth estimator `E_T - ln(<w>) / tau_eff` of one step."""
+    return reference_energy - math.log(tally.weight_sum / tally.walkers_before) / tau_eff
+
+
+class DmcRun(ABC):
+    """Bookkeeping shared by single- and multi-process DMC drivers.
+
+    `config.step_size` is the time step `tau`, `config.n_walkers` the target
+    population, `config.n_steps` the total number of time steps and
+    `config.burn_in` the equilibration steps excluded from the estimators.
+    Walkers start at `config.initial_position`. Subclasses must implement
+    the abstract `advance` and `population_size`, feeding every step of the
+    whole population to `record`.
+    """
+
+    def __init__(
+        self,
+        system: BatchedSystem,
+        config: SimulationConfig,
+        *,
+        feedback: float = DEFAULT_POPULATION_FEEDBACK,
+    ) -> None:
+        if not isinstance(system, BatchedDriftSystem):
+            raise TypeError(f"{system.name} does not implement BatchedDriftSystem, required by DMC")
+        if feedback <= 0:
+            raise ValueError("feedback must be positive")
+        self.system = system
+        self.config = config
+        self.feedback = feedback
+        self.steps_done = 0
+        self.accepted_moves = 0
+        self.attempted_moves = 0
+
+        start = np.full((1, system.n_dim), config.initial_position, dtype=float)
+        self.reference_energy = float(system.batched_local_energy(start, config.alpha)[0])
+        self.estimators = DmcEstimators()
+
+    def __enter__(self) -> DmcRun:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release worker resources; a no-op for in-process runs."""
+
+    @property
+    @abstractmethod
+    def population_size(self) -> int:
+        """Current number of walkers over the whole population."""
+
+    @property
+    def tau(self) -> float:
+        return self.config.step_size
+
+    @property
+    def acceptance_ratio(self) -> float:
+        if self.attempted_moves == 0:
+            return 1.0
+        return self.accepted_moves / self.attempted_moves
+
+    @property
+    def effective_time_step(self) -> float:
+        """`tau` scaled by the acceptance ratio, used for branching."""
+        return self.tau * self.acceptance_ratio
+
+    @abstractmethod
+    def advance(self, n_steps: int) -> None:
+        """Run `n_steps` more time steps."""
+
+    def record(self, tally: StepTally, tau_eff: float) -> None:
+        """Count one step of the whole population and feed the estimators."""
+        if tally.energy.count == 0:
+            raise RuntimeError("DMC population died out; reduce step_size")
+        self.accepted_moves += tally.accepted
+        self.attempted_moves += tally.walkers_before
+        if self.steps_done >= self.config.burn_in:
+            self.estimators.push(tally, growth_energy(tally, self.reference_energy, tau_eff))
+        self.steps_done += 1
+
+    def next_reference_energy(self, tally: StepTally) -> float:
+        """Reference energy after a step that left `tally.energy.count` walkers."""
+        mixed = self.estimators.mixed_stats
+        estimate = mixed.mean if mixed.count else tally.energy.mean
+        return population_control(
+            estimate, tally.energy.count, self.config.n_walkers, self.tau, self.feedback
+        )
+
+
+class DmcEngine(DmcRun):
+    """Resumable DMC run on one in-process walker population."""
+
+    def __init__(
+        self,
+        system: BatchedSystem,
+        config: SimulationConfig,
+        *,
+        feedback: float = DEFAULT_POPULATION_FEEDBACK,
+    ) -> None:
+        super().__init__(system, config, feedback=feedback)
+        self.rng = np.random.default_rng(config.seed)
+        positions = np.full((config.n_walkers, system.n_dim), config.initial_position, dtype=float)
+        self.population = WalkerPopulation.from_positions(system, positions, config.alpha)
+
+    @property
+    def population_size(self) -> int:
+        return len(self.population)
+
+    def advance(self, n_steps: int) -> None:
+        """Run `n_steps` more time steps."""
+        for _ in range(n_steps):
+            tau_eff = self.effective_time_step
+            self.population, tally = dmc_step(
+                self.system,
+                self.population,
+                self.config.alpha,
+                self.tau,
+                tau_eff,
+                self.reference_energy,
+                self.rng,
+            )
+            self.record(tally, tau_eff)
+            self.reference_energy = self.next_reference_energy(tally)
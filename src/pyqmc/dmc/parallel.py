@@ -0,0 +1,361 @@
+"""Multi-process DMC with shared-memory walker exchange.
+
+The walker population is split over `config.workers` local processes. Every
+exchange round, each worker:
+
+1. rebuilds its sub-population from the shared staging buffer according to
+   the balance plan of the previous round (`balance_plan`),
+2. runs `steps_per_exchange` DMC steps with the global reference energy,
+3. writes its walkers back to its slot of the other staging buffer and
+   returns one `StepTally` per step through its pipe.
+
+The parent merges the tallies step by step, so estimators and population
+control see the whole population exactly as in a single-process run, and
+plans the next rebalance so every worker again holds `N / workers` walkers.
+Only walkers moving between workers are copied. Staging is double-buffered:
+a worker writes round `r` while slower workers may still read round `r - 1`
+from the other buffer, so no extra barrier is needed.
+
+Walkers are exchanged through `multiprocessing.shared_memory`, so this runs on
+one machine with no MPI. Random streams come from `spawn_seeds`; results
+depend on the worker count. This module requires NumPy.
+"""
+
+from __future__ import annotations
+
+import math
+import multiprocessing
+import time
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import numpy as np
+
+from pyqmc.core.config import SimulationConfig
+from pyqmc.core.seeding import spawn_seeds
+from pyqmc.dmc.engine import (
+    DEFAULT_POPULATION_FEEDBACK,
+    DmcRun,
+    StepTally,
+    WalkerPopulation,
+    dmc_step,
+)
+from pyqmc.vmc.system import BatchedSystem
+
+DEFAULT_STEPS_PER_EXCHANGE = 1
+
+# Slot capacity per worker, as a multiple of its share of the target
+# population; branching between exchanges rarely exceeds 1.5x.
+_SLOT_CAPACITY_FACTOR = 4
+_SLOT_CAPACITY_PAD = 64
+
+# A plan lists, for every worker, the `(source worker, start, stop)` walker
+# slices that form its next sub-population.
+BalancePlan = list[list[tuple[int, int, int]]]
+
+
+def balance_plan(counts: list[int]) -> BalancePlan:
+    """Split `sum(counts)` walkers evenly, moving as few walkers as possible.
+
+    Every worker keeps its own walkers up to its new share; surplus walkers
+    fill the deficits of other workers in worker order.
+    """
+    n_workers = len(counts)
+    total = sum(counts)
+    base, extra = divmod(total, n_workers)
+    shares = [base + (1 if index < extra else 0) for index in range(n_workers)]
+
+    plan: BalancePlan = [[] for _ in range(n_workers)]
+    surplus: list[list[int]] = []
+    for index, (count, share) in enumerate(zip(counts, shares)):
+        kept = min(count, share)
+        if kept:
+            plan[index].append((index, 0, kept))
+        if count > share:
+            surplus.append([index, share, count])
+
+    for index, (count, share) in enumerate(zip(counts, shares)):
+        needed = share - min(count, share)
+        while needed:
+            source, start, stop = surplus[0]
+            taken = min(needed, stop - start)
+            plan[index].append((source, start, start + taken))
+            needed -= taken
+            if start + taken == stop:
+                surplus.pop(0)
+            else:
+                surplus[0][1] = start + taken
+    return plan
+
+
+def moved_walkers(plan: BalancePlan) -> int:
+    """Number of walkers a plan copies between different workers."""
+    return sum(
+        stop - start
+        for index, slices in enumerate(plan)
+        for source, start, stop in slices
+        if source != index
+    )
+
+
+def _pack(population: WalkerPopulation, slot: np.ndarray) -> None:
+    n_walkers, n_dim = population.positions.shape
+    slot[:n_walkers, :n_dim] = population.positions
+    slot[:n_walkers, n_dim : 2 * n_dim] = population.drift
+    slot[:n_walkers, 2 * n_dim] = population.log_prob
+    slot[:n_walkers, 2 * n_dim + 1] = population.local_energy
+
+
+def _unpack(records: np.ndarray, n_dim: int) -> WalkerPopulation:
+    return WalkerPopulation(
+        positions=records[:, :n_dim].copy(),
+        log_prob=records[:, 2 * n_dim].copy(),
+        local_energy=records[:, 2 * n_dim + 1].copy(),
+        drift=records[:, n_dim : 2 * n_dim].copy(),
+    )
+
+
+def _serve_round(
+    system: Any,
+    config: SimulationConfig,
+    index: int,
+    rng: np.random.Generator,
+    population: WalkerPopulation,
+    stage: np.ndarray,
+    message: tuple[Any, ...],
+) -> tuple[WalkerPopulation, tuple[int, list[StepTally], float]]:
+    """Rebuild, step and stage one worker's sub-population for one round."""
+    plan, read_buffer, n_steps, reference_energy, tau_eff = message
+    n_dim = system.n_dim
+    start = time.process_time()
+    if plan is not None:
+        # Rebalancing can leave a worker with no walkers for a round.
+        records = [stage[read_buffer, source, lo:hi] for source, lo, hi in plan]
+        population = _unpack(
+            np.concatenate(records) if records else stage[read_buffer, index, :0], n_dim
+        )
+    tallies = []
+    for _ in range(n_steps):
+        population, tally = dmc_step(
+            system,
+            population,
+            config.alpha,
+            config.step_size,
+            tau_eff,
+            reference_energy,
+            rng,
+        )
+        tallies.append(tally)
+    if len(population) > stage.shape[2]:
+        raise RuntimeError("DMC sub-population outgrew its staging slot")
+    _pack(population, stage[1 - read_buffer, index])
+    return population, (len(population), tallies, time.process_time() - start)
+
+
+def _worker_main(
+    conn: Connection,
+    system: Any,
+    config: SimulationConfig,
+    index: int,
+    seed: int | None,
+    initial_walkers: int,
+    shm_name: str,
+    stage_shape: tuple[int, ...],
+) -> None:
+    """Serve exchange rounds for one sub-population until told to stop."""
+    shm = SharedMemory(name=shm_name)
+    stage = np.ndarray(stage_shape, dtype=float, buffer=shm.buf)
+    try:
+        rng = np.random.default_rng(seed)
+        positions = np.full(
+            (initial_walkers, system.n_dim), config.initial_position, dtype=float
+        )
+        population = WalkerPopulation.from_positions(system, positions, config.alpha)
+
+        while (message := conn.recv()) is not None:
+            try:
+                population, reply = _serve_round(
+                    system, config, index, rng, population, stage, message
+                )
+            except Exception as exc:  # report to the parent instead of dying
+                conn.send(exc)
+                continue
+            conn.send(reply)
+    finally:
+        del stage
+        shm.close()
+
+
+@dataclass
+class LoadBalanceMetrics:
+    """Per-worker populations and CPU time collected over exchange rounds.
+
+    `imbalance` of a round is `max / mean - 1` of the per-worker populations
+    just before rebalancing; 0 means perfectly even work.
+    """
+
+    n_workers: int
+    rounds: int = 0
+    walkers_moved: int = 0
+    walkers_after_steps: int = 0
+    imbalance_sum: float = 0.0
+    max_imbalance: float = 0.0
+    worker_populations: list[float] = field(default_factory=list)
+    worker_cpu_seconds: list[float] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.worker_populations = [0.0] * self.n_workers
+        self.worker_cpu_seconds = [0.0] * self.n_workers
+
+    def record(self, counts: list[int], cpu_seconds: list[float], plan: BalancePlan) -> None:
+        mean = sum(counts) / len(counts)
+        imbalance = max(counts) / mean - 1.0 if mean > 0 else 0.0
+        self.rounds += 1
+        self.imbalance_sum += imbalance
+        self.max_imbalance = max(self.max_imbalance, imbalance)
+        self.walkers_moved += moved_walkers(plan)
+        self.walkers_after_steps += sum(counts)
+        for index, (count, cpu) in enumerate(zip(counts, cpu_seconds)):
+            self.worker_populations[index] += count
+            self.worker_cpu_seconds[index] += cpu
+
+    def to_dict(self) -> dict[str, Any]:
+        rounds = max(self.rounds, 1)
+        busiest = max(self.worker_cpu_seconds, default=0.0)
+        mean_cpu = sum(self.worker_cpu_seconds) / max(self.n_workers, 1)
+        return {
+            "workers": self.n_workers,
+            "exchange_rounds": self.rounds,
+            "mean_imbalance": self.imbalance_sum / rounds,
+            "max_imbalance": self.max_imbalance,
+            "moved_fraction": (
+                self.walkers_moved / self.walkers_after_steps if self.walkers_after_steps else 0.0
+            ),
+            "mean_worker_populations": [count / rounds for count in self.worker_populations],
+            "worker_cpu_seconds": list(self.worker_cpu_seconds),
+            "cpu_imbalance": busiest / mean_cpu - 1.0 if mean_cpu > 0 else 0.0,
+        }
+
+
+class ParallelDmcEngine(DmcRun):
+    """DMC population spread over `config.workers` local processes.
+
+    Use as a context manager (or call `close`) so the workers and the shared
+    staging buffer are released. `steps_per_exchange` trades exchange
+    overhead against how far sub-populations drift apart between rebalances;
+    the reference energy is updated once per exchange.
+    """
+
+    def __init__(
+        self,
+        system: BatchedSystem,
+        config: SimulationConfig,
+        *,
+        feedback: float = DEFAULT_POPULATION_FEEDBACK,
+        steps_per_exchange: int = DEFAULT_STEPS_PER_EXCHANGE,
+    ) -> None:
+        super().__init__(system, config, feedback=feedback)
+        if steps_per_exchange <= 0:
+            raise ValueError("steps_per_exchange must be positive")
+        n_workers = config.workers
+        if config.n_walkers < n_workers:
+            raise ValueError("n_walkers must be at least workers for parallel DMC")
+        self.steps_per_exchange = steps_per_exchange
+        self.metrics = LoadBalanceMetrics(n_workers)
+
+        initial = balance_plan([config.n_walkers] + [0] * (n_workers - 1))
+        self.counts = [sum(hi - lo for _, lo, hi in slices) for slices in initial]
+        capacity = _SLOT_CAPACITY_FACTOR * math.ceil(config.n_walkers / n_workers)
+        capacity += _SLOT_CAPACITY_PAD
+        stage_shape = (2, n_workers, capacity, 2 * system.n_dim + 2)
+        self._shm = SharedMemory(create=True, size=int(np.prod(stage_shape)) * 8)
+        self._read_buffer = 0
+        self._plan: BalancePlan | None = None
+        self._connections: list[Connection] = []
+        self._processes: list[multiprocessing.Process] = []
+
+        seeds = spawn_seeds(config.seed, n_workers)
+        try:
+            for index in range(n_workers):
+                parent_conn, child_conn = multiprocessing.Pipe()
+                process = multiprocessing.Process(
+                    target=_worker_main,
+                    args=(
+                        child_conn,
+                        system,
+                        config,
+                        index,
+                        seeds[index],
+                        self.counts[index],
+                        self._shm.name,
+                        stage_shape,
+                    ),
+                    daemon=True,
+                )
+                process.start()
+                child_conn.close()
+                self._connections.append(parent_conn)
+                self._processes.append(process)
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def population_size(self) -> int:
+        return sum(self.counts)
+
+    def advance(self, n_steps: int) -> None:
+        """Run `n_steps` more time steps on all workers."""
+        remaining = n_steps
+        while remaining > 0:
+            chunk = min(self.steps_per_exchange, remaining)
+            self._exchange_round(chunk)
+            remaining -= chunk
+
+    def _exchange_round(self, n_steps: int) -> None:
+        tau_eff = self.effective_time_step
+        for index, conn in enumerate(self._connections):
+            slices = None if self._plan is None else self._plan[index]
+            conn.send((slices, self._read_buffer, n_steps, self.reference_energy, tau_eff))
+
+        replies = [conn.recv() for conn in self._connections]
+        for reply in replies:
+            if isinstance(reply, Exception):
+                raise reply
+        self.counts = [count for count, _, _ in replies]
+        cpu_seconds = [cpu for _, _, cpu in replies]
+
+        tally = StepTally()
+        for step in range(n_steps):
+            tally = StepTally()
+            for _, tallies, _ in replies:
+                tally.merge(tallies[step])
+            self.record(tally, tau_eff)
+        self.reference_energy = self.next_reference_energy(tally)
+
+        self._plan = balance_plan(self.counts)
+        self.metrics.record(self.counts, cpu_seconds, self._plan)
+        # Workers wrote this round into the other buffer.
+        self._read_buffer = 1 - self._read_buffer
+
+    def close(self) -> None:
+        """Stop the workers and free the shared staging buffer."""
+        for conn in self._connections:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for conn in self._connections:
+            conn.close()
+        self._connections = []
+        self._processes = []
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 import argparse
+import json
 import subprocess
 import sys
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal
 from urllib.parse import urlencode
 from urllib.request import urlopen
 
+from pyqmc.application.cache import get_result_cache_stats
 from pyqmc.application.vmc import run_vmc_harmonic_oscillator_use_case
+from pyqmc.core.progress import ProgressSnapshot
 from pyqmc.core.vmc_input import build_vmc_harmonic_oscillator_config_from_mapping
 
 ComputeMode = Literal["auto", "direct", "api"]
@@ -28,7 +32,16 @@ class EmbeddedApiProcess:
 
 
 class LocalComputeBridge:
-    """Expose local Python computations directly to frontend JavaScript."""
+    """Expose local Python computations directly to frontend JavaScript.
+
+    `on_progress`, when given, receives each progress snapshot of a running
+    simulation as a JSON-serializable dict; the GUI host forwards them to
+    the page. The sampler throttles snapshots, so a slow listener cannot
+    take more than about 1% of the run time.
+    """
+
+    def __init__(self, on_progress: Callable[[dict[str, Any]], None] | None = None) -> None:
+        self._on_progress = on_progress
 
     def run_vmc_harmonic_oscillator(self, payload: dict[str, Any]) -> dict[str, Any]:
         """Run VMC locally without HTTP and return JSON-serializable result."""
@@ -41,9 +54,26 @@ class LocalComputeBridge:
             alpha=config.alpha,
             initial_position=config.initial_position,
             seed=config.seed,
+            backend=config.backend,
+            n_walkers=config.n_walkers,
+            n_chains=config.n_chains,
+            workers=config.workers,
+            target_standard_error=config.target_standard_error,
+            max_seconds=config.max_seconds,
+            tune_step_size=config.tune_step_size,
+            target_acceptance=config.target_acceptance,
+            proposal=config.proposal,
+            progress=None if self._on_progress is None else self._report_progress,
         )
         return result.to_dict()
 
+    def _report_progress(self, snapshot: ProgressSnapshot) -> None:
+        self._on_progress(snapshot.to_dict())
+
+    def result_cache_stats(self) -> dict[str, Any]:
+        """Return hit/miss counters of the result cache shared with the API."""
+        return get_result_cache_stats()
+
 
 def _wait_for_api_health(base_url: str, timeout_seconds: float = 15.0) -> None:
     """Poll `/health` until the API is reachable or timeout elapses."""
@@ -215,10 +245,16 @@ def launch_gui(
         compute_mode=compute_mode,
     )
 
+    def _push_progress(snapshot: dict[str, Any]) -> None:
+        # app.js installs window.pyqmcOnProgress to render snapshots.
+        window.evaluate_js(
+            f"window.pyqmcOnProgress && window.pyqmcOnProgress({json.dumps(snapshot)})"
+        )
+
     window = webview.create_window(
         title="pyQMC Educational GUI",
         url=frontend_url,
-        js_api=LocalComputeBridge(),
+        js_api=LocalComputeBridge(on_progress=_push_progress),
         width=width,
         height=height,
         min_size=(980, 680),
@@ -3,6 +3,7 @@
   const transportModeEl = document.getElementById("transport-mode");
   const apiUrlEl = document.getElementById("api-url");
   const resultEl = document.getElementById("result");
+  const progressEl = document.getElementById("progress");
   const runBtn = document.getElementById("run-btn");
   const form = document.getElementById("vmc-form");
 
@@ -42,6 +43,21 @@
     return Number(x).toFixed(digits);
   }
 
+  function renderProgress(snapshot) {
+    const parts = [
+      `${fmt(100 * snapshot.fraction_done, 1)}% (${snapshot.steps_done}/${snapshot.total_steps} steps)`,
+    ];
+    if (snapshot.mean_energy !== null) {
+      parts.push(`E = ${fmt(snapshot.mean_energy, 6)} ± ${fmt(snapshot.standard_error, 6)}`);
+    }
+    parts.push(`acceptance ${fmt(snapshot.acceptance_ratio, 3)}`);
+    parts.push(`${Math.round(snapshot.steps_per_second)} steps/s`);
+    progressEl.textContent = parts.join(" | ");
+  }
+
+  // The local bridge pushes snapshots here through window.evaluate_js.
+  window.pyqmcOnProgress = renderProgress;
+
   function renderResult(data) {
     const exact = data.metadata && data.metadata.exact_ground_state_energy;
     const delta = exact !== undefined ? data.mean_energy - exact : null;
@@ -131,10 +147,11 @@
     }
 
     setTransportMode(transportLabel);
-    const response = await fetch(`${apiBaseUrl}/simulate/vmc/harmonic-oscillator`, {
+    // Run as a background job so progress can stream back over SSE.
+    const response = await fetch(`${apiBaseUrl}/jobs`, {
       method: "POST",
       headers: { "Content-Type": "application/json" },
-      body: JSON.stringify(payload),
+      body: JSON.stringify({ kind: "vmc_harmonic_oscillator", parameters: payload }),
     });
 
     if (!response.ok) {
@@ -142,7 +159,33 @@
       throw new Error(`API ${response.status}: ${detail}`);
     }
 
-    return response.json();
+    const job = await response.json();
+    return followJob(job.id);
+  }
+
+  function followJob(jobId) {
+    return new Promise((resolve, reject) => {
+      const events = new EventSource(`${apiBaseUrl}/jobs/${jobId}/events`);
+
+      events.addEventListener("progress", (evt) => {
+        renderProgress(JSON.parse(evt.data));
+      });
+
+      events.addEventListener("done", (evt) => {
+        events.close();
+        const job = JSON.parse(evt.data);
+        if (job.status === "succeeded") {
+          resolve(job.result);
+        } else {
+          reject(new Error(job.error || `Job ${job.status}`));
+        }
+      });
+
+      events.onerror = () => {
+        events.close();
+        reject(new Error("Lost the job event stream"));
+      };
+    });
   }
 
   async function runWithConfiguredMode(payload) {
@@ -169,6 +212,7 @@
     runBtn.disabled = true;
     runBtn.textContent = "Running...";
     resultEl.textContent = "Submitting simulation request...";
+    progressEl.textContent = "(starting)";
     setTransportMode("running...");
 
     try {
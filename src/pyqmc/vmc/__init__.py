@@ -1,5 +1,27 @@
 """Variational Monte Carlo (VMC) educational implementations."""
 
-from .solver import run_vmc_harmonic_oscillator
+from .solver import (
+    run_vmc_harmonic_oscillator,
+    run_vmc_harmonic_oscillator_alpha_sweep,
+    run_vmc_harmonic_oscillator_optimization,
+)
+from .system import (
+    BatchedDriftSystem,
+    BatchedSystem,
+    DriftSystem,
+    OptimizableSystem,
+    ScalarFallbackMixin,
+    ScalarSystem,
+)
 
-__all__ = ["run_vmc_harmonic_oscillator"]
+__all__ = [
+    "BatchedDriftSystem",
+    "BatchedSystem",
+    "DriftSystem",
+    "OptimizableSystem",
+    "ScalarFallbackMixin",
+    "ScalarSystem",
+    "run_vmc_harmonic_oscillator",
+    "run_vmc_harmonic_oscillator_alpha_sweep",
+    "run_vmc_harmonic_oscillator_optimization",
+]
@@ -3,11 +3,20 @@
 Units are chosen as hbar = m = omega = 1.
 """
 
+from typing import Any
+
 
 class HarmonicOscillator1D:
-    """Simple analytic model used as a first educational VMC target."""
+    """Simple analytic model used as a first educational VMC target.
+
+    Implements the scalar, batched, drift and optimizable system protocols
+    from `pyqmc.vmc.system`. The scalar methods are kept as explicit closed forms so
+    the pure-Python sampler never needs NumPy.
+    """
 
     name = "harmonic_oscillator_1d"
+    n_dim = 1
+    n_parameters = 1
 
     def log_trial_wavefunction(self, x: float, alpha: float) -> float:
         """Return log(psi_T(x; alpha)) for psi_T = exp(-alpha * x^2 / 2)."""
@@ -24,3 +33,28 @@ class HarmonicOscillator1D:
         E_L(x) = alpha / 2 + (1 - alpha^2) * x^2 / 2
         """
         return 0.5 * alpha + 0.5 * (1.0 - alpha * alpha) * x * x
+
+    def drift_velocity(self, x: float, alpha: float) -> float:
+        """Return the drift velocity d ln(psi_T) / dx = -alpha * x."""
+        return -alpha * x
+
+    def batched_log_trial_wavefunction(self, positions: Any, alpha: float) -> Any:
+        """Return log(psi_T) for a `(n_walkers, 1)` array of positions."""
+        return self.log_trial_wavefunction(positions[:, 0], alpha)
+
+    def batched_log_probability_density(self, positions: Any, alpha: float) -> Any:
+        """Return log(|psi_T|^2) for a `(n_walkers, 1)` array of positions."""
+        return self.log_probability_density(positions[:, 0], alpha)
+
+    def batched_local_energy(self, positions: Any, alpha: float) -> Any:
+        """Return E_L for a `(n_walkers, 1)` array of positions."""
+        return self.local_energy(positions[:, 0], alpha)
+
+    def batched_drift_velocity(self, positions: Any, alpha: float) -> Any:
+        """Return grad ln(psi_T) with the same `(n_walkers, 1)` shape as `positions`."""
+        return -alpha * positions
+
+    def batched_log_derivatives(self, positions: Any, alpha: float) -> Any:
+        """Return d ln(psi_T) / d alpha = -x^2 / 2 with shape `(n_walkers, 1)`."""
+        del alpha
+        return -0.5 * positions * positions
@@ -0,0 +1,105 @@
+"""Non-interacting particles in an anisotropic harmonic trap.
+
+Units are hbar = m = 1; axis `d` has trap frequency `omega_d`. The trial
+wavefunction is a product of Gaussians scaled by one variational parameter,
+
+    psi_T(R; alpha) = exp(-alpha / 2 * sum_i sum_d omega_d * r_id^2),
+
+which is exact at `alpha = 1`. Configurations are arrays of shape
+`(n_walkers, n_particles, n_axes)`; the kernels also accept the flattened
+`(n_walkers, n_dim)` layout used by the batched samplers and return drift
+velocities in the layout they were given. This module requires NumPy
+(install with `pip install -e '.[numpy]'`).
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+from pyqmc.vmc.system import ParticleConfiguration, ScalarFallbackMixin
+
+
+class HarmonicTrap(ScalarFallbackMixin):
+    """`n_particles` independent particles in a harmonic trap.
+
+    Implements the batched, drift, optimizable and particle-move system
+    protocols from `pyqmc.vmc.system`; scalar methods come from
+    `ScalarFallbackMixin`. Particles are independent, so a single-particle
+    move ratio only touches that particle's coordinates.
+
+    `frequencies` sets one trap frequency per axis, so its length is the
+    spatial dimension (three by default).
+    """
+
+    name = "harmonic_trap"
+    n_parameters = 1
+
+    def __init__(self, n_particles: int = 1, frequencies: Sequence[float] = (1.0, 1.0, 1.0)):
+        if n_particles <= 0:
+            raise ValueError("n_particles must be positive")
+        if len(frequencies) == 0:
+            raise ValueError("frequencies must list at least one axis")
+        if any(omega <= 0 for omega in frequencies):
+            raise ValueError("frequencies must be positive")
+        self.n_particles = int(n_particles)
+        self.frequencies = tuple(float(omega) for omega in frequencies)
+        self.n_axes = len(self.frequencies)
+        self.n_dim = self.n_particles * self.n_axes
+        self._omega = np.array(self.frequencies)
+
+    def walkers(self, positions: Any) -> Any:
+        """View `positions` as `(n_walkers, n_particles, n_axes)` without copying."""
+        return np.asarray(positions, dtype=float).reshape(-1, self.n_particles, self.n_axes)
+
+    def _weighted_square(self, positions: Any, weights: Any) -> Any:
+        """Return sum_i sum_d weights_d * r_id^2 for every walker."""
+        r = self.walkers(positions)
+        return np.einsum("wpd,wpd,d->w", r, r, weights)
+
+    def batched_log_trial_wavefunction(self, positions: Any, alpha: float) -> Any:
+        """Return log(psi_T) for every walker."""
+        return -0.5 * alpha * self._weighted_square(positions, self._omega)
+
+    def batched_log_probability_density(self, positions: Any, alpha: float) -> Any:
+        """Return log(|psi_T|^2) for every walker."""
+        return -alpha * self._weighted_square(positions, self._omega)
+
+    def batched_local_energy(self, positions: Any, alpha: float) -> Any:
+        """Return E_L = N alpha sum_d omega_d / 2 + (1 - alpha^2) sum omega_d^2 r_id^2 / 2."""
+        constant = 0.5 * alpha * self.n_particles * float(self._omega.sum())
+        curvature = 0.5 * (1.0 - alpha * alpha)
+        return constant + curvature * self._weighted_square(positions, self._omega**2)
+
+    def batched_drift_velocity(self, positions: Any, alpha: float) -> Any:
+        """Return grad ln(psi_T) = -alpha omega_d r_id, shaped like `positions`."""
+        positions = np.asarray(positions, dtype=float)
+        drift = -alpha * self.walkers(positions) * self._omega
+        return drift.reshape(positions.shape)
+
+    def batched_log_derivatives(self, positions: Any, alpha: float) -> Any:
+        """Return d ln(psi_T) / d alpha with shape `(n_walkers, 1)`."""
+        del alpha
+        return -0.5 * self._weighted_square(positions, self._omega)[:, None]
+
+    def particle_configuration(self, positions: Any, alpha: float) -> ParticleConfiguration:
+        """Return the particle-move state of one walker."""
+        positions = np.array(positions, dtype=float).reshape(self.n_particles, self.n_axes)
+        return ParticleConfiguration(positions, alpha)
+
+    def ratio(self, configuration: ParticleConfiguration, i: int, new_position: Any) -> float:
+        """Return psi_T(R') / psi_T(R) for moving particle `i`."""
+        old = configuration.positions[i]
+        change = float(self._omega @ (new_position * new_position - old * old))
+        return math.exp(-0.5 * configuration.alpha * change)
+
+    def accept_move(self, configuration: ParticleConfiguration, i: int, new_position: Any) -> None:
+        """Move particle `i` to `new_position`."""
+        configuration.positions[i] = new_position
+
+    def configuration_local_energy(self, configuration: ParticleConfiguration) -> float:
+        """Return the local energy of one walker's positions."""
+        return float(self.batched_local_energy(configuration.positions, configuration.alpha)[0])
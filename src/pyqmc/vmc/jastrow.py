@@ -0,0 +1,91 @@
+"""Two-body Jastrow factors `J = exp(sum_{i<j} u(r_ij))`.
+
+Each form provides the pair function `u`, its first two radial derivatives
+(for drift and local energy) and its parameter derivatives (for
+optimization), all evaluated elementwise on arrays of pair distances. Every
+form has `u(0) = 0` and a slope `u'(0) = a` at contact, so fixing `a`
+enforces a cusp condition; the remaining parameters are trainable. This
+module requires NumPy (install with `pip install -e '.[numpy]'`).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+
+class _PairJastrow:
+    """Shared parameter handling: `a` is either fixed (`cusp`) or trainable."""
+
+    def __init__(self, cusp: float | None = None) -> None:
+        self.cusp = None if cusp is None else float(cusp)
+        self.n_parameters = 2 if self.cusp is None else 1
+
+    def split(self, params: Any) -> tuple[float, float]:
+        """Return `(a, b)` from this factor's slice of the parameter vector."""
+        if self.cusp is None:
+            return float(params[0]), float(params[1])
+        return self.cusp, float(params[0])
+
+    def _trainable(self, d_a: Any, d_b: Any) -> Any:
+        if self.cusp is None:
+            return np.stack([d_a, d_b], axis=-1)
+        return d_b[..., None]
+
+
+class PadeJastrow(_PairJastrow):
+    """Pade form `u(r) = a r / (1 + b r)`; `b >= 0` keeps it pole-free."""
+
+    name = "pade"
+
+    def values(self, r: Any, params: Any) -> Any:
+        a, b = self.split(params)
+        return a * r / (1.0 + b * r)
+
+    def derivatives(self, r: Any, params: Any) -> tuple[Any, Any, Any]:
+        """Return `(u, u', u'')` at every distance."""
+        a, b = self.split(params)
+        denominator = 1.0 + b * r
+        return a * r / denominator, a / denominator**2, -2.0 * a * b / denominator**3
+
+    def parameter_derivatives(self, r: Any, params: Any) -> Any:
+        """Return `du / dp_k` with a trailing axis of length `n_parameters`."""
+        a, b = self.split(params)
+        denominator = 1.0 + b * r
+        return self._trainable(r / denominator, -a * r * r / denominator**2)
+
+
+class ExponentialJastrow(_PairJastrow):
+    """Exponential form `u(r) = a (1 - exp(-b r)) / b` with range `1/b`, `b > 0`."""
+
+    name = "exponential"
+
+    def values(self, r: Any, params: Any) -> Any:
+        a, b = self.split(params)
+        return a * -np.expm1(-b * r) / b
+
+    def derivatives(self, r: Any, params: Any) -> tuple[Any, Any, Any]:
+        """Return `(u, u', u'')` at every distance."""
+        a, b = self.split(params)
+        decay = np.exp(-b * r)
+        return a * (1.0 - decay) / b, a * decay, -a * b * decay
+
+    def parameter_derivatives(self, r: Any, params: Any) -> Any:
+        """Return `du / dp_k` with a trailing axis of length `n_parameters`."""
+        a, b = self.split(params)
+        decay = np.exp(-b * r)
+        growth = (1.0 - decay) / b
+        return self._trainable(growth, a * (r * decay - growth) / b)
+
+
+JASTROW_FORMS = {"pade": PadeJastrow, "exponential": ExponentialJastrow}
+
+
+def make_jastrow(form: str, cusp: float | None = None) -> PadeJastrow | ExponentialJastrow:
+    """Create a Jastrow factor by name (`"pade"` or `"exponential"`)."""
+    try:
+        factory = JASTROW_FORMS[form]
+    except KeyError as exc:
+        raise ValueError(f"jastrow must be one of: {', '.join(JASTROW_FORMS)}") from exc
+    return factory(cusp)
@@ -1,20 +1,43 @@
 """Random-walk Metropolis sampler for 1D VMC demonstrations."""
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field, replace
 import math
 import random
+from typing import Any
 
+from pyqmc.core.autocorrelation import DecimatedSeries
+from pyqmc.core.checkpoint import (
+    blocking_state,
+    restore_blocking,
+    restore_series,
+    series_state,
+)
 from pyqmc.core.config import SimulationConfig
+from pyqmc.core.stats import BlockingAccumulator, RunningStats
+from pyqmc.vmc.proposals import make_proposal
+from pyqmc.vmc.system import ScalarSystem
+from pyqmc.vmc.tuning import StepSizeTuner
+
+_ENERGY_CHUNK = 4096
 
 
 @dataclass
 class MetropolisTrace:
-    """Raw samples produced by one Metropolis chain."""
+    """Samples and streaming estimators produced by one Metropolis chain.
+
+    `energy_blocks` is always filled and uses memory logarithmic in the chain
+    length; `energy_series` keeps a bounded, block-averaged copy of the energy
+    series for autocorrelation analysis. `positions` and `local_energies` are
+    only populated when the chain is run with `store_trace=True`; otherwise
+    they stay empty.
+    """
 
     positions: list[float]
     local_energies: list[float]
     accepted_steps: int
     attempted_steps: int
+    energy_blocks: BlockingAccumulator = field(default_factory=BlockingAccumulator)
+    energy_series: DecimatedSeries = field(default_factory=DecimatedSeries)
 
     @property
     def acceptance_ratio(self) -> float:
@@ -22,43 +45,214 @@ class MetropolisTrace:
             return 0.0
         return self.accepted_steps / self.attempted_steps
 
+    @property
+    def energy_stats(self) -> RunningStats:
+        """Per-sample mean/variance of the post-burn-in local energies."""
+        return self.energy_blocks.levels[0]
+
+
+class MetropolisChain:
+    """Resumable single-walker Metropolis chain.
+
+    `advance` can be called repeatedly; the chain keeps its position, random
+    state and estimators between calls, so running `a` then `b` steps gives
+    exactly the same samples as running `a + b` steps at once. Steps with a
+    global index below `config.burn_in` are discarded.
+
+    With `config.tune_step_size`, `step_size` adapts during burn-in and is
+    frozen from the first kept step on.
+
+    `get_state` and `set_state` capture everything `advance` depends on, so a
+    chain restored from a checkpoint continues bit-for-bit identically.
+
+    `trace_sink` (a `pyqmc.vmc.trace_store.TraceSink`) streams the kept
+    positions and local energies to disk instead of keeping them in lists.
+    """
+
+    def __init__(
+        self,
+        system: ScalarSystem,
+        config: SimulationConfig,
+        *,
+        store_trace: bool = False,
+        trace_sink: Any = None,
+    ) -> None:
+        if store_trace and trace_sink is not None:
+            raise ValueError("store_trace and trace_sink cannot be combined")
+        self.system = system
+        self.config = config
+        self.store_trace = store_trace
+        self.trace_sink = trace_sink
+        self.rng = random.Random(config.seed)
+        self.steps_done = 0
+        self.step_size = config.step_size
+        self.tuner = (
+            StepSizeTuner(config.step_size, config.target_acceptance, config.burn_in)
+            if config.tune_step_size
+            else None
+        )
+        self.kernel = make_proposal(config.proposal, system, config.alpha)
+        self.x = config.initial_position
+        self.log_prob_x = system.log_probability_density(self.x, config.alpha)
+        self._trace = MetropolisTrace(
+            positions=[],
+            local_energies=[],
+            accepted_steps=0,
+            attempted_steps=0,
+        )
+        # Kept energies not yet folded into the estimators. The chunk carries
+        # over between `advance` calls, so the estimators see the same chunks
+        # however the run is split into segments.
+        self._pending_energies: list[float] = []
+
+    @property
+    def trace(self) -> MetropolisTrace:
+        """Samples and estimators so far, including the unfolded energy chunk.
 
-def sample_chain(system: object, config: SimulationConfig) -> MetropolisTrace:
+        The pending chunk is folded into copies of the estimators, so reading
+        the trace mid-run does not change the chain's later results.
+        """
+        trace = self._trace
+        pending = self._pending_energies
+        if not pending:
+            return trace
+        energy_blocks = restore_blocking(blocking_state(trace.energy_blocks))
+        energy_series = replace(trace.energy_series, values=list(trace.energy_series.values))
+        energy_blocks.extend(pending)
+        energy_series.extend(pending)
+        return replace(trace, energy_blocks=energy_blocks, energy_series=energy_series)
+
+    def get_state(self) -> dict[str, Any]:
+        """Return the chain state as JSON-compatible values."""
+        trace = self._trace
+        return {
+            "rng": self.rng.getstate(),
+            "steps_done": self.steps_done,
+            "step_size": self.step_size,
+            "tuner": None if self.tuner is None else asdict(self.tuner),
+            "x": self.x,
+            "log_prob_x": self.log_prob_x,
+            "positions": trace.positions,
+            "local_energies": trace.local_energies,
+            "accepted_steps": trace.accepted_steps,
+            "attempted_steps": trace.attempted_steps,
+            "energy_blocks": blocking_state(trace.energy_blocks),
+            "energy_series": series_state(trace.energy_series),
+            "pending_energies": list(self._pending_energies),
+            "trace_rows": None if self.trace_sink is None else self.trace_sink.rows,
+        }
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Restore a state produced by `get_state`."""
+        version, internal, gauss_next = state["rng"]
+        self.rng.setstate((version, tuple(internal), gauss_next))
+        self.steps_done = state["steps_done"]
+        self.step_size = state["step_size"]
+        self.tuner = None if state["tuner"] is None else StepSizeTuner(**state["tuner"])
+        self.x = state["x"]
+        self.log_prob_x = state["log_prob_x"]
+        self._trace = MetropolisTrace(
+            positions=list(state["positions"]),
+            local_energies=list(state["local_energies"]),
+            accepted_steps=state["accepted_steps"],
+            attempted_steps=state["attempted_steps"],
+            energy_blocks=restore_blocking(state["energy_blocks"]),
+            energy_series=restore_series(state["energy_series"]),
+        )
+        self._pending_energies = list(state.get("pending_energies", []))
+        if self.trace_sink is not None:
+            self.trace_sink.rows = state["trace_rows"] or 0
+
+    def advance(self, n_steps: int) -> None:
+        """Run `n_steps` more Metropolis steps."""
+        end = self.steps_done + n_steps
+        tuner = self.tuner
+        while tuner is not None and (segment := tuner.segment(self.steps_done, end)) > 0:
+            accepted = self._trace.accepted_steps
+            self._run(segment)
+            tuner.update(self._trace.accepted_steps - accepted, segment)
+            self.step_size = tuner.step_size
+        self._run(end - self.steps_done)
+
+    def _run(self, n_steps: int) -> None:
+        system = self.system
+        config = self.config
+        rng = self.rng
+        propose = self.kernel.propose
+        trace = self._trace
+        alpha = config.alpha
+        step_size = self.step_size
+        burn_in = config.burn_in
+        store_trace = self.store_trace
+        sink = self.trace_sink
+
+        x = self.x
+        log_prob_x = self.log_prob_x
+        energy_blocks = trace.energy_blocks
+        energy_series = trace.energy_series
+        # Energies are folded into the accumulators in fixed-size chunks, which
+        # is much cheaper than one accumulator update per step in pure Python.
+        pending_energies = self._pending_energies
+        sink_positions: list[float] = []
+        sink_energies: list[float] = []
+        accepted = 0
+
+        for step in range(self.steps_done, self.steps_done + n_steps):
+            proposal, log_green_ratio = propose(x, step_size, rng)
+            log_prob_proposal = system.log_probability_density(proposal, alpha)
+
+            # Use a log test for numerical stability: accept if log(u) < log(ratio),
+            # where the ratio includes the Green's-function asymmetry of the kernel.
+            log_accept_ratio = log_prob_proposal - log_prob_x + log_green_ratio
+            if math.log(rng.random()) < log_accept_ratio:
+                x = proposal
+                log_prob_x = log_prob_proposal
+                accepted += 1
+
+            if step >= burn_in:
+                energy = system.local_energy(x, alpha)
+                pending_energies.append(energy)
+                if len(pending_energies) == _ENERGY_CHUNK:
+                    energy_blocks.extend(pending_energies)
+                    energy_series.extend(pending_energies)
+                    pending_energies.clear()
+                if sink is not None:
+                    sink_positions.append(x)
+                    sink_energies.append(energy)
+                    if len(sink_energies) == _ENERGY_CHUNK:
+                        sink.write(sink_positions, sink_energies)
+                        sink_positions.clear()
+                        sink_energies.clear()
+                if store_trace:
+                    trace.positions.append(x)
+                    trace.local_energies.append(energy)
+
+        if sink is not None:
+            sink.write(sink_positions, sink_energies)
+
+        self.x = x
+        self.log_prob_x = log_prob_x
+        self.steps_done += n_steps
+        trace.accepted_steps += accepted
+        trace.attempted_steps += n_steps
+
+
+def sample_chain(
+    system: ScalarSystem,
+    config: SimulationConfig,
+    *,
+    store_trace: bool = False,
+) -> MetropolisTrace:
     """Run a single Metropolis chain.
 
-    The `system` object is expected to expose:
+    The `system` object is expected to follow the `ScalarSystem` protocol:
     - log_probability_density(x, alpha)
     - local_energy(x, alpha)
+
+    Local energies are folded into a streaming accumulator as the chain
+    advances, so memory stays constant unless `store_trace=True` asks for the
+    full post-burn-in positions and local energies as well.
     """
-    rng = random.Random(config.seed)
-
-    x = config.initial_position
-    log_prob_x = system.log_probability_density(x, config.alpha)
-
-    positions: list[float] = []
-    local_energies: list[float] = []
-    accepted = 0
-    attempted = 0
-
-    for step in range(config.n_steps):
-        proposal = x + rng.uniform(-config.step_size, config.step_size)
-        log_prob_proposal = system.log_probability_density(proposal, config.alpha)
-
-        # Use a log test for numerical stability: accept if log(u) < delta_log_prob.
-        log_accept_ratio = log_prob_proposal - log_prob_x
-        if math.log(rng.random()) < log_accept_ratio:
-            x = proposal
-            log_prob_x = log_prob_proposal
-            accepted += 1
-        attempted += 1
-
-        if step >= config.burn_in:
-            positions.append(x)
-            local_energies.append(system.local_energy(x, config.alpha))
-
-    return MetropolisTrace(
-        positions=positions,
-        local_energies=local_energies,
-        accepted_steps=accepted,
-        attempted_steps=attempted,
-    )
+    chain = MetropolisChain(system, config, store_trace=store_trace)
+    chain.advance(config.n_steps)
+    return chain.trace
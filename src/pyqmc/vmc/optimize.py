@@ -0,0 +1,293 @@
+"""Optimization of trial-wavefunction parameters from sampled log-derivatives.
+
+With the log-derivatives `O_k = d ln psi_T / d p_k` sampled from
+`|psi_T|^2`, the energy gradient is a covariance,
+
+    g_k = 2 (<E_L O_k> - <E_L><O_k>),
+
+and the overlap matrix of the parameter derivatives is
+`S_kl = <O_k O_l> - <O_k><O_l>`. Two updates are available:
+
+- "sr" (stochastic reconfiguration) takes natural-gradient steps
+  `p <- p - tau S^{-1} g / 2`;
+- "linear" (the linear method) diagonalizes the Hamiltonian in the basis
+  `{psi_T, d psi_T / d p_k}` and steps to its lowest eigenvector. It behaves
+  like a Newton step and needs no time step; the parameter derivatives of
+  `E_L` it requires are taken by central finite differences, so systems only
+  provide `batched_log_derivatives`.
+
+The walker ensemble is carried over between iterations through
+`BatchedMetropolisChain.retarget`; only the first iteration burns in.
+
+This module requires NumPy (install with `pip install -e '.[numpy]'`).
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+import numpy as np
+
+from pyqmc.core.config import SimulationConfig
+from pyqmc.core.results import OptimizationResult, OptimizationStep
+from pyqmc.vmc.batched_metropolis import BatchedMetropolisChain
+from pyqmc.vmc.system import BatchedSystem, OptimizableSystem
+
+OPTIMIZATION_METHODS = ("linear", "sr")
+
+DEFAULT_OPTIMIZATION_METHOD = "linear"
+DEFAULT_LEARNING_RATE = 0.5
+DEFAULT_REGULARIZATION = 1e-3
+DEFAULT_MAX_STEP = 0.5
+DEFAULT_TOLERANCE = 1e-4
+
+_METHOD_LABELS = {
+    "linear": "VMC (linear method)",
+    "sr": "VMC (stochastic reconfiguration)",
+}
+
+# Keeps S invertible when a parameter has no sampled variance (e.g. at an
+# exact eigenstate, where the forces vanish too).
+_S_DIAGONAL_FLOOR = 1e-12
+# Relative finite-difference step for d E_L / d p_k.
+_FD_RELATIVE_STEP = 1e-5
+
+
+def _system_parameters(vector: np.ndarray) -> Any:
+    """Convert a parameter vector into the `alpha` argument systems expect."""
+    if len(vector) == 1:
+        return float(vector[0])
+    return tuple(float(value) for value in vector)
+
+
+def sr_update(
+    log_derivatives: np.ndarray,
+    local_energies: np.ndarray,
+    *,
+    learning_rate: float = DEFAULT_LEARNING_RATE,
+    regularization: float = DEFAULT_REGULARIZATION,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the SR parameter step and the energy gradient.
+
+    `log_derivatives` has shape `(n_samples, n_parameters)` and
+    `local_energies` shape `(n_samples,)`. `regularization` scales a diagonal
+    shift `S_kk -> S_kk (1 + regularization)` that damps noisy directions.
+    """
+    n_samples = len(local_energies)
+    centered_o = log_derivatives - log_derivatives.mean(axis=0)
+    centered_e = local_energies - local_energies.mean()
+
+    forces = centered_o.T @ centered_e / n_samples
+    overlap = centered_o.T @ centered_o / n_samples
+    overlap = overlap + np.diag(regularization * np.diag(overlap) + _S_DIAGONAL_FLOOR)
+
+    step = -learning_rate * np.linalg.solve(overlap, forces)
+    return step, 2.0 * forces
+
+
+def _local_energy_derivatives(
+    system: BatchedSystem,
+    positions: np.ndarray,
+    parameters: np.ndarray,
+) -> np.ndarray:
+    """Return `d E_L / d p_k` by central differences, shape `(n_samples, n_parameters)`."""
+    derivatives = np.empty((len(positions), len(parameters)))
+    for index, value in enumerate(parameters):
+        h = _FD_RELATIVE_STEP * max(1.0, abs(value))
+        forward = parameters.copy()
+        backward = parameters.copy()
+        forward[index] += h
+        backward[index] -= h
+        derivatives[:, index] = (
+            system.batched_local_energy(positions, _system_parameters(forward))
+            - system.batched_local_energy(positions, _system_parameters(backward))
+        ) / (2.0 * h)
+    return derivatives
+
+
+def linear_method_update(
+    log_derivatives: np.ndarray,
+    local_energies: np.ndarray,
+    local_energy_derivatives: np.ndarray,
+    *,
+    regularization: float = DEFAULT_REGULARIZATION,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the linear-method parameter step and the energy gradient.
+
+    Builds the non-symmetric Hamiltonian and overlap estimators in the basis
+    `{psi_T, (O_k - <O_k>) psi_T}` and returns `c_k / c_0` of the lowest
+    eigenvector. `regularization` is an energy shift added to the diagonal of
+    the derivative block, which shortens steps along noisy directions.
+    """
+    n_samples, n_parameters = log_derivatives.shape
+    centered_o = log_derivatives - log_derivatives.mean(axis=0)
+    forces = centered_o.T @ (local_energies - local_energies.mean()) / n_samples
+
+    hamiltonian = np.empty((n_parameters + 1, n_parameters + 1))
+    hamiltonian[0, 0] = local_energies.mean()
+    hamiltonian[1:, 0] = centered_o.T @ local_energies / n_samples
+    hamiltonian[0, 1:] = (
+        local_energies @ centered_o + local_energy_derivatives.sum(axis=0)
+    ) / n_samples
+    hamiltonian[1:, 1:] = (
+        centered_o.T @ (local_energies[:, None] * centered_o)
+        + centered_o.T @ local_energy_derivatives
+    ) / n_samples
+    hamiltonian[1:, 1:] += regularization * np.eye(n_parameters)
+
+    overlap = np.zeros_like(hamiltonian)
+    overlap[0, 0] = 1.0
+    overlap[1:, 1:] = centered_o.T @ centered_o / n_samples
+    overlap[1:, 1:] += _S_DIAGONAL_FLOOR * np.eye(n_parameters)
+
+    eigenvalues, eigenvectors = np.linalg.eig(np.linalg.solve(overlap, hamiltonian))
+    lowest = int(np.argmin(eigenvalues.real))
+    vector = eigenvectors[:, lowest].real
+    return vector[1:] / vector[0], 2.0 * forces
+
+
+def _sign_preserving_update(parameters: np.ndarray, step: np.ndarray) -> np.ndarray:
+    """Return `parameters + step`, halving `step` until no parameter crosses zero.
+
+    Widths and decay rates (`alpha`, `zeta`, a Jastrow `b`) are only valid
+    while positive, so a step that would flip the sign of a nonzero parameter
+    is too long. Parameters that are exactly zero may move either way.
+    """
+    nonzero = parameters != 0.0
+    candidate = parameters + step
+    while np.any(nonzero & (parameters * candidate <= 0.0)):
+        step = 0.5 * step
+        candidate = parameters + step
+    return candidate
+
+
+def optimize_wavefunction(
+    system: BatchedSystem,
+    config: SimulationConfig,
+    initial_parameters: Any = None,
+    *,
+    method: str = DEFAULT_OPTIMIZATION_METHOD,
+    n_iterations: int = 30,
+    learning_rate: float = DEFAULT_LEARNING_RATE,
+    regularization: float = DEFAULT_REGULARIZATION,
+    max_step: float = DEFAULT_MAX_STEP,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> OptimizationResult:
+    """Minimize the variational energy of `system` with `method`.
+
+    Every iteration samples `config.n_steps - config.burn_in` sweeps of
+    `config.n_walkers` walkers at the current parameters. `initial_parameters`
+    defaults to `config.alpha` and may be a sequence for systems with
+    `n_parameters > 1`. Steps longer than `max_step` are scaled down and steps
+    that would flip a parameter's sign are halved until they do not; the run
+    counts as converged once a step is shorter than `tolerance`.
+    `learning_rate` only affects "sr".
+    """
+    config.validate()
+    if config.backend != "numpy":
+        raise ValueError("parameter optimization requires backend='numpy'")
+    if config.n_chains != 1:
+        raise ValueError("parameter optimization runs a single walker ensemble; set n_chains=1")
+    if config.target_standard_error is not None:
+        raise ValueError(
+            "parameter optimization requires a fixed n_steps; unset target_standard_error"
+        )
+    if method not in OPTIMIZATION_METHODS:
+        raise ValueError(f"method must be one of: {', '.join(OPTIMIZATION_METHODS)}")
+    if n_iterations <= 0:
+        raise ValueError("n_iterations must be positive")
+    if learning_rate <= 0:
+        raise ValueError("learning_rate must be positive")
+    if regularization < 0:
+        raise ValueError("regularization cannot be negative")
+    if max_step <= 0:
+        raise ValueError("max_step must be positive")
+    if not isinstance(system, OptimizableSystem):
+        raise TypeError(f"{system.name} does not implement OptimizableSystem")
+
+    start = config.alpha if initial_parameters is None else initial_parameters
+    parameters = np.atleast_1d(np.asarray(start, dtype=float)).copy()
+    if len(parameters) != system.n_parameters:
+        raise ValueError(f"{system.name} expects {system.n_parameters} parameters")
+
+    chain = BatchedMetropolisChain(
+        system,
+        config,
+        store_trace=True,
+        alpha=_system_parameters(parameters),
+    )
+    chain.advance(config.n_steps)
+    history: list[OptimizationStep] = []
+    converged = False
+
+    for iteration in range(n_iterations):
+        if iteration > 0:
+            chain.retarget(_system_parameters(parameters))
+            chain.advance(config.n_steps - config.burn_in)
+
+        trace = chain.trace
+        positions = trace.positions.reshape(-1, system.n_dim)
+        energies = trace.local_energies.reshape(-1)
+        log_derivatives = system.batched_log_derivatives(positions, chain.alpha)
+        if method == "linear":
+            step, gradient = linear_method_update(
+                log_derivatives,
+                energies,
+                _local_energy_derivatives(system, positions, parameters),
+                regularization=regularization,
+            )
+        else:
+            step, gradient = sr_update(
+                log_derivatives,
+                energies,
+                learning_rate=learning_rate,
+                regularization=regularization,
+            )
+        history.append(
+            OptimizationStep(
+                iteration=iteration,
+                parameters=parameters.tolist(),
+                energy=trace.energy_stats.mean,
+                standard_error=trace.energy_blocks.analysis().standard_error,
+                gradient=gradient.tolist(),
+                acceptance_ratio=trace.acceptance_ratio,
+            )
+        )
+
+        step_length = float(np.linalg.norm(step))
+        if step_length < tolerance:
+            converged = True
+            break
+        if step_length > max_step:
+            step *= max_step / step_length
+        parameters = _sign_preserving_update(parameters, step)
+
+    return OptimizationResult(
+        method=_METHOD_LABELS[method],
+        system=system.name,
+        converged=converged,
+        history=history,
+        parameters={
+            "initial_parameters": np.atleast_1d(np.asarray(start, dtype=float)).tolist(),
+            "method": method,
+            "n_iterations": n_iterations,
+            "learning_rate": learning_rate,
+            "regularization": regularization,
+            "max_step": max_step,
+            "tolerance": tolerance,
+            "n_steps": config.n_steps,
+            "burn_in": config.burn_in,
+            "step_size": config.step_size,
+            "n_walkers": config.n_walkers,
+            "seed": config.seed,
+            "proposal": config.proposal,
+        },
+        metadata={
+            "samples_per_iteration": (config.n_steps - config.burn_in) * config.n_walkers,
+            "total_sweeps": chain.steps_done,
+            "final_gradient_norm": math.hypot(*history[-1].gradient),
+            "tuned_step_size": chain.step_size if config.tune_step_size else None,
+        },
+    )
+
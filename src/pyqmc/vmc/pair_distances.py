@@ -0,0 +1,69 @@
+"""Per-walker pair-distance table with O(N) single-particle updates.
+
+Pair terms (Jastrow factors, Coulomb repulsion) need every distance
+`r_ij = |r_i - r_j|`. Recomputing them after a single-particle move costs
+O(N^2); only row and column `i` actually change, so `PairDistanceTable`
+computes that row for a trial position in O(N) and copies it in on
+acceptance. This module requires NumPy (install with `pip install -e '.[numpy]'`).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+
+def pair_displacements(positions: Any) -> tuple[Any, Any]:
+    """Return `(r_i - r_j, |r_i - r_j|)` for every ordered pair.
+
+    `positions` has shape `(..., n_particles, n_axes)`, so a whole walker
+    ensemble is handled in one call; the displacements have shape
+    `(..., n_particles, n_particles, n_axes)` and the distances drop the
+    last axis.
+    """
+    positions = np.asarray(positions, dtype=float)
+    displacements = positions[..., :, None, :] - positions[..., None, :, :]
+    return displacements, np.sqrt(np.einsum("...ijd,...ijd->...ij", displacements, displacements))
+
+
+def pair_distance_matrix(positions: Any) -> Any:
+    """Return all distances `|r_i - r_j|`, shape `(..., n_particles, n_particles)`."""
+    return pair_displacements(positions)[1]
+
+
+class PairDistanceTable:
+    """Positions and pair distances of one walker, kept consistent under moves."""
+
+    def __init__(self, positions: Any) -> None:
+        self.positions = np.array(positions, dtype=float)
+        if self.positions.ndim != 2:
+            raise ValueError("positions must have shape (n_particles, n_axes)")
+        self.n_particles = len(self.positions)
+        self.distances = pair_distance_matrix(self.positions)
+
+    def trial_row(self, i: int, new_position: Any) -> Any:
+        """Return the distances from `new_position` to every particle.
+
+        Entry `i` is the distance to particle `i`'s old position, so callers
+        summing over `j != i` should skip or mask it.
+        """
+        displacement = self.positions - new_position
+        return np.sqrt(np.einsum("jd,jd->j", displacement, displacement))
+
+    def accept(self, i: int, new_position: Any, row: Any = None) -> None:
+        """Move particle `i`; `row` reuses a result of `trial_row`."""
+        if row is None:
+            row = self.trial_row(i, new_position)
+        self.positions[i] = new_position
+        self.distances[i, :] = row
+        self.distances[:, i] = row
+        self.distances[i, i] = 0.0
+
+    def rebuild(self) -> None:
+        """Recompute every distance from the positions in O(N^2)."""
+        self.distances = pair_distance_matrix(self.positions)
+
+    def pairs(self) -> Any:
+        """Return the `n_particles * (n_particles - 1) / 2` distinct distances."""
+        return self.distances[np.triu_indices(self.n_particles, k=1)]
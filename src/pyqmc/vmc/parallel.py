@@ -0,0 +1,478 @@
+"""Independent VMC chains fanned out over a process pool.
+
+Every chain gets its own random stream from `pyqmc.core.seeding.spawn_seeds`
+and reports only its streaming accumulators, so results cross process
+boundaries cheaply. Chains are merged in chain-index order, which keeps the
+combined result identical for any number of worker processes.
+
+Runs either take a fixed `n_steps` per chain or, with
+`SimulationConfig.target_standard_error`, advance all chains in chunks and stop
+as soon as the blocked error bar is small enough.
+
+With a `CheckpointPolicy`, chains advance in segments of fixed global length
+and the state of every chain is saved between segments, so a resumed run
+repeats the uninterrupted one bit for bit. A `progress` callback is likewise
+offered a `ProgressSnapshot` of the merged estimators between segments,
+rate-limited by a `ProgressThrottle`.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from itertools import repeat
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pyqmc.core.autocorrelation import DecimatedSeries
+from pyqmc.core.checkpoint import CheckpointPolicy, read_checkpoint, write_checkpoint
+from pyqmc.core.config import SimulationConfig
+from pyqmc.core.progress import ProgressCallback, ProgressSnapshot, ProgressThrottle
+from pyqmc.core.seeding import spawn_seeds
+from pyqmc.core.stats import BlockingAccumulator, RunningStats
+from pyqmc.vmc.metropolis import MetropolisChain
+from pyqmc.vmc.system import BatchedSystem, ScalarSystem
+
+if TYPE_CHECKING:
+    from pyqmc.vmc.batched_metropolis import BatchedMetropolisChain
+
+# Post-burn-in steps per chain before the first precision check, and the
+# smallest chunk between later checks.
+_MIN_CHUNK_STEPS = 2_000
+# Segment length between checkpoint opportunities when only a time interval
+# is configured; it must not depend on timing to keep resumed runs exact.
+_CHECKPOINT_SEGMENT_STEPS = 10_000
+# Walker moves per chain between progress reports.
+_PROGRESS_SEGMENT_MOVES = 50_000
+
+STOP_N_STEPS = "n_steps"
+STOP_TARGET_STANDARD_ERROR = "target_standard_error"
+STOP_MAX_SECONDS = "max_seconds"
+
+
+@dataclass
+class ChainSummary:
+    """Streaming estimators and acceptance counts of one or more chains.
+
+    `energy_series` holds one bounded energy series per chain, in chain order,
+    and `cpu_seconds` is the CPU time summed over all chains. `step_sizes`
+    holds each chain's final (possibly tuned) proposal width. `traces` holds
+    each chain's full trace when the run stored them. `steps_per_chain`,
+    `stop_reason` and `resumed_from_step` (the checkpointed step a run
+    continued from, if any) describe the whole run and are set by
+    `run_chains`.
+    """
+
+    energy_stats: RunningStats = field(default_factory=RunningStats)
+    energy_blocks: BlockingAccumulator = field(default_factory=BlockingAccumulator)
+    energy_series: list[DecimatedSeries] = field(default_factory=list)
+    step_sizes: list[float] = field(default_factory=list)
+    traces: list[Any] = field(default_factory=list)
+    accepted_steps: int = 0
+    attempted_steps: int = 0
+    cpu_seconds: float = 0.0
+    steps_per_chain: int = 0
+    stop_reason: str = STOP_N_STEPS
+    resumed_from_step: int | None = None
+
+    @property
+    def acceptance_ratio(self) -> float:
+        if self.attempted_steps == 0:
+            return 0.0
+        return self.accepted_steps / self.attempted_steps
+
+    def merge(self, other: ChainSummary) -> None:
+        """Fold an independent chain into this summary in place."""
+        self.energy_stats.merge(other.energy_stats)
+        self.energy_blocks.merge(other.energy_blocks)
+        self.energy_series.extend(other.energy_series)
+        self.step_sizes.extend(other.step_sizes)
+        self.traces.extend(other.traces)
+        self.accepted_steps += other.accepted_steps
+        self.attempted_steps += other.attempted_steps
+        self.cpu_seconds += other.cpu_seconds
+
+
+def chain_configs(config: SimulationConfig) -> list[SimulationConfig]:
+    """Return one single-chain config per chain with its own derived seed.
+
+    A run with `n_chains=1` keeps the root seed unchanged, so it reproduces
+    the classic single-chain result exactly.
+    """
+    if config.n_chains == 1:
+        return [replace(config, workers=1)]
+    seeds = spawn_seeds(config.seed, config.n_chains)
+    return [replace(config, seed=seed, n_chains=1, workers=1) for seed in seeds]
+
+
+def make_chain(
+    system: ScalarSystem | BatchedSystem,
+    config: SimulationConfig,
+    *,
+    store_trace: bool = False,
+    trace_sink: Any = None,
+) -> MetropolisChain | BatchedMetropolisChain:
+    """Create a resumable chain for the configured backend."""
+    if config.backend == "numpy":
+        if not isinstance(system, BatchedSystem):
+            raise TypeError(f"{system.name} does not implement the batched system protocol")
+        try:
+            from pyqmc.vmc.batched_metropolis import BatchedMetropolisChain
+        except ModuleNotFoundError as exc:
+            raise RuntimeError(
+                "The numpy backend requires NumPy. Install with: pip install -e '.[numpy]'"
+            ) from exc
+        return BatchedMetropolisChain(
+            system, config, store_trace=store_trace, trace_sink=trace_sink
+        )
+    return MetropolisChain(system, config, store_trace=store_trace, trace_sink=trace_sink)
+
+
+def _advance_chain(
+    chain: MetropolisChain | BatchedMetropolisChain,
+    n_steps: int,
+) -> tuple[MetropolisChain | BatchedMetropolisChain, float]:
+    """Advance one chain and return it with the CPU time spent."""
+    start = time.process_time()
+    chain.advance(n_steps)
+    return chain, time.process_time() - start
+
+
+def _summarize(
+    chain: MetropolisChain | BatchedMetropolisChain,
+    cpu_seconds: float,
+    *,
+    keep_trace: bool = False,
+) -> ChainSummary:
+    trace = chain.trace
+    return ChainSummary(
+        energy_stats=trace.energy_stats,
+        energy_blocks=trace.energy_blocks,
+        energy_series=[trace.energy_series],
+        step_sizes=[chain.step_size],
+        traces=[trace] if keep_trace else [],
+        accepted_steps=trace.accepted_steps,
+        attempted_steps=trace.attempted_steps,
+        cpu_seconds=cpu_seconds,
+        steps_per_chain=chain.steps_done,
+    )
+
+
+def run_single_chain(
+    system: ScalarSystem | BatchedSystem,
+    config: SimulationConfig,
+) -> ChainSummary:
+    """Run one chain with the configured backend and summarize it."""
+    chain, cpu_seconds = _advance_chain(make_chain(system, config), config.n_steps)
+    return _summarize(chain, cpu_seconds)
+
+
+class _Checkpointer:
+    """Decides when a `_ChainGroup` saves its state and writes it.
+
+    Like every segment observer of a `_ChainGroup`, it tells the group how
+    far to advance before its next opportunity (`segment`) and acts after
+    each segment (`after_segment`).
+    """
+
+    def __init__(self, policy: CheckpointPolicy, config: SimulationConfig) -> None:
+        self.policy = policy
+        self.config = config
+        self.last_write = time.perf_counter()
+
+    def segment(self, steps_done: int, end: int) -> int:
+        """Steps to run before the next checkpoint opportunity."""
+        every = self.policy.every_steps or _CHECKPOINT_SEGMENT_STEPS
+        return min((steps_done // every + 1) * every, end) - steps_done
+
+    def after_segment(self, chains: _ChainGroup, end: int) -> None:
+        policy = self.policy
+        due_by_steps = (
+            policy.every_steps is not None and chains.steps_done % policy.every_steps == 0
+        )
+        due_by_time = (
+            policy.every_seconds is not None
+            and time.perf_counter() - self.last_write >= policy.every_seconds
+        )
+        if due_by_steps or due_by_time:
+            self.write(chains, end)
+
+    def write(self, chains: _ChainGroup, end: int) -> None:
+        state = {
+            "steps_done": chains.steps_done,
+            "advance_end": end,
+            "cpu_seconds": chains.cpu_seconds,
+            "chains": [chain.get_state() for chain in chains.chains],
+        }
+        write_checkpoint(self.policy.path, self.config, state)
+        self.last_write = time.perf_counter()
+
+    def resume(self, chains: _ChainGroup) -> int | None:
+        """Load the checkpoint into `chains`; return the chunk end it was inside."""
+        if not self.policy.resume or not self.policy.path.exists():
+            return None
+        state = read_checkpoint(self.policy.path, self.config)
+        for chain, chain_state in zip(chains.chains, state["chains"], strict=True):
+            chain.set_state(chain_state)
+        chains.steps_done = state["steps_done"]
+        chains.cpu_seconds = list(state["cpu_seconds"])
+        return state["advance_end"]
+
+
+class _ProgressReporter:
+    """Reports progress after segments, as often as its throttle allows."""
+
+    def __init__(
+        self,
+        callback: ProgressCallback,
+        config: SimulationConfig,
+        throttle: ProgressThrottle,
+    ) -> None:
+        self.callback = callback
+        self.config = config
+        self.throttle = throttle
+        # Segments depend on step counts only, so checkpointed runs stay exact.
+        self.every = max(1, _PROGRESS_SEGMENT_MOVES // config.n_walkers)
+        self.start = time.perf_counter()
+        self.start_step: int | None = None
+        self.reported_step: int | None = None
+
+    def segment(self, steps_done: int, end: int) -> int:
+        if self.start_step is None:
+            self.start_step = steps_done
+        return min((steps_done // self.every + 1) * self.every, end) - steps_done
+
+    def after_segment(self, chains: _ChainGroup, end: int) -> None:
+        if self.throttle.due():
+            self.report(chains)
+
+    def report(self, chains: _ChainGroup) -> None:
+        if self.reported_step == chains.steps_done:
+            return
+        self.reported_step = chains.steps_done
+        self.throttle.emit(self.callback, lambda: self._snapshot(chains))
+
+    def _snapshot(self, chains: _ChainGroup) -> ProgressSnapshot:
+        summary = chains.summary()
+        stats = summary.energy_stats
+        has_samples = stats.count > 0
+        elapsed = time.perf_counter() - self.start
+        start_step = chains.steps_done if self.start_step is None else self.start_step
+        moves = (chains.steps_done - start_step) * len(chains.chains) * self.config.n_walkers
+        return ProgressSnapshot(
+            steps_done=chains.steps_done,
+            total_steps=self.config.n_steps,
+            n_samples=stats.count,
+            mean_energy=stats.mean if has_samples else None,
+            standard_error=(
+                summary.energy_blocks.analysis().standard_error if has_samples else None
+            ),
+            acceptance_ratio=summary.acceptance_ratio,
+            elapsed_seconds=elapsed,
+            steps_per_second=moves / elapsed if elapsed > 0 else 0.0,
+        )
+
+
+class _ChainGroup:
+    """Chains advanced together, on `pool` or serially when it is None.
+
+    With segment `observers` (a checkpointer, a progress reporter), `advance`
+    stops at every observer's next segment boundary and lets all observers
+    act there.
+    """
+
+    def __init__(
+        self,
+        chains: list[MetropolisChain | BatchedMetropolisChain],
+        pool: Executor | None,
+        *,
+        store_trace: bool = False,
+        observers: list[_Checkpointer | _ProgressReporter] | None = None,
+    ) -> None:
+        self.chains = chains
+        self.pool = pool
+        self.store_trace = store_trace
+        self.observers = observers or []
+        self.cpu_seconds = [0.0] * len(chains)
+        self.steps_done = 0
+
+    def advance(self, n_steps: int) -> None:
+        if not self.observers:
+            self._advance(n_steps)
+            return
+        end = self.steps_done + n_steps
+        while self.steps_done < end:
+            self._advance(
+                min(observer.segment(self.steps_done, end) for observer in self.observers)
+            )
+            for observer in self.observers:
+                observer.after_segment(self, end)
+
+    def _advance(self, n_steps: int) -> None:
+        if self.pool is None:
+            results = [_advance_chain(chain, n_steps) for chain in self.chains]
+        else:
+            # Chains travel to the workers and back; `map` keeps their order.
+            results = list(self.pool.map(_advance_chain, self.chains, repeat(n_steps)))
+        self.chains = [chain for chain, _ in results]
+        self.cpu_seconds = [
+            total + spent for total, (_, spent) in zip(self.cpu_seconds, results)
+        ]
+        self.steps_done += n_steps
+
+    def summary(self) -> ChainSummary:
+        merged = ChainSummary(steps_per_chain=self.steps_done)
+        for chain, cpu_seconds in zip(self.chains, self.cpu_seconds):
+            merged.merge(_summarize(chain, cpu_seconds, keep_trace=self.store_trace))
+        return merged
+
+
+def _next_chunk(
+    config: SimulationConfig,
+    summary: ChainSummary,
+    elapsed: float,
+    start_step: int = 0,
+) -> int:
+    """Pick the steps per chain for the next chunk of a target-precision run.
+
+    `elapsed` is the wall time since this process reached `start_step`, so
+    steps restored from a checkpoint do not inflate the measured rate.
+    """
+    steps_done = summary.steps_per_chain
+    kept = steps_done - config.burn_in
+    blocking = summary.energy_blocks.analysis()
+    if blocking.converged and blocking.standard_error > 0:
+        # The error falls like 1/sqrt(N); extrapolate the remaining steps.
+        ratio = blocking.standard_error / config.target_standard_error
+        needed = math.ceil(kept * (ratio * ratio - 1.0))
+    else:
+        needed = kept
+    # Never more than double the run on a noisy early extrapolation.
+    chunk = min(max(needed, _MIN_CHUNK_STEPS), max(kept, _MIN_CHUNK_STEPS))
+
+    if config.max_seconds is not None and elapsed > 0:
+        steps_per_second = (steps_done - start_step) / elapsed
+        chunk = min(chunk, max(1, int(steps_per_second * (config.max_seconds - elapsed))))
+    return min(chunk, config.n_steps - steps_done)
+
+
+def _run_to_target(
+    chains: _ChainGroup,
+    config: SimulationConfig,
+    first_chunk: int | None = None,
+) -> ChainSummary:
+    """Advance chains chunk by chunk until the error target or a budget is hit.
+
+    `first_chunk` overrides the initial chunk, which lets a resumed run finish
+    the chunk its checkpoint was written in.
+    """
+    start = time.perf_counter()
+    start_step = chains.steps_done
+    chunk = min(config.burn_in + _MIN_CHUNK_STEPS, config.n_steps)
+    if first_chunk is not None:
+        chunk = first_chunk
+
+    while True:
+        chains.advance(chunk)
+        summary = chains.summary()
+
+        blocking = summary.energy_blocks.analysis()
+        if blocking.converged and blocking.standard_error <= config.target_standard_error:
+            summary.stop_reason = STOP_TARGET_STANDARD_ERROR
+            return summary
+        if chains.steps_done >= config.n_steps:
+            summary.stop_reason = STOP_N_STEPS
+            return summary
+        elapsed = time.perf_counter() - start
+        if config.max_seconds is not None and elapsed >= config.max_seconds:
+            summary.stop_reason = STOP_MAX_SECONDS
+            return summary
+
+        chunk = _next_chunk(config, summary, elapsed, start_step)
+
+
+def run_chains(
+    system: ScalarSystem | BatchedSystem,
+    config: SimulationConfig,
+    *,
+    store_trace: bool = False,
+    checkpoint: CheckpointPolicy | None = None,
+    trace_out: Path | None = None,
+    progress: ProgressCallback | None = None,
+    progress_throttle: ProgressThrottle | None = None,
+) -> ChainSummary:
+    """Run `config.n_chains` chains on up to `config.workers` processes.
+
+    Returns the merged summary of all chains. With `store_trace=True` every
+    chain also keeps its post-burn-in samples, returned in `traces`; with
+    `trace_out` they are streamed to a memory-mapped trace directory instead
+    (see `pyqmc.vmc.trace_store`). With `checkpoint`, the chains' state is
+    saved as the policy asks and, when `checkpoint.resume` is set, restored
+    from an existing file first. `progress` receives snapshots at segment
+    boundaries (every `_PROGRESS_SEGMENT_MOVES` walker moves per chain) as
+    often as `progress_throttle` allows, and once more at the end; an
+    exception it raises aborts the run.
+    """
+    checkpointer = None
+    resuming = False
+    if checkpoint is not None:
+        checkpoint.validate()
+        checkpointer = _Checkpointer(checkpoint, config)
+        resuming = checkpoint.resume and checkpoint.path.exists()
+    configs = chain_configs(config)
+    sinks: list[Any] = [None] * len(configs)
+    if trace_out is not None:
+        try:
+            from pyqmc.vmc.trace_store import create_trace_store, write_trace_header
+        except ModuleNotFoundError as exc:
+            raise RuntimeError(
+                "Trace output requires NumPy. Install with: pip install -e '.[numpy]'"
+            ) from exc
+        sinks = create_trace_store(
+            trace_out, config, system.n_dim, len(configs), reuse=resuming
+        )
+    observers: list[_Checkpointer | _ProgressReporter] = []
+    if checkpointer is not None:
+        observers.append(checkpointer)
+    reporter = None
+    if progress is not None:
+        reporter = _ProgressReporter(progress, config, progress_throttle or ProgressThrottle())
+        observers.append(reporter)
+    n_workers = min(config.workers, len(configs))
+    pool = ProcessPoolExecutor(max_workers=n_workers) if n_workers > 1 else None
+
+    try:
+        chains = _ChainGroup(
+            [
+                make_chain(system, chain_config, store_trace=store_trace, trace_sink=sink)
+                for chain_config, sink in zip(configs, sinks)
+            ],
+            pool,
+            store_trace=store_trace,
+            observers=observers,
+        )
+        resumed_end = None if checkpointer is None else checkpointer.resume(chains)
+        resumed_from_step = None if resumed_end is None else chains.steps_done
+
+        if config.target_standard_error is not None:
+            first_chunk = None if resumed_end is None else resumed_end - chains.steps_done
+            summary = _run_to_target(chains, config, first_chunk)
+        else:
+            chains.advance(config.n_steps - chains.steps_done)
+            summary = chains.summary()
+
+        if checkpointer is not None:
+            checkpointer.write(chains, chains.steps_done)
+        if reporter is not None:
+            reporter.report(chains)
+        if trace_out is not None:
+            write_trace_header(
+                trace_out, config, system.n_dim, [chain.trace_sink for chain in chains.chains]
+            )
+        summary.resumed_from_step = resumed_from_step
+        return summary
+    finally:
+        if pool is not None:
+            pool.shutdown()
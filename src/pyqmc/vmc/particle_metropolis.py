@@ -0,0 +1,211 @@
+"""Particle-by-particle Metropolis sampler for many-particle systems.
+
+Moving every coordinate of an N-particle walker at once drives acceptance
+toward zero as N grows, and each trial move re-evaluates the whole
+wavefunction. A sweep here instead proposes one uniform move per particle and
+accepts it with probability `min(1, |psi_T(R') / psi_T(R)|^2)`, where the
+ratio comes from the system's incremental `ratio` hook
+(`pyqmc.vmc.system.ParticleMoveSystem`). With pair terms kept in a
+`pyqmc.vmc.pair_distances.PairDistanceTable` a move costs O(N) and a sweep
+O(N^2), against O(N^3) when every move re-evaluates all pairs.
+
+`FullEvaluationMoves` gives any batched system the same hooks by full
+re-evaluation; it is the baseline of the scaling benchmark in
+`pyqmc.benchmarks.particle_moves`. This module requires NumPy (install with
+`pip install -e '.[numpy]'`).
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from pyqmc.core.autocorrelation import DecimatedSeries
+from pyqmc.core.config import SimulationConfig
+from pyqmc.core.stats import BlockingAccumulator, RunningStats
+from pyqmc.vmc.system import BatchedSystem, ParticleConfiguration, ParticleMoveSystem
+from pyqmc.vmc.tuning import StepSizeTuner
+
+
+@dataclass
+class ParticleMetropolisTrace:
+    """Streaming estimators of a particle-move chain.
+
+    Like the batched sampler, `energy_stats` holds every post-burn-in walker
+    energy and the blocking/series accumulators one walker-mean per sweep.
+    Moves are counted per particle, so `acceptance_ratio` is the
+    single-particle acceptance.
+    """
+
+    accepted_moves: int
+    attempted_moves: int
+    energy_stats: RunningStats = field(default_factory=RunningStats)
+    energy_blocks: BlockingAccumulator = field(default_factory=BlockingAccumulator)
+    energy_series: DecimatedSeries = field(default_factory=DecimatedSeries)
+
+    @property
+    def acceptance_ratio(self) -> float:
+        if self.attempted_moves == 0:
+            return 0.0
+        return self.accepted_moves / self.attempted_moves
+
+
+@dataclass
+class _FullConfiguration(ParticleConfiguration):
+    log_prob: float = 0.0
+    pending_log_prob: float = 0.0
+
+
+class FullEvaluationMoves:
+    """Particle-move hooks for a batched system, re-evaluated from scratch.
+
+    Every `ratio` call evaluates `batched_log_probability_density` on the
+    whole trial configuration, so a move costs as much as a full evaluation.
+    The returned ratio is |psi_T(R') / psi_T(R)|, which is all acceptance needs.
+    """
+
+    def __init__(self, system: BatchedSystem, n_particles: int, n_axes: int) -> None:
+        if n_particles * n_axes != system.n_dim:
+            raise ValueError("n_particles * n_axes must equal the system's n_dim")
+        self.system = system
+        self.name = system.name
+        self.n_particles = n_particles
+        self.n_axes = n_axes
+
+    def _log_prob(self, positions: Any, alpha: Any) -> float:
+        flat = positions.reshape(1, self.system.n_dim)
+        return float(self.system.batched_log_probability_density(flat, alpha)[0])
+
+    def particle_configuration(self, positions: Any, alpha: Any) -> _FullConfiguration:
+        positions = np.array(positions, dtype=float).reshape(self.n_particles, self.n_axes)
+        return _FullConfiguration(positions, alpha, self._log_prob(positions, alpha))
+
+    def ratio(self, configuration: _FullConfiguration, i: int, new_position: Any) -> float:
+        trial = configuration.positions.copy()
+        trial[i] = new_position
+        configuration.pending_log_prob = self._log_prob(trial, configuration.alpha)
+        return math.exp(0.5 * (configuration.pending_log_prob - configuration.log_prob))
+
+    def accept_move(self, configuration: _FullConfiguration, i: int, new_position: Any) -> None:
+        configuration.positions[i] = new_position
+        configuration.log_prob = configuration.pending_log_prob
+
+    def configuration_local_energy(self, configuration: _FullConfiguration) -> float:
+        flat = configuration.positions.reshape(1, self.system.n_dim)
+        return float(self.system.batched_local_energy(flat, configuration.alpha)[0])
+
+
+class ParticleMetropolisChain:
+    """Resumable particle-by-particle Metropolis chain over `config.n_walkers` walkers.
+
+    One step is a sweep that tries to move every particle of every walker
+    once, in order; `n_steps` and `burn_in` count sweeps. Walkers start at
+    `config.initial_position` plus a uniform jitter of width `step_size`,
+    so no two particles coincide. Only the uniform proposal is supported.
+    With `config.tune_step_size` the width adapts during burn-in from the
+    single-particle acceptance.
+    """
+
+    def __init__(
+        self,
+        system: ParticleMoveSystem,
+        config: SimulationConfig,
+        *,
+        alpha: Any = None,
+    ) -> None:
+        if not isinstance(system, ParticleMoveSystem):
+            raise TypeError(f"{system.name} does not implement the particle-move protocol")
+        if config.proposal != "uniform":
+            raise ValueError("particle moves support only the uniform proposal")
+        self.system = system
+        self.config = config
+        self.alpha = config.alpha if alpha is None else alpha
+        self.rng = np.random.default_rng(config.seed)
+        self.steps_done = 0
+        self.step_size = config.step_size
+        moves_per_sweep = config.n_walkers * system.n_particles
+        self.tuner = (
+            StepSizeTuner(
+                config.step_size,
+                config.target_acceptance,
+                config.burn_in,
+                n_walkers=moves_per_sweep,
+            )
+            if config.tune_step_size
+            else None
+        )
+        shape = (config.n_walkers, system.n_particles, system.n_axes)
+        self.x = config.initial_position + self.rng.uniform(
+            -config.step_size, config.step_size, size=shape
+        )
+        self.configurations = [
+            system.particle_configuration(walker, self.alpha) for walker in self.x
+        ]
+        self.trace = ParticleMetropolisTrace(accepted_moves=0, attempted_moves=0)
+
+    def advance(self, n_steps: int) -> None:
+        """Run `n_steps` more sweeps."""
+        end = self.steps_done + n_steps
+        tuner = self.tuner
+        while tuner is not None and (segment := tuner.segment(self.steps_done, end)) > 0:
+            accepted = self.trace.accepted_moves
+            self._run(segment)
+            tuner.update(self.trace.accepted_moves - accepted, segment)
+            self.step_size = tuner.step_size
+        self._run(end - self.steps_done)
+
+    def _run(self, n_steps: int) -> None:
+        system = self.system
+        config = self.config
+        rng = self.rng
+        trace = self.trace
+        ratio = system.ratio
+        accept_move = system.accept_move
+        n_walkers = config.n_walkers
+        n_particles = system.n_particles
+        x = self.x
+        accepted = 0
+
+        for step in range(self.steps_done, self.steps_done + n_steps):
+            # Draw a whole sweep's randomness at once; the loop body then
+            # only calls the system's O(N) hooks.
+            moves = rng.uniform(-self.step_size, self.step_size, size=x.shape)
+            thresholds = rng.random((n_walkers, n_particles))
+            for w, configuration in enumerate(self.configurations):
+                walker = x[w]
+                for i in range(n_particles):
+                    new_position = walker[i] + moves[w, i]
+                    r = ratio(configuration, i, new_position)
+                    if thresholds[w, i] < r * r:
+                        accept_move(configuration, i, new_position)
+                        walker[i] = new_position
+                        accepted += 1
+
+            if step >= config.burn_in:
+                energies = np.array(
+                    [system.configuration_local_energy(c) for c in self.configurations]
+                )
+                sweep_mean = float(energies.mean())
+                deviations = energies - sweep_mean
+                trace.energy_stats.merge(
+                    RunningStats.from_moments(n_walkers, sweep_mean, deviations @ deviations)
+                )
+                trace.energy_blocks.push(sweep_mean)
+                trace.energy_series.push(sweep_mean)
+
+        self.steps_done += n_steps
+        trace.accepted_moves += accepted
+        trace.attempted_moves += n_steps * n_walkers * n_particles
+
+
+def sample_particles(
+    system: ParticleMoveSystem,
+    config: SimulationConfig,
+) -> ParticleMetropolisTrace:
+    """Run `config.n_steps` particle-by-particle sweeps and return the estimators."""
+    chain = ParticleMetropolisChain(system, config)
+    chain.advance(config.n_steps)
+    return chain.trace
@@ -0,0 +1,137 @@
+"""Proposal kernels for Metropolis-Hastings moves.
+
+A kernel turns the current configuration into a trial move and returns the
+log Green's-function ratio `log T(x' -> x) - log T(x -> x')` needed for
+detailed balance; symmetric kernels return 0. Like the systems in
+`pyqmc.vmc.system`, every kernel offers a scalar method for the pure-Python
+chain and a batched method for `(n_walkers, n_dim)` NumPy arrays.
+
+`step_size` is the kernel's scale: the half-width of the uniform move or the
+time step `tau` of the drift-diffusion move.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from typing import Any, Protocol
+
+from pyqmc.core.config import PROPOSAL_KERNELS
+from pyqmc.vmc.system import BatchedDriftSystem, DriftSystem
+
+
+class ProposalKernel(Protocol):
+    """Interface shared by all proposal kernels."""
+
+    name: str
+
+    def propose(self, x: float, step_size: float, rng: random.Random) -> tuple[float, float]:
+        """Return `(x', log_green_ratio)` for one scalar walker."""
+        ...
+
+    def batched_propose(self, positions: Any, step_size: float, rng: Any) -> tuple[Any, Any]:
+        """Return `(positions', log_green_ratio)` for a whole walker ensemble."""
+        ...
+
+
+class UniformProposal:
+    """Symmetric random-walk move `x' = x + U(-step_size, step_size)`."""
+
+    name = "uniform"
+
+    def __init__(self, system: Any, alpha: float, *, batched: bool = False) -> None:
+        del system, alpha, batched
+
+    def propose(self, x: float, step_size: float, rng: random.Random) -> tuple[float, float]:
+        return x + rng.uniform(-step_size, step_size), 0.0
+
+    def batched_propose(self, positions: Any, step_size: float, rng: Any) -> tuple[Any, Any]:
+        # Same draws as `rng.uniform(-step_size, step_size)`, which computes
+        # `low + (high - low) * u`, but scaled in place to skip its overhead.
+        proposal = rng.random(positions.shape)
+        proposal *= 2.0 * step_size
+        proposal -= step_size
+        proposal += positions
+        return proposal, 0.0
+
+
+class LangevinProposal:
+    """Drift-diffusion (Metropolis-adjusted Langevin) move.
+
+    The walker drifts along the drift velocity `v = grad ln psi_T` and
+    diffuses with variance `tau` per coordinate:
+
+        x' = x + tau * v(x) + sqrt(tau) * eta,    eta ~ N(0, 1)
+
+    The Gaussian Green's function is not symmetric, so the acceptance test
+    includes `log G(x <- x') - log G(x' <- x)`. The system must implement
+    `DriftSystem` for scalar chains or `BatchedDriftSystem` for batched ones.
+    """
+
+    name = "langevin"
+
+    def __init__(self, system: Any, alpha: float, *, batched: bool = False) -> None:
+        required = BatchedDriftSystem if batched else DriftSystem
+        if not isinstance(system, required):
+            raise TypeError(
+                f"{system.name} does not implement {required.__name__}, "
+                "required by langevin moves"
+            )
+        self.system = system
+        self.alpha = alpha
+        # The walker restarts from either the old or the proposed position, so
+        # remembering both drifts saves one evaluation per scalar step.
+        self._cache: tuple[tuple[float, float], ...] = ()
+
+    def _scalar_drift(self, x: float) -> float:
+        for cached_x, cached_drift in self._cache:
+            if cached_x == x:
+                return cached_drift
+        return self.system.drift_velocity(x, self.alpha)
+
+    def propose(self, x: float, step_size: float, rng: random.Random) -> tuple[float, float]:
+        drift_x = self._scalar_drift(x)
+        proposal = x + step_size * drift_x + math.sqrt(step_size) * rng.gauss(0.0, 1.0)
+        drift_proposal = self.system.drift_velocity(proposal, self.alpha)
+        self._cache = ((x, drift_x), (proposal, drift_proposal))
+
+        forward = proposal - x - step_size * drift_x
+        backward = x - proposal - step_size * drift_proposal
+        return proposal, (forward * forward - backward * backward) / (2.0 * step_size)
+
+    def batched_propose(self, positions: Any, step_size: float, rng: Any) -> tuple[Any, Any]:
+        drift = self.system.batched_drift_velocity(positions, self.alpha)
+        noise = rng.standard_normal(positions.shape)
+        proposal = positions + step_size * drift + math.sqrt(step_size) * noise
+        drift_proposal = self.system.batched_drift_velocity(proposal, self.alpha)
+
+        forward = proposal - positions - step_size * drift
+        backward = positions - proposal - step_size * drift_proposal
+        log_ratio = ((forward * forward).sum(axis=1) - (backward * backward).sum(axis=1)) / (
+            2.0 * step_size
+        )
+        return proposal, log_ratio
+
+
+_KERNELS: dict[str, type] = {
+    UniformProposal.name: UniformProposal,
+    LangevinProposal.name: LangevinProposal,
+}
+
+
+def make_proposal(
+    name: str,
+    system: Any,
+    alpha: float,
+    *,
+    batched: bool = False,
+) -> ProposalKernel:
+    """Instantiate the proposal kernel registered under `name`.
+
+    `batched` selects which system protocol the kernel has to rely on.
+    """
+    try:
+        kernel_cls = _KERNELS[name]
+    except KeyError as exc:
+        raise ValueError(f"proposal must be one of: {', '.join(PROPOSAL_KERNELS)}") from exc
+    return kernel_cls(system, alpha, batched=batched)
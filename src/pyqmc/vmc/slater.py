@@ -0,0 +1,248 @@
+"""Slater-determinant factors with Sherman-Morrison inverse updates.
+
+For `n_up` spin-up and `n_down` spin-down fermions (particles `0..n_up-1`
+are spin up) the antisymmetric factor is `det A_up * det A_down`, with
+`A[i, k] = phi_k(r_i)` for the lowest single-particle orbitals.
+
+Batched evaluation inverts every walker's matrices in O(N^3). Particle moves
+instead keep the inverse per walker (`SlaterInverse`). The ratio after moving
+particle `i` is `sum_k phi_k(r_i') A^-1[k, i]`, which costs O(N). An accepted
+move applies a Sherman-Morrison rank-1 update in O(N^2), and every
+`recompute_interval` accepted moves the inverse is rebuilt from scratch to
+stop rounding errors from accumulating. This module requires NumPy (install
+with `pip install -e '.[numpy]'`).
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+DEFAULT_RECOMPUTE_INTERVAL = 100
+
+
+def trap_orbital_quantum_numbers(
+    n_orbitals: int,
+    frequencies: Sequence[float],
+) -> list[tuple[int, ...]]:
+    """Return the `n_orbitals` lowest trap levels `(n_x, n_y, ...)` in energy order.
+
+    Ties are broken by the quantum numbers, so the choice is deterministic.
+    A level's lower neighbours along every axis have strictly lower energy
+    and are always included.
+    """
+    origin = (0,) * len(frequencies)
+    heap = [(0.0, origin)]
+    seen = {origin}
+    levels: list[tuple[int, ...]] = []
+    while len(levels) < n_orbitals:
+        _, level = heapq.heappop(heap)
+        levels.append(level)
+        for axis in range(len(frequencies)):
+            raised = level[:axis] + (level[axis] + 1,) + level[axis + 1 :]
+            if raised not in seen:
+                seen.add(raised)
+                energy = sum(n * omega for n, omega in zip(raised, frequencies, strict=True))
+                heapq.heappush(heap, (energy, raised))
+    return levels
+
+
+class HarmonicOrbitals:
+    """Trap orbitals without their Gaussian: `phi_k(r) = prod_d H_{n_kd}(sqrt(omega_d) r_d)`.
+
+    The Gaussian envelope is left to a `GaussianOneBody` factor. Because each
+    filled level's lower neighbours are filled too, the determinant of these
+    Hermite polynomials equals a constant times the determinant of
+    monomials. It therefore does not depend on the length scale, and
+    `GaussianOneBody`'s `alpha` scales the whole trial function exactly.
+    """
+
+    def __init__(self, frequencies: Sequence[float] = (1.0, 1.0, 1.0)) -> None:
+        if any(omega <= 0 for omega in frequencies):
+            raise ValueError("frequencies must be positive")
+        self.frequencies = tuple(float(omega) for omega in frequencies)
+        self.scale = np.sqrt(np.array(self.frequencies))
+        self._levels: dict[int, Any] = {}
+
+    def levels(self, n_orbitals: int) -> Any:
+        """Quantum numbers of the lowest `n_orbitals` levels, shape `(n_orbitals, n_axes)`."""
+        if n_orbitals not in self._levels:
+            self._levels[n_orbitals] = np.array(
+                trap_orbital_quantum_numbers(n_orbitals, self.frequencies), dtype=int
+            ).reshape(n_orbitals, len(self.frequencies))
+        return self._levels[n_orbitals]
+
+    def level_energies(self, n_orbitals: int) -> Any:
+        """Trap energies `sum_d (n_d + 1/2) omega_d` of the lowest `n_orbitals` levels."""
+        return (self.levels(n_orbitals) + 0.5) @ np.array(self.frequencies)
+
+    def _hermite(self, positions: Any, n_max: int) -> Any:
+        """Return `H_n(sqrt(omega_d) x_d)` for `n <= n_max`, shape `(..., n_axes, n_max + 1)`."""
+        x = positions * self.scale
+        table = np.empty(x.shape + (n_max + 1,))
+        table[..., 0] = 1.0
+        if n_max > 0:
+            table[..., 1] = 2.0 * x
+        for n in range(1, n_max):
+            table[..., n + 1] = 2.0 * x * table[..., n] - 2.0 * n * table[..., n - 1]
+        return table
+
+    def values(self, positions: Any, n_orbitals: int) -> Any:
+        """Return `phi_k(r_i)` with shape `(..., n_particles, n_orbitals)`."""
+        levels = self.levels(n_orbitals)
+        hermite = self._hermite(positions, int(levels.max()))
+        return hermite[..., np.arange(levels.shape[1]), levels].prod(axis=-1)
+
+    def evaluate(self, positions: Any, n_orbitals: int) -> tuple[Any, Any, Any]:
+        """Return orbital values, gradients and Laplacians at every position.
+
+        Shapes are `(..., n_particles, n_orbitals)`, the same with a trailing
+        `n_axes` axis, and the same as the values.
+        """
+        levels = self.levels(n_orbitals)
+        n_axes = levels.shape[1]
+        hermite = self._hermite(positions, int(levels.max()) + 1)
+        n = np.arange(hermite.shape[-1])
+        # H_n' = 2n H_{n-1} and H_n'' = 4n(n-1) H_{n-2}, times the chain-rule scale.
+        first = np.zeros_like(hermite)
+        first[..., 1:] = 2.0 * n[1:] * hermite[..., :-1]
+        second = np.zeros_like(hermite)
+        second[..., 2:] = 4.0 * n[2:] * (n[2:] - 1) * hermite[..., :-2]
+        axes = np.arange(n_axes)
+        factors = hermite[..., axes, levels]
+        first = first[..., axes, levels] * self.scale
+        second = second[..., axes, levels] * self.scale**2
+        values = factors.prod(axis=-1)
+        gradients = np.empty_like(factors)
+        laplacians = np.zeros_like(values)
+        for axis in range(n_axes):
+            others = np.delete(factors, axis, axis=-1).prod(axis=-1)
+            gradients[..., axis] = first[..., axis] * others
+            laplacians = laplacians + second[..., axis] * others
+        return values, gradients, laplacians
+
+
+class SlaterDeterminant:
+    """Spin-up times spin-down determinant of the lowest `orbitals`.
+
+    Contributes `ln|det A_up| + ln|det A_down|` to `ln |psi_T|` and has no
+    trainable parameters.
+    """
+
+    n_parameters = 0
+
+    def __init__(
+        self,
+        orbitals: HarmonicOrbitals,
+        n_up: int,
+        n_down: int = 0,
+        *,
+        recompute_interval: int = DEFAULT_RECOMPUTE_INTERVAL,
+    ) -> None:
+        if n_up < 0 or n_down < 0 or n_up + n_down == 0:
+            raise ValueError("n_up and n_down must be non-negative with at least one particle")
+        if recompute_interval <= 0:
+            raise ValueError("recompute_interval must be positive")
+        self.orbitals = orbitals
+        self.n_up = int(n_up)
+        self.n_down = int(n_down)
+        self.n_particles = self.n_up + self.n_down
+        self.recompute_interval = int(recompute_interval)
+        self.blocks = [
+            (start, stop)
+            for start, stop in ((0, self.n_up), (self.n_up, self.n_particles))
+            if stop > start
+        ]
+
+    def filled_level_energy(self) -> float:
+        """Sum of the filled levels' trap energies, exact E0 without interactions."""
+        return float(
+            sum(self.orbitals.level_energies(stop - start).sum() for start, stop in self.blocks)
+        )
+
+    def matrices(self, positions: Any) -> list[Any]:
+        """Return the Slater matrix `A[..., i, k]` of every spin block."""
+        return [
+            self.orbitals.values(positions[..., start:stop, :], stop - start)
+            for start, stop in self.blocks
+        ]
+
+    def log_value(self, positions: Any) -> Any:
+        """Return `ln|det A_up| + ln|det A_down|` for every walker."""
+        return sum(np.linalg.slogdet(matrix)[1] for matrix in self.matrices(positions))
+
+    def gradient_and_laplacian(self, positions: Any) -> tuple[Any, Any]:
+        """Return `grad ln|D|` per particle and `lap ln|D|` per walker.
+
+        With `B = A^-1`, `grad_i ln D = sum_k grad phi_k(r_i) B[k, i]` and
+        `lap_i ln D = sum_k lap phi_k(r_i) B[k, i] - |grad_i ln D|^2`.
+        """
+        gradient = np.zeros(positions.shape)
+        laplacian = np.zeros(positions.shape[:-2])
+        for start, stop in self.blocks:
+            values, gradients, laplacians = self.orbitals.evaluate(
+                positions[..., start:stop, :], stop - start
+            )
+            inverse = np.linalg.inv(values)
+            block_gradient = np.einsum("...ikd,...ki->...id", gradients, inverse)
+            gradient[..., start:stop, :] = block_gradient
+            laplacian = laplacian + (
+                np.einsum("...ik,...ki->...", laplacians, inverse)
+                - np.einsum("...id,...id->...", block_gradient, block_gradient)
+            )
+        return gradient, laplacian
+
+    def inverse_state(self, positions: Any) -> SlaterInverse:
+        """Return the particle-move state of one walker, sharing `positions`."""
+        return SlaterInverse(self, positions)
+
+
+class SlaterInverse:
+    """Inverse Slater matrices of one walker, updated by Sherman-Morrison.
+
+    `positions` is shared with the caller, which moves particles before
+    calling `accept`, so a periodic rebuild sees the current positions.
+    """
+
+    def __init__(self, determinant: SlaterDeterminant, positions: Any) -> None:
+        self.determinant = determinant
+        self.positions = positions
+        self.updates_since_rebuild = 0
+        self._block_of = [
+            (block, i - start)
+            for block, (start, stop) in enumerate(determinant.blocks)
+            for i in range(start, stop)
+        ]
+        self._pending_row: Any = None
+        self._pending_ratio = 0.0
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Recompute every inverse from the positions in O(N^3)."""
+        matrices = self.determinant.matrices(self.positions)
+        self.inverses = [np.linalg.inv(matrix) for matrix in matrices]
+        self.updates_since_rebuild = 0
+
+    def ratio(self, i: int, new_position: Any) -> float:
+        """Return `det A' / det A` for moving particle `i`, in O(N)."""
+        block, column = self._block_of[i]
+        inverse = self.inverses[block]
+        row = self.determinant.orbitals.values(new_position[None, :], len(inverse))[0]
+        self._pending_row = row
+        self._pending_ratio = float(row @ inverse[:, column])
+        return self._pending_ratio
+
+    def accept(self, i: int) -> None:
+        """Apply the move last passed to `ratio` to the inverse in O(N^2)."""
+        block, column = self._block_of[i]
+        inverse = self.inverses[block]
+        # A' = A + e_i (u - A_i)^T gives A'^-1 = A^-1 - A^-1[:, i] (u A^-1 - e_i) / R.
+        projected = self._pending_row @ inverse
+        projected[column] -= 1.0
+        inverse -= np.outer(inverse[:, column] / self._pending_ratio, projected)
+        self.updates_since_rebuild += 1
+        if self.updates_since_rebuild >= self.determinant.recompute_interval:
+            self.rebuild()
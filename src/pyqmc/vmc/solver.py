@@ -1,33 +1,69 @@
 """Public VMC runners used by CLI/API layers."""
 
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+from pyqmc.core.autocorrelation import autocorrelation_analysis
+from pyqmc.core.checkpoint import CheckpointPolicy
 from pyqmc.core.config import SimulationConfig
-from pyqmc.core.results import SimulationResult
-from pyqmc.core.stats import mean, standard_error
+from pyqmc.core.progress import ProgressCallback
+from pyqmc.core.results import AlphaSweepResult, OptimizationResult, SimulationResult
 from pyqmc.vmc.harmonic_oscillator import HarmonicOscillator1D
-from pyqmc.vmc.metropolis import sample_chain
+from pyqmc.vmc.parallel import run_chains
 
 
-def run_vmc_harmonic_oscillator(config: SimulationConfig) -> SimulationResult:
+def run_vmc_harmonic_oscillator(
+    config: SimulationConfig,
+    *,
+    checkpoint: CheckpointPolicy | None = None,
+    trace_out: Path | None = None,
+    progress: ProgressCallback | None = None,
+) -> SimulationResult:
     """Run educational VMC on the 1D harmonic oscillator.
 
     The exact ground-state energy is 0.5 in these units; this provides an
-    immediate correctness check for students.
+    immediate correctness check for students. With `checkpoint`, the chain
+    state is saved periodically and a run can resume from it (see
+    `pyqmc.core.checkpoint`). With `trace_out`, every kept sample is written
+    to that directory for later analysis (see `pyqmc.vmc.trace_store`).
+    `progress` receives periodic `ProgressSnapshot`s while the chains run.
     """
     config.validate()
 
     system = HarmonicOscillator1D()
-    trace = sample_chain(system, config)
+    summary = run_chains(
+        system, config, checkpoint=checkpoint, trace_out=trace_out, progress=progress
+    )
+    energy_stats = summary.energy_stats
 
-    if not trace.local_energies:
+    if energy_stats.count == 0:
         raise RuntimeError("no samples collected; check n_steps and burn_in")
 
+    # Metropolis samples are correlated; report the blocking-plateau error.
+    blocking = summary.energy_blocks.analysis()
+    error = blocking.standard_error
+    autocorrelation = autocorrelation_analysis([s.values for s in summary.energy_series])
+    effective_samples = _effective_samples(energy_stats.variance, energy_stats.count, error)
+    # The autocorrelation series may be block-averaged (and, for the numpy
+    # backend, walker-averaged), so convert its error back to per-sample units.
+    autocorrelation_samples = _effective_samples(
+        energy_stats.variance, energy_stats.count, autocorrelation.standard_error
+    )
+    tuned_step_size = (
+        sum(summary.step_sizes) / len(summary.step_sizes) if config.tune_step_size else None
+    )
+    ess_per_cpu_second = (
+        autocorrelation_samples / summary.cpu_seconds if summary.cpu_seconds > 0 else None
+    )
+
     return SimulationResult(
         method="VMC (Metropolis)",
         system=system.name,
-        n_samples=len(trace.local_energies),
-        mean_energy=mean(trace.local_energies),
-        standard_error=standard_error(trace.local_energies),
-        acceptance_ratio=trace.acceptance_ratio,
+        n_samples=energy_stats.count,
+        mean_energy=energy_stats.mean,
+        standard_error=error,
+        acceptance_ratio=summary.acceptance_ratio,
         parameters={
             "alpha": config.alpha,
             "n_steps": config.n_steps,
@@ -35,9 +71,222 @@ def run_vmc_harmonic_oscillator(config: SimulationConfig) -> SimulationResult:
             "step_size": config.step_size,
             "initial_position": config.initial_position,
             "seed": config.seed,
+            "backend": config.backend,
+            "n_walkers": config.n_walkers,
+            "n_chains": config.n_chains,
+            "target_standard_error": config.target_standard_error,
+            "max_seconds": config.max_seconds,
+            "tune_step_size": config.tune_step_size,
+            "target_acceptance": config.target_acceptance,
+            "proposal": config.proposal,
         },
         metadata={
             "exact_ground_state_energy": 0.5,
+            "workers": config.workers,
+            "steps_per_chain": summary.steps_per_chain,
+            "stop_reason": summary.stop_reason,
+            "resumed_from_step": summary.resumed_from_step,
+            "trace_out": None if trace_out is None else str(trace_out),
+            "tuned_step_size": tuned_step_size,
+            "naive_standard_error": energy_stats.standard_error,
+            "integrated_autocorrelation_time": energy_stats.count / autocorrelation_samples,
+            "effective_samples": autocorrelation_samples,
+            "cpu_seconds": summary.cpu_seconds,
+            "effective_samples_per_cpu_second": ess_per_cpu_second,
+            "autocorrelation": {
+                "window": autocorrelation.window,
+                "stride": summary.energy_series[0].stride,
+                "converged": autocorrelation.converged,
+            },
+            "blocking": {
+                "block_size": blocking.block_size,
+                "effective_samples": effective_samples,
+                "converged": blocking.converged,
+            },
             "notes": "Use alpha near 1.0 for best agreement in this simple trial family.",
         },
     )
+
+
+def _effective_samples(variance: float, count: int, error: float) -> float:
+    """Number of independent samples with the same error as `count` correlated ones."""
+    if error <= 0.0:
+        return float(count)
+    return variance / (error * error)
+
+
+def run_vmc_fermion_trap(
+    config: SimulationConfig,
+    *,
+    n_up: int,
+    n_down: int,
+    frequencies: Sequence[float],
+) -> SimulationResult:
+    """Run particle-by-particle VMC for non-interacting fermions in a harmonic trap.
+
+    The trial function is one Slater determinant per spin times the trap
+    Gaussian scaled by `config.alpha`; it is exact at `alpha = 1`. Each
+    walker keeps its inverse Slater matrices, so a move costs O(N) and an
+    accepted move O(N^2) (see `pyqmc.vmc.slater`). `n_steps` and `burn_in`
+    count sweeps over all particles of `config.n_walkers` walkers in one
+    chain. Requires NumPy.
+    """
+    config.validate()
+    if config.n_chains != 1 or config.target_standard_error is not None:
+        raise ValueError("particle-move runs use one chain with a fixed n_steps")
+
+    try:
+        from pyqmc.vmc.interacting import fermion_trap
+        from pyqmc.vmc.particle_metropolis import ParticleMetropolisChain
+    except ModuleNotFoundError as exc:
+        raise RuntimeError(
+            "Fermion systems require NumPy. Install with: pip install -e '.[numpy]'"
+        ) from exc
+
+    system = fermion_trap(n_up, n_down, frequencies)
+    determinant = system.wavefunction.determinant
+    start = time.process_time()
+    chain = ParticleMetropolisChain(system, config)
+    chain.advance(config.n_steps)
+    cpu_seconds = time.process_time() - start
+    trace = chain.trace
+    energy_stats = trace.energy_stats
+    if energy_stats.count == 0:
+        raise RuntimeError("no samples collected; check n_steps and burn_in")
+
+    blocking = trace.energy_blocks.analysis()
+    return SimulationResult(
+        method="VMC (particle-by-particle Metropolis)",
+        system=system.name,
+        n_samples=energy_stats.count,
+        mean_energy=energy_stats.mean,
+        standard_error=blocking.standard_error,
+        acceptance_ratio=trace.acceptance_ratio,
+        parameters={
+            "alpha": config.alpha,
+            "n_up": n_up,
+            "n_down": n_down,
+            "frequencies": [float(omega) for omega in frequencies],
+            "n_steps": config.n_steps,
+            "burn_in": config.burn_in,
+            "step_size": config.step_size,
+            "seed": config.seed,
+            "n_walkers": config.n_walkers,
+            "tune_step_size": config.tune_step_size,
+            "target_acceptance": config.target_acceptance,
+        },
+        metadata={
+            "exact_ground_state_energy": determinant.filled_level_energy(),
+            "recompute_interval": determinant.recompute_interval,
+            "tuned_step_size": chain.step_size if config.tune_step_size else None,
+            "naive_standard_error": energy_stats.standard_error,
+            "cpu_seconds": cpu_seconds,
+            "blocking": {
+                "block_size": blocking.block_size,
+                "effective_samples": _effective_samples(
+                    energy_stats.variance, energy_stats.count, blocking.standard_error
+                ),
+                "converged": blocking.converged,
+            },
+            "notes": "alpha = 1.0 is exact; the local energy then has zero variance.",
+        },
+    )
+
+
+def run_vmc_harmonic_oscillator_alpha_sweep(
+    config: SimulationConfig,
+    alphas: Sequence[float],
+) -> AlphaSweepResult:
+    """Estimate E(alpha) on a grid from one run at `config.alpha`.
+
+    The chains sample `|psi_T|^2` at the reference `config.alpha` once; every
+    grid value is then obtained by reweighting the stored configurations (see
+    `pyqmc.vmc.reweighting`). Requires NumPy.
+    """
+    config.validate()
+    if not alphas:
+        raise ValueError("alphas must contain at least one value")
+    if any(alpha <= 0 for alpha in alphas):
+        raise ValueError("alphas must be positive")
+    if config.target_standard_error is not None:
+        raise ValueError("alpha sweeps require a fixed n_steps; unset target_standard_error")
+
+    try:
+        from pyqmc.vmc.reweighting import reweight_alpha_grid, stack_positions
+    except ModuleNotFoundError as exc:
+        raise RuntimeError(
+            "Alpha sweeps require NumPy. Install with: pip install -e '.[numpy]'"
+        ) from exc
+
+    system = HarmonicOscillator1D()
+    summary = run_chains(system, config, store_trace=True)
+    energy_stats = summary.energy_stats
+    if energy_stats.count == 0:
+        raise RuntimeError("no samples collected; check n_steps and burn_in")
+
+    positions = stack_positions(summary.traces, system.n_dim)
+    points = reweight_alpha_grid(system, positions, config.alpha, alphas)
+
+    return AlphaSweepResult(
+        method="VMC (correlated sampling)",
+        system=system.name,
+        reference_alpha=config.alpha,
+        n_samples=energy_stats.count,
+        points=points,
+        parameters={
+            "alphas": [float(alpha) for alpha in alphas],
+            "n_steps": config.n_steps,
+            "burn_in": config.burn_in,
+            "step_size": config.step_size,
+            "initial_position": config.initial_position,
+            "seed": config.seed,
+            "backend": config.backend,
+            "n_walkers": config.n_walkers,
+            "n_chains": config.n_chains,
+            "proposal": config.proposal,
+        },
+        metadata={
+            "exact_ground_state_energy": 0.5,
+            "workers": config.workers,
+            "reference_acceptance_ratio": summary.acceptance_ratio,
+            "notes": (
+                "Grid points far from the reference alpha have few effective "
+                "samples; re-centre the reference when effective_samples drops."
+            ),
+        },
+    )
+
+
+def run_vmc_harmonic_oscillator_optimization(
+    config: SimulationConfig,
+    *,
+    method: str = "linear",
+    n_iterations: int = 30,
+    learning_rate: float = 0.5,
+    regularization: float = 1e-3,
+) -> OptimizationResult:
+    """Optimize `alpha` starting at `config.alpha`.
+
+    `method` is "linear" (linear method) or "sr" (stochastic
+    reconfiguration). Each iteration samples `config.n_steps - config.burn_in`
+    sweeps of the NumPy walker ensemble; see `pyqmc.vmc.optimize`. Requires
+    NumPy.
+    """
+    try:
+        from pyqmc.vmc.optimize import optimize_wavefunction
+    except ModuleNotFoundError as exc:
+        raise RuntimeError(
+            "Parameter optimization requires NumPy. Install with: pip install -e '.[numpy]'"
+        ) from exc
+
+    result = optimize_wavefunction(
+        HarmonicOscillator1D(),
+        config,
+        method=method,
+        n_iterations=n_iterations,
+        learning_rate=learning_rate,
+        regularization=regularization,
+    )
+    result.metadata["exact_optimal_alpha"] = 1.0
+    result.metadata["exact_ground_state_energy"] = 0.5
+    return result
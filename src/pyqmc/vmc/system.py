@@ -0,0 +1,177 @@
+"""Protocols describing the physical systems understood by VMC samplers.
+
+Two calling conventions coexist:
+- scalar methods take one Python float and are used by the pure-Python
+  reference sampler (`sample_chain`);
+- batched methods take a `(n_walkers, n_dim)` array and return one value per
+  walker, so a whole ensemble is evaluated in a single call.
+
+Systems that support drift-diffusion (Langevin) moves additionally provide
+the drift velocity `grad ln psi_T` (`DriftSystem`, `BatchedDriftSystem`).
+Systems whose parameters can be optimized provide the log-derivatives
+`d ln psi_T / d p_k` (`OptimizableSystem`).
+
+Many-particle systems can also support single-particle moves
+(`ParticleMoveSystem`): they keep a per-walker configuration object with
+whatever caches make moving one particle cheap, and expose the wavefunction
+ratio of a move plus a hook that commits it.
+
+Systems whose trial function or potential is singular where particles
+coincide (Coulomb nuclei, pair cusps) choose their own walker start
+positions (`StartPositionSystem`) instead of placing every coordinate at
+`config.initial_position`.
+
+The `alpha` argument carries the trial-wavefunction parameters: a float for
+one-parameter systems, or a tuple of `n_parameters` floats otherwise.
+
+Systems only need to implement the batched methods; `ScalarFallbackMixin`
+derives the scalar ones from them. Systems that care about the pure-Python
+path (such as `HarmonicOscillator1D`) can still provide explicit scalar
+formulas.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class ScalarSystem(Protocol):
+    """System evaluated one configuration at a time."""
+
+    name: str
+
+    def log_probability_density(self, x: float, alpha: float) -> float:
+        """Return log(|psi_T(x)|^2)."""
+        ...
+
+    def local_energy(self, x: float, alpha: float) -> float:
+        """Return E_L(x) = H psi_T / psi_T."""
+        ...
+
+
+@runtime_checkable
+class BatchedSystem(Protocol):
+    """System evaluated on whole walker ensembles.
+
+    `positions` arguments are NumPy arrays of shape `(n_walkers, n_dim)` and
+    every method returns an array of shape `(n_walkers,)`.
+    """
+
+    name: str
+    n_dim: int
+
+    def batched_log_probability_density(self, positions: Any, alpha: float) -> Any:
+        """Return log(|psi_T|^2) for every walker."""
+        ...
+
+    def batched_local_energy(self, positions: Any, alpha: float) -> Any:
+        """Return the local energy for every walker."""
+        ...
+
+
+@runtime_checkable
+class DriftSystem(Protocol):
+    """Scalar system that also provides its drift velocity."""
+
+    def drift_velocity(self, x: float, alpha: float) -> float:
+        """Return d ln(psi_T) / dx."""
+        ...
+
+
+@runtime_checkable
+class BatchedDriftSystem(Protocol):
+    """Batched system that also provides its drift velocity."""
+
+    def batched_drift_velocity(self, positions: Any, alpha: float) -> Any:
+        """Return grad ln(psi_T) with shape `(n_walkers, n_dim)`."""
+        ...
+
+
+@runtime_checkable
+class OptimizableSystem(Protocol):
+    """Batched system that exposes the parameter derivatives of ln(psi_T)."""
+
+    n_parameters: int
+
+    def batched_log_derivatives(self, positions: Any, alpha: Any) -> Any:
+        """Return `d ln(psi_T) / d p_k` with shape `(n_walkers, n_parameters)`."""
+        ...
+
+
+@runtime_checkable
+class ParticleMoveSystem(Protocol):
+    """System sampled one particle at a time with incremental updates.
+
+    A configuration is the system's own per-walker object (for example a
+    `ParticleConfiguration` subclass) holding positions of shape
+    `(n_particles, n_axes)` and cached quantities. `ratio` must leave the
+    walker unchanged; `accept_move` commits the move most recently passed to
+    `ratio`, so systems may stash work from `ratio` for reuse.
+    """
+
+    n_particles: int
+    n_axes: int
+
+    def particle_configuration(self, positions: Any, alpha: Any) -> Any:
+        """Build the cached configuration of one walker."""
+        ...
+
+    def ratio(self, configuration: Any, i: int, new_position: Any) -> float:
+        """Return psi_T(R') / psi_T(R) for moving particle `i` to `new_position`."""
+        ...
+
+    def accept_move(self, configuration: Any, i: int, new_position: Any) -> None:
+        """Move particle `i` to `new_position`, updating the caches."""
+        ...
+
+    def configuration_local_energy(self, configuration: Any) -> float:
+        """Return the local energy of the walker's current positions."""
+        ...
+
+
+@runtime_checkable
+class StartPositionSystem(Protocol):
+    """Batched system that chooses where its walkers start."""
+
+    def initial_positions(self, n_walkers: int, center: float, width: float, rng: Any) -> Any:
+        """Return start positions of shape `(n_walkers, n_dim)` near `center`."""
+        ...
+
+
+@dataclass
+class ParticleConfiguration:
+    """Per-walker state for particle moves: positions and trial parameters.
+
+    Systems that cache more (pair distances, inverse matrices) subclass it.
+    """
+
+    positions: Any
+    alpha: Any
+
+
+class ScalarFallbackMixin:
+    """Generate scalar system methods from batched implementations.
+
+    The scalar value is evaluated as a one-walker batch, which costs an array
+    allocation per call. Systems that are sampled by the pure-Python loop in
+    hot paths should override these methods with closed forms.
+    """
+
+    n_dim: int
+
+    def _as_single_walker(self, x: Any) -> Any:
+        import numpy as np
+
+        return np.asarray(x, dtype=float).reshape(1, self.n_dim)
+
+    def log_probability_density(self, x: Any, alpha: float) -> float:
+        """Return log(|psi_T(x)|^2) via `batched_log_probability_density`."""
+        batch = self._as_single_walker(x)
+        return float(self.batched_log_probability_density(batch, alpha)[0])
+
+    def local_energy(self, x: Any, alpha: float) -> float:
+        """Return E_L(x) via `batched_local_energy`."""
+        batch = self._as_single_walker(x)
+        return float(self.batched_local_energy(batch, alpha)[0])
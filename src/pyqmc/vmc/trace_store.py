@@ -0,0 +1,217 @@
+"""On-disk sample traces backed by memory-mapped `.npy` files.
+
+A trace directory holds a small JSON header (`trace.json`) and, for every
+chain, two preallocated `.npy` arrays:
+
+- `chainNNN_positions.npy` with shape `(n_kept, n_walkers, n_dim)`;
+- `chainNNN_local_energies.npy` with shape `(n_kept, n_walkers)`,
+
+where row `k` holds the walkers after kept step `k` (scalar chains have one
+walker). Samplers stream rows through a `TraceSink` in chunks, so memory stays
+bounded however long the run is; the header records how many rows each chain
+filled. `open_trace` maps the arrays read-only, so blocking, histograms or
+reweighting read them without loading the files into RAM.
+
+This module requires NumPy (install with `pip install -e '.[numpy]'`).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from pyqmc.core.config import SimulationConfig
+
+TRACE_HEADER_NAME = "trace.json"
+TRACE_FORMAT = "pyqmc-trace"
+TRACE_FORMAT_VERSION = 1
+
+# Rows are buffered in memory up to about this many floats between writes.
+_BUFFER_FLOATS = 1 << 20
+
+
+class TraceSink:
+    """Appends one chain's samples to its memory-mapped trace files.
+
+    Sinks hold only paths, a row counter and a small write buffer, so chains
+    carrying them can travel to worker processes. Call `flush` before the
+    chain leaves the process that filled the buffer.
+    """
+
+    def __init__(
+        self,
+        positions_path: Path,
+        energies_path: Path,
+        n_walkers: int,
+        n_dim: int,
+    ) -> None:
+        self.positions_path = positions_path
+        self.energies_path = energies_path
+        self.n_walkers = n_walkers
+        self.n_dim = n_dim
+        self.rows = 0
+        self.buffer_rows = max(1, _BUFFER_FLOATS // (n_walkers * (n_dim + 1)))
+        self._positions: np.ndarray | None = None
+        self._energies: np.ndarray | None = None
+        self._buffered = 0
+
+    def write(self, positions: Any, local_energies: Any) -> None:
+        """Write a block of rows; accepts anything reshapeable to the row layout."""
+        energies = np.asarray(local_energies, dtype=float).reshape(-1, self.n_walkers)
+        n_rows = len(energies)
+        if n_rows == 0:
+            return
+        positions = np.asarray(positions, dtype=float).reshape(n_rows, self.n_walkers, self.n_dim)
+        self.flush()
+        stored_positions = np.load(self.positions_path, mmap_mode="r+")
+        stored_energies = np.load(self.energies_path, mmap_mode="r+")
+        if self.rows + n_rows > len(stored_energies):
+            raise RuntimeError("trace files are full; the chain ran past n_steps")
+        stored_positions[self.rows : self.rows + n_rows] = positions
+        stored_energies[self.rows : self.rows + n_rows] = energies
+        stored_positions.flush()
+        stored_energies.flush()
+        self.rows += n_rows
+
+    def append(self, positions: np.ndarray, local_energies: np.ndarray) -> None:
+        """Buffer one row (one step of every walker), writing full buffers."""
+        if self._positions is None:
+            self._positions = np.empty((self.buffer_rows, self.n_walkers, self.n_dim))
+            self._energies = np.empty((self.buffer_rows, self.n_walkers))
+        self._positions[self._buffered] = positions
+        self._energies[self._buffered] = local_energies
+        self._buffered += 1
+        if self._buffered == self.buffer_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered rows to disk and release the buffer."""
+        if self._buffered == 0:
+            self._positions = self._energies = None
+            return
+        positions, energies = self._positions[: self._buffered], self._energies[: self._buffered]
+        self._buffered = 0
+        self._positions = self._energies = None
+        self.write(positions, energies)
+
+
+def _chain_file_names(index: int) -> tuple[str, str]:
+    return f"chain{index:03d}_positions.npy", f"chain{index:03d}_local_energies.npy"
+
+
+def create_trace_store(
+    directory: Path,
+    config: SimulationConfig,
+    n_dim: int,
+    n_chains: int,
+    *,
+    reuse: bool = False,
+) -> list[TraceSink]:
+    """Prepare `directory` for `n_chains` traces and return one sink per chain.
+
+    Arrays are preallocated for `config.n_steps - config.burn_in` rows (the
+    files are sparse where the OS supports it). With `reuse`, existing files
+    are kept so a resumed run can continue writing where it stopped.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    n_kept = config.n_steps - config.burn_in
+    sinks: list[TraceSink] = []
+    for index in range(n_chains):
+        positions_name, energies_name = _chain_file_names(index)
+        positions_path = directory / positions_name
+        energies_path = directory / energies_name
+        if not (reuse and positions_path.exists() and energies_path.exists()):
+            np.lib.format.open_memmap(
+                positions_path, mode="w+", shape=(n_kept, config.n_walkers, n_dim)
+            ).flush()
+            np.lib.format.open_memmap(
+                energies_path, mode="w+", shape=(n_kept, config.n_walkers)
+            ).flush()
+        sinks.append(TraceSink(positions_path, energies_path, config.n_walkers, n_dim))
+    write_trace_header(directory, config, n_dim, sinks)
+    return sinks
+
+
+def write_trace_header(
+    directory: Path,
+    config: SimulationConfig,
+    n_dim: int,
+    sinks: list[TraceSink],
+) -> None:
+    """Record the layout and the rows filled so far in `trace.json`."""
+    header = {
+        "format": TRACE_FORMAT,
+        "version": TRACE_FORMAT_VERSION,
+        "n_dim": n_dim,
+        "n_walkers": config.n_walkers,
+        "config": dataclasses.asdict(config),
+        "chains": [
+            {
+                "positions": sink.positions_path.name,
+                "local_energies": sink.energies_path.name,
+                "rows": sink.rows,
+            }
+            for sink in sinks
+        ],
+    }
+    (Path(directory) / TRACE_HEADER_NAME).write_text(json.dumps(header, indent=2))
+
+
+@dataclass(frozen=True)
+class StoredChainTrace:
+    """Read-only memory-mapped samples of one chain."""
+
+    positions: np.ndarray
+    local_energies: np.ndarray
+
+    @property
+    def sweep_energies(self) -> np.ndarray:
+        """Walker-averaged energy of every kept step, the series to block."""
+        return self.local_energies.mean(axis=1)
+
+
+@dataclass(frozen=True)
+class StoredTrace:
+    """A trace directory opened with `open_trace`."""
+
+    directory: Path
+    header: dict[str, Any]
+    chains: list[StoredChainTrace]
+
+    @property
+    def n_dim(self) -> int:
+        return int(self.header["n_dim"])
+
+    @property
+    def n_samples(self) -> int:
+        return sum(chain.local_energies.size for chain in self.chains)
+
+
+def open_trace(directory: Path) -> StoredTrace:
+    """Map the trace in `directory` read-only, trimmed to the filled rows."""
+    directory = Path(directory)
+    header_path = directory / TRACE_HEADER_NAME
+    if not header_path.exists():
+        raise ValueError(f"{directory} does not contain a pyqmc trace")
+    header = json.loads(header_path.read_text())
+    if header.get("format") != TRACE_FORMAT:
+        raise ValueError(f"{directory} does not contain a pyqmc trace")
+    if header.get("version") != TRACE_FORMAT_VERSION:
+        raise ValueError(f"unsupported trace version {header.get('version')}")
+
+    chains = []
+    for chain in header["chains"]:
+        rows = chain["rows"]
+        chains.append(
+            StoredChainTrace(
+                positions=np.load(directory / chain["positions"], mmap_mode="r")[:rows],
+                local_energies=np.load(directory / chain["local_energies"], mmap_mode="r")[:rows],
+            )
+        )
+    return StoredTrace(directory=directory, header=header, chains=chains)
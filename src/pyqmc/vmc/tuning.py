@@ -0,0 +1,58 @@
+"""Burn-in adaptation of the Metropolis proposal width.
+
+The tuner nudges `log(step_size)` toward a target acceptance ratio with a
+Robbins-Monro update whose gain decays like `1/sqrt(k)`. It only acts during
+burn-in; the width is frozen afterwards, so the kept samples come from a fixed
+kernel and detailed balance holds.
+
+Adaptation happens at fixed global step indices, so a chain advanced in
+chunks tunes exactly like one advanced in a single call.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+# Proposals (steps times walkers) per adaptation window.
+_TUNE_WINDOW_MOVES = 100
+_TUNE_GAIN = 2.0
+
+
+@dataclass
+class StepSizeTuner:
+    """Adapt `step_size` toward `target_acceptance` during burn-in."""
+
+    step_size: float
+    target_acceptance: float
+    burn_in: int
+    n_walkers: int = 1
+    accepted: int = 0
+    attempted: int = 0
+    n_updates: int = 0
+
+    @property
+    def window_steps(self) -> int:
+        """Steps per adaptation window for this walker count."""
+        return max(1, math.ceil(_TUNE_WINDOW_MOVES / self.n_walkers))
+
+    def segment(self, steps_done: int, end: int) -> int:
+        """Steps to run before the next adaptation point, or 0 after burn-in."""
+        if steps_done >= min(end, self.burn_in):
+            return 0
+        window = self.window_steps
+        boundary = (steps_done // window + 1) * window
+        return min(boundary, self.burn_in, end) - steps_done
+
+    def update(self, accepted: int, steps: int) -> None:
+        """Record one segment and adapt once a full window has been seen."""
+        self.accepted += accepted
+        self.attempted += steps * self.n_walkers
+        if self.attempted < self.window_steps * self.n_walkers:
+            return
+        rate = self.accepted / self.attempted
+        self.n_updates += 1
+        gain = _TUNE_GAIN / math.sqrt(self.n_updates)
+        self.step_size *= math.exp(gain * (rate - self.target_acceptance))
+        self.accepted = 0
+        self.attempted = 0
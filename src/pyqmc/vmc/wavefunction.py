@@ -0,0 +1,195 @@
+"""Composable trial wavefunctions: a one-body part times a two-body Jastrow.
+
+    ln |psi_T(R)| = sum_i ln phi(r_i) + sum_{i<j} u(r_ij) [+ ln |D(R)|]
+
+Everything is evaluated on walker ensembles of shape
+`(n_walkers, n_particles, n_axes)` with analytic gradients and Laplacians of
+`ln psi_T`, so the local kinetic energy `-(lap + |grad|^2) / 2` needs no
+finite differences and no per-pair Python loops. The parameter vector is the
+one-body parameters followed by the Jastrow's trainable ones. Fermions add
+an optional `SlaterDeterminant` factor `D` (see `pyqmc.vmc.slater`), which
+has no parameters.
+
+For particle-by-particle moves, `log_ratio` evaluates the change of the
+symmetric factors from a `PairDistanceTable` in O(N); a determinant's ratio
+comes from its per-walker `SlaterInverse`. This module requires NumPy
+(install with `pip install -e '.[numpy]'`).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+from pyqmc.vmc.jastrow import ExponentialJastrow, PadeJastrow
+from pyqmc.vmc.pair_distances import (
+    PairDistanceTable,
+    pair_displacements,
+    pair_distance_matrix,
+)
+from pyqmc.vmc.slater import SlaterDeterminant
+
+
+class GaussianOneBody:
+    """Trap orbital `ln phi(r) = -alpha/2 sum_d omega_d r_d^2`; parameter `alpha`."""
+
+    n_parameters = 1
+
+    def __init__(self, frequencies: Sequence[float] = (1.0, 1.0, 1.0)) -> None:
+        if any(omega <= 0 for omega in frequencies):
+            raise ValueError("frequencies must be positive")
+        self.omega = np.array(frequencies, dtype=float)
+
+    def log_values(self, positions: Any, params: Any) -> Any:
+        """Return `ln phi(r_i)` for every particle, shape `(..., n_particles)`."""
+        return -0.5 * params[0] * (positions * positions) @ self.omega
+
+    def gradient_and_laplacian(self, positions: Any, params: Any) -> tuple[Any, Any]:
+        """Return `grad ln phi` per particle and the summed Laplacian per walker."""
+        alpha = params[0]
+        n_particles = positions.shape[-2]
+        laplacian = np.full(positions.shape[:-2], -alpha * n_particles * self.omega.sum())
+        return -alpha * self.omega * positions, laplacian
+
+    def parameter_derivatives(self, positions: Any, params: Any) -> Any:
+        """Return `d ln psi / d alpha` per walker, shape `(..., 1)`."""
+        del params
+        return -0.5 * ((positions * positions) @ self.omega).sum(axis=-1)[..., None]
+
+
+class ExponentialOneBody:
+    """Hydrogenic orbital `ln phi(r) = -zeta |r|` about the origin.
+
+    `zeta` is trainable unless fixed; fixing it at the nuclear charge `Z`
+    satisfies the electron-nucleus cusp, so the `Z / r` divergence of the
+    potential cancels against the kinetic energy.
+    """
+
+    def __init__(self, zeta: float | None = None) -> None:
+        self.zeta = None if zeta is None else float(zeta)
+        self.n_parameters = 1 if self.zeta is None else 0
+
+    def _zeta(self, params: Any) -> float:
+        return float(params[0]) if self.zeta is None else self.zeta
+
+    def log_values(self, positions: Any, params: Any) -> Any:
+        """Return `ln phi(r_i)` for every particle, shape `(..., n_particles)`."""
+        return -self._zeta(params) * np.linalg.norm(positions, axis=-1)
+
+    def gradient_and_laplacian(self, positions: Any, params: Any) -> tuple[Any, Any]:
+        """Return `grad ln phi` per particle and the summed Laplacian per walker."""
+        zeta = self._zeta(params)
+        radius = np.linalg.norm(positions, axis=-1)
+        n_axes = positions.shape[-1]
+        gradient = -zeta * positions / radius[..., None]
+        return gradient, (-zeta * (n_axes - 1) / radius).sum(axis=-1)
+
+    def parameter_derivatives(self, positions: Any, params: Any) -> Any:
+        """Return `d ln psi / d zeta` per walker, shape `(..., n_parameters)`."""
+        del params
+        radius_sum = np.linalg.norm(positions, axis=-1).sum(axis=-1)[..., None]
+        return -radius_sum if self.zeta is None else radius_sum[..., :0]
+
+
+class ProductWavefunction:
+    """`psi_T = prod_i phi(r_i) * exp(sum_{i<j} u(r_ij)) * D(R)`; Jastrow and `D` optional."""
+
+    def __init__(
+        self,
+        one_body: GaussianOneBody | ExponentialOneBody,
+        jastrow: PadeJastrow | ExponentialJastrow | None = None,
+        determinant: SlaterDeterminant | None = None,
+    ) -> None:
+        self.one_body = one_body
+        self.jastrow = jastrow
+        self.determinant = determinant
+        self.n_parameters = one_body.n_parameters + (0 if jastrow is None else jastrow.n_parameters)
+
+    def split(self, params: Any) -> tuple[Any, Any]:
+        """Split a flat parameter vector into one-body and Jastrow slices."""
+        params = np.atleast_1d(np.asarray(params, dtype=float))
+        if len(params) != self.n_parameters:
+            raise ValueError(f"expected {self.n_parameters} parameters, got {len(params)}")
+        return params[: self.one_body.n_parameters], params[self.one_body.n_parameters :]
+
+    def _pair_distances(self, positions: Any) -> Any:
+        """Distinct pair distances, shape `(..., n_pairs)`."""
+        upper = np.triu_indices(positions.shape[-2], k=1)
+        return pair_distance_matrix(positions)[..., upper[0], upper[1]]
+
+    def log_value(self, positions: Any, params: Any) -> Any:
+        """Return `ln |psi_T|` for every walker."""
+        one_params, pair_params = self.split(params)
+        value = self.one_body.log_values(positions, one_params).sum(axis=-1)
+        if self.jastrow is not None:
+            r = self._pair_distances(positions)
+            value = value + self.jastrow.values(r, pair_params).sum(axis=-1)
+        if self.determinant is not None:
+            value = value + self.determinant.log_value(positions)
+        return value
+
+    def gradient_and_laplacian(self, positions: Any, params: Any) -> tuple[Any, Any]:
+        """Return `grad ln psi_T` (shape of `positions`) and `lap ln psi_T` per walker.
+
+        For the Jastrow, `grad_i = sum_j u'(r_ij) (r_i - r_j) / r_ij` and the
+        Laplacian is `2 sum_{i<j} [u''(r_ij) + (n_axes - 1) u'(r_ij) / r_ij]`.
+        """
+        one_params, pair_params = self.split(params)
+        gradient, laplacian = self.one_body.gradient_and_laplacian(positions, one_params)
+        if self.determinant is not None:
+            determinant_gradient, determinant_laplacian = (
+                self.determinant.gradient_and_laplacian(positions)
+            )
+            gradient = gradient + determinant_gradient
+            laplacian = laplacian + determinant_laplacian
+        if self.jastrow is None:
+            return gradient, laplacian
+        displacements, distances = pair_displacements(positions)
+        off_diagonal = ~np.eye(positions.shape[-2], dtype=bool)
+        # A unit self-distance avoids 0/0; those entries are masked out below.
+        safe = np.where(off_diagonal, distances, 1.0)
+        _, du, d2u = self.jastrow.derivatives(safe, pair_params)
+        radial = np.where(off_diagonal, du / safe, 0.0)
+        gradient = gradient + np.einsum("...ij,...ijd->...id", radial, displacements)
+        n_axes = positions.shape[-1]
+        # Summing over ordered pairs counts every i<j pair twice, as required.
+        pair_laplacian = np.where(off_diagonal, d2u, 0.0) + (n_axes - 1) * radial
+        return gradient, laplacian + pair_laplacian.sum(axis=(-2, -1))
+
+    def parameter_derivatives(self, positions: Any, params: Any) -> Any:
+        """Return `d ln psi_T / d p_k`, shape `(n_walkers, n_parameters)`."""
+        one_params, pair_params = self.split(params)
+        derivatives = self.one_body.parameter_derivatives(positions, one_params)
+        if self.jastrow is None:
+            return derivatives
+        r = self._pair_distances(positions)
+        pair = self.jastrow.parameter_derivatives(r, pair_params).sum(axis=-2)
+        return np.concatenate([derivatives, pair], axis=-1)
+
+    def log_ratio(
+        self,
+        table: PairDistanceTable,
+        i: int,
+        new_position: Any,
+        params: Any,
+    ) -> tuple[float, Any]:
+        """Return the change of `ln psi_T` for moving particle `i`, plus its new row.
+
+        Only the one-body and Jastrow factors are included; the determinant
+        ratio comes from a `SlaterInverse`. The row (with entry `i` zeroed)
+        can be passed to `table.accept`.
+        """
+        one_params, pair_params = self.split(params)
+        moved = np.array((table.positions[i], new_position))
+        old_one, new_one = self.one_body.log_values(moved, one_params)
+        change = float(new_one - old_one)
+        row = table.trial_row(i, new_position)
+        row[i] = 0.0
+        if self.jastrow is not None:
+            # u(0) = 0, so the zeroed self-distance drops out of both sums.
+            new_pairs = self.jastrow.values(row, pair_params).sum()
+            old_pairs = self.jastrow.values(table.distances[i], pair_params).sum()
+            change += float(new_pairs - old_pairs)
+        return change, row
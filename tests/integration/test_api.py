@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
 from fastapi.testclient import TestClient
 
 from pyqmc.api.api import create_app
+from pyqmc.application.dispatch import get_simulation_dispatcher
 
 
 def test_health_endpoint() -> None:
@@ -16,6 +23,20 @@ def test_health_endpoint() -> None:
     assert response.json() == {"status": "ok"}
 
 
+def test_cache_stats_endpoint_counts_repeated_runs() -> None:
+    client = TestClient(create_app())
+    payload = {"n_steps": 1500, "burn_in": 300, "alpha": 0.93, "seed": 21}
+
+    before = client.get("/cache/stats").json()
+    client.post("/simulate/vmc/harmonic-oscillator", json=payload)
+    repeated = client.post("/simulate/vmc/harmonic-oscillator", json=payload)
+    after = client.get("/cache/stats").json()
+
+    assert repeated.json()["metadata"]["result_cache"] == "hit"
+    assert after["hits"] == before["hits"] + 1
+    assert after["misses"] == before["misses"] + 1
+
+
 def test_catalog_endpoints() -> None:
     client = TestClient(create_app())
 
@@ -54,6 +75,35 @@ def test_simulation_endpoint_returns_expected_payload() -> None:
     assert data["metadata"]["exact_ground_state_energy"] == 0.5
 
 
+def test_simulation_endpoint_supports_target_standard_error() -> None:
+    client = TestClient(create_app())
+
+    payload = {
+        "n_steps": 5_000_000,
+        "burn_in": 500,
+        "alpha": 0.8,
+        "seed": 7,
+        "target_standard_error": 0.004,
+        "max_seconds": 30.0,
+    }
+
+    response = client.post("/simulate/vmc/harmonic-oscillator", json=payload)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["metadata"]["stop_reason"] == "target_standard_error"
+    assert data["standard_error"] <= 0.004
+    assert data["parameters"]["target_standard_error"] == 0.004
+
+
+def test_simulation_endpoint_rejects_time_budget_without_target() -> None:
+    client = TestClient(create_app())
+
+    response = client.post("/simulate/vmc/harmonic-oscillator", json={"max_seconds": 5.0})
+
+    assert response.status_code == 422
+
+
 def test_simulation_endpoint_validates_burnin() -> None:
     client = TestClient(create_app())
 
@@ -108,3 +158,213 @@ def test_benchmark_endpoint_validates_burnin() -> None:
 
     assert response.status_code == 422
     assert response.json()["detail"]
+
+
+def test_alpha_sweep_endpoint_returns_grid() -> None:
+    pytest.importorskip("numpy")
+    client = TestClient(create_app())
+
+    payload = {"alphas": [0.8, 1.0, 1.2], "n_steps": 4000, "burn_in": 400, "alpha": 0.9, "seed": 7}
+
+    response = client.post("/simulate/vmc/harmonic-oscillator/alpha-sweep", json=payload)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["n_samples"] == 3600
+    assert [point["alpha"] for point in data["points"]] == [0.8, 1.0, 1.2]
+    assert data["best_alpha"] == 1.0
+
+
+def test_alpha_sweep_endpoint_rejects_nonpositive_alpha() -> None:
+    client = TestClient(create_app())
+
+    response = client.post(
+        "/simulate/vmc/harmonic-oscillator/alpha-sweep",
+        json={"alphas": [0.0, 1.0]},
+    )
+
+    assert response.status_code == 422
+
+
+def test_optimize_endpoint_converges_to_exact_alpha() -> None:
+    pytest.importorskip("numpy")
+    client = TestClient(create_app())
+
+    response = client.post(
+        "/optimize/vmc/harmonic-oscillator",
+        json={"method": "sr", "alpha": 0.6, "n_walkers": 128, "seed": 3},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["method"] == "VMC (stochastic reconfiguration)"
+    assert data["converged"] is True
+    assert abs(data["optimized_parameters"][0] - 1.0) < 1e-3
+
+
+def test_dmc_endpoint_returns_simulation_result() -> None:
+    pytest.importorskip("numpy")
+    client = TestClient(create_app())
+
+    response = client.post(
+        "/simulate/dmc/harmonic-oscillator",
+        json={"n_steps": 800, "burn_in": 200, "target_population": 300, "seed": 5},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["system"] == "harmonic_oscillator_1d"
+    assert abs(data["mean_energy"] - 0.5) < 0.01
+    assert data["parameters"]["target_population"] == 300
+
+
+def test_dmc_endpoint_rejects_more_workers_than_walkers() -> None:
+    client = TestClient(create_app())
+
+    response = client.post(
+        "/simulate/dmc/harmonic-oscillator",
+        json={"target_population": 2, "workers": 4},
+    )
+
+    assert response.status_code == 422
+
+
+def test_job_endpoints_submit_poll_and_cancel(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PYQMC_JOB_WORKERS", "1")
+    monkeypatch.setenv("PYQMC_JOB_QUEUE_DEPTH", "0")
+    with TestClient(create_app()) as client:
+        submitted = client.post(
+            "/jobs",
+            json={"kind": "vmc_harmonic_oscillator", "parameters": {"n_steps": 50_000_000}},
+        )
+        assert submitted.status_code == 202
+        job_id = submitted.json()["id"]
+
+        full = client.post("/jobs", json={"kind": "dmc_harmonic_oscillator"})
+        assert full.status_code == 429
+        assert full.headers["retry-after"] == "1"
+
+        cancelled = client.delete(f"/jobs/{job_id}")
+        assert cancelled.status_code == 200
+        assert cancelled.json()["cancel_requested"]
+        for _ in range(1_000):
+            job = client.get(f"/jobs/{job_id}").json()
+            if job["status"] == "cancelled":
+                break
+            time.sleep(0.02)
+        assert job["status"] == "cancelled"
+        assert [item["id"] for item in client.get("/jobs").json()] == [job_id]
+        assert client.get("/jobs/missing").status_code == 404
+
+
+def test_job_endpoint_returns_result_and_validates_kind() -> None:
+    with TestClient(create_app()) as client:
+        submitted = client.post(
+            "/jobs",
+            json={
+                "kind": "vmc_harmonic_oscillator",
+                "parameters": {"n_steps": 3_000, "burn_in": 300, "alpha": 0.9, "seed": 8},
+            },
+        )
+        for _ in range(1_000):
+            job = client.get(f"/jobs/{submitted.json()['id']}").json()
+            if job["status"] == "succeeded":
+                break
+            time.sleep(0.02)
+
+        assert job["result"]["n_samples"] == 2_700
+        assert job["progress"]["fraction_done"] == 1.0
+        assert client.post("/jobs", json={"kind": "pimc"}).status_code == 422
+
+
+def test_job_events_stream_progress_then_result() -> None:
+    with TestClient(create_app()) as client:
+        submitted = client.post(
+            "/jobs",
+            json={
+                "kind": "vmc_harmonic_oscillator",
+                "parameters": {"n_steps": 600_000, "burn_in": 500, "alpha": 0.9, "seed": 4},
+            },
+        )
+        job_id = submitted.json()["id"]
+
+        with client.stream("GET", f"/jobs/{job_id}/events") as response:
+            assert response.headers["content-type"].startswith("text/event-stream")
+            lines = [line for line in response.iter_lines() if line]
+
+        events = [line.removeprefix("event: ") for line in lines[::2]]
+        payloads = [json.loads(line.removeprefix("data: ")) for line in lines[1::2]]
+        assert events[-1] == "done" and set(events[:-1]) == {"progress"}
+        assert payloads[-2]["steps_done"] == 600_000
+        assert payloads[-1]["status"] == "succeeded"
+        assert payloads[-1]["result"]["mean_energy"] == payloads[-2]["mean_energy"]
+        assert client.get("/jobs/missing/events").status_code == 404
+
+
+def test_batch_endpoint_streams_deduplicated_results() -> None:
+    configs = [
+        {"n_steps": 4_000, "burn_in": 400, "alpha": 0.85, "seed": 31},
+        {"n_steps": 3_000, "burn_in": 300, "alpha": 0.9, "seed": None},
+        {"n_steps": 4_000, "burn_in": 400, "alpha": 0.85, "seed": 31},
+    ]
+    with TestClient(create_app()) as client:
+        response = client.post(
+            "/simulate/vmc/harmonic-oscillator/batch", json={"configs": configs}
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    by_index = {line["index"]: line for line in lines}
+    assert sorted(by_index) == [0, 1, 2]
+    assert all(line["status"] == "ok" for line in lines)
+    assert by_index[0]["result"]["mean_energy"] == by_index[2]["result"]["mean_energy"]
+    statuses = {by_index[i]["result"]["metadata"]["result_cache"] for i in (0, 2)}
+    assert statuses == {"miss", "coalesced"}
+    assert by_index[1]["result"]["metadata"]["result_cache"] == "bypass"
+
+
+def test_batch_endpoint_validates_every_config() -> None:
+    client = TestClient(create_app())
+
+    empty = client.post("/simulate/vmc/harmonic-oscillator/batch", json={"configs": []})
+    invalid = client.post(
+        "/simulate/vmc/harmonic-oscillator/batch",
+        json={"configs": [{"n_steps": 100, "burn_in": 100}]},
+    )
+
+    assert empty.status_code == 422
+    assert invalid.status_code == 422
+
+
+def test_lifespan_warms_and_stops_the_compute_pool() -> None:
+    dispatcher = get_simulation_dispatcher()
+    payload = {"n_steps": 2_000, "burn_in": 200, "alpha": 0.9, "seed": 41}
+
+    with TestClient(create_app()) as client:
+        assert dispatcher._pool is not None
+        response = client.post("/simulate/vmc/harmonic-oscillator", json=payload)
+
+    assert response.status_code == 200
+    assert dispatcher._pool is None
+
+
+def test_compute_requests_do_not_block_the_event_loop() -> None:
+    app = create_app()
+    slow = {"n_steps": 400_000, "burn_in": 1_000, "alpha": 0.9, "seed": None}
+
+    async def scenario() -> tuple[int, int, bool]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            simulation = asyncio.create_task(
+                client.post("/simulate/vmc/harmonic-oscillator", json=slow)
+            )
+            await asyncio.sleep(0.2)
+            health = await client.get("/health")
+            still_running = not simulation.done()
+            return health.status_code, (await simulation).status_code, still_running
+
+    health_status, simulation_status, still_running = asyncio.run(scenario())
+
+    assert (health_status, simulation_status) == (200, 200)
+    assert still_running
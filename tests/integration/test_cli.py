@@ -8,6 +8,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 
 def _run_pyqmc(args: list[str]) -> subprocess.CompletedProcess[str]:
     repo_root = Path(__file__).resolve().parents[2]
@@ -71,6 +73,193 @@ def test_vmc_ho_invalid_burn_in_returns_nonzero_exit() -> None:
     assert "burn_in must be smaller than n_steps" in combined_output
 
 
+def test_vmc_ho_target_standard_error_stops_early() -> None:
+    proc = _run_pyqmc(
+        [
+            "vmc-ho",
+            "--n-steps",
+            "5000000",
+            "--burn-in",
+            "500",
+            "--alpha",
+            "0.8",
+            "--target-standard-error",
+            "0.004",
+            "--json",
+        ]
+    )
+
+    assert proc.returncode == 0, proc.stderr
+    payload = json.loads(proc.stdout)
+
+    assert payload["metadata"]["stop_reason"] == "target_standard_error"
+    assert payload["standard_error"] <= 0.004
+    assert payload["n_samples"] < 5_000_000
+
+
+def test_benchmark_kernels_json_reports_tau_int_reduction() -> None:
+    proc = _run_pyqmc(["benchmark-kernels", "--n-steps", "5000", "--burn-in", "500", "--json"])
+
+    assert proc.returncode == 0, proc.stderr
+    payload = json.loads(proc.stdout)
+
+    assert payload["system"] == "harmonic_oscillator_1d"
+    assert payload["tau_int_reduction"] > 1.0
+    assert {point["kernel"] for point in payload["points"]} == {"uniform", "langevin"}
+
+
+def test_benchmark_particle_moves_json_reports_exponents() -> None:
+    pytest.importorskip("numpy")
+    proc = _run_pyqmc(
+        ["benchmark-particle-moves", "--particle-counts", "16", "64", "--n-sweeps", "1", "--json"]
+    )
+
+    assert proc.returncode == 0, proc.stderr
+    payload = json.loads(proc.stdout)
+    assert set(payload["exponents"]) == {
+        "pair_table_incremental",
+        "pair_table_rebuild",
+        "jastrow_incremental",
+        "jastrow_full_evaluation",
+        "slater_sherman_morrison",
+        "slater_full_evaluation",
+    }
+    assert len(payload["points"]) == 12
+
+
+def test_vmc_fermion_trap_json_is_exact_at_alpha_one() -> None:
+    pytest.importorskip("numpy")
+    proc = _run_pyqmc(
+        [
+            "vmc-fermion-trap",
+            "--n-up",
+            "2",
+            "--n-down",
+            "1",
+            "--n-steps",
+            "60",
+            "--burn-in",
+            "10",
+            "--n-walkers",
+            "4",
+            "--alpha",
+            "1.0",
+            "--json",
+        ]
+    )
+
+    assert proc.returncode == 0, proc.stderr
+    payload = json.loads(proc.stdout)
+    assert payload["system"] == "fermion_trap"
+    assert payload["mean_energy"] == pytest.approx(payload["metadata"]["exact_ground_state_energy"])
+
+
+def test_vmc_fermion_trap_rejects_an_empty_trap() -> None:
+    proc = _run_pyqmc(["vmc-fermion-trap", "--n-up", "0", "--n-down", "0"])
+
+    assert proc.returncode == 2
+    assert "at least one particle" in proc.stderr
+
+
+def test_vmc_ho_sweep_json_reports_reweighted_curve() -> None:
+    proc = _run_pyqmc(
+        [
+            "vmc-ho-sweep",
+            "--n-steps",
+            "5000",
+            "--burn-in",
+            "500",
+            "--alpha",
+            "0.9",
+            "--n-alpha",
+            "5",
+            "--json",
+        ]
+    )
+
+    if "requires NumPy" in proc.stderr:
+        pytest.skip("numpy is not installed")
+    assert proc.returncode == 0, proc.stderr
+    payload = json.loads(proc.stdout)
+
+    assert payload["reference_alpha"] == 0.9
+    assert payload["n_samples"] == 4500
+    assert [point["alpha"] for point in payload["points"]] == pytest.approx(
+        [0.6, 0.8, 1.0, 1.2, 1.4]
+    )
+    assert payload["best_alpha"] == pytest.approx(1.0)
+
+
+def test_vmc_ho_optimize_json_converges_to_exact_alpha() -> None:
+    proc = _run_pyqmc(["vmc-ho-optimize", "--alpha", "0.4", "--json"])
+
+    if "requires NumPy" in proc.stderr:
+        pytest.skip("numpy is not installed")
+    assert proc.returncode == 0, proc.stderr
+    payload = json.loads(proc.stdout)
+
+    assert payload["converged"] is True
+    assert payload["optimized_parameters"][0] == pytest.approx(1.0, abs=1e-3)
+    assert payload["history"][0]["parameters"] == [0.4]
+
+
+def test_vmc_ho_resume_reproduces_checkpointed_run(tmp_path: Path) -> None:
+    checkpoint = tmp_path / "vmc.ckp"
+    args = ["vmc-ho", "--n-steps", "4000", "--burn-in", "500", "--json"]
+    args += ["--checkpoint", str(checkpoint), "--checkpoint-every", "1000"]
+
+    first = _run_pyqmc(args)
+    resumed = _run_pyqmc([*args, "--resume"])
+
+    assert first.returncode == 0, first.stderr
+    assert resumed.returncode == 0, resumed.stderr
+    assert checkpoint.exists()
+    first_payload = json.loads(first.stdout)
+    resumed_payload = json.loads(resumed.stdout)
+    assert resumed_payload["mean_energy"] == first_payload["mean_energy"]
+    assert resumed_payload["metadata"]["resumed_from_step"] == 4000
+
+
+def test_vmc_ho_trace_out_writes_trace_directory(tmp_path: Path) -> None:
+    trace_dir = tmp_path / "trace"
+    proc = _run_pyqmc(
+        ["vmc-ho", "--n-steps", "2000", "--burn-in", "500", "--trace-out", str(trace_dir), "--json"]
+    )
+
+    if "requires NumPy" in proc.stderr:
+        pytest.skip("numpy is not installed")
+    assert proc.returncode == 0, proc.stderr
+    header = json.loads((trace_dir / "trace.json").read_text())
+    assert header["chains"][0]["rows"] == 1500
+
+
+def test_vmc_ho_cache_dir_reuses_result_across_invocations(tmp_path: Path) -> None:
+    args = ["vmc-ho", "--n-steps", "2000", "--burn-in", "500", "--json"]
+    args += ["--cache-dir", str(tmp_path)]
+
+    first = json.loads(_run_pyqmc(args).stdout)
+    second = json.loads(_run_pyqmc(args).stdout)
+
+    assert first["metadata"]["result_cache"] == "miss"
+    assert second["metadata"]["result_cache"] == "hit"
+    assert second["mean_energy"] == first["mean_energy"]
+
+
+def test_dmc_ho_json_reports_mixed_and_growth_estimators() -> None:
+    proc = _run_pyqmc(
+        ["dmc-ho", "--n-steps", "1000", "--burn-in", "200", "--target-population", "300", "--json"]
+    )
+
+    if "requires NumPy" in proc.stderr:
+        pytest.skip("numpy is not installed")
+    assert proc.returncode == 0, proc.stderr
+    payload = json.loads(proc.stdout)
+
+    assert payload["method"] == "DMC (importance sampled)"
+    assert abs(payload["mean_energy"] - 0.5) < 0.01
+    assert abs(payload["metadata"]["growth_energy"] - 0.5) < 0.01
+
+
 def test_top_level_help_lists_supported_commands() -> None:
     proc = _run_pyqmc(["--help"])
 
@@ -121,6 +310,22 @@ def test_benchmark_strict_returns_zero_when_all_cases_pass() -> None:
     assert proc.returncode == 0, proc.stderr
 
 
+def test_serve_api_help_lists_worker_pool_options() -> None:
+    proc = _run_pyqmc(["serve-api", "--help"])
+
+    assert proc.returncode == 0
+    assert "--workers" in proc.stdout
+    assert "--job-workers" in proc.stdout
+    assert "--shutdown-timeout" in proc.stdout
+
+
+def test_serve_api_rejects_non_positive_workers() -> None:
+    proc = _run_pyqmc(["serve-api", "--workers", "0"])
+
+    assert proc.returncode == 2
+    assert "workers must be positive" in proc.stderr
+
+
 def test_gui_help_lists_compute_mode_option() -> None:
     proc = _run_pyqmc(["gui", "--help"])
 
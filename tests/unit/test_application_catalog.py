@@ -12,6 +12,7 @@ def test_get_available_methods_shape() -> None:
     first = methods[0]
     assert first["id"] == "vmc_metropolis"
     assert first["systems"] == ["harmonic_oscillator_1d"]
+    assert "dmc_importance_sampled" in {method["id"] for method in methods}
 
 
 def test_get_available_systems_shape() -> None:
@@ -21,3 +22,5 @@ def test_get_available_systems_shape() -> None:
     first = systems[0]
     assert first["id"] == "harmonic_oscillator_1d"
     assert first["dimension"] == "1D"
+    expected = {"harmonic_trap", "hookes_atom", "fermion_trap", "hydrogen_atom", "helium_atom"}
+    assert expected <= {system["id"] for system in systems}
@@ -0,0 +1,133 @@
+"""Unit tests for pooled simulation dispatch with request coalescing."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from pyqmc.application.cache import configure_result_cache, get_result_cache
+from pyqmc.application.dispatch import (
+    API_WORKERS_ENV,
+    SimulationDispatcher,
+    _worker_ready,
+    configure_simulation_dispatcher,
+    get_simulation_dispatcher,
+)
+from pyqmc.application.vmc import run_vmc_harmonic_oscillator_use_case
+
+ARGUMENTS = {"n_steps": 6_000, "burn_in": 600, "alpha": 0.88, "seed": 17}
+
+
+@pytest.fixture
+def dispatcher():
+    configure_result_cache()
+    pool = SimulationDispatcher(max_workers=2)
+    yield pool
+    pool.shutdown()
+
+
+def test_identical_requests_share_one_computation(dispatcher: SimulationDispatcher) -> None:
+    first = dispatcher.submit("vmc_harmonic_oscillator", ARGUMENTS)
+    second = dispatcher.submit("vmc_harmonic_oscillator", dict(ARGUMENTS))
+
+    assert dispatcher.in_flight == 1
+    results = [first.result(timeout=60), second.result(timeout=60)]
+    assert [item.metadata["result_cache"] for item in results] == ["miss", "coalesced"]
+    assert results[0].mean_energy == results[1].mean_energy
+    assert dispatcher.in_flight == 0
+
+    repeated = dispatcher.submit("vmc_harmonic_oscillator", ARGUMENTS).result(timeout=60)
+    stats = get_result_cache().stats()
+    assert repeated.metadata["result_cache"] == "hit"
+    assert (stats.misses, stats.hits) == (1, 1)
+
+
+def test_pooled_result_matches_direct_use_case(dispatcher: SimulationDispatcher) -> None:
+    pooled = dispatcher.submit("vmc_harmonic_oscillator", ARGUMENTS).result(timeout=60)
+    direct = run_vmc_harmonic_oscillator_use_case(
+        step_size=1.0, initial_position=0.0, use_cache=False, **ARGUMENTS
+    )
+
+    assert pooled.mean_energy == direct.mean_energy
+    assert pooled.standard_error == direct.standard_error
+
+
+def test_unseeded_requests_are_never_coalesced(dispatcher: SimulationDispatcher) -> None:
+    unseeded = {**ARGUMENTS, "seed": None}
+
+    futures = [dispatcher.submit("vmc_harmonic_oscillator", unseeded) for _ in range(2)]
+
+    assert dispatcher.in_flight == 0
+    assert [item.result(timeout=60).metadata["result_cache"] for item in futures] == [
+        "bypass",
+        "bypass",
+    ]
+
+
+def test_invalid_requests_are_rejected_before_dispatch(
+    dispatcher: SimulationDispatcher,
+) -> None:
+    with pytest.raises(ValueError, match="unknown simulation kind"):
+        dispatcher.submit("pimc", {})
+    with pytest.raises(ValueError, match="unexpected keyword"):
+        dispatcher.submit("vmc_harmonic_oscillator", {"temperature": 1.0})
+    with pytest.raises(ValueError, match="burn_in must be smaller"):
+        dispatcher.submit("vmc_harmonic_oscillator", {**ARGUMENTS, "burn_in": 6_000})
+
+
+def test_start_warms_every_worker_and_call_runs_on_the_pool(
+    dispatcher: SimulationDispatcher,
+) -> None:
+    dispatcher.start()
+
+    assert dispatcher.call(_worker_ready).result(timeout=60) != os.getpid()
+    result = dispatcher.call(
+        run_vmc_harmonic_oscillator_use_case,
+        step_size=1.0,
+        initial_position=0.0,
+        use_cache=False,
+        **ARGUMENTS,
+    ).result(timeout=60)
+    assert result.n_samples == ARGUMENTS["n_steps"] - ARGUMENTS["burn_in"]
+
+
+def test_shutdown_then_submit_starts_a_fresh_pool(dispatcher: SimulationDispatcher) -> None:
+    dispatcher.shutdown()
+
+    result = dispatcher.submit("vmc_harmonic_oscillator", ARGUMENTS).result(timeout=60)
+
+    assert result.metadata["result_cache"] == "miss"
+
+
+def test_shared_dispatcher_is_sized_from_the_environment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv(API_WORKERS_ENV, "3")
+    configure_simulation_dispatcher(max_workers=1).shutdown()
+    monkeypatch.setattr("pyqmc.application.dispatch._dispatcher", None)
+
+    shared = get_simulation_dispatcher()
+
+    assert shared.max_workers == 3
+    assert get_simulation_dispatcher() is shared
+    shared.shutdown()
+
+
+def test_seeded_dmc_requests_coalesce(dispatcher: SimulationDispatcher) -> None:
+    pytest.importorskip("numpy")
+    arguments = {
+        "n_steps": 400,
+        "burn_in": 100,
+        "time_step": 0.05,
+        "alpha": 0.9,
+        "target_population": 200,
+        "initial_position": 0.0,
+        "seed": 5,
+    }
+
+    futures = [dispatcher.submit("dmc_harmonic_oscillator", arguments) for _ in range(2)]
+
+    results = [future.result(timeout=120) for future in futures]
+    assert [item.metadata["result_cache"] for item in results] == ["miss", "coalesced"]
+    assert results[0].mean_energy == results[1].mean_energy
@@ -0,0 +1,101 @@
+"""Unit tests for background simulation jobs."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from pyqmc.application.cache import configure_result_cache
+from pyqmc.application.jobs import JobManager, JobQueueFull
+
+VMC_ARGUMENTS = dict(
+    n_steps=4_000, burn_in=500, step_size=1.0, alpha=0.8, initial_position=0.0, seed=5
+)
+
+
+def _wait(manager: JobManager, job_id: str, timeout: float = 60.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while True:
+        job = manager.get(job_id)
+        if job["status"] in ("succeeded", "failed", "cancelled"):
+            return job
+        assert time.monotonic() < deadline, "job did not finish in time"
+        time.sleep(0.02)
+
+
+@pytest.fixture
+def manager():
+    configure_result_cache()
+    jobs = JobManager(max_workers=1, max_queued=1)
+    yield jobs
+    jobs.shutdown()
+
+
+def test_job_runs_to_completion_with_result_and_progress(manager: JobManager) -> None:
+    submitted = manager.submit("vmc_harmonic_oscillator", VMC_ARGUMENTS)
+
+    job = _wait(manager, submitted["id"])
+
+    assert submitted["status"] == "queued"
+    assert job["status"] == "succeeded"
+    assert job["result"]["n_samples"] == 3_500
+    assert job["progress"]["steps_done"] == 4_000
+    assert job["progress"]["mean_energy"] == job["result"]["mean_energy"]
+    assert job["finished_at"] >= job["started_at"] >= job["submitted_at"]
+
+
+def test_repeated_seeded_job_is_served_from_the_parent_cache(manager: JobManager) -> None:
+    first = _wait(manager, manager.submit("vmc_harmonic_oscillator", VMC_ARGUMENTS)["id"])
+    second = manager.submit("vmc_harmonic_oscillator", VMC_ARGUMENTS)
+    unseeded = manager.submit("vmc_harmonic_oscillator", {**VMC_ARGUMENTS, "seed": None})
+
+    assert first["result"]["metadata"]["result_cache"] == "miss"
+    assert second["status"] == "succeeded"
+    assert second["result"]["metadata"]["result_cache"] == "hit"
+    assert second["result"]["mean_energy"] == first["result"]["mean_energy"]
+    assert second["progress"]["fraction_done"] == 1.0
+    assert second["progress"]["mean_energy"] == first["result"]["mean_energy"]
+    assert _wait(manager, unseeded["id"])["result"]["metadata"]["result_cache"] == "bypass"
+
+
+def test_invalid_arguments_fail_the_job(manager: JobManager) -> None:
+    submitted = manager.submit("vmc_harmonic_oscillator", {**VMC_ARGUMENTS, "burn_in": 10_000})
+
+    job = _wait(manager, submitted["id"])
+
+    assert job["status"] == "failed"
+    assert "burn_in" in job["error"]
+
+
+def test_unknown_kind_and_job_are_rejected(manager: JobManager) -> None:
+    with pytest.raises(ValueError, match="unknown job kind"):
+        manager.submit("pimc", {})
+    with pytest.raises(KeyError):
+        manager.get("missing")
+
+
+def test_admission_control_and_cancellation(manager: JobManager) -> None:
+    long_run = {**VMC_ARGUMENTS, "n_steps": 50_000_000}
+    running = manager.submit("vmc_harmonic_oscillator", long_run)
+    queued = manager.submit("vmc_harmonic_oscillator", long_run)
+
+    with pytest.raises(JobQueueFull):
+        manager.submit("vmc_harmonic_oscillator", VMC_ARGUMENTS)
+
+    deadline = time.monotonic() + 30
+    while manager.get(running["id"])["progress"] is None:
+        assert time.monotonic() < deadline
+        time.sleep(0.02)
+    manager.cancel(queued["id"])
+    manager.cancel(running["id"])
+
+    assert _wait(manager, queued["id"])["status"] == "cancelled"
+    cancelled = _wait(manager, running["id"])
+    assert cancelled["status"] == "cancelled"
+    assert cancelled["cancel_requested"]
+    assert 0 < cancelled["progress"]["steps_done"] < 50_000_000
+    # Both slots are free again.
+    assert _wait(manager, manager.submit("vmc_harmonic_oscillator", VMC_ARGUMENTS)["id"])[
+        "status"
+    ] == "succeeded"
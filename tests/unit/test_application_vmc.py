@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import pytest
 
+from pyqmc.application.cache import configure_result_cache
 from pyqmc.application.vmc import (
+    run_vmc_fermion_trap_use_case,
     run_vmc_harmonic_oscillator_benchmark_use_case,
     run_vmc_harmonic_oscillator_use_case,
 )
@@ -48,3 +50,75 @@ def test_run_vmc_harmonic_oscillator_benchmark_use_case_runs() -> None:
 
     assert suite.total_cases == 3
     assert suite.all_passed
+
+
+def test_seeded_runs_are_served_from_result_cache() -> None:
+    cache = configure_result_cache()
+    arguments = dict(n_steps=2000, burn_in=500, step_size=1.0, alpha=0.9, initial_position=0.0)
+
+    first = run_vmc_harmonic_oscillator_use_case(**arguments, seed=3)
+    second = run_vmc_harmonic_oscillator_use_case(**arguments, seed=3, workers=2)
+    unseeded = run_vmc_harmonic_oscillator_use_case(**arguments, seed=None)
+
+    assert first.metadata["result_cache"] == "miss"
+    assert second.metadata["result_cache"] == "hit"
+    assert second.mean_energy == first.mean_energy
+    assert unseeded.metadata["result_cache"] == "bypass"
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.bypassed) == (1, 1, 1)
+
+
+def test_cache_hits_report_this_call_instead_of_the_stored_run_timing() -> None:
+    configure_result_cache()
+    arguments = dict(n_steps=2000, burn_in=500, step_size=1.0, alpha=0.9, initial_position=0.0)
+
+    first = run_vmc_harmonic_oscillator_use_case(**arguments, seed=4)
+    second = run_vmc_harmonic_oscillator_use_case(**arguments, seed=4, workers=2)
+    third = run_vmc_harmonic_oscillator_use_case(**arguments, seed=4)
+
+    assert first.metadata["workers"] == 1
+    assert first.metadata["cpu_seconds"] > 0.0
+    assert second.metadata["result_cache"] == "hit"
+    assert second.metadata["workers"] == 2
+    assert second.metadata["cpu_seconds"] == 0.0
+    assert second.metadata["effective_samples_per_cpu_second"] is None
+    assert second.metadata["effective_samples"] == first.metadata["effective_samples"]
+    # The stored entry is untouched by what a hit reports.
+    assert third.metadata["workers"] == 1
+
+
+def test_cache_hit_reports_one_final_progress_snapshot() -> None:
+    configure_result_cache()
+    arguments = dict(
+        n_steps=2000, burn_in=500, step_size=1.0, alpha=0.9, initial_position=0.0, seed=6
+    )
+    first = run_vmc_harmonic_oscillator_use_case(**arguments)
+    snapshots = []
+
+    second = run_vmc_harmonic_oscillator_use_case(**arguments, progress=snapshots.append)
+
+    assert second.metadata["result_cache"] == "hit"
+    assert len(snapshots) == 1
+    final = snapshots[0]
+    assert final.fraction_done == 1.0
+    assert (final.steps_done, final.total_steps) == (2000, 2000)
+    assert final.n_samples == first.n_samples
+    assert final.mean_energy == first.mean_energy
+    assert final.standard_error == first.standard_error
+
+
+def test_fermion_trap_cache_keys_include_the_particle_numbers() -> None:
+    pytest.importorskip("numpy")
+    configure_result_cache()
+    arguments = dict(
+        frequencies=(1.0, 1.0, 1.0), n_steps=40, burn_in=10, step_size=0.8, alpha=0.9, seed=3
+    )
+
+    first = run_vmc_fermion_trap_use_case(n_up=2, n_down=1, n_walkers=2, **arguments)
+    repeat = run_vmc_fermion_trap_use_case(n_up=2, n_down=1, n_walkers=2, **arguments)
+    other = run_vmc_fermion_trap_use_case(n_up=1, n_down=1, n_walkers=2, **arguments)
+
+    assert first.metadata["result_cache"] == "miss"
+    assert repeat.metadata["result_cache"] == "hit"
+    assert other.metadata["result_cache"] == "miss"
+    assert other.parameters["n_up"] == 1
@@ -0,0 +1,55 @@
+"""Unit tests for the particle-move scaling benchmark."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from pyqmc.benchmarks.particle_moves import (  # noqa: E402
+    JASTROW_FULL_EVALUATION,
+    JASTROW_INCREMENTAL,
+    PAIR_TABLE_INCREMENTAL,
+    PAIR_TABLE_REBUILD,
+    SLATER_FULL_EVALUATION,
+    SLATER_SHERMAN_MORRISON,
+    ParticleMoveScalingPoint,
+    ParticleMoveScalingResult,
+    run_particle_move_scaling_benchmark,
+)
+
+
+def test_exponent_fit_recovers_a_power_law() -> None:
+    result = ParticleMoveScalingResult(
+        points=[
+            ParticleMoveScalingPoint("cubic", n, 1e-6 * n**3) for n in (8, 16, 32)
+        ]
+    )
+
+    assert result.exponent("cubic") == pytest.approx(3.0)
+    with pytest.raises(ValueError, match="at least two"):
+        result.exponent("missing")
+
+
+def test_incremental_updates_scale_better_than_rebuilds() -> None:
+    result = run_particle_move_scaling_benchmark(particle_counts=(16, 64, 128), n_sweeps=1)
+    summary = result.to_dict()
+
+    assert set(summary["exponents"]) == {
+        PAIR_TABLE_INCREMENTAL,
+        PAIR_TABLE_REBUILD,
+        JASTROW_INCREMENTAL,
+        JASTROW_FULL_EVALUATION,
+        SLATER_SHERMAN_MORRISON,
+        SLATER_FULL_EVALUATION,
+    }
+    assert result.exponent(PAIR_TABLE_REBUILD) > result.exponent(PAIR_TABLE_INCREMENTAL) + 0.5
+    assert result.exponent(JASTROW_FULL_EVALUATION) > result.exponent(JASTROW_INCREMENTAL) + 0.5
+    largest = {point.mode: point.seconds_per_sweep for point in result.points[-6:]}
+    assert largest[SLATER_FULL_EVALUATION] > largest[SLATER_SHERMAN_MORRISON]
+    assert "k=" in result.to_pretty_text()
+
+
+def test_benchmark_rejects_a_single_particle_count() -> None:
+    with pytest.raises(ValueError, match="at least two"):
+        run_particle_move_scaling_benchmark(particle_counts=(16,))
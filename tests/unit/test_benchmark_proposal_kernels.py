@@ -0,0 +1,56 @@
+"""Unit tests for the proposal kernel efficiency benchmark."""
+
+from __future__ import annotations
+
+import pytest
+
+from pyqmc.benchmarks.proposal_kernels import (
+    DEFAULT_KERNEL_STEP_SIZES,
+    run_proposal_kernel_benchmark,
+)
+
+
+def test_kernel_benchmark_scans_every_kernel_and_step_size() -> None:
+    result = run_proposal_kernel_benchmark(
+        n_steps=20_000,
+        burn_in=1_000,
+        seed=3,
+        step_sizes={"uniform": (1.5, 2.5), "langevin": (0.8, 1.2)},
+    )
+
+    assert [(p.kernel, p.step_size) for p in result.points] == [
+        ("uniform", 1.5),
+        ("uniform", 2.5),
+        ("langevin", 0.8),
+        ("langevin", 1.2),
+    ]
+    assert result.tau_int_reduction > 1.5
+    payload = result.to_dict()
+    assert set(payload["best"]) == {"langevin", "uniform"}
+    assert "tau_int reduction" in result.to_pretty_text()
+
+
+def test_kernel_benchmark_best_rejects_unknown_kernel() -> None:
+    result = run_proposal_kernel_benchmark(
+        n_steps=2_000,
+        burn_in=100,
+        seed=3,
+        step_sizes={"uniform": (1.0,), "langevin": (1.0,)},
+    )
+
+    with pytest.raises(ValueError, match="no benchmark points"):
+        result.best("hamiltonian")
+
+
+def test_kernel_benchmark_fills_missing_kernels_from_defaults() -> None:
+    result = run_proposal_kernel_benchmark(
+        n_steps=500, burn_in=50, seed=3, step_sizes={"uniform": (1.0,)}
+    )
+
+    langevin = [p.step_size for p in result.points if p.kernel == "langevin"]
+    assert langevin == list(DEFAULT_KERNEL_STEP_SIZES["langevin"])
+
+
+def test_kernel_benchmark_rejects_unknown_kernel_step_sizes() -> None:
+    with pytest.raises(ValueError, match="unknown proposal kernels"):
+        run_proposal_kernel_benchmark(step_sizes={"hamiltonian": (1.0,)})
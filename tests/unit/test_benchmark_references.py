@@ -7,6 +7,14 @@ import pytest
 from pyqmc.benchmarks.references import (
     harmonic_oscillator_exact_ground_state_energy,
     harmonic_oscillator_variational_energy,
+    fermion_trap_exact_ground_state_energy,
+    fermion_trap_variational_energy,
+    harmonic_trap_exact_ground_state_energy,
+    helium_exact_ground_state_energy,
+    helium_variational_energy,
+    hydrogen_exact_ground_state_energy,
+    hydrogen_variational_energy,
+    harmonic_trap_variational_energy,
 )
 
 
@@ -23,3 +31,39 @@ def test_variational_energy_formula_known_values() -> None:
 def test_variational_energy_rejects_nonpositive_alpha() -> None:
     with pytest.raises(ValueError, match="alpha must be positive"):
         harmonic_oscillator_variational_energy(0.0)
+
+
+def test_trap_references_reduce_to_the_1d_oscillator() -> None:
+    assert harmonic_trap_exact_ground_state_energy(1, (1.0,)) == pytest.approx(0.5)
+    assert harmonic_trap_variational_energy(0.8, 1, (1.0,)) == pytest.approx(0.5125)
+
+
+def test_trap_references_sum_over_particles_and_axes() -> None:
+    assert harmonic_trap_exact_ground_state_energy(4, (1.0, 1.5, 2.0)) == pytest.approx(9.0)
+    assert harmonic_trap_variational_energy(1.2, 4, (1.0, 1.5, 2.0)) == pytest.approx(9.15)
+
+
+def test_fermion_references_fill_levels_per_spin() -> None:
+    # Isotropic unit trap: levels 3/2, then three at 5/2.
+    assert fermion_trap_exact_ground_state_energy(1, 1, (1.0, 1.0, 1.0)) == pytest.approx(3.0)
+    assert fermion_trap_exact_ground_state_energy(4, 4, (1.0, 1.0, 1.0)) == pytest.approx(18.0)
+    assert fermion_trap_exact_ground_state_energy(3, 0, (1.0, 1.5, 2.0)) == pytest.approx(9.25)
+    assert fermion_trap_variational_energy(0.8, 1, 1, (1.0,)) == pytest.approx(1.025)
+    with pytest.raises(ValueError, match="at least one particle"):
+        fermion_trap_exact_ground_state_energy(0, 0, (1.0,))
+
+
+def test_hydrogen_variational_energy_is_exact_at_the_cusp_value() -> None:
+    assert hydrogen_variational_energy(1.0) == pytest.approx(hydrogen_exact_ground_state_energy())
+    assert hydrogen_variational_energy(0.8) == pytest.approx(-0.48)
+    with pytest.raises(ValueError, match="zeta must be positive"):
+        hydrogen_variational_energy(0.0)
+
+
+def test_helium_variational_minimum_lies_above_the_exact_energy() -> None:
+    best = helium_variational_energy(27.0 / 16.0)
+
+    assert best == pytest.approx(-2.84765625)
+    assert helium_variational_energy(1.6) > best
+    assert helium_variational_energy(1.8) > best
+    assert best > helium_exact_ground_state_energy()
@@ -0,0 +1,28 @@
+"""Unit tests for the hydrogen and helium benchmark suites."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from pyqmc.benchmarks.vmc_atoms import (  # noqa: E402
+    run_vmc_helium_benchmarks,
+    run_vmc_hydrogen_benchmarks,
+)
+
+
+def test_hydrogen_benchmark_suite_passes() -> None:
+    suite = run_vmc_hydrogen_benchmarks(n_steps=800, burn_in=200, n_walkers=32)
+
+    assert suite.system == "hydrogen_atom"
+    assert suite.all_passed
+    assert suite.cases[0].standard_error == pytest.approx(0.0, abs=1e-12)
+
+
+def test_helium_benchmark_suite_passes_and_cusps_reduce_the_error_bar() -> None:
+    suite = run_vmc_helium_benchmarks(n_steps=1600, burn_in=200, n_walkers=64)
+    errors = {case.case_id: case.standard_error for case in suite.cases}
+
+    assert suite.all_passed
+    assert errors["helium_cusp_jastrow"] < errors["helium_variational_zeta_1.6875"]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from pyqmc.benchmarks.vmc_harmonic_oscillator import (
     run_vmc_harmonic_oscillator_benchmarks,
 )
@@ -52,3 +54,20 @@ def test_benchmark_serialization_contains_summary_fields() -> None:
     assert payload["total_cases"] == 3
     assert payload["passed_cases"] + payload["failed_cases"] == 3
     assert len(payload["cases"]) == 3
+
+
+def test_benchmark_suite_runs_on_numpy_backend() -> None:
+    pytest.importorskip("numpy")
+
+    suite = run_vmc_harmonic_oscillator_benchmarks(
+        n_steps=600,
+        burn_in=100,
+        step_size=1.0,
+        seed=7,
+        backend="numpy",
+        n_walkers=200,
+    )
+
+    assert suite.all_passed
+    for case in suite.cases:
+        assert case.n_samples == 500 * 200
@@ -0,0 +1,112 @@
+"""Unit tests for FFT autocorrelation and integrated autocorrelation time."""
+
+from __future__ import annotations
+
+import cmath
+import math
+import random
+
+import pytest
+
+from pyqmc.core import autocorrelation
+from pyqmc.core.autocorrelation import (
+    DecimatedSeries,
+    autocorrelation_analysis,
+    autocorrelation_function,
+)
+
+
+def _ar1_series(n: int, rho: float, seed: int) -> list[float]:
+    rng = random.Random(seed)
+    value = 0.0
+    series = []
+    for _ in range(n):
+        value = rho * value + rng.gauss(0.0, 1.0)
+        series.append(value)
+    return series
+
+
+def _direct_autocorrelation(values: list[float], max_lag: int) -> list[float]:
+    n = len(values)
+    mu = sum(values) / n
+    d = [x - mu for x in values]
+    c0 = sum(x * x for x in d) / n
+    return [sum(d[i] * d[i + t] for i in range(n - t)) / n / c0 for t in range(max_lag)]
+
+
+def test_pure_python_fft_matches_direct_dft() -> None:
+    values = [complex(x) for x in _ar1_series(16, 0.5, seed=1)]
+
+    spectrum = autocorrelation._fft(values)
+
+    for k in (0, 1, 5, 15):
+        expected = sum(
+            x * cmath.exp(-2j * math.pi * k * n / 16) for n, x in enumerate(values)
+        )
+        assert spectrum[k] == pytest.approx(expected)
+
+
+def test_pure_python_autocovariance_matches_direct_sum() -> None:
+    values = _ar1_series(37, 0.5, seed=1)
+
+    acov = autocorrelation._python_autocovariance(values)
+
+    assert len(acov) == 37
+    assert [c / acov[0] for c in acov[:10]] == pytest.approx(
+        _direct_autocorrelation(values, 10)
+    )
+
+
+def test_autocorrelation_function_matches_direct_sum() -> None:
+    values = _ar1_series(200, 0.6, seed=2)
+
+    rho = autocorrelation_function(values)
+
+    assert rho[0] == pytest.approx(1.0)
+    assert rho[:10] == pytest.approx(_direct_autocorrelation(values, 10))
+
+
+def test_integrated_time_of_ar1_process_matches_theory() -> None:
+    rho = 0.8
+    chains = [_ar1_series(20_000, rho, seed=seed) for seed in range(4)]
+
+    result = autocorrelation_analysis(chains)
+
+    assert result.converged
+    assert result.tau_int == pytest.approx((1 + rho) / (1 - rho), rel=0.15)
+    assert result.effective_samples == pytest.approx(80_000 / result.tau_int)
+
+
+def test_independent_samples_have_unit_integrated_time() -> None:
+    rng = random.Random(5)
+    values = [rng.gauss(0.0, 1.0) for _ in range(10_000)]
+
+    result = autocorrelation_analysis([values])
+
+    assert result.tau_int == pytest.approx(1.0, abs=0.1)
+
+
+def test_constant_series_is_treated_as_uncorrelated() -> None:
+    result = autocorrelation_analysis([[2.0] * 50])
+
+    assert result.tau_int == 1.0
+    assert result.standard_error == 0.0
+    assert result.effective_samples == 50.0
+
+
+def test_autocorrelation_analysis_rejects_empty_input() -> None:
+    with pytest.raises(ValueError, match="requires at least one value"):
+        autocorrelation_analysis([[]])
+
+
+def test_decimated_series_stays_bounded_and_averages_pairs() -> None:
+    series = DecimatedSeries(capacity=8)
+
+    series.extend([float(x) for x in range(21)])
+    series.push(21.0)
+    series.extend([22.0, 23.0])
+
+    assert series.stride == 4
+    assert series.count == 24
+    assert series.values == [1.5, 5.5, 9.5, 13.5, 17.5, 21.5]
+    assert series.partial_count == 0
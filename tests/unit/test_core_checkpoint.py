@@ -0,0 +1,136 @@
+"""Unit tests for checkpoint files and resumable chain runs."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from pyqmc.core.checkpoint import (
+    CheckpointPolicy,
+    config_fingerprint,
+    read_checkpoint,
+    write_checkpoint,
+)
+from pyqmc.core.config import SimulationConfig
+from pyqmc.vmc import parallel
+from pyqmc.vmc.harmonic_oscillator import HarmonicOscillator1D
+from pyqmc.vmc.metropolis import MetropolisChain
+from pyqmc.vmc.parallel import run_chains
+
+
+def test_checkpoint_round_trips_and_checks_config(tmp_path: Path) -> None:
+    config = SimulationConfig(seed=3)
+    path = tmp_path / "run.ckp"
+
+    write_checkpoint(path, config, {"value": 0.1 + 0.2, "items": [1, None]})
+
+    assert read_checkpoint(path, replace(config, workers=4)) == {
+        "value": 0.1 + 0.2,
+        "items": [1, None],
+    }
+    assert not list(tmp_path.glob(".*.tmp"))
+    with pytest.raises(ValueError, match="different configuration"):
+        read_checkpoint(path, replace(config, seed=4))
+
+
+def test_read_checkpoint_rejects_foreign_files(tmp_path: Path) -> None:
+    path = tmp_path / "notes.txt"
+    path.write_text("not a checkpoint, but long enough to hold a header")
+
+    with pytest.raises(ValueError, match="not a pyqmc checkpoint"):
+        read_checkpoint(path, SimulationConfig())
+
+
+def test_fingerprint_ignores_worker_count_only() -> None:
+    config = SimulationConfig()
+
+    assert config_fingerprint(config) == config_fingerprint(replace(config, workers=8))
+    assert config_fingerprint(config) != config_fingerprint(replace(config, alpha=0.9))
+
+
+def test_chain_state_restores_identical_continuation() -> None:
+    config = SimulationConfig(n_steps=3_000, burn_in=500, tune_step_size=True, seed=8)
+    system = HarmonicOscillator1D()
+    reference = MetropolisChain(system, config)
+    reference.advance(3_000)
+
+    first = MetropolisChain(system, config)
+    first.advance(1_200)
+    restored = MetropolisChain(system, config)
+    restored.set_state(first.get_state())
+    restored.advance(1_800)
+
+    assert restored.x == reference.x
+    assert restored.step_size == reference.step_size
+    assert restored.trace.energy_blocks.levels[-1] == reference.trace.energy_blocks.levels[-1]
+
+
+def _interrupt_after(monkeypatch: pytest.MonkeyPatch, n_segments: int) -> None:
+    original = parallel._ChainGroup._advance
+    calls = [0]
+
+    def advance(self: parallel._ChainGroup, n_steps: int) -> None:
+        calls[0] += 1
+        if calls[0] > n_segments:
+            raise KeyboardInterrupt
+        original(self, n_steps)
+
+    monkeypatch.setattr(parallel._ChainGroup, "_advance", advance)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        SimulationConfig(n_steps=6_000, burn_in=500, proposal="langevin", n_chains=2),
+        SimulationConfig(n_steps=200_000, burn_in=500, target_standard_error=0.003),
+    ],
+    ids=["fixed", "target"],
+)
+def test_resumed_run_matches_uninterrupted_run(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    config: SimulationConfig,
+) -> None:
+    system = HarmonicOscillator1D()
+    policy = CheckpointPolicy(tmp_path / "full.ckp", every_steps=700, every_seconds=None)
+    uninterrupted = run_chains(system, config, checkpoint=policy)
+
+    interrupted = replace(policy, path=tmp_path / "run.ckp")
+    with monkeypatch.context() as patch:
+        _interrupt_after(patch, 3)
+        with pytest.raises(KeyboardInterrupt):
+            run_chains(system, config, checkpoint=interrupted)
+    resumed = run_chains(system, config, checkpoint=replace(interrupted, resume=True))
+
+    assert resumed.resumed_from_step == 2_100
+    assert resumed.steps_per_chain == uninterrupted.steps_per_chain
+    assert resumed.energy_stats == uninterrupted.energy_stats
+    assert resumed.accepted_steps == uninterrupted.accepted_steps
+
+
+def test_checkpointing_does_not_change_the_result(tmp_path: Path) -> None:
+    system = HarmonicOscillator1D()
+    config = SimulationConfig(n_steps=20_000, burn_in=500, alpha=0.8, seed=4)
+    policy = CheckpointPolicy(tmp_path / "run.ckp", every_steps=3_000, every_seconds=None)
+
+    plain = run_chains(system, config)
+    checkpointed = run_chains(system, config, checkpoint=policy)
+
+    assert checkpointed.energy_stats == plain.energy_stats
+    assert checkpointed.energy_blocks == plain.energy_blocks
+    assert checkpointed.energy_series == plain.energy_series
+
+
+def test_batched_chains_resume_from_checkpoint(tmp_path: Path) -> None:
+    pytest.importorskip("numpy")
+    system = HarmonicOscillator1D()
+    config = SimulationConfig(n_steps=1_500, burn_in=300, backend="numpy", n_walkers=32, seed=2)
+    policy = CheckpointPolicy(tmp_path / "run.ckp", every_steps=400)
+    uninterrupted = run_chains(system, config, checkpoint=policy)
+
+    resumed = run_chains(system, config, checkpoint=replace(policy, resume=True))
+
+    assert resumed.resumed_from_step == 1_500
+    assert resumed.energy_stats == uninterrupted.energy_stats
@@ -28,10 +28,24 @@ def test_validate_accepts_valid_configuration() -> None:
         ({"n_steps": 10, "burn_in": 10}, "burn_in must be smaller than n_steps"),
         ({"step_size": 0.0}, "step_size must be positive"),
         ({"alpha": 0.0}, "alpha must be positive"),
+        ({"backend": "fortran"}, "backend must be one of"),
+        ({"backend": "numpy", "n_walkers": 0}, "n_walkers must be positive"),
+        ({"n_walkers": 8}, "n_walkers > 1 requires backend='numpy'"),
+        ({"n_chains": 0}, "n_chains must be positive"),
+        ({"workers": 0}, "workers must be positive"),
+        ({"target_standard_error": 0.0}, "target_standard_error must be positive"),
+        (
+            {"target_standard_error": 0.01, "max_seconds": -1.0},
+            "max_seconds must be positive",
+        ),
+        ({"max_seconds": 5.0}, "max_seconds requires target_standard_error"),
+        ({"target_acceptance": 1.0}, "target_acceptance must be between 0 and 1"),
+        ({"tune_step_size": True, "burn_in": 0}, "tune_step_size requires burn_in > 0"),
+        ({"proposal": "hamiltonian"}, "proposal must be one of"),
     ],
 )
 def test_validate_rejects_invalid_values(
-    overrides: dict[str, float | int],
+    overrides: dict[str, float | int | str | bool],
     error_fragment: str,
 ) -> None:
     kwargs = {
@@ -0,0 +1,60 @@
+"""Unit tests for progress snapshots and their time-based throttle."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from pyqmc.core.progress import ProgressSnapshot, ProgressThrottle
+
+
+def _snapshot(steps_done: int = 50) -> ProgressSnapshot:
+    return ProgressSnapshot(
+        steps_done=steps_done,
+        total_steps=200,
+        n_samples=40,
+        mean_energy=0.51,
+        standard_error=0.01,
+        acceptance_ratio=0.6,
+        elapsed_seconds=1.0,
+        steps_per_second=50.0,
+    )
+
+
+def test_snapshot_serializes_with_fraction_done() -> None:
+    data = _snapshot().to_dict()
+
+    assert data["fraction_done"] == 0.25
+    assert data["mean_energy"] == 0.51
+    assert _snapshot(500).fraction_done == 1.0
+
+
+def test_throttle_waits_for_the_interval() -> None:
+    throttle = ProgressThrottle(interval=0.05)
+    assert not throttle.due()
+
+    time.sleep(0.06)
+
+    assert throttle.due()
+    throttle.emit(lambda snapshot: None, _snapshot)
+    assert not throttle.due()
+    assert throttle.reports == 1
+
+
+def test_throttle_stretches_the_wait_for_slow_callbacks() -> None:
+    throttle = ProgressThrottle(interval=0.0, budget=0.1)
+
+    throttle.emit(lambda snapshot: time.sleep(0.02), _snapshot)
+
+    # A 20 ms report may recur only every 200 ms to stay within 10%.
+    assert not throttle.due()
+    time.sleep(0.3)
+    assert throttle.due()
+
+
+def test_throttle_rejects_invalid_settings() -> None:
+    with pytest.raises(ValueError, match="interval"):
+        ProgressThrottle(interval=-1.0)
+    with pytest.raises(ValueError, match="budget"):
+        ProgressThrottle(budget=0.0)
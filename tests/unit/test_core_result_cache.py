@@ -0,0 +1,97 @@
+"""Unit tests for the content-addressed result cache."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from pyqmc.core.config import SimulationConfig
+from pyqmc.core.result_cache import ENTRY_SUFFIX, ResultCache, result_cache_key
+from pyqmc.core.results import SimulationResult
+
+
+def _result(energy: float) -> SimulationResult:
+    return SimulationResult(
+        method="VMC (Metropolis)",
+        system="harmonic_oscillator_1d",
+        n_samples=10,
+        mean_energy=energy,
+        standard_error=0.01,
+        acceptance_ratio=0.5,
+        metadata={"blocking": {"converged": True}},
+    )
+
+
+def test_key_depends_on_config_kind_and_extra_but_not_workers() -> None:
+    config = SimulationConfig(seed=1)
+
+    key = result_cache_key("vmc", config)
+
+    assert key == result_cache_key("vmc", replace(config, workers=4))
+    assert key != result_cache_key("vmc", replace(config, seed=2))
+    assert key != result_cache_key("dmc", config)
+    assert key != result_cache_key("vmc", config, {"workers": 2})
+
+
+def test_memory_tier_evicts_least_recently_used() -> None:
+    cache = ResultCache(max_entries=2)
+    cache.put("a", _result(1.0))
+    cache.put("b", _result(2.0))
+    assert cache.get("a") is not None
+
+    cache.put("c", _result(3.0))
+
+    assert cache.get("b") is None
+    assert cache.get("a").mean_energy == 1.0
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.memory_entries) == (2, 1, 2)
+
+
+def test_hits_are_independent_copies() -> None:
+    cache = ResultCache()
+    cache.put("a", _result(1.0))
+
+    cache.get("a").metadata["blocking"]["converged"] = False
+
+    assert cache.get("a").metadata["blocking"]["converged"] is True
+
+
+def test_disk_tier_survives_new_cache_and_caps_size(tmp_path: Path) -> None:
+    writer = ResultCache(directory=tmp_path)
+    writer.put("old", _result(1.0))
+    writer.put("new", _result(2.0))
+    os.utime(tmp_path / f"old{ENTRY_SUFFIX}", (0, 0))
+
+    reader = ResultCache(directory=tmp_path)
+    assert reader.get("new").mean_energy == 2.0
+    assert reader.stats().disk_hits == 1
+
+    entry_size = (tmp_path / f"new{ENTRY_SUFFIX}").stat().st_size
+    capped = ResultCache(directory=tmp_path, max_bytes=2 * entry_size + entry_size // 2)
+    capped.put("newest", _result(3.0))
+
+    entries = sorted(path.name for path in tmp_path.glob("*.json"))
+    assert entries == [f"new{ENTRY_SUFFIX}", f"newest{ENTRY_SUFFIX}"]
+    assert capped.stats().disk_entries == 2
+
+
+def test_disk_tier_leaves_other_json_files_alone(tmp_path: Path) -> None:
+    own = tmp_path / "results.json"
+    own.write_text('{"energy": 0.5}')
+    cache = ResultCache(directory=tmp_path, max_bytes=1)
+
+    cache.put("a", _result(1.0))
+    assert cache.stats().disk_entries == 0
+    cache.put("b", _result(2.0))
+    cache.clear()
+
+    assert own.read_text() == '{"energy": 0.5}'
+    assert cache.get("results") is None
+
+
+def test_rejects_invalid_limits() -> None:
+    with pytest.raises(ValueError, match="max_bytes"):
+        ResultCache(max_bytes=0)
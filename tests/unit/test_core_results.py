@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from pyqmc.core.results import SimulationResult
+from pyqmc.core.results import (
+    AlphaSweepPoint,
+    AlphaSweepResult,
+    OptimizationResult,
+    OptimizationStep,
+    SimulationResult,
+)
 
 
 def test_to_dict_returns_serializable_copy() -> None:
@@ -41,3 +47,40 @@ def test_pretty_text_contains_key_fields() -> None:
     assert "System: harmonic_oscillator_1d" in text
     assert "Samples: 50" in text
     assert "Mean energy: 0.50000000" in text
+
+
+def test_alpha_sweep_reports_lowest_energy_point() -> None:
+    result = AlphaSweepResult(
+        method="VMC (correlated sampling)",
+        system="harmonic_oscillator_1d",
+        reference_alpha=0.9,
+        n_samples=1000,
+        points=[
+            AlphaSweepPoint(alpha=0.8, energy=0.5125, standard_error=0.001, effective_samples=990.0),
+            AlphaSweepPoint(alpha=1.0, energy=0.5, standard_error=0.0, effective_samples=995.0),
+        ],
+    )
+
+    payload = result.to_dict()
+    assert payload["best_alpha"] == 1.0
+    assert payload["points"][0]["effective_samples"] == 990.0
+    assert "Lowest energy at alpha=1.0000" in result.to_pretty_text()
+
+
+def test_optimization_result_reports_final_iteration() -> None:
+    history = [
+        OptimizationStep(0, [0.5], 0.625, 0.01, [-0.75], 0.7),
+        OptimizationStep(1, [0.99], 0.50003, 0.0001, [-0.01], 0.6),
+    ]
+    result = OptimizationResult(
+        method="VMC (linear method)",
+        system="harmonic_oscillator_1d",
+        converged=True,
+        history=history,
+    )
+
+    payload = result.to_dict()
+    assert payload["n_iterations"] == 2
+    assert payload["optimized_parameters"] == [0.99]
+    assert payload["energy"] == 0.50003
+    assert "Optimized parameters: [0.990000] (converged)" in result.to_pretty_text()
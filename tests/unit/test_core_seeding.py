@@ -0,0 +1,32 @@
+"""Unit tests for deterministic child-seed derivation."""
+
+from __future__ import annotations
+
+import pytest
+
+from pyqmc.core.seeding import spawn_seeds
+
+
+def test_spawn_seeds_is_deterministic_and_distinct() -> None:
+    first = spawn_seeds(12345, 8)
+    second = spawn_seeds(12345, 8)
+
+    assert first == second
+    assert len(set(first)) == 8
+
+
+def test_spawn_seeds_prefix_is_stable_for_more_streams() -> None:
+    assert spawn_seeds(7, 16)[:4] == spawn_seeds(7, 4)
+
+
+def test_spawn_seeds_differs_between_root_seeds() -> None:
+    assert set(spawn_seeds(1, 4)).isdisjoint(spawn_seeds(2, 4))
+
+
+def test_spawn_seeds_without_root_seed_returns_none() -> None:
+    assert spawn_seeds(None, 3) == [None, None, None]
+
+
+def test_spawn_seeds_rejects_nonpositive_count() -> None:
+    with pytest.raises(ValueError, match="n_streams must be positive"):
+        spawn_seeds(1, 0)
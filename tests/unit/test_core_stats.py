@@ -3,10 +3,18 @@
 from __future__ import annotations
 
 import math
+import random
 
 import pytest
 
-from pyqmc.core.stats import mean, sample_variance, standard_error
+from pyqmc.core.stats import (
+    BlockingAccumulator,
+    RunningStats,
+    blocking_analysis,
+    mean,
+    sample_variance,
+    standard_error,
+)
 
 
 def test_mean_and_variance_known_values() -> None:
@@ -37,3 +45,135 @@ def test_mean_and_standard_error_raise_on_empty_input() -> None:
 
     with pytest.raises(ValueError, match="standard_error requires at least one value"):
         standard_error([])
+
+
+def test_running_stats_matches_batch_formulas() -> None:
+    values = [0.3, 1.7, -2.2, 4.1, 0.0, 2.5]
+    stats = RunningStats()
+    for value in values:
+        stats.push(value)
+
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(mean(values))
+    assert stats.variance == pytest.approx(sample_variance(values))
+    assert stats.standard_error == pytest.approx(standard_error(values))
+
+
+def test_running_stats_merge_equals_single_pass() -> None:
+    values = [float(i % 7) - 0.5 * i for i in range(40)]
+    left, right, combined = RunningStats(), RunningStats(), RunningStats()
+    for value in values[:13]:
+        left.push(value)
+    for value in values[13:]:
+        right.push(value)
+    for value in values:
+        combined.push(value)
+
+    left.merge(right)
+
+    assert left.count == combined.count
+    assert left.mean == pytest.approx(combined.mean)
+    assert left.m2 == pytest.approx(combined.m2)
+
+
+def test_blocking_accumulator_levels_hold_pairwise_block_means() -> None:
+    values = [float(v) for v in range(1, 9)]
+    accumulator = BlockingAccumulator()
+    for value in values:
+        accumulator.push(value)
+
+    assert accumulator.count == 8
+    assert accumulator.mean == pytest.approx(4.5)
+    assert [level.count for level in accumulator.levels] == [8, 4, 2, 1]
+    assert accumulator.levels[1].mean == pytest.approx(mean([1.5, 3.5, 5.5, 7.5]))
+    assert accumulator.levels[2].variance == pytest.approx(sample_variance([2.5, 6.5]))
+
+
+def test_blocking_accumulator_extend_matches_push() -> None:
+    values = [((7 * i) % 11) / 3.0 for i in range(101)]
+    pushed, extended = BlockingAccumulator(), BlockingAccumulator()
+    for value in values:
+        pushed.push(value)
+    extended.extend(values[:37])
+    extended.extend(values[37:])
+
+    assert extended.pending == pytest.approx(pushed.pending)
+    assert len(extended.levels) == len(pushed.levels)
+    for got, expected in zip(extended.levels, pushed.levels):
+        assert got.count == expected.count
+        assert got.mean == pytest.approx(expected.mean)
+        assert got.m2 == pytest.approx(expected.m2)
+
+
+def test_blocking_accumulator_merge_pools_levels() -> None:
+    left, right = BlockingAccumulator(), BlockingAccumulator()
+    for value in [1.0, 3.0, 5.0, 7.0]:
+        left.push(value)
+    for value in [2.0, 4.0]:
+        right.push(value)
+
+    left.merge(right)
+
+    assert left.count == 6
+    assert left.levels[1].count == 3
+    assert left.levels[1].mean == pytest.approx(mean([2.0, 6.0, 3.0]))
+
+
+def _ar1_series(n: int, rho: float, seed: int) -> list[float]:
+    rng = random.Random(seed)
+    value = 0.0
+    series = []
+    for _ in range(n):
+        value = rho * value + rng.gauss(0.0, 1.0)
+        series.append(value)
+    return series
+
+
+def test_blocking_analysis_of_independent_data_matches_naive_error() -> None:
+    rng = random.Random(3)
+    values = [rng.gauss(0.0, 1.0) for _ in range(2**14)]
+
+    result = blocking_analysis(values)
+
+    assert result.converged
+    assert result.standard_error == pytest.approx(result.naive_standard_error, rel=0.2)
+    assert result.effective_samples == pytest.approx(len(values), rel=0.4)
+
+
+def test_blocking_analysis_corrects_autocorrelated_error() -> None:
+    rho = 0.9
+    values = _ar1_series(2**16, rho, seed=5)
+    # Var(mean) of AR(1) is var * (1 + rho) / (1 - rho) / N for large N.
+    result = blocking_analysis(values)
+    expected = result.naive_standard_error * math.sqrt((1 + rho) / (1 - rho))
+
+    assert result.converged
+    assert result.block_size > 1
+    assert result.standard_error == pytest.approx(expected, rel=0.25)
+    assert result.effective_samples < len(values) / 5
+
+
+def test_incremental_blocking_matches_batch_analysis() -> None:
+    values = _ar1_series(5_000, 0.7, seed=9)
+    accumulator = BlockingAccumulator()
+    for value in values:
+        accumulator.push(value)
+
+    streamed = accumulator.analysis()
+    batch = blocking_analysis(values)
+
+    assert len(accumulator.levels) <= math.ceil(math.log2(len(values))) + 1
+    assert streamed.block_size == batch.block_size
+    assert streamed.standard_error == pytest.approx(batch.standard_error)
+
+
+def test_blocking_analysis_of_constant_series_has_zero_error() -> None:
+    result = blocking_analysis([0.5] * 100)
+
+    assert result.standard_error == 0.0
+    assert result.effective_samples == 100.0
+
+
+def test_blocking_analysis_rejects_empty_input() -> None:
+    with pytest.raises(ValueError, match="blocking_analysis requires at least one value"):
+        blocking_analysis([])
@@ -58,6 +58,27 @@ def test_build_vmc_config_from_mapping_allows_null_seed() -> None:
     assert config.seed is None
 
 
+def test_build_vmc_config_from_mapping_parses_precision_target() -> None:
+    config = build_vmc_harmonic_oscillator_config_from_mapping(
+        {"target_standard_error": "0.001", "max_seconds": "", "burn_in": 10, "n_steps": 100}
+    )
+
+    assert config.target_standard_error == pytest.approx(0.001)
+    assert config.max_seconds is None
+
+
+@pytest.mark.parametrize(("raw", "expected"), [(True, True), ("false", False), ("1", True)])
+def test_build_vmc_config_from_mapping_parses_tuning_flag(raw: object, expected: bool) -> None:
+    config = build_vmc_harmonic_oscillator_config_from_mapping({"tune_step_size": raw})
+
+    assert config.tune_step_size is expected
+
+
+def test_build_vmc_config_from_mapping_rejects_bad_boolean() -> None:
+    with pytest.raises(ValueError, match="tune_step_size must be a boolean"):
+        build_vmc_harmonic_oscillator_config_from_mapping({"tune_step_size": "maybe"})
+
+
 def test_build_vmc_config_propagates_domain_validation_errors() -> None:
     with pytest.raises(ValueError, match="burn_in must be smaller than n_steps"):
         build_vmc_harmonic_oscillator_config(
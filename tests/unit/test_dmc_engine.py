@@ -0,0 +1,92 @@
+"""Unit tests for the vectorized DMC engine."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyqmc.core.config import SimulationConfig  # noqa: E402
+from pyqmc.dmc.engine import (  # noqa: E402
+    DmcEngine,
+    DmcRun,
+    WalkerPopulation,
+    branch,
+    branching_weights,
+    population_control,
+)
+from pyqmc.vmc.harmonic_oscillator import HarmonicOscillator1D  # noqa: E402
+
+
+def _population(values: list[float]) -> WalkerPopulation:
+    positions = np.array(values, dtype=float).reshape(-1, 1)
+    return WalkerPopulation.from_positions(HarmonicOscillator1D(), positions, 0.8)
+
+
+def test_branch_copies_integer_weights_exactly() -> None:
+    population = _population([0.1, 0.2, 0.3])
+
+    branched = branch(population, np.array([0.0, 1.0, 3.0]), np.random.default_rng(0))
+
+    assert branched.positions[:, 0].tolist() == [0.2, 0.3, 0.3, 0.3]
+    assert branched.local_energy.shape == (4,)
+    assert branched.drift.shape == (4, 1)
+
+
+def test_branch_preserves_mean_weight_on_average() -> None:
+    population = _population([0.0] * 100_000)
+
+    branched = branch(population, np.full(100_000, 1.3), np.random.default_rng(1))
+
+    assert len(branched) / 100_000 == pytest.approx(1.3, abs=0.01)
+
+
+def test_branching_weights_clip_outlier_energies() -> None:
+    weights = branching_weights(
+        np.array([0.5, 0.5]), np.array([0.5, -1e6]), reference_energy=0.5, tau_eff=0.01
+    )
+
+    assert weights[0] == pytest.approx(1.0)
+    # Clipped at E_T - 2 / sqrt(tau), so the weight is exp(0.01 * 10) at most.
+    assert weights[1] == pytest.approx(math.exp(0.1))
+
+
+def test_population_control_pushes_toward_target() -> None:
+    assert population_control(0.5, 1200, 1000, 0.05, 0.1) < 0.5
+    assert population_control(0.5, 800, 1000, 0.05, 0.1) > 0.5
+    assert population_control(0.5, 1000, 1000, 0.05, 0.1) == 0.5
+
+
+def test_engine_is_exact_for_exact_trial_function() -> None:
+    config = SimulationConfig(
+        n_steps=200, burn_in=50, step_size=0.05, backend="numpy", n_walkers=200, seed=3
+    )
+    engine = DmcEngine(HarmonicOscillator1D(), config)
+
+    engine.advance(200)
+
+    # E_L is constant, so every weight is 1 and the population never changes.
+    assert len(engine.population) == 200
+    assert engine.estimators.mixed_stats.mean == pytest.approx(0.5)
+    assert engine.estimators.growth_stats.mean == pytest.approx(0.5)
+
+
+def test_engine_requires_drift_velocity() -> None:
+    class _NoDrift:
+        name = "no_drift"
+        n_dim = 1
+
+    with pytest.raises(TypeError, match="BatchedDriftSystem"):
+        DmcEngine(_NoDrift(), SimulationConfig())  # type: ignore[arg-type]
+
+
+def test_incomplete_run_subclass_fails_at_construction() -> None:
+    class _NoAdvance(DmcRun):
+        @property
+        def population_size(self) -> int:
+            return 0
+
+    with pytest.raises(TypeError, match="advance"):
+        _NoAdvance(HarmonicOscillator1D(), SimulationConfig())  # type: ignore[abstract]
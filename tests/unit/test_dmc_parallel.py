@@ -0,0 +1,82 @@
+"""Unit tests for multi-process DMC and walker load balancing."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from pyqmc.core.config import SimulationConfig
+from pyqmc.dmc.parallel import ParallelDmcEngine, balance_plan, moved_walkers
+from pyqmc.vmc.harmonic_oscillator import HarmonicOscillator1D
+
+
+def test_balance_plan_evens_counts_and_keeps_local_walkers() -> None:
+    plan = balance_plan([7, 1, 4])
+
+    assert [sum(hi - lo for _, lo, hi in slices) for slices in plan] == [4, 4, 4]
+    assert plan[0] == [(0, 0, 4)]
+    assert plan[1] == [(1, 0, 1), (0, 4, 7)]
+    assert plan[2] == [(2, 0, 4)]
+    assert moved_walkers(plan) == 3
+
+
+def test_balance_plan_moves_nothing_when_balanced() -> None:
+    plan = balance_plan([5, 5, 4])
+
+    assert moved_walkers(plan) == 0
+    assert plan == [[(0, 0, 5)], [(1, 0, 5)], [(2, 0, 4)]]
+
+
+def test_parallel_engine_matches_exact_energy_and_reports_balance() -> None:
+    config = SimulationConfig(
+        n_steps=800,
+        burn_in=200,
+        step_size=0.05,
+        alpha=0.8,
+        backend="numpy",
+        n_walkers=400,
+        seed=2,
+        workers=2,
+    )
+
+    with ParallelDmcEngine(HarmonicOscillator1D(), config) as engine:
+        engine.advance(config.n_steps)
+        metrics = engine.metrics.to_dict()
+
+    mixed = engine.estimators.mixed_stats
+    assert abs(mixed.mean - 0.5) < 0.01
+    assert engine.estimators.population_stats.mean == pytest.approx(400, rel=0.05)
+    assert metrics["exchange_rounds"] == 800
+    assert metrics["max_imbalance"] < 0.1
+    assert len(metrics["mean_worker_populations"]) == 2
+    assert abs(metrics["mean_worker_populations"][0] - 200) < 5
+
+
+def test_parallel_engine_rejects_more_workers_than_walkers() -> None:
+    config = SimulationConfig(backend="numpy", n_walkers=2, workers=3)
+
+    with pytest.raises(ValueError, match="at least workers"):
+        ParallelDmcEngine(HarmonicOscillator1D(), config)
+
+
+def test_parallel_engine_survives_workers_emptied_by_rebalancing() -> None:
+    # With one walker per worker, branching regularly leaves a worker empty.
+    config = SimulationConfig(
+        n_steps=400,
+        burn_in=50,
+        step_size=0.05,
+        alpha=0.6,
+        backend="numpy",
+        n_walkers=2,
+        seed=0,
+        workers=2,
+    )
+
+    with ParallelDmcEngine(HarmonicOscillator1D(), config) as engine:
+        engine.advance(config.n_steps)
+        metrics = engine.metrics.to_dict()
+
+    assert engine.steps_done == 400
+    assert metrics["max_imbalance"] == pytest.approx(1.0)
+    assert engine.estimators.mixed_stats.count > 0
@@ -0,0 +1,79 @@
+"""Unit tests for DMC runners."""
+
+from __future__ import annotations
+
+import pytest
+
+from pyqmc.core.config import SimulationConfig
+from pyqmc.core.progress import ProgressThrottle
+from pyqmc.dmc.solver import run_dmc_harmonic_oscillator
+
+
+def test_dmc_projects_out_trial_function_error() -> None:
+    pytest.importorskip("numpy")
+    config = SimulationConfig(
+        n_steps=3_000,
+        burn_in=500,
+        step_size=0.02,
+        alpha=0.6,
+        backend="numpy",
+        n_walkers=1_000,
+        seed=4,
+    )
+
+    result = run_dmc_harmonic_oscillator(config)
+
+    # VMC at alpha=0.6 gives (0.6 + 1/0.6) / 4 = 0.567; DMC recovers 0.5.
+    assert abs(result.mean_energy - 0.5) < 4 * result.standard_error + 0.001
+    assert abs(result.metadata["growth_energy"] - 0.5) < 0.005
+    assert result.metadata["mean_population"] == pytest.approx(1_000, rel=0.05)
+    assert result.parameters["time_step"] == 0.02
+
+
+def test_dmc_with_workers_reports_load_balance() -> None:
+    pytest.importorskip("numpy")
+    config = SimulationConfig(
+        n_steps=600,
+        burn_in=100,
+        step_size=0.05,
+        alpha=0.8,
+        backend="numpy",
+        n_walkers=300,
+        seed=4,
+        workers=2,
+    )
+
+    result = run_dmc_harmonic_oscillator(config)
+
+    assert abs(result.mean_energy - 0.5) < 0.01
+    assert result.parameters["workers"] == 2
+    assert result.metadata["load_balance"]["workers"] == 2
+
+
+def test_dmc_rejects_unsupported_controls() -> None:
+    with pytest.raises(ValueError, match="fixed n_steps"):
+        run_dmc_harmonic_oscillator(SimulationConfig(target_standard_error=0.01))
+    with pytest.raises(ValueError, match="one walker population"):
+        run_dmc_harmonic_oscillator(SimulationConfig(n_chains=2))
+
+
+def test_dmc_progress_callback_reports_mixed_estimate() -> None:
+    pytest.importorskip("numpy")
+    config = SimulationConfig(
+        n_steps=300,
+        burn_in=100,
+        step_size=0.05,
+        alpha=0.8,
+        backend="numpy",
+        n_walkers=500,
+        seed=2,
+    )
+    snapshots = []
+
+    result = run_dmc_harmonic_oscillator(
+        config, progress=snapshots.append, progress_throttle=ProgressThrottle(interval=0.0)
+    )
+
+    assert [item.steps_done for item in snapshots] == [100, 200, 300]
+    assert snapshots[0].mean_energy is None
+    assert snapshots[-1].mean_energy == result.mean_energy
@@ -46,3 +46,27 @@ def test_local_bridge_propagates_config_validation_errors() -> None:
 
     with pytest.raises(ValueError, match="burn_in must be smaller than n_steps"):
         bridge.run_vmc_harmonic_oscillator(payload)
+
+
+def test_local_bridge_exposes_result_cache_stats() -> None:
+    stats = LocalComputeBridge().result_cache_stats()
+
+    assert {"hits", "misses", "bypassed"} <= stats.keys()
+
+
+def test_local_bridge_forwards_progress_snapshots() -> None:
+    snapshots = []
+    bridge = LocalComputeBridge(on_progress=snapshots.append)
+    payload = {
+        "n_steps": 3000,
+        "burn_in": 500,
+        "step_size": 1.0,
+        "alpha": 0.9,
+        "initial_position": 0.0,
+        "seed": 19,
+    }
+
+    result = bridge.run_vmc_harmonic_oscillator(payload)
+
+    assert snapshots[-1]["steps_done"] == 3000
+    assert snapshots[-1]["mean_energy"] == result["mean_energy"]
@@ -0,0 +1,185 @@
+"""Unit tests for the vectorized multi-walker Metropolis sampler."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyqmc.core.config import SimulationConfig  # noqa: E402
+from pyqmc.vmc.batched_metropolis import BatchedMetropolisChain, sample_walkers  # noqa: E402
+from pyqmc.vmc.harmonic_oscillator import HarmonicOscillator1D  # noqa: E402
+from pyqmc.vmc.metropolis import MetropolisChain  # noqa: E402
+from pyqmc.vmc.proposals import UniformProposal  # noqa: E402
+from pyqmc.vmc.solver import run_vmc_harmonic_oscillator  # noqa: E402
+
+
+def _numpy_config(**overrides: float | int | str) -> SimulationConfig:
+    kwargs = {
+        "n_steps": 400,
+        "burn_in": 100,
+        "step_size": 1.0,
+        "alpha": 0.9,
+        "seed": 7,
+        "backend": "numpy",
+        "n_walkers": 64,
+    }
+    kwargs.update(overrides)
+    return SimulationConfig(**kwargs)
+
+
+def test_batched_sampling_is_deterministic_for_fixed_seed() -> None:
+    system = HarmonicOscillator1D()
+    config = _numpy_config()
+
+    trace_a = sample_walkers(system, config, store_trace=True)
+    trace_b = sample_walkers(system, config, store_trace=True)
+
+    np.testing.assert_array_equal(trace_a.positions, trace_b.positions)
+    np.testing.assert_array_equal(trace_a.local_energies, trace_b.local_energies)
+    assert trace_a.accepted_steps == trace_b.accepted_steps
+
+
+def test_batched_sampling_collects_one_row_per_post_burnin_sweep() -> None:
+    trace = sample_walkers(HarmonicOscillator1D(), _numpy_config(), store_trace=True)
+
+    assert trace.positions.shape == (300, 64, 1)
+    assert trace.local_energies.shape == (300, 64)
+    assert trace.attempted_steps == 400 * 64
+    assert 0.0 < trace.acceptance_ratio < 1.0
+
+
+def test_batched_chain_advanced_in_chunks_matches_single_run() -> None:
+    system = HarmonicOscillator1D()
+    config = _numpy_config()
+
+    chain = BatchedMetropolisChain(system, config, store_trace=True)
+    chain.advance(150)
+    chain.advance(250)
+    single = sample_walkers(system, config, store_trace=True)
+
+    np.testing.assert_array_equal(chain.trace.positions, single.positions)
+    assert chain.trace.accepted_steps == single.accepted_steps
+    assert chain.trace.energy_stats.mean == pytest.approx(single.energy_stats.mean)
+
+
+def test_streaming_statistics_match_stored_trace() -> None:
+    system = HarmonicOscillator1D()
+    config = _numpy_config()
+
+    streamed = sample_walkers(system, config)
+    stored = sample_walkers(system, config, store_trace=True)
+    energies = stored.local_energies.ravel()
+
+    assert streamed.local_energies.shape == (0, 64)
+    assert streamed.energy_stats.count == energies.size
+    assert streamed.energy_stats.mean == pytest.approx(energies.mean())
+    assert streamed.energy_stats.variance == pytest.approx(energies.var(ddof=1))
+    assert streamed.energy_blocks.count == 300
+
+
+def test_numpy_backend_statistics_match_python_backend() -> None:
+    python_result = run_vmc_harmonic_oscillator(
+        SimulationConfig(n_steps=60_000, burn_in=1_000, alpha=0.8, seed=3)
+    )
+    numpy_result = run_vmc_harmonic_oscillator(
+        _numpy_config(n_steps=1_000, burn_in=100, alpha=0.8, n_walkers=500, seed=3)
+    )
+
+    assert numpy_result.n_samples == 900 * 500
+    assert numpy_result.parameters["backend"] == "numpy"
+    assert numpy_result.mean_energy == pytest.approx(0.5125, abs=0.01)
+    assert numpy_result.mean_energy == pytest.approx(python_result.mean_energy, abs=0.02)
+    assert numpy_result.acceptance_ratio == pytest.approx(
+        python_result.acceptance_ratio, abs=0.02
+    )
+
+
+def test_numpy_backend_alpha_one_has_zero_variance() -> None:
+    result = run_vmc_harmonic_oscillator(_numpy_config(alpha=1.0))
+
+    assert result.mean_energy == pytest.approx(0.5)
+    assert result.standard_error == pytest.approx(0.0)
+
+
+def test_batched_tuning_shares_one_step_size_across_walkers() -> None:
+    config = _numpy_config(n_steps=2_000, burn_in=500, step_size=0.05, tune_step_size=True)
+
+    chain = BatchedMetropolisChain(HarmonicOscillator1D(), config)
+    chain.advance(config.burn_in)
+    accepted = chain.accepted_steps
+    chain.advance(config.n_steps - config.burn_in)
+
+    kept_acceptance = (chain.accepted_steps - accepted) / (1_500 * config.n_walkers)
+    assert chain.step_size > 1.0
+    assert kept_acceptance == pytest.approx(0.5, abs=0.05)
+
+
+def test_batched_langevin_reproduces_variational_energy() -> None:
+    config = _numpy_config(
+        n_steps=1_500, burn_in=200, n_walkers=400, alpha=0.8, step_size=1.2, proposal="langevin"
+    )
+
+    result = run_vmc_harmonic_oscillator(config)
+
+    assert result.mean_energy == pytest.approx(0.5125, abs=4.0 * result.standard_error + 1e-3)
+
+
+def test_retarget_keeps_walkers_and_restarts_statistics() -> None:
+    system = HarmonicOscillator1D()
+    config = SimulationConfig(n_steps=60, burn_in=20, seed=4, backend="numpy", n_walkers=16)
+    chain = BatchedMetropolisChain(system, config, store_trace=True)
+    chain.advance(60)
+    walkers = chain.x.copy()
+
+    chain.retarget(0.8)
+
+    assert chain.alpha == 0.8
+    assert np.array_equal(chain.x, walkers)
+    assert chain.trace.energy_stats.count == 0
+    assert chain.trace.positions.shape == (0, 16, 1)
+
+    chain.advance(40)
+    trace = chain.trace
+    assert trace.positions.shape == (40, 16, 1)
+    assert trace.attempted_steps == 40 * 16
+    expected = system.batched_local_energy(trace.positions.reshape(-1, 1), 0.8)
+    assert np.allclose(trace.local_energies, expected.reshape(40, 16))
+
+
+def test_batched_uniform_proposal_matches_rng_uniform_draws() -> None:
+    positions = np.linspace(-1.0, 1.0, 12).reshape(6, 2)
+    kernel = UniformProposal(HarmonicOscillator1D(), 1.0, batched=True)
+
+    proposal, log_green_ratio = kernel.batched_propose(positions, 0.7, np.random.default_rng(3))
+    move = np.random.default_rng(3).uniform(-0.7, 0.7, size=positions.shape)
+
+    assert np.array_equal(proposal, positions + move)
+    assert log_green_ratio == 0.0
+
+
+def _best_seconds(run, repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_batched_chain_outpaces_scalar_chain_per_sample() -> None:
+    # Recorded in docs/benchmark_references.md: about 50-60x at 10k walkers.
+    # The floor leaves headroom for timer noise on shared machines.
+    system = HarmonicOscillator1D()
+    n_samples = 200_000
+    scalar = SimulationConfig(n_steps=n_samples, burn_in=0, alpha=0.8, seed=1)
+    batched = SimulationConfig(
+        n_steps=20, burn_in=0, alpha=0.8, seed=1, backend="numpy", n_walkers=10_000
+    )
+
+    scalar_seconds = _best_seconds(lambda: MetropolisChain(system, scalar).advance(n_samples))
+    batched_seconds = _best_seconds(lambda: BatchedMetropolisChain(system, batched).advance(20))
+
+    assert scalar_seconds / batched_seconds >= 25.0
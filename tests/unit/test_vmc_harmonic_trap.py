@@ -0,0 +1,102 @@
+"""Unit tests for the N-particle anisotropic harmonic trap."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyqmc.benchmarks.vmc_harmonic_trap import run_vmc_harmonic_trap_benchmarks  # noqa: E402
+from pyqmc.vmc.harmonic_oscillator import HarmonicOscillator1D  # noqa: E402
+from pyqmc.vmc.harmonic_trap import HarmonicTrap  # noqa: E402
+from pyqmc.vmc.system import (  # noqa: E402
+    BatchedDriftSystem,
+    BatchedSystem,
+    OptimizableSystem,
+)
+
+FREQUENCIES = (1.0, 1.5, 2.0)
+
+
+def _walkers(n_walkers: int = 6, n_particles: int = 4) -> np.ndarray:
+    return np.random.default_rng(3).normal(size=(n_walkers, n_particles, len(FREQUENCIES)))
+
+
+def test_trap_implements_batched_protocols() -> None:
+    system = HarmonicTrap(4, FREQUENCIES)
+
+    assert isinstance(system, BatchedSystem)
+    assert isinstance(system, BatchedDriftSystem)
+    assert isinstance(system, OptimizableSystem)
+    assert system.n_dim == 12
+
+
+def test_local_energy_is_exact_at_alpha_one() -> None:
+    system = HarmonicTrap(4, FREQUENCIES)
+
+    energies = system.batched_local_energy(_walkers(), alpha=1.0)
+
+    assert energies == pytest.approx(np.full(6, 9.0))
+
+
+def test_one_particle_on_one_axis_matches_the_1d_oscillator() -> None:
+    trap = HarmonicTrap(1, (1.0,))
+    oscillator = HarmonicOscillator1D()
+    positions = np.linspace(-2.0, 2.0, 7)[:, None]
+
+    assert trap.batched_local_energy(positions, 0.8) == pytest.approx(
+        oscillator.batched_local_energy(positions, 0.8)
+    )
+    assert trap.batched_log_probability_density(positions, 0.8) == pytest.approx(
+        oscillator.batched_log_probability_density(positions, 0.8)
+    )
+
+
+def test_flat_and_particle_layouts_agree() -> None:
+    system = HarmonicTrap(4, FREQUENCIES)
+    walkers = _walkers()
+    flat = walkers.reshape(6, system.n_dim)
+
+    assert system.batched_local_energy(flat, 0.9) == pytest.approx(
+        system.batched_local_energy(walkers, 0.9)
+    )
+    assert system.batched_drift_velocity(flat, 0.9).shape == flat.shape
+    assert system.batched_drift_velocity(walkers, 0.9).shape == walkers.shape
+
+
+def test_drift_matches_finite_difference_gradient() -> None:
+    system = HarmonicTrap(2, FREQUENCIES)
+    flat = _walkers(n_walkers=1, n_particles=2).reshape(1, system.n_dim)
+    h = 1e-6
+    numerical = np.empty(system.n_dim)
+    for k in range(system.n_dim):
+        step = np.zeros_like(flat)
+        step[0, k] = h
+        forward = system.batched_log_trial_wavefunction(flat + step, 0.7)[0]
+        backward = system.batched_log_trial_wavefunction(flat - step, 0.7)[0]
+        numerical[k] = (forward - backward) / (2.0 * h)
+
+    assert system.batched_drift_velocity(flat, 0.7)[0] == pytest.approx(numerical, rel=1e-6)
+
+
+def test_scalar_fallback_evaluates_one_flattened_configuration() -> None:
+    system = HarmonicTrap(4, FREQUENCIES)
+    walker = _walkers()[0]
+
+    assert system.local_energy(walker.ravel(), 0.9) == pytest.approx(
+        system.batched_local_energy(walker[None], 0.9)[0]
+    )
+
+
+def test_invalid_trap_parameters_are_rejected() -> None:
+    with pytest.raises(ValueError, match="n_particles must be positive"):
+        HarmonicTrap(0)
+    with pytest.raises(ValueError, match="frequencies must be positive"):
+        HarmonicTrap(2, (1.0, -1.0, 1.0))
+
+
+def test_trap_benchmark_suite_passes() -> None:
+    suite = run_vmc_harmonic_trap_benchmarks(n_steps=2_000, burn_in=300, n_walkers=32, seed=7)
+
+    assert suite.system == "harmonic_trap"
+    assert suite.all_passed, suite.to_pretty_text()
@@ -0,0 +1,157 @@
+"""Unit tests for interacting systems with Jastrow trial wavefunctions."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyqmc.benchmarks.references import (  # noqa: E402
+    helium_variational_energy,
+    hookes_atom_exact_ground_state_energy,
+)
+from pyqmc.core.config import SimulationConfig  # noqa: E402
+from pyqmc.vmc.batched_metropolis import BatchedMetropolisChain  # noqa: E402
+from pyqmc.vmc.interacting import (  # noqa: E402
+    helium_atom,
+    hookes_atom,
+    hydrogen_atom,
+    interacting_trap,
+)
+from pyqmc.vmc.parallel import run_chains  # noqa: E402
+from pyqmc.vmc.particle_metropolis import ParticleMetropolisChain  # noqa: E402
+from pyqmc.vmc.system import (  # noqa: E402
+    BatchedDriftSystem,
+    OptimizableSystem,
+    ParticleMoveSystem,
+)
+
+
+def _config(**overrides: float | int | str | bool) -> SimulationConfig:
+    kwargs = {
+        "n_steps": 800,
+        "burn_in": 200,
+        "step_size": 1.0,
+        "alpha": 1.0,
+        "seed": 3,
+        "backend": "numpy",
+        "n_walkers": 100,
+    }
+    kwargs.update(overrides)
+    return SimulationConfig(**kwargs)
+
+
+def test_interacting_trap_implements_the_system_protocols() -> None:
+    system = interacting_trap(5, (1.0, 1.5, 2.0), jastrow="exponential")
+
+    assert system.n_dim == 15
+    assert system.n_parameters == 2
+    for protocol in (BatchedDriftSystem, OptimizableSystem, ParticleMoveSystem):
+        assert isinstance(system, protocol)
+
+
+def test_flat_and_particle_layouts_agree() -> None:
+    system = interacting_trap(4)
+    positions = np.random.default_rng(7).normal(size=(3, 4, 3))
+    flat = positions.reshape(3, 12)
+    params = (0.9, 0.5)
+
+    assert system.batched_local_energy(flat, params) == pytest.approx(
+        system.batched_local_energy(positions, params)
+    )
+    assert system.batched_drift_velocity(flat, params).shape == (3, 12)
+    assert system.batched_log_derivatives(flat, params).shape == (3, 2)
+
+
+def test_cusp_cancels_the_coulomb_divergence_at_contact() -> None:
+    system = hookes_atom()
+    centre = np.array([0.4, -0.3, 0.2])
+    energies = [
+        system.batched_local_energy(
+            np.concatenate([centre, centre + [gap, 0.0, 0.0]])[None, :], (1.0, 0.3)
+        )[0]
+        for gap in (1e-2, 1e-4, 1e-6)
+    ]
+
+    assert energies[2] == pytest.approx(energies[1], abs=1e-3)
+    assert abs(energies[2]) < 10.0
+
+
+def test_hookes_atom_vmc_energy_approaches_the_exact_value() -> None:
+    chain = BatchedMetropolisChain(hookes_atom(), _config(), alpha=(1.0, 0.2))
+    chain.advance(800)
+
+    exact = hookes_atom_exact_ground_state_energy()
+    assert chain.trace.energy_stats.mean == pytest.approx(exact, abs=0.01)
+    assert chain.trace.energy_stats.variance < 0.01
+
+
+def test_particle_moves_sample_the_same_energy() -> None:
+    config = _config(n_steps=300, burn_in=50, n_walkers=20)
+    chain = ParticleMetropolisChain(hookes_atom(), config, alpha=(1.0, 0.2))
+    chain.advance(300)
+
+    for configuration, walker in zip(chain.configurations, chain.x, strict=True):
+        assert configuration.table.positions == pytest.approx(walker)
+    assert chain.trace.energy_stats.mean == pytest.approx(2.0, abs=0.02)
+
+
+def test_interacting_trap_needs_two_axes_for_the_cusp() -> None:
+    with pytest.raises(ValueError, match="at least two axes"):
+        interacting_trap(2, (1.0,))
+
+
+def test_hydrogen_local_energy_is_constant_at_the_cusp_value() -> None:
+    positions = np.random.default_rng(9).normal(size=(20, 3))
+
+    assert hydrogen_atom().batched_local_energy(positions, 1.0) == pytest.approx(
+        np.full(20, -0.5)
+    )
+
+
+def test_helium_cusps_keep_the_local_energy_finite_at_coalescence() -> None:
+    correlated = helium_atom(jastrow="pade")
+    plain = helium_atom()
+    # Electron 1 approaches the nucleus, then the two electrons approach each other.
+    near_nucleus = [np.array([[gap, 0.0, 0.0, 0.5, 0.7, -0.3]]) for gap in (1e-3, 1e-6)]
+    near_pair = [np.array([[0.5, 0.7, -0.3, 0.5 + gap, 0.7, -0.3]]) for gap in (1e-3, 1e-6)]
+
+    for pair in (near_nucleus, near_pair):
+        close, closer = (correlated.batched_local_energy(r, 0.15)[0] for r in pair)
+        assert closer == pytest.approx(close, abs=0.01)
+    # The exponent-only trial at zeta = 27/16 misses the nuclear cusp.
+    assert abs(plain.batched_local_energy(near_nucleus[1], 27.0 / 16.0)[0]) > 1e4
+
+
+def test_helium_exponent_trial_has_its_analytic_energy() -> None:
+    chain = BatchedMetropolisChain(
+        helium_atom(), _config(alpha=27.0 / 16.0, step_size=0.6), alpha=27.0 / 16.0
+    )
+    chain.advance(800)
+
+    expected = helium_variational_energy(27.0 / 16.0)
+    assert chain.trace.energy_stats.mean == pytest.approx(expected, abs=0.04)
+
+
+@pytest.mark.filterwarnings("error::RuntimeWarning")
+@pytest.mark.parametrize(
+    ("system", "alpha", "expected"),
+    [(hydrogen_atom(), 1.0, -0.5), (helium_atom(), 27.0 / 16.0, -2.84765625)],
+)
+def test_langevin_walkers_start_off_the_nucleus(
+    system: object, alpha: float, expected: float
+) -> None:
+    config = _config(alpha=alpha, step_size=0.05, proposal="langevin", n_walkers=64)
+
+    summary = run_chains(system, config)
+
+    assert summary.accepted_steps > 0.9 * summary.attempted_steps
+    assert summary.energy_stats.mean == pytest.approx(expected, abs=0.05)
+
+
+def test_fixed_orbital_exponent_leaves_only_the_jastrow_range() -> None:
+    system = helium_atom(jastrow="exponential")
+    positions = np.random.default_rng(10).normal(size=(4, 6))
+
+    assert system.n_parameters == 1
+    assert system.batched_log_derivatives(positions, 0.8).shape == (4, 1)
@@ -0,0 +1,58 @@
+"""Unit tests for the Pade and exponential Jastrow pair functions."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyqmc.vmc.jastrow import ExponentialJastrow, PadeJastrow, make_jastrow  # noqa: E402
+
+DISTANCES = np.array([0.3, 0.9, 1.7, 3.2])
+
+
+@pytest.mark.parametrize("form", [PadeJastrow, ExponentialJastrow])
+def test_radial_derivatives_match_finite_differences(form: type) -> None:
+    jastrow = form()
+    params = (0.5, 0.8)
+    h = 1e-4
+
+    u, du, d2u = jastrow.derivatives(DISTANCES, params)
+    plus = jastrow.values(DISTANCES + h, params)
+    minus = jastrow.values(DISTANCES - h, params)
+
+    assert u == pytest.approx(jastrow.values(DISTANCES, params))
+    assert du == pytest.approx((plus - minus) / (2 * h), rel=1e-6)
+    assert d2u == pytest.approx((plus - 2 * u + minus) / h**2, rel=1e-4)
+
+
+@pytest.mark.parametrize("form", [PadeJastrow, ExponentialJastrow])
+def test_parameter_derivatives_match_finite_differences(form: type) -> None:
+    jastrow = form()
+    params = np.array([0.5, 0.8])
+    h = 1e-6
+
+    derivatives = jastrow.parameter_derivatives(DISTANCES, params)
+
+    assert derivatives.shape == (len(DISTANCES), 2)
+    for k in range(2):
+        step = np.eye(2)[k] * h
+        expected = (
+            jastrow.values(DISTANCES, params + step) - jastrow.values(DISTANCES, params - step)
+        ) / (2 * h)
+        assert derivatives[:, k] == pytest.approx(expected, rel=1e-6)
+
+
+def test_fixed_cusp_sets_the_contact_slope_and_leaves_one_parameter() -> None:
+    jastrow = make_jastrow("exponential", cusp=0.5)
+
+    _, du, _ = jastrow.derivatives(np.array([0.0]), (1.3,))
+
+    assert jastrow.n_parameters == 1
+    assert du == pytest.approx([0.5])
+    assert jastrow.parameter_derivatives(DISTANCES, (1.3,)).shape == (len(DISTANCES), 1)
+
+
+def test_make_jastrow_rejects_unknown_forms() -> None:
+    with pytest.raises(ValueError, match="jastrow must be one of"):
+        make_jastrow("gaussian")
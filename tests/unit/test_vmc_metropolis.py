@@ -5,16 +5,17 @@ from __future__ import annotations
 import pytest
 
 from pyqmc.core.config import SimulationConfig
+from pyqmc.core.stats import mean, standard_error
 from pyqmc.vmc.harmonic_oscillator import HarmonicOscillator1D
-from pyqmc.vmc.metropolis import sample_chain
+from pyqmc.vmc.metropolis import MetropolisChain, sample_chain
 
 
 def test_sampling_is_deterministic_for_fixed_seed() -> None:
     system = HarmonicOscillator1D()
     config = SimulationConfig(n_steps=120, burn_in=20, step_size=0.8, alpha=0.9, seed=7)
 
-    trace_a = sample_chain(system, config)
-    trace_b = sample_chain(system, config)
+    trace_a = sample_chain(system, config, store_trace=True)
+    trace_b = sample_chain(system, config, store_trace=True)
 
     assert trace_a.positions == trace_b.positions
     assert trace_a.local_energies == trace_b.local_energies
@@ -26,7 +27,7 @@ def test_sampling_collects_expected_number_of_post_burnin_samples() -> None:
     system = HarmonicOscillator1D()
     config = SimulationConfig(n_steps=200, burn_in=50, step_size=1.0, alpha=1.0, seed=3)
 
-    trace = sample_chain(system, config)
+    trace = sample_chain(system, config, store_trace=True)
 
     assert len(trace.positions) == 150
     assert len(trace.local_energies) == 150
@@ -34,6 +35,38 @@ def test_sampling_collects_expected_number_of_post_burnin_samples() -> None:
     assert 0.0 <= trace.acceptance_ratio <= 1.0
 
 
+def test_streaming_mode_keeps_no_samples_but_matches_stored_statistics() -> None:
+    system = HarmonicOscillator1D()
+    config = SimulationConfig(n_steps=500, burn_in=100, step_size=1.0, alpha=0.9, seed=4)
+
+    streamed = sample_chain(system, config)
+    stored = sample_chain(system, config, store_trace=True)
+
+    assert streamed.positions == []
+    assert streamed.local_energies == []
+    assert streamed.energy_stats.count == 400
+    assert streamed.energy_stats.mean == pytest.approx(mean(stored.local_energies))
+    assert streamed.energy_stats.standard_error == pytest.approx(
+        standard_error(stored.local_energies)
+    )
+
+
+def test_chain_advanced_in_chunks_matches_single_run() -> None:
+    system = HarmonicOscillator1D()
+    config = SimulationConfig(n_steps=300, burn_in=50, step_size=1.0, alpha=0.9, seed=6)
+
+    chain = MetropolisChain(system, config, store_trace=True)
+    for n_steps in (30, 70, 200):
+        chain.advance(n_steps)
+    single = sample_chain(system, config, store_trace=True)
+
+    assert chain.steps_done == 300
+    assert chain.trace.positions == single.positions
+    assert chain.trace.accepted_steps == single.accepted_steps
+    assert chain.trace.attempted_steps == 300
+    assert chain.trace.energy_stats.mean == pytest.approx(single.energy_stats.mean)
+
+
 def test_acceptance_ratio_zero_when_no_attempts() -> None:
     from pyqmc.vmc.metropolis import MetropolisTrace
 
@@ -0,0 +1,171 @@
+"""Unit tests for stochastic-reconfiguration parameter optimization."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyqmc.core.config import SimulationConfig  # noqa: E402
+from pyqmc.vmc.harmonic_oscillator import HarmonicOscillator1D  # noqa: E402
+from pyqmc.vmc.optimize import (  # noqa: E402
+    linear_method_update,
+    optimize_wavefunction,
+    sr_update,
+)
+from pyqmc.vmc.solver import run_vmc_harmonic_oscillator_optimization  # noqa: E402
+from pyqmc.vmc.system import OptimizableSystem  # noqa: E402
+
+
+class _AnisotropicOscillator:
+    """2D oscillator V = (x^2 + 4 y^2) / 2 with one Gaussian width per axis.
+
+    psi_T = exp(-(a x^2 + b y^2) / 2) is exact at (a, b) = (1, 2).
+    """
+
+    name = "anisotropic_oscillator_2d"
+    n_dim = 2
+    n_parameters = 2
+
+    def batched_log_probability_density(self, positions: Any, alpha: Any) -> Any:
+        a, b = alpha
+        return -(a * positions[:, 0] ** 2 + b * positions[:, 1] ** 2)
+
+    def batched_local_energy(self, positions: Any, alpha: Any) -> Any:
+        a, b = alpha
+        x2 = positions[:, 0] ** 2
+        y2 = positions[:, 1] ** 2
+        return 0.5 * (a + b) + 0.5 * (1.0 - a * a) * x2 + 0.5 * (4.0 - b * b) * y2
+
+    def batched_log_derivatives(self, positions: Any, alpha: Any) -> Any:
+        del alpha
+        return -0.5 * positions * positions
+
+
+def _config(**overrides: Any) -> SimulationConfig:
+    values = dict(
+        n_steps=300,
+        burn_in=100,
+        step_size=1.5,
+        alpha=0.5,
+        seed=5,
+        backend="numpy",
+        n_walkers=256,
+    )
+    values.update(overrides)
+    return SimulationConfig(**values)
+
+
+def test_sr_update_matches_closed_form_for_oscillator() -> None:
+    # For psi = exp(-alpha x^2 / 2), S^{-1} f = -(1 - alpha^2), so the step is
+    # tau (1 - alpha^2) in expectation.
+    system = HarmonicOscillator1D()
+    rng = np.random.default_rng(0)
+    alpha = 0.7
+    positions = rng.normal(0.0, np.sqrt(0.5 / alpha), size=(200_000, 1))
+
+    step, gradient = sr_update(
+        system.batched_log_derivatives(positions, alpha),
+        system.batched_local_energy(positions, alpha),
+        learning_rate=0.5,
+        regularization=0.0,
+    )
+
+    assert step[0] == pytest.approx(0.5 * (1.0 - alpha * alpha), rel=1e-6)
+    # dE/dalpha of E(alpha) = (alpha + 1/alpha) / 4.
+    assert gradient[0] == pytest.approx(0.25 * (1.0 - 1.0 / alpha**2), rel=0.05)
+
+
+def test_linear_method_step_is_newton_like_for_oscillator() -> None:
+    system = HarmonicOscillator1D()
+    rng = np.random.default_rng(1)
+    alpha = 0.7
+    positions = rng.normal(0.0, np.sqrt(0.5 / alpha), size=(200_000, 1))
+    derivatives = (0.5 - alpha * positions[:, 0] ** 2)[:, None]
+
+    step, _ = linear_method_update(
+        system.batched_log_derivatives(positions, alpha),
+        system.batched_local_energy(positions, alpha),
+        derivatives,
+        regularization=0.0,
+    )
+
+    # The step lands much closer to the optimum than a plain SR step of 0.5 tau.
+    assert abs(alpha + step[0] - 1.0) < 0.1
+
+
+@pytest.mark.parametrize("method", ["linear", "sr"])
+def test_oscillator_optimization_converges_to_exact_alpha(method: str) -> None:
+    result = run_vmc_harmonic_oscillator_optimization(
+        _config(alpha=0.4), method=method, n_iterations=30
+    )
+
+    assert result.converged
+    assert len(result.history) < 15
+    assert result.final_step.parameters[0] == pytest.approx(1.0, abs=1e-3)
+    assert result.final_step.energy == pytest.approx(0.5, abs=1e-5)
+    assert result.metadata["samples_per_iteration"] == 200 * 256
+
+
+def test_walkers_are_reused_between_iterations() -> None:
+    result = optimize_wavefunction(HarmonicOscillator1D(), _config(), n_iterations=3, tolerance=0.0)
+
+    assert len(result.history) == 3
+    # Burn-in only runs for the first iteration.
+    assert result.metadata["total_sweeps"] == 300 + 2 * 200
+
+
+def test_linear_method_optimizes_several_parameters_at_once() -> None:
+    system = _AnisotropicOscillator()
+    assert isinstance(system, OptimizableSystem)
+
+    result = optimize_wavefunction(system, _config(step_size=1.0), (0.5, 0.5), n_iterations=30)
+
+    assert result.converged
+    assert result.final_step.parameters == pytest.approx([1.0, 2.0], abs=1e-3)
+    assert result.final_step.energy == pytest.approx(1.5, abs=1e-4)
+
+
+def test_optimization_validates_inputs() -> None:
+    system = HarmonicOscillator1D()
+
+    with pytest.raises(ValueError, match="backend='numpy'"):
+        optimize_wavefunction(system, _config(backend="python", n_walkers=1))
+    with pytest.raises(ValueError, match="method must be one of"):
+        optimize_wavefunction(system, _config(), method="newton")
+    with pytest.raises(ValueError, match="n_iterations must be positive"):
+        optimize_wavefunction(system, _config(), n_iterations=0)
+    with pytest.raises(ValueError, match="expects 1 parameters"):
+        optimize_wavefunction(system, _config(), (0.5, 0.5))
+
+
+def test_steps_that_would_flip_alpha_negative_are_halved() -> None:
+    # From alpha = 0.05 an SR step of about 2 overshoots to alpha ~ 2, where
+    # the next step of about -6 would leave the normalizable region.
+    result = optimize_wavefunction(
+        HarmonicOscillator1D(),
+        _config(alpha=0.05),
+        method="sr",
+        n_iterations=6,
+        learning_rate=2.0,
+        max_step=10.0,
+        tolerance=0.0,
+    )
+
+    alphas = [step.parameters[0] for step in result.history]
+    assert len(alphas) == 6
+    assert max(alphas) > 1.5
+    assert all(alpha > 0.0 for alpha in alphas)
+    assert all(np.isfinite(step.energy) for step in result.history)
+
+
+def test_tuned_step_size_is_only_reported_when_tuning() -> None:
+    fixed = optimize_wavefunction(HarmonicOscillator1D(), _config(), n_iterations=1)
+    tuned = optimize_wavefunction(
+        HarmonicOscillator1D(), _config(tune_step_size=True), n_iterations=1
+    )
+
+    assert fixed.metadata["tuned_step_size"] is None
+    assert tuned.metadata["tuned_step_size"] > 0.0
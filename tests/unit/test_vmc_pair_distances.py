@@ -0,0 +1,49 @@
+"""Unit tests for the incrementally updated pair-distance table."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyqmc.vmc.pair_distances import PairDistanceTable, pair_distance_matrix  # noqa: E402
+
+
+def test_pair_distance_matrix_handles_walker_batches() -> None:
+    positions = np.random.default_rng(1).normal(size=(4, 5, 3))
+
+    distances = pair_distance_matrix(positions)
+
+    assert distances.shape == (4, 5, 5)
+    expected = np.linalg.norm(positions[2, 1] - positions[2, 3])
+    assert distances[2, 1, 3] == pytest.approx(expected)
+    assert distances[2, 3, 1] == pytest.approx(expected)
+    assert np.diagonal(distances, axis1=1, axis2=2) == pytest.approx(np.zeros((4, 5)))
+
+
+def test_incremental_moves_match_a_rebuild() -> None:
+    rng = np.random.default_rng(2)
+    table = PairDistanceTable(rng.normal(size=(6, 3)))
+
+    for _ in range(20):
+        i = int(rng.integers(6))
+        new_position = table.positions[i] + rng.uniform(-0.5, 0.5, size=3)
+        table.accept(i, new_position, table.trial_row(i, new_position))
+
+    assert table.distances == pytest.approx(pair_distance_matrix(table.positions))
+
+
+def test_trial_row_leaves_the_table_unchanged() -> None:
+    table = PairDistanceTable(np.eye(3))
+    before = table.distances.copy()
+
+    row = table.trial_row(0, np.zeros(3))
+
+    assert row[1:] == pytest.approx([1.0, 1.0])
+    assert table.distances == pytest.approx(before)
+    assert len(table.pairs()) == 3
+
+
+def test_table_rejects_flat_positions() -> None:
+    with pytest.raises(ValueError, match="n_particles, n_axes"):
+        PairDistanceTable(np.zeros(6))
@@ -0,0 +1,196 @@
+"""Unit tests for multi-chain VMC runs and their merged statistics."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import replace
+
+import pytest
+
+from pyqmc.core.config import SimulationConfig
+from pyqmc.core.progress import ProgressThrottle
+from pyqmc.vmc.harmonic_oscillator import HarmonicOscillator1D
+from pyqmc.vmc.parallel import (
+    ChainSummary,
+    _next_chunk,
+    chain_configs,
+    run_chains,
+    run_single_chain,
+)
+from pyqmc.vmc.solver import run_vmc_harmonic_oscillator
+
+
+def test_chain_configs_spawn_distinct_single_chain_seeds() -> None:
+    config = SimulationConfig(n_steps=200, burn_in=50, seed=5, n_chains=4, workers=2)
+
+    configs = chain_configs(config)
+
+    assert len(configs) == 4
+    assert len({item.seed for item in configs}) == 4
+    assert all(item.n_chains == 1 and item.workers == 1 for item in configs)
+
+
+def test_single_chain_keeps_root_seed() -> None:
+    config = SimulationConfig(n_steps=300, burn_in=50, alpha=0.9, seed=5)
+
+    assert chain_configs(config)[0].seed == 5
+    assert run_vmc_harmonic_oscillator(config).mean_energy == pytest.approx(
+        run_single_chain(HarmonicOscillator1D(), config).energy_stats.mean
+    )
+
+
+def test_merged_result_is_independent_of_worker_count() -> None:
+    base = dict(n_steps=2_000, burn_in=200, alpha=0.85, seed=11, n_chains=3)
+
+    serial = run_vmc_harmonic_oscillator(SimulationConfig(**base, workers=1))
+    pooled = run_vmc_harmonic_oscillator(SimulationConfig(**base, workers=3))
+
+    assert serial.n_samples == 3 * 1_800
+    assert pooled.n_samples == serial.n_samples
+    assert pooled.mean_energy == serial.mean_energy
+    assert pooled.standard_error == serial.standard_error
+    assert pooled.acceptance_ratio == serial.acceptance_ratio
+    assert serial.parameters["n_chains"] == 3
+
+
+def test_merged_statistics_pool_every_chain() -> None:
+    system = HarmonicOscillator1D()
+    config = SimulationConfig(n_steps=1_500, burn_in=100, alpha=0.8, seed=3, n_chains=4)
+
+    merged = run_chains(system, config)
+    parts = [run_single_chain(system, item) for item in chain_configs(config)]
+
+    counts = [part.energy_stats.count for part in parts]
+    means = [part.energy_stats.mean for part in parts]
+    assert merged.energy_stats.count == sum(counts)
+    assert merged.energy_stats.mean == pytest.approx(
+        sum(c * m for c, m in zip(counts, means)) / sum(counts)
+    )
+    assert merged.attempted_steps == 4 * 1_500
+    assert math.isfinite(merged.energy_stats.standard_error)
+
+
+def test_merged_summary_keeps_one_energy_series_per_chain() -> None:
+    config = SimulationConfig(n_steps=500, burn_in=100, seed=2, n_chains=3)
+
+    summary = run_chains(HarmonicOscillator1D(), config)
+
+    assert len(summary.energy_series) == 3
+    assert all(series.count == 400 for series in summary.energy_series)
+    assert summary.cpu_seconds >= 0.0
+
+
+def test_target_precision_run_stops_once_error_bar_is_reached() -> None:
+    config = SimulationConfig(
+        n_steps=2_000_000, burn_in=500, alpha=0.8, seed=3, target_standard_error=0.003
+    )
+
+    summary = run_chains(HarmonicOscillator1D(), config)
+    blocking = summary.energy_blocks.analysis()
+
+    assert summary.stop_reason == "target_standard_error"
+    assert blocking.converged
+    assert blocking.standard_error <= 0.003
+    assert summary.steps_per_chain < 200_000
+
+
+def test_target_precision_run_respects_step_cap() -> None:
+    config = SimulationConfig(
+        n_steps=5_000, burn_in=500, alpha=0.8, seed=3, n_chains=2, target_standard_error=1e-9
+    )
+
+    summary = run_chains(HarmonicOscillator1D(), config)
+
+    assert summary.stop_reason == "n_steps"
+    assert summary.steps_per_chain == 5_000
+    assert summary.energy_stats.count == 2 * 4_500
+
+
+def test_target_precision_run_respects_time_budget() -> None:
+    config = SimulationConfig(
+        n_steps=100_000_000,
+        burn_in=500,
+        alpha=0.8,
+        seed=3,
+        target_standard_error=1e-9,
+        max_seconds=0.2,
+    )
+
+    summary = run_chains(HarmonicOscillator1D(), config)
+
+    assert summary.stop_reason == "max_seconds"
+    assert summary.steps_per_chain < 100_000_000
+
+
+def test_target_precision_result_is_independent_of_worker_count() -> None:
+    config = SimulationConfig(
+        n_steps=200_000, burn_in=500, alpha=0.8, seed=3, n_chains=2, target_standard_error=0.004
+    )
+
+    serial = run_chains(HarmonicOscillator1D(), config)
+    pooled = run_chains(HarmonicOscillator1D(), replace(config, workers=2))
+
+    assert pooled.steps_per_chain == serial.steps_per_chain
+    assert pooled.energy_stats.mean == serial.energy_stats.mean
+
+
+def test_progress_callback_reports_running_estimates() -> None:
+    config = SimulationConfig(n_steps=120_000, burn_in=1_000, alpha=0.8, seed=3, n_chains=2)
+    snapshots = []
+
+    summary = run_chains(
+        HarmonicOscillator1D(),
+        config,
+        progress=snapshots.append,
+        # A full budget reports at every segment however long snapshots take.
+        progress_throttle=ProgressThrottle(interval=0.0, budget=1.0),
+    )
+
+    assert [item.steps_done for item in snapshots] == [50_000, 100_000, 120_000]
+    assert snapshots[-1].fraction_done == 1.0
+    assert snapshots[-1].n_samples == summary.energy_stats.count
+    assert snapshots[-1].mean_energy == summary.energy_stats.mean
+    assert snapshots[0].standard_error is not None
+    assert all(item.steps_per_second > 0 for item in snapshots)
+    # Observing the run must not perturb it.
+    assert summary.energy_stats == run_chains(HarmonicOscillator1D(), config).energy_stats
+
+
+def test_progress_callback_can_abort_a_run() -> None:
+    config = SimulationConfig(n_steps=200_000, burn_in=100, alpha=0.8, seed=3)
+
+    def abort(snapshot: object) -> None:
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        run_chains(
+            HarmonicOscillator1D(),
+            config,
+            progress=abort,
+            progress_throttle=ProgressThrottle(interval=0.0),
+        )
+
+
+def test_throttled_progress_still_reports_the_end_of_the_run() -> None:
+    config = SimulationConfig(n_steps=200_000, burn_in=100, alpha=0.8, seed=3)
+    snapshots = []
+
+    run_chains(
+        HarmonicOscillator1D(),
+        config,
+        progress=snapshots.append,
+        progress_throttle=ProgressThrottle(interval=60.0),
+    )
+
+    assert [item.steps_done for item in snapshots] == [200_000]
+
+
+def test_time_budget_ignores_steps_restored_from_a_checkpoint() -> None:
+    config = SimulationConfig(
+        n_steps=100_000, burn_in=500, target_standard_error=1e-6, max_seconds=2.0
+    )
+    summary = ChainSummary(steps_per_chain=10_000)
+    summary.energy_blocks.extend([0.4, 0.6] * 4_750)
+
+    # 1_000 steps ran in this process during the first second after resuming.
+    assert _next_chunk(config, summary, elapsed=1.0, start_step=9_000) == 1_000
@@ -0,0 +1,96 @@
+"""Unit tests for the particle-by-particle Metropolis sampler."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyqmc.benchmarks.references import harmonic_trap_variational_energy  # noqa: E402
+from pyqmc.core.config import SimulationConfig  # noqa: E402
+from pyqmc.vmc.harmonic_oscillator import HarmonicOscillator1D  # noqa: E402
+from pyqmc.vmc.harmonic_trap import HarmonicTrap  # noqa: E402
+from pyqmc.vmc.particle_metropolis import (  # noqa: E402
+    FullEvaluationMoves,
+    ParticleMetropolisChain,
+    sample_particles,
+)
+from pyqmc.vmc.system import ParticleMoveSystem  # noqa: E402
+
+FREQUENCIES = (1.0, 1.5, 2.0)
+
+
+def _config(**overrides: float | int | str | bool) -> SimulationConfig:
+    kwargs = {
+        "n_steps": 1_500,
+        "burn_in": 200,
+        "step_size": 0.6,
+        "alpha": 0.8,
+        "seed": 11,
+        "backend": "numpy",
+        "n_walkers": 4,
+    }
+    kwargs.update(overrides)
+    return SimulationConfig(**kwargs)
+
+
+def test_trap_ratio_matches_full_wavefunction_ratio() -> None:
+    system = HarmonicTrap(5, FREQUENCIES)
+    positions = np.random.default_rng(4).normal(size=(5, 3))
+    configuration = system.particle_configuration(positions, 0.7)
+    new_position = positions[2] + 0.3
+    moved = positions.copy()
+    moved[2] = new_position
+
+    log_psi = system.batched_log_trial_wavefunction(np.stack([positions, moved]), 0.7)
+
+    assert isinstance(system, ParticleMoveSystem)
+    assert system.ratio(configuration, 2, new_position) == pytest.approx(
+        np.exp(log_psi[1] - log_psi[0])
+    )
+    assert configuration.positions == pytest.approx(positions)
+
+
+def test_particle_moves_reproduce_the_variational_energy() -> None:
+    trace = sample_particles(HarmonicTrap(6, FREQUENCIES), _config())
+    reference = harmonic_trap_variational_energy(0.8, 6, FREQUENCIES)
+    error = trace.energy_blocks.analysis().standard_error
+
+    assert abs(trace.energy_stats.mean - reference) < 4 * error
+    assert 0.3 < trace.acceptance_ratio < 0.9
+    assert trace.attempted_moves == 1_500 * 4 * 6
+
+
+def test_incremental_and_full_evaluation_hooks_give_identical_chains() -> None:
+    system = HarmonicTrap(4, FREQUENCIES)
+    config = _config(n_steps=300, burn_in=50)
+
+    incremental = sample_particles(system, config)
+    full = sample_particles(FullEvaluationMoves(system, 4, 3), config)
+
+    assert incremental.accepted_moves == full.accepted_moves
+    assert incremental.energy_stats.mean == pytest.approx(full.energy_stats.mean)
+
+
+def test_chunked_advance_matches_single_run() -> None:
+    system = HarmonicTrap(3, FREQUENCIES)
+    config = _config(n_steps=400, burn_in=100, tune_step_size=True)
+    chunked = ParticleMetropolisChain(system, config)
+    for _ in range(4):
+        chunked.advance(100)
+
+    single = ParticleMetropolisChain(system, config)
+    single.advance(400)
+
+    assert chunked.trace.energy_stats.mean == single.trace.energy_stats.mean
+    assert chunked.trace.accepted_moves == single.trace.accepted_moves
+    assert chunked.step_size == single.step_size != config.step_size
+
+
+def test_chain_rejects_unsupported_systems_and_kernels() -> None:
+    with pytest.raises(TypeError, match="particle-move protocol"):
+        ParticleMetropolisChain(HarmonicOscillator1D(), _config())
+    with pytest.raises(ValueError, match="uniform proposal"):
+        ParticleMetropolisChain(HarmonicTrap(2), _config(proposal="langevin"))
+    with pytest.raises(ValueError, match="n_dim"):
+        FullEvaluationMoves(HarmonicTrap(2), 3, 3)
@@ -0,0 +1,97 @@
+"""Unit tests for Metropolis proposal kernels."""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from pyqmc.core.config import SimulationConfig
+from pyqmc.vmc.harmonic_oscillator import HarmonicOscillator1D
+from pyqmc.vmc.metropolis import MetropolisChain
+from pyqmc.vmc.proposals import LangevinProposal, UniformProposal, make_proposal
+from pyqmc.vmc.solver import run_vmc_harmonic_oscillator
+
+
+class _NoDriftSystem:
+    name = "no_drift"
+
+    def log_probability_density(self, x: float, alpha: float) -> float:
+        return -alpha * x * x
+
+    def local_energy(self, x: float, alpha: float) -> float:
+        return alpha
+
+
+def _log_green(to: float, start: float, tau: float, alpha: float) -> float:
+    mean = start + tau * (-alpha * start)
+    return -((to - mean) ** 2) / (2.0 * tau)
+
+
+def test_uniform_proposal_is_symmetric_and_bounded() -> None:
+    kernel = UniformProposal(HarmonicOscillator1D(), 1.0)
+    rng = random.Random(1)
+
+    for _ in range(100):
+        proposal, log_green_ratio = kernel.propose(0.3, 0.5, rng)
+        assert abs(proposal - 0.3) <= 0.5
+        assert log_green_ratio == 0.0
+
+
+def test_langevin_green_ratio_matches_gaussian_transition_densities() -> None:
+    alpha = 0.8
+    tau = 0.7
+    kernel = LangevinProposal(HarmonicOscillator1D(), alpha)
+    rng = random.Random(2)
+
+    for x in (-1.3, 0.0, 0.4, 2.1):
+        proposal, log_green_ratio = kernel.propose(x, tau, rng)
+        expected = _log_green(x, proposal, tau, alpha) - _log_green(proposal, x, tau, alpha)
+        assert log_green_ratio == pytest.approx(expected)
+
+
+def test_langevin_requires_drift_velocity() -> None:
+    with pytest.raises(TypeError, match="does not implement DriftSystem"):
+        LangevinProposal(_NoDriftSystem(), 1.0)
+
+
+def test_make_proposal_rejects_unknown_kernel() -> None:
+    with pytest.raises(ValueError, match="proposal must be one of"):
+        make_proposal("hamiltonian", HarmonicOscillator1D(), 1.0)
+
+
+def test_chain_uses_configured_kernel() -> None:
+    config = SimulationConfig(n_steps=100, burn_in=10, proposal="langevin", seed=1)
+
+    chain = MetropolisChain(HarmonicOscillator1D(), config)
+
+    assert chain.kernel.name == "langevin"
+
+
+@pytest.mark.parametrize("alpha", [0.8, 1.3])
+def test_langevin_sampling_reproduces_variational_energy(alpha: float) -> None:
+    # Without the Green's-function correction a large time step biases E(alpha).
+    config = SimulationConfig(
+        n_steps=80_000, burn_in=1_000, step_size=1.2, alpha=alpha, proposal="langevin", seed=5
+    )
+
+    result = run_vmc_harmonic_oscillator(config)
+    exact = 0.25 * (alpha + 1.0 / alpha)
+
+    assert abs(result.mean_energy - exact) < 4.0 * result.standard_error + 1e-3
+    assert math.isfinite(result.metadata["integrated_autocorrelation_time"])
+
+
+def test_langevin_has_shorter_autocorrelation_than_uniform() -> None:
+    base = {"n_steps": 60_000, "burn_in": 1_000, "alpha": 0.8, "seed": 9}
+
+    uniform = run_vmc_harmonic_oscillator(SimulationConfig(step_size=2.5, **base))
+    langevin = run_vmc_harmonic_oscillator(
+        SimulationConfig(step_size=1.0, proposal="langevin", **base)
+    )
+
+    assert (
+        langevin.metadata["integrated_autocorrelation_time"]
+        < 0.6 * uniform.metadata["integrated_autocorrelation_time"]
+    )
@@ -0,0 +1,122 @@
+"""Unit tests for correlated-sampling alpha sweeps."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyqmc.core.config import SimulationConfig  # noqa: E402
+from pyqmc.vmc.harmonic_oscillator import HarmonicOscillator1D  # noqa: E402
+from pyqmc.vmc.reweighting import reweight_alpha_grid, stack_positions  # noqa: E402
+from pyqmc.vmc.solver import run_vmc_harmonic_oscillator_alpha_sweep  # noqa: E402
+
+
+def _variational_energy(alpha: float) -> float:
+    return 0.25 * (alpha + 1.0 / alpha)
+
+
+def test_reweighting_at_reference_keeps_every_sample() -> None:
+    system = HarmonicOscillator1D()
+    rng = np.random.default_rng(3)
+    positions = rng.normal(0.0, 1.0, size=(1000, 1))
+
+    (point,) = reweight_alpha_grid(system, positions, 0.5, [0.5])
+
+    assert point.effective_samples == pytest.approx(1000.0)
+    assert point.energy == pytest.approx(float(system.batched_local_energy(positions, 0.5).mean()))
+
+
+def test_reweighting_rejects_empty_sample_set() -> None:
+    with pytest.raises(ValueError, match="at least one stored sample"):
+        reweight_alpha_grid(HarmonicOscillator1D(), np.empty((0, 1)), 1.0, [1.0])
+
+
+def test_grid_pass_matches_reweighting_one_alpha_at_a_time() -> None:
+    system = HarmonicOscillator1D()
+    positions = np.random.default_rng(5).normal(0.0, 0.8, size=(2000, 1))
+    alphas = [0.7, 0.9, 1.1, 1.3]
+
+    grid = reweight_alpha_grid(system, positions, 0.9, alphas)
+    single = [reweight_alpha_grid(system, positions, 0.9, [alpha])[0] for alpha in alphas]
+
+    for point, expected in zip(grid, single):
+        assert point.energy == pytest.approx(expected.energy, rel=1e-12)
+        assert point.standard_error == pytest.approx(expected.standard_error, rel=1e-12)
+        assert point.effective_samples == pytest.approx(expected.effective_samples, rel=1e-12)
+
+
+def test_reweighting_rejects_systems_that_do_not_broadcast_alpha() -> None:
+    class _PerWalkerOnly:
+        name = "per_walker_only"
+
+        def batched_log_probability_density(self, positions, alpha):
+            return np.zeros(len(positions))
+
+        def batched_local_energy(self, positions, alpha):
+            return np.zeros(len(positions))
+
+    with pytest.raises(ValueError, match="does not broadcast alpha"):
+        reweight_alpha_grid(_PerWalkerOnly(), np.zeros((4, 1)), 1.0, [0.9, 1.1])
+
+
+def test_stack_positions_keeps_chains_sweeps_and_walkers_apart() -> None:
+    class _Trace:
+        def __init__(self, positions):
+            self.positions = positions
+
+    batched = [_Trace(np.zeros((5, 4, 1))), _Trace(np.ones((5, 4, 1)))]
+    scalar = [_Trace([0.1, 0.2, 0.3])]
+
+    assert stack_positions(batched, 1).shape == (2, 5, 4, 1)
+    assert stack_positions(scalar, 1).shape == (1, 3, 1, 1)
+
+
+def test_error_bars_are_calibrated_from_an_exact_reference() -> None:
+    # At alpha = 1 the local energy is constant, so only the per-point
+    # blocking of the reweighted series can supply the error bar at 0.7.
+    z_scores = []
+    for seed in range(10):
+        config = SimulationConfig(n_steps=20_000, burn_in=1_000, alpha=1.0, seed=seed)
+        (point,) = run_vmc_harmonic_oscillator_alpha_sweep(config, [0.7]).points
+        z_scores.append((point.energy - _variational_energy(0.7)) / point.standard_error)
+
+    assert math.sqrt(sum(z * z for z in z_scores) / len(z_scores)) < 2.0
+
+
+@pytest.mark.parametrize("backend,n_walkers", [("python", 1), ("numpy", 32)])
+def test_alpha_sweep_tracks_variational_curve(backend: str, n_walkers: int) -> None:
+    config = SimulationConfig(
+        n_steps=20_000 if backend == "python" else 1_000,
+        burn_in=1_000 if backend == "python" else 200,
+        alpha=0.9,
+        seed=11,
+        backend=backend,
+        n_walkers=n_walkers,
+    )
+    alphas = [0.7, 0.8, 0.9, 1.0, 1.1, 1.2]
+
+    result = run_vmc_harmonic_oscillator_alpha_sweep(config, alphas)
+
+    assert [point.alpha for point in result.points] == alphas
+    for point in result.points:
+        error = abs(point.energy - _variational_energy(point.alpha))
+        assert error < 5 * point.standard_error + 1e-9
+    assert result.best_point.alpha == pytest.approx(1.0)
+    reference = result.points[alphas.index(0.9)]
+    assert reference.effective_samples == pytest.approx(result.n_samples)
+
+
+def test_alpha_sweep_validates_grid_and_mode() -> None:
+    config = SimulationConfig(n_steps=200, burn_in=10)
+
+    with pytest.raises(ValueError, match="at least one value"):
+        run_vmc_harmonic_oscillator_alpha_sweep(config, [])
+    with pytest.raises(ValueError, match="alphas must be positive"):
+        run_vmc_harmonic_oscillator_alpha_sweep(config, [1.0, -0.5])
+    with pytest.raises(ValueError, match="fixed n_steps"):
+        run_vmc_harmonic_oscillator_alpha_sweep(
+            SimulationConfig(n_steps=200, burn_in=10, target_standard_error=0.01), [1.0]
+        )
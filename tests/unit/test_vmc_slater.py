@@ -0,0 +1,199 @@
+"""Unit tests for Slater determinants with Sherman-Morrison inverse updates."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyqmc.benchmarks.references import fermion_trap_exact_ground_state_energy  # noqa: E402
+from pyqmc.benchmarks.vmc_fermion_trap import run_vmc_fermion_trap_benchmarks  # noqa: E402
+from pyqmc.core.config import SimulationConfig  # noqa: E402
+from pyqmc.vmc.batched_metropolis import BatchedMetropolisChain  # noqa: E402
+from pyqmc.vmc.interacting import fermion_trap  # noqa: E402
+from pyqmc.vmc.particle_metropolis import ParticleMetropolisChain  # noqa: E402
+from pyqmc.vmc.slater import (  # noqa: E402
+    HarmonicOrbitals,
+    SlaterDeterminant,
+    trap_orbital_quantum_numbers,
+)
+from pyqmc.vmc.solver import run_vmc_fermion_trap  # noqa: E402
+from pyqmc.vmc.wavefunction import GaussianOneBody, ProductWavefunction  # noqa: E402
+
+FREQUENCIES = (1.0, 1.5, 2.0)
+
+
+def _config(**overrides: float | int | str | bool) -> SimulationConfig:
+    kwargs = {
+        "n_steps": 200,
+        "burn_in": 50,
+        "step_size": 0.8,
+        "alpha": 1.0,
+        "seed": 5,
+        "backend": "numpy",
+        "n_walkers": 4,
+    }
+    kwargs.update(overrides)
+    return SimulationConfig(**kwargs)
+
+
+def test_levels_fill_in_energy_order_and_stay_closed_downward() -> None:
+    levels = trap_orbital_quantum_numbers(10, FREQUENCIES)
+
+    energies = [sum(n * omega for n, omega in zip(level, FREQUENCIES)) for level in levels]
+    assert levels[:3] == [(0, 0, 0), (1, 0, 0), (0, 1, 0)]
+    assert energies == sorted(energies)
+    for level in levels:
+        for axis, n in enumerate(level):
+            if n > 0:
+                assert level[:axis] + (n - 1,) + level[axis + 1 :] in levels
+
+
+def test_orbital_derivatives_match_finite_differences() -> None:
+    orbitals = HarmonicOrbitals(FREQUENCIES)
+    positions = np.random.default_rng(1).normal(size=(2, 6, 3))
+    h = 1e-4
+
+    values, gradients, laplacians = orbitals.evaluate(positions, 6)
+
+    numeric_laplacian = np.zeros_like(values)
+    for axis in range(3):
+        step = np.zeros(3)
+        step[axis] = h
+        plus = orbitals.values(positions + step, 6)
+        minus = orbitals.values(positions - step, 6)
+        assert gradients[..., axis] == pytest.approx((plus - minus) / (2 * h), rel=1e-6)
+        numeric_laplacian += (plus - 2 * values + minus) / h**2
+    assert values == pytest.approx(orbitals.values(positions, 6))
+    assert laplacians == pytest.approx(numeric_laplacian, rel=1e-4, abs=1e-4)
+
+
+def test_determinant_gradient_and_laplacian_match_finite_differences() -> None:
+    determinant = SlaterDeterminant(HarmonicOrbitals(FREQUENCIES), 3, 2)
+    wavefunction = ProductWavefunction(GaussianOneBody(FREQUENCIES), determinant=determinant)
+    positions = np.random.default_rng(2).normal(size=(3, 5, 3))
+    h = 1e-4
+    value = wavefunction.log_value(positions, 0.9)
+    numeric_gradient = np.zeros_like(positions)
+    numeric_laplacian = np.zeros(3)
+    for i in range(5):
+        for axis in range(3):
+            step = np.zeros_like(positions)
+            step[:, i, axis] = h
+            plus = wavefunction.log_value(positions + step, 0.9)
+            minus = wavefunction.log_value(positions - step, 0.9)
+            numeric_gradient[:, i, axis] = (plus - minus) / (2 * h)
+            numeric_laplacian += (plus - 2 * value + minus) / h**2
+
+    gradient, laplacian = wavefunction.gradient_and_laplacian(positions, 0.9)
+
+    # Near a node ln|D| varies quickly, so compare relative to the gradient.
+    assert gradient == pytest.approx(numeric_gradient, rel=1e-3, abs=1e-5)
+    assert laplacian == pytest.approx(numeric_laplacian, rel=1e-3)
+
+
+def test_sherman_morrison_updates_track_the_exact_inverse() -> None:
+    determinant = SlaterDeterminant(HarmonicOrbitals(FREQUENCIES), 4, 3, recompute_interval=1000)
+    rng = np.random.default_rng(3)
+    positions = rng.normal(size=(7, 3))
+    state = determinant.inverse_state(positions)
+
+    for _ in range(100):
+        i = int(rng.integers(7))
+        new_position = positions[i] + rng.normal(scale=0.3, size=3)
+        moved = positions.copy()
+        moved[i] = new_position
+        expected = np.prod(
+            [
+                np.linalg.det(new) / np.linalg.det(old)
+                for new, old in zip(determinant.matrices(moved), determinant.matrices(positions))
+            ]
+        )
+        assert state.ratio(i, new_position) == pytest.approx(expected, rel=1e-8)
+        positions[i] = new_position
+        state.accept(i)
+
+    assert state.updates_since_rebuild == 100
+    for inverse, matrix in zip(state.inverses, determinant.matrices(positions)):
+        assert inverse == pytest.approx(np.linalg.inv(matrix), rel=1e-6, abs=1e-9)
+
+
+def test_inverse_is_rebuilt_every_recompute_interval() -> None:
+    determinant = SlaterDeterminant(HarmonicOrbitals(), 2, 2, recompute_interval=3)
+    positions = np.random.default_rng(4).normal(size=(4, 3))
+    state = determinant.inverse_state(positions)
+
+    for step in range(1, 8):
+        new_position = positions[step % 4] + 0.1
+        state.ratio(step % 4, new_position)
+        positions[step % 4] = new_position
+        state.accept(step % 4)
+        assert state.updates_since_rebuild == step % 3
+
+
+def test_same_spin_exchange_flips_the_determinant_sign() -> None:
+    determinant = SlaterDeterminant(HarmonicOrbitals(), 3, 1)
+    positions = np.random.default_rng(6).normal(size=(4, 3))
+    state = determinant.inverse_state(positions.copy())
+
+    # Moving particle 0 onto particle 1 makes two spin-up rows equal.
+    assert state.ratio(0, positions[1]) == pytest.approx(0.0, abs=1e-10)
+    # Opposite spins do not constrain each other.
+    assert abs(state.ratio(0, positions[3])) > 1e-6
+
+
+def test_noninteracting_fermions_are_exact_at_alpha_one() -> None:
+    system = fermion_trap(4, 3, FREQUENCIES)
+    positions = np.random.default_rng(7).normal(size=(5, 21))
+    exact = fermion_trap_exact_ground_state_energy(4, 3, FREQUENCIES)
+
+    assert system.batched_local_energy(positions, 1.0) == pytest.approx(np.full(5, exact))
+    assert system.wavefunction.determinant.filled_level_energy() == pytest.approx(exact)
+
+
+def test_particle_chain_keeps_inverses_consistent() -> None:
+    system = fermion_trap(3, 3, FREQUENCIES, recompute_interval=7)
+    chain = ParticleMetropolisChain(system, _config(alpha=0.9))
+    chain.advance(30)
+
+    for configuration, walker in zip(chain.configurations, chain.x, strict=True):
+        assert configuration.positions == pytest.approx(walker)
+        matrices = system.wavefunction.determinant.matrices(walker)
+        for inverse, matrix in zip(configuration.slater.inverses, matrices):
+            assert inverse @ matrix == pytest.approx(np.eye(3), abs=1e-8)
+
+
+def test_interacting_fermions_sample_the_same_energy_with_both_samplers() -> None:
+    system = fermion_trap(2, 2, strength=1.0)
+    config = _config(n_steps=250, n_walkers=10, alpha=1.0)
+
+    particle = ParticleMetropolisChain(system, config, alpha=(1.0, 0.3))
+    particle.advance(250)
+    batched_config = _config(n_steps=250, n_walkers=100, alpha=1.0, step_size=0.5)
+    batched = BatchedMetropolisChain(system, batched_config, alpha=(1.0, 0.3))
+    batched.advance(250)
+
+    assert particle.trace.energy_stats.mean == pytest.approx(
+        batched.trace.energy_stats.mean, abs=0.1
+    )
+
+
+def test_fermion_trap_runner_returns_a_simulation_result() -> None:
+    result = run_vmc_fermion_trap(_config(alpha=0.9), n_up=2, n_down=1, frequencies=FREQUENCIES)
+
+    assert result.system == "fermion_trap"
+    assert result.n_samples == 150 * 4
+    assert result.metadata["exact_ground_state_energy"] == pytest.approx(
+        fermion_trap_exact_ground_state_energy(2, 1, FREQUENCIES)
+    )
+    with pytest.raises(ValueError, match="one chain"):
+        run_vmc_fermion_trap(
+            _config(n_chains=2), n_up=2, n_down=1, frequencies=FREQUENCIES
+        )
+
+
+def test_fermion_trap_benchmark_suite_passes() -> None:
+    suite = run_vmc_fermion_trap_benchmarks(n_up=2, n_down=1, n_steps=300, burn_in=50)
+
+    assert suite.all_passed
+    assert suite.cases[0].standard_error == pytest.approx(0.0, abs=1e-9)
@@ -35,3 +35,32 @@ def test_solver_raises_for_invalid_config() -> None:
 
     with pytest.raises(ValueError, match="burn_in must be smaller than n_steps"):
         run_vmc_harmonic_oscillator(invalid)
+
+
+def test_solver_reports_blocked_error_for_correlated_chain() -> None:
+    # A small step size makes successive samples strongly correlated.
+    config = SimulationConfig(n_steps=40_000, burn_in=1_000, step_size=0.2, alpha=0.8, seed=4)
+
+    result = run_vmc_harmonic_oscillator(config)
+
+    assert result.standard_error > 2.0 * result.metadata["naive_standard_error"]
+    assert result.metadata["effective_samples"] < result.n_samples
+    assert result.metadata["blocking"]["block_size"] > 1
+
+
+def test_solver_reports_autocorrelation_time_and_efficiency() -> None:
+    config = SimulationConfig(n_steps=20_000, burn_in=1_000, step_size=0.2, alpha=0.8, seed=4)
+
+    result = run_vmc_harmonic_oscillator(config)
+    metadata = result.metadata
+
+    assert metadata["integrated_autocorrelation_time"] > 5.0
+    assert metadata["effective_samples"] == pytest.approx(
+        result.n_samples / metadata["integrated_autocorrelation_time"]
+    )
+    assert metadata["cpu_seconds"] > 0.0
+    assert metadata["effective_samples_per_cpu_second"] > 0.0
+    # Both error estimates describe the same chain and should roughly agree.
+    assert metadata["effective_samples"] == pytest.approx(
+        metadata["blocking"]["effective_samples"], rel=0.5
+    )
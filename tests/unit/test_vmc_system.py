@@ -0,0 +1,70 @@
+"""Unit tests for scalar/batched system protocols."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from pyqmc.vmc.harmonic_oscillator import HarmonicOscillator1D
+from pyqmc.vmc.system import (
+    BatchedDriftSystem,
+    BatchedSystem,
+    DriftSystem,
+    ScalarFallbackMixin,
+    ScalarSystem,
+)
+
+
+class _BatchedOnlyOscillator(ScalarFallbackMixin):
+    """Toy system that only implements the batched protocol."""
+
+    name = "batched_only"
+    n_dim = 1
+
+    def batched_log_probability_density(self, positions: Any, alpha: float) -> Any:
+        return -alpha * positions[:, 0] ** 2
+
+    def batched_local_energy(self, positions: Any, alpha: float) -> Any:
+        return 0.5 * alpha + 0.5 * (1.0 - alpha * alpha) * positions[:, 0] ** 2
+
+
+def test_harmonic_oscillator_implements_both_protocols() -> None:
+    system = HarmonicOscillator1D()
+
+    assert isinstance(system, ScalarSystem)
+    assert isinstance(system, BatchedSystem)
+    assert isinstance(system, DriftSystem)
+    assert isinstance(system, BatchedDriftSystem)
+
+
+def test_batched_methods_match_scalar_methods() -> None:
+    np = pytest.importorskip("numpy")
+    system = HarmonicOscillator1D()
+    xs = [-1.5, -0.2, 0.0, 0.7, 2.1]
+    positions = np.array(xs).reshape(-1, 1)
+
+    log_prob = system.batched_log_probability_density(positions, 0.85)
+    energies = system.batched_local_energy(positions, 0.85)
+
+    assert log_prob.shape == (len(xs),)
+    assert energies.shape == (len(xs),)
+    for index, x in enumerate(xs):
+        assert log_prob[index] == pytest.approx(system.log_probability_density(x, 0.85))
+        assert energies[index] == pytest.approx(system.local_energy(x, 0.85))
+
+    drift = system.batched_drift_velocity(positions, 0.85)
+    assert drift.shape == positions.shape
+    assert drift[3, 0] == pytest.approx(system.drift_velocity(0.7, 0.85))
+
+
+def test_scalar_fallback_is_generated_from_batched_methods() -> None:
+    pytest.importorskip("numpy")
+    system = _BatchedOnlyOscillator()
+    reference = HarmonicOscillator1D()
+
+    assert isinstance(system, ScalarSystem)
+    assert system.log_probability_density(1.3, 0.9) == pytest.approx(
+        reference.log_probability_density(1.3, 0.9)
+    )
+    assert system.local_energy(1.3, 0.9) == pytest.approx(reference.local_energy(1.3, 0.9))
@@ -0,0 +1,87 @@
+"""Unit tests for memory-mapped on-disk sample traces."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyqmc.core.checkpoint import CheckpointPolicy
+from pyqmc.core.config import SimulationConfig
+from pyqmc.vmc import parallel
+from pyqmc.vmc.harmonic_oscillator import HarmonicOscillator1D
+from pyqmc.vmc.parallel import run_chains
+from pyqmc.vmc.solver import run_vmc_harmonic_oscillator
+from pyqmc.vmc.trace_store import TraceSink, create_trace_store, open_trace
+
+
+def test_scalar_chains_stream_every_kept_sample(tmp_path: Path) -> None:
+    config = SimulationConfig(n_steps=9_000, burn_in=1_000, alpha=0.8, n_chains=2, seed=4)
+
+    result = run_vmc_harmonic_oscillator(config, trace_out=tmp_path)
+    trace = open_trace(tmp_path)
+
+    assert trace.n_samples == result.n_samples == 16_000
+    assert trace.chains[0].positions.shape == (8_000, 1, 1)
+    assert isinstance(trace.chains[0].local_energies, np.memmap)
+    energies = np.concatenate([chain.local_energies.ravel() for chain in trace.chains])
+    assert energies.mean() == pytest.approx(result.mean_energy, rel=1e-12)
+    assert result.metadata["trace_out"] == str(tmp_path)
+
+
+def test_batched_trace_matches_in_memory_trace(tmp_path: Path) -> None:
+    system = HarmonicOscillator1D()
+    config = SimulationConfig(n_steps=400, burn_in=100, backend="numpy", n_walkers=16, seed=3)
+
+    in_memory = run_chains(system, config, store_trace=True).traces[0]
+    run_chains(system, config, trace_out=tmp_path)
+    stored = open_trace(tmp_path).chains[0]
+
+    np.testing.assert_array_equal(stored.positions, in_memory.positions)
+    np.testing.assert_array_equal(stored.local_energies, in_memory.local_energies)
+    assert stored.sweep_energies.shape == (300,)
+
+
+def test_resumed_run_continues_trace(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    system = HarmonicOscillator1D()
+    config = SimulationConfig(n_steps=5_000, burn_in=500, seed=6)
+    policy = CheckpointPolicy(tmp_path / "run.ckp", every_steps=1_000, every_seconds=None)
+    run_chains(system, config, trace_out=tmp_path / "full")
+
+    original = parallel._ChainGroup._advance
+    calls = [0]
+
+    def interrupted(self: parallel._ChainGroup, n_steps: int) -> None:
+        calls[0] += 1
+        if calls[0] > 2:
+            raise KeyboardInterrupt
+        original(self, n_steps)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(parallel._ChainGroup, "_advance", interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            run_chains(system, config, checkpoint=policy, trace_out=tmp_path / "run")
+    run_chains(system, config, checkpoint=replace(policy, resume=True), trace_out=tmp_path / "run")
+
+    full = open_trace(tmp_path / "full").chains[0]
+    resumed = open_trace(tmp_path / "run").chains[0]
+    np.testing.assert_array_equal(resumed.positions, full.positions)
+    np.testing.assert_array_equal(resumed.local_energies, full.local_energies)
+
+
+def test_sink_rejects_rows_past_preallocated_length(tmp_path: Path) -> None:
+    config = SimulationConfig(n_steps=10, burn_in=5)
+    (sink,) = create_trace_store(tmp_path, config, n_dim=1, n_chains=1)
+
+    sink.write([0.0] * 5, [1.0] * 5)
+    with pytest.raises(RuntimeError, match="full"):
+        sink.write([0.0], [1.0])
+    assert isinstance(sink, TraceSink)
+
+
+def test_open_trace_rejects_other_directories(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="does not contain"):
+        open_trace(tmp_path)
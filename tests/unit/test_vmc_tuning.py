@@ -0,0 +1,88 @@
+"""Unit tests for burn-in step-size adaptation."""
+
+from __future__ import annotations
+
+import pytest
+
+from pyqmc.core.config import SimulationConfig
+from pyqmc.vmc.harmonic_oscillator import HarmonicOscillator1D
+from pyqmc.vmc.metropolis import MetropolisChain
+from pyqmc.vmc.solver import run_vmc_harmonic_oscillator
+from pyqmc.vmc.tuning import StepSizeTuner
+
+
+def _tuned_config(step_size: float, **overrides: float | int | bool) -> SimulationConfig:
+    kwargs = {
+        "n_steps": 20_000,
+        "burn_in": 3_000,
+        "step_size": step_size,
+        "alpha": 0.8,
+        "seed": 11,
+        "tune_step_size": True,
+    }
+    kwargs.update(overrides)
+    return SimulationConfig(**kwargs)
+
+
+def test_tuner_segments_stop_at_window_boundaries_and_burn_in() -> None:
+    tuner = StepSizeTuner(step_size=1.0, target_acceptance=0.5, burn_in=250)
+
+    assert tuner.window_steps == 100
+    assert tuner.segment(0, 1_000) == 100
+    assert tuner.segment(130, 1_000) == 70
+    assert tuner.segment(200, 1_000) == 50
+    assert tuner.segment(120, 150) == 30
+    assert tuner.segment(250, 1_000) == 0
+
+
+def test_tuner_widens_when_acceptance_is_too_high() -> None:
+    tuner = StepSizeTuner(step_size=1.0, target_acceptance=0.5, burn_in=1_000)
+
+    tuner.update(accepted=60, steps=60)
+    assert tuner.step_size == 1.0
+    tuner.update(accepted=40, steps=40)
+
+    assert tuner.step_size > 1.0
+    assert tuner.n_updates == 1
+
+
+@pytest.mark.parametrize("initial_step_size", [0.01, 1.0, 50.0])
+def test_tuned_chain_reaches_target_acceptance(initial_step_size: float) -> None:
+    config = _tuned_config(initial_step_size)
+    chain = MetropolisChain(HarmonicOscillator1D(), config)
+
+    chain.advance(config.burn_in)
+    tuned = chain.step_size
+    accepted_in_burn_in = chain.trace.accepted_steps
+    chain.advance(config.n_steps - config.burn_in)
+
+    kept_acceptance = (chain.trace.accepted_steps - accepted_in_burn_in) / (
+        config.n_steps - config.burn_in
+    )
+    assert chain.step_size == tuned
+    assert kept_acceptance == pytest.approx(0.5, abs=0.05)
+
+
+def test_tuning_is_independent_of_chunking() -> None:
+    config = _tuned_config(0.1, n_steps=4_000, burn_in=1_000)
+    system = HarmonicOscillator1D()
+
+    chunked = MetropolisChain(system, config)
+    for n_steps in (37, 463, 1_500, 2_000):
+        chunked.advance(n_steps)
+    single = MetropolisChain(system, config)
+    single.advance(4_000)
+
+    assert chunked.step_size == single.step_size
+    assert chunked.trace.accepted_steps == single.trace.accepted_steps
+    assert chunked.trace.energy_stats.mean == pytest.approx(single.trace.energy_stats.mean)
+
+
+def test_solver_reports_tuned_step_size() -> None:
+    tuned = run_vmc_harmonic_oscillator(_tuned_config(0.05, n_chains=2))
+    fixed = run_vmc_harmonic_oscillator(_tuned_config(0.05, tune_step_size=False))
+
+    assert tuned.metadata["tuned_step_size"] > 1.0
+    assert tuned.parameters["tune_step_size"] is True
+    assert fixed.metadata["tuned_step_size"] is None
+    assert tuned.acceptance_ratio < fixed.acceptance_ratio
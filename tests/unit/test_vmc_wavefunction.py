@@ -0,0 +1,93 @@
+"""Unit tests for the one-body times Jastrow product wavefunction."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyqmc.vmc.jastrow import ExponentialJastrow, PadeJastrow  # noqa: E402
+from pyqmc.vmc.pair_distances import PairDistanceTable  # noqa: E402
+from pyqmc.vmc.wavefunction import (  # noqa: E402
+    ExponentialOneBody,
+    GaussianOneBody,
+    ProductWavefunction,
+)
+
+CASES = [
+    (ProductWavefunction(GaussianOneBody((1.0, 1.5, 2.0)), PadeJastrow()), (0.9, 0.4, 0.7)),
+    (ProductWavefunction(ExponentialOneBody(), ExponentialJastrow(cusp=0.5)), (1.7, 0.6)),
+    (ProductWavefunction(GaussianOneBody()), (1.1,)),
+]
+
+
+def _positions(n_walkers: int = 3, n_particles: int = 4) -> np.ndarray:
+    return np.random.default_rng(5).normal(size=(n_walkers, n_particles, 3))
+
+
+@pytest.mark.parametrize(("wavefunction", "params"), CASES)
+def test_gradient_and_laplacian_match_finite_differences(
+    wavefunction: ProductWavefunction, params: tuple[float, ...]
+) -> None:
+    positions = _positions()
+    h = 1e-4
+    value = wavefunction.log_value(positions, params)
+    numeric_gradient = np.zeros_like(positions)
+    numeric_laplacian = np.zeros(len(positions))
+    for i in range(positions.shape[1]):
+        for d in range(3):
+            step = np.zeros_like(positions)
+            step[:, i, d] = h
+            plus = wavefunction.log_value(positions + step, params)
+            minus = wavefunction.log_value(positions - step, params)
+            numeric_gradient[:, i, d] = (plus - minus) / (2 * h)
+            numeric_laplacian += (plus - 2 * value + minus) / h**2
+
+    gradient, laplacian = wavefunction.gradient_and_laplacian(positions, params)
+
+    assert gradient == pytest.approx(numeric_gradient, abs=1e-6)
+    assert laplacian == pytest.approx(numeric_laplacian, abs=1e-4)
+
+
+@pytest.mark.parametrize(("wavefunction", "params"), CASES)
+def test_parameter_derivatives_match_finite_differences(
+    wavefunction: ProductWavefunction, params: tuple[float, ...]
+) -> None:
+    positions = _positions()
+    h = 1e-6
+
+    derivatives = wavefunction.parameter_derivatives(positions, params)
+
+    assert derivatives.shape == (len(positions), wavefunction.n_parameters)
+    for k in range(wavefunction.n_parameters):
+        step = np.eye(wavefunction.n_parameters)[k] * h
+        expected = (
+            wavefunction.log_value(positions, np.add(params, step))
+            - wavefunction.log_value(positions, np.subtract(params, step))
+        ) / (2 * h)
+        assert derivatives[:, k] == pytest.approx(expected, rel=1e-6)
+
+
+@pytest.mark.parametrize(("wavefunction", "params"), CASES)
+def test_log_ratio_matches_the_full_log_value_difference(
+    wavefunction: ProductWavefunction, params: tuple[float, ...]
+) -> None:
+    positions = _positions(n_walkers=1, n_particles=6)[0]
+    table = PairDistanceTable(positions)
+    new_position = positions[2] + np.array([0.3, -0.2, 0.4])
+    moved = positions.copy()
+    moved[2] = new_position
+
+    change, row = wavefunction.log_ratio(table, 2, new_position, params)
+    table.accept(2, new_position, row)
+
+    expected = wavefunction.log_value(moved, params) - wavefunction.log_value(positions, params)
+    assert change == pytest.approx(expected)
+    assert table.distances == pytest.approx(PairDistanceTable(moved).distances)
+
+
+def test_split_rejects_a_wrong_parameter_count() -> None:
+    wavefunction = ProductWavefunction(GaussianOneBody(), PadeJastrow())
+
+    with pytest.raises(ValueError, match="expected 3 parameters"):
+        wavefunction.split((1.0, 0.5))